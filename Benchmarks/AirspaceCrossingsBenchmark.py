@@ -0,0 +1,105 @@
+import argparse
+import math
+import random
+import time
+
+from F15_Parser.ExtractedRouteRecord import ExtractedRouteRecord
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from F15_Parser.F15TokenSyntaxDescriptions import TokenBaseType, TokenSubType
+from RouteAnalysis.AirspaceCrossings import AirspaceCrossings
+from RouteAnalysis.AirspaceVolume import AirspaceVolume
+
+
+class AirspaceCrossingsBenchmark:
+    """This class measures AirspaceCrossings.get_crossings_batch() with thousands of synthetic volumes whose
+    boundaries have FIR-like vertex counts, crossed by batches of synthetic routes.
+
+    The volumes tile a 60 x 60 degree area in a square grid, each boundary is a circle inscribed in its
+    grid cell with the requested number of vertices. Routes are random 5 point routes inside the area."""
+
+    @staticmethod
+    def build_volumes(number_of_volumes, vertices):
+        # type: (int, int) -> [AirspaceVolume]
+        """Creates the synthetic volumes.
+
+            :param number_of_volumes: The approximate number of volumes, rounded to a square grid;
+            :param vertices: The number of vertices of each volume boundary;
+            :return: The list of volumes;"""
+        columns = max(int(math.sqrt(number_of_volumes)), 1)
+        cell = 60.0 / columns
+        volumes = []
+        for row in range(columns):
+            for column in range(columns):
+                centre_lon = column * cell + cell / 2.0
+                centre_lat = row * cell + cell / 2.0
+                ring = [(centre_lon + math.cos(2.0 * math.pi * i / vertices) * cell / 2.0,
+                         centre_lat + math.sin(2.0 * math.pi * i / vertices) * cell / 2.0)
+                        for i in range(vertices)]
+                volumes.append(AirspaceVolume("V" + str(row) + "_" + str(column), "FIR", [ring]))
+        return volumes
+
+    @staticmethod
+    def build_routes(number_of_routes, seed=26):
+        # type: (int, int) -> [ExtractedRouteSequence]
+        """Creates the synthetic routes as extracted route sequences of point records.
+
+            :param number_of_routes: The number of routes to create;
+            :param seed: The random seed;
+            :return: The list of extracted route sequences;"""
+        generator = random.Random(seed)
+        routes = []
+        for _ in range(number_of_routes):
+            ers = ExtractedRouteSequence()
+            latitude = generator.uniform(5.0, 55.0)
+            longitude = generator.uniform(5.0, 55.0)
+            for _ in range(5):
+                record = ers.append_element(ExtractedRouteRecord("POINT", 0, 0, TokenBaseType.F15_POINT,
+                                                                 TokenSubType.F15_SB_LL_DEG))
+                record.set_latitude(latitude)
+                record.set_longitude(longitude)
+                record.set_lat_long_valid(True)
+                record.set_altitude_si(10000.0)
+                latitude = min(max(latitude + generator.uniform(-2.0, 2.0), 0.0), 60.0)
+                longitude = min(max(longitude + generator.uniform(-2.0, 2.0), 0.0), 60.0)
+            routes.append(ers)
+        return routes
+
+    @staticmethod
+    def run(number_of_volumes, vertices, number_of_routes):
+        # type: (int, int, int) -> None
+        """Runs one benchmark configuration and prints the timings. The batch is run twice, the first run
+        includes building the edge indices of the volumes with many vertices.
+
+            :param number_of_volumes: The approximate number of volumes;
+            :param vertices: The number of vertices of each volume boundary;
+            :param number_of_routes: The number of routes in the batch;
+            :return: None"""
+        volumes = AirspaceCrossingsBenchmark.build_volumes(number_of_volumes, vertices)
+        routes = AirspaceCrossingsBenchmark.build_routes(number_of_routes)
+        crossings = AirspaceCrossings()
+        for volume in volumes:
+            crossings.add_volume(volume)
+        start = time.perf_counter()
+        crossings.get_index()
+        index_time = time.perf_counter() - start
+        start = time.perf_counter()
+        crossings.get_crossings_batch(routes)
+        cold_time = time.perf_counter() - start
+        start = time.perf_counter()
+        events = crossings.get_crossings_batch(routes)
+        warm_time = time.perf_counter() - start
+        print("{0:>7} volumes {1:>6} vertices {2:>7} routes: index {3:7.3f}s, first batch {4:8.3f}s, "
+              "batch {5:8.3f}s, {6:9.1f} routes/s, {7:>8} events".format(
+                len(volumes), vertices, len(routes), index_time, cold_time, warm_time,
+                len(routes) / warm_time, sum(len(route_events) for route_events in events)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark airspace crossing detection")
+    parser.add_argument("--volumes", type=int, nargs="+", default=[1000, 4000])
+    parser.add_argument("--vertices", type=int, nargs="+", default=[16, 1000])
+    parser.add_argument("--routes", type=int, default=2000)
+    arguments = parser.parse_args()
+    for benchmark_volumes in arguments.volumes:
+        for benchmark_vertices in arguments.vertices:
+            AirspaceCrossingsBenchmark.run(benchmark_volumes, benchmark_vertices, arguments.routes)
@@ -0,0 +1,107 @@
+import argparse
+import gc
+import time
+
+from Benchmarks.ParseDaemonLoadGenerator import ParseDaemonLoadGenerator
+from F15_Parser.ParseObjectPool import ParseObjectPool
+from Service.AsyncParseF15 import AsyncParseF15
+from Service.ErsCodec import ErsCodec
+from Utilities.GcControl import GcControl
+
+
+class BatchModeBenchmark:
+    """This class measures the effect of object pooling and garbage collection control on steady state batch
+    parsing. Messages are parsed in chunks with AsyncParseF15.parse_texts() as BulkParse does, then each is
+    encoded with ErsCodec.encode() and released. The latency of each chunk is recorded, so the pauses of
+    garbage collections show in the tail latencies.
+
+    The pool modes are 'off', 'tokens' to recycle tokens only and 'records' to recycle records as well.
+
+    A long running ingest process holds many long lived objects, e.g. caches and reference data, that each
+    full collection traverses. The benchmark creates a resident heap of the requested number of small
+    container objects to reproduce this."""
+
+    POOL_MODES = ["off", "tokens", "records"]
+    """The object pool configurations measured"""
+
+    @staticmethod
+    def build_resident_heap(number_of_objects):
+        # type: (int) -> [{}]
+        """Creates the long lived objects.
+
+            :param number_of_objects: The number of objects;
+            :return: The objects, they stay alive as long as the list is referenced;"""
+        return [{"key": index, "values": [index]} for index in range(number_of_objects // 2)]
+
+    @staticmethod
+    def run_configuration(routes, rounds, chunk_size, pool_mode, gc_mode):
+        # type: ([str], int, int, str, str) -> {}
+        """Parses the routes a number of times with one configuration.
+
+            :param routes: The field 15 strings;
+            :param rounds: The number of times the routes are parsed;
+            :param chunk_size: The number of routes parsed together;
+            :param pool_mode: One of POOL_MODES;
+            :param gc_mode: One of GcControl.MODES;
+            :return: A dictionary with the messages per second, the chunk latency percentiles in microseconds
+                     and the number of collections run;"""
+        object_pool = None if pool_mode == "off" else ParseObjectPool(recycle_records=pool_mode == "records")
+        chunks = [routes[index:index + chunk_size] for index in range(0, len(routes), chunk_size)]
+        latencies = []
+        gc.collect()
+        collections = sum(item["collections"] for item in gc.get_stats())
+        with GcControl(gc_mode):
+            start = time.perf_counter()
+            for _ in range(rounds):
+                for chunk in chunks:
+                    chunk_start = time.perf_counter_ns()
+                    for ers in AsyncParseF15.parse_texts(chunk, object_pool=object_pool):
+                        ErsCodec.encode(ers)
+                        if object_pool is not None:
+                            object_pool.release_sequence(ers)
+                    latencies.append(time.perf_counter_ns() - chunk_start)
+            elapsed = time.perf_counter() - start
+        collections = sum(item["collections"] for item in gc.get_stats()) - collections
+        latencies.sort()
+        return {
+            "messages_per_second": rounds * len(routes) / elapsed,
+            "p50": latencies[len(latencies) // 2] / 1000.0,
+            "p99": latencies[int(len(latencies) * 0.99)] / 1000.0,
+            "max": latencies[-1] / 1000.0,
+            "collections": collections
+        }
+
+    @staticmethod
+    def run(number_of_routes, rounds, chunk_size, resident_objects):
+        # type: (int, int, int, int) -> None
+        """Runs every configuration and prints the results.
+
+            :param number_of_routes: The number of distinct routes;
+            :param rounds: The number of times the routes are parsed per configuration;
+            :param chunk_size: The number of routes parsed together;
+            :param resident_objects: The number of long lived objects held while parsing;
+            :return: None"""
+        routes = ParseDaemonLoadGenerator.build_routes(number_of_routes)
+        resident_heap = BatchModeBenchmark.build_resident_heap(resident_objects)
+        # Warm up the intern pool and the geodesic caches
+        BatchModeBenchmark.run_configuration(routes, 1, chunk_size, "off", GcControl.NONE)
+        print("{0:<10}{1:<10}{2:>12}{3:>12}{4:>12}{5:>12}{6:>13}".format(
+            "Pool", "GC", "Messages/s", "p50 us", "p99 us", "max us", "Collections"))
+        for pool_mode in BatchModeBenchmark.POOL_MODES:
+            for gc_mode in GcControl.MODES:
+                result = BatchModeBenchmark.run_configuration(routes, rounds, chunk_size, pool_mode, gc_mode)
+                print("{0:<10}{1:<10}{2:>12.0f}{3:>12.0f}{4:>12.0f}{5:>12.0f}{6:>13}".format(
+                    pool_mode, gc_mode, result["messages_per_second"], result["p50"], result["p99"],
+                    result["max"], result["collections"]))
+        del resident_heap
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark object pooling and garbage collection control")
+    parser.add_argument("--routes", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--chunk-size", type=int, default=64)
+    parser.add_argument("--resident", type=int, default=1000000,
+                        help="The number of long lived objects held while parsing")
+    arguments = parser.parse_args()
+    BatchModeBenchmark.run(arguments.routes, arguments.rounds, arguments.chunk_size, arguments.resident)
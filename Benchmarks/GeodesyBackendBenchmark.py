@@ -0,0 +1,122 @@
+import argparse
+import math
+import random
+import time
+
+from Utilities.GeodesyBackend import GeodesyBackend, KarneyBackend
+
+
+class GeodesyBackendBenchmark:
+    """This class measures the throughput of each geodesy backend and its largest errors compared to the
+    Karney backend, over random points spread uniformly over the globe.
+
+    The inverse errors are measured between random point pairs, half of them less than 5 degrees apart as the
+    points of a route are. The direct errors are measured for random bearings and distances up to the
+    antipode. These are the measurements behind the error bounds documented by each backend."""
+
+    @staticmethod
+    def build_point_pairs(number_of_pairs, seed=46):
+        # type: (int, int) -> [(float, float, float, float)]
+        """Creates the random point pairs.
+
+            :param number_of_pairs: The number of point pairs to create;
+            :param seed: The random seed;
+            :return: A list of (latitude 1, longitude 1, latitude 2, longitude 2) tuples;"""
+        generator = random.Random(seed)
+        pairs = []
+        for index in range(number_of_pairs):
+            latitude = math.degrees(math.asin(generator.uniform(-1.0, 1.0)))
+            longitude = generator.uniform(-180.0, 180.0)
+            if index % 2 == 0:
+                pairs.append((latitude, longitude, math.degrees(math.asin(generator.uniform(-1.0, 1.0))),
+                              generator.uniform(-180.0, 180.0)))
+            else:
+                pairs.append((latitude, longitude, min(max(latitude + generator.uniform(-5.0, 5.0), -90.0), 90.0),
+                              GeodesyBackend.normalise_degrees(longitude + generator.uniform(-5.0, 5.0))))
+        return pairs
+
+    @staticmethod
+    def build_projections(point_pairs, seed=46):
+        # type: ([(float, float, float, float)], int) -> [(float, float, float, float)]
+        """Creates a random projection from the first point of each pair.
+
+            :param point_pairs: The point pairs;
+            :param seed: The random seed;
+            :return: A list of (latitude, longitude, bearing, distance) tuples;"""
+        generator = random.Random(seed)
+        return [(pair[0], pair[1], generator.uniform(-180.0, 180.0), generator.uniform(1.0, 19900000.0))
+                for pair in point_pairs]
+
+    @staticmethod
+    def get_errors(backend, point_pairs, projections):
+        # type: (GeodesyBackend, [()], [()]) -> (float, float, float)
+        """Measures the largest errors of a backend compared to the Karney backend.
+
+            :param backend: The backend to measure;
+            :param point_pairs: The inverse arguments;
+            :param projections: The direct arguments;
+            :return: The largest relative distance error, the largest azimuth error in degrees for points less
+                     than AZIMUTH_ERROR_RANGE apart and the largest relative position error;"""
+        reference = KarneyBackend()
+        distance_error = 0.0
+        azimuth_error = 0.0
+        for pair in point_pairs:
+            azimuth, distance = reference.inverse(*pair)
+            backend_azimuth, backend_distance = backend.inverse(*pair)
+            if distance > 1.0:
+                distance_error = max(distance_error, abs(backend_distance - distance) / distance)
+            if 1000.0 < distance < backend.AZIMUTH_ERROR_RANGE:
+                azimuth_error = max(azimuth_error, abs(GeodesyBackend.normalise_degrees(backend_azimuth - azimuth)))
+        position_error = 0.0
+        for projection in projections:
+            latitude, longitude = reference.direct(*projection)
+            backend_latitude, backend_longitude = backend.direct(*projection)
+            position_error = max(position_error, reference.inverse(
+                latitude, longitude, backend_latitude, backend_longitude)[1] / projection[3])
+        return distance_error, azimuth_error, position_error
+
+    @staticmethod
+    def get_throughput(backend, point_pairs, projections):
+        # type: (GeodesyBackend, [()], [()]) -> (float, float)
+        """Measures the throughput of a backend.
+
+            :param backend: The backend to measure;
+            :param point_pairs: The inverse arguments;
+            :param projections: The direct arguments;
+            :return: The number of inverse and of direct calculations per second;"""
+        start = time.perf_counter()
+        for pair in point_pairs:
+            backend.inverse(*pair)
+        inverse_time = time.perf_counter() - start
+        start = time.perf_counter()
+        for projection in projections:
+            backend.direct(*projection)
+        direct_time = time.perf_counter() - start
+        return len(point_pairs) / inverse_time, len(projections) / direct_time
+
+    @staticmethod
+    def run(number_of_pairs):
+        # type: (int) -> None
+        """Runs the benchmark and prints the throughput and the errors of each backend beside its documented
+        bounds.
+
+            :param number_of_pairs: The number of point pairs and of projections;
+            :return: None"""
+        point_pairs = GeodesyBackendBenchmark.build_point_pairs(number_of_pairs)
+        projections = GeodesyBackendBenchmark.build_projections(point_pairs)
+        print("{0:<10}{1:>12}{2:>12}{3:>24}{4:>24}{5:>24}".format(
+            "Backend", "Inverse/s", "Direct/s", "Distance error (bound)", "Azimuth error (bound)",
+            "Position error (bound)"))
+        for backend in GeodesyBackend.get_backends():
+            inverse_rate, direct_rate = GeodesyBackendBenchmark.get_throughput(backend, point_pairs, projections)
+            errors = GeodesyBackendBenchmark.get_errors(backend, point_pairs, projections)
+            print("{0:<10}{1:>12.0f}{2:>12.0f}{3:>13.1e} ({4:7.1e}){5:>13.1e} ({6:7.1e}){7:>13.1e} ({8:7.1e})".format(
+                backend.get_name(), inverse_rate, direct_rate, errors[0], backend.DISTANCE_ERROR, errors[1],
+                backend.AZIMUTH_ERROR, errors[2], backend.POSITION_ERROR))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the geodesy backends")
+    parser.add_argument("--pairs", type=int, default=20000)
+    arguments = parser.parse_args()
+    GeodesyBackendBenchmark.run(arguments.pairs)
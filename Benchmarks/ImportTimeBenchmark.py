@@ -0,0 +1,65 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+
+class ImportTimeBenchmark:
+    """This class measures the start-up cost of a fresh worker process: importing the parser, and importing
+    the parser and parsing a first route, which compiles the token classifier. Each case runs in new Python
+    processes which report the time spent after the interpreter started, the median of the repeats is
+    printed."""
+
+    SCRIPT = """
+import sys
+import time
+start = time.perf_counter()
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from F15_Parser.F15Parse import ParseF15
+from Tokenizer.Tokenize import Tokenize
+imported = time.perf_counter()
+if sys.argv[1] == "parse":
+    tokenizer = Tokenize()
+    tokenizer.set_whitespace(" \\n\\t\\r/")
+    tokenizer.set_string_to_tokenize("N0450F350 LNZ UL610 ABC DCT 50N010E")
+    tokenizer.tokenize()
+    ParseF15().parse_f15(ExtractedRouteSequence(), tokenizer.get_tokens())
+print((imported - start) * 1000.0, (time.perf_counter() - start) * 1000.0)
+"""
+    """The script run in each process, prints the import time and the total time in milliseconds"""
+
+    @staticmethod
+    def measure(mode):
+        # type: (str) -> (float, float)
+        """Runs the script in a new process.
+
+            :param mode: 'import' to import only, 'parse' to parse a route after importing;
+            :return: The import time and the total time in milliseconds;"""
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.run([sys.executable, "-c", ImportTimeBenchmark.SCRIPT, mode], cwd=root,
+                                capture_output=True, text=True, check=True).stdout
+        import_time, total_time = output.split()
+        return float(import_time), float(total_time)
+
+    @staticmethod
+    def run(repeats):
+        # type: (int) -> None
+        """Runs all cases and prints the median times.
+
+            :param repeats: The number of processes started for each case;
+            :return: None"""
+        results = {"import only": [], "first parse": []}
+        for _ in range(repeats):
+            results["import only"].append(ImportTimeBenchmark.measure("import"))
+            results["first parse"].append(ImportTimeBenchmark.measure("parse"))
+        for name, times in results.items():
+            print("{0:<14} import {1:7.2f} ms, total {2:7.2f} ms".format(
+                name, statistics.median(time[0] for time in times), statistics.median(time[1] for time in times)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark parser import and first parse time")
+    parser.add_argument("--repeats", type=int, default=20)
+    arguments = parser.parse_args()
+    ImportTimeBenchmark.run(arguments.repeats)
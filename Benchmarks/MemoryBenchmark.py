@@ -0,0 +1,89 @@
+import argparse
+import os
+import tracemalloc
+
+from Benchmarks.ParseDaemonLoadGenerator import ParseDaemonLoadGenerator
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from F15_Parser.F15Parse import ParseF15
+from Tokenizer.ColumnarTokens import ColumnarTokens
+from Tokenizer.Tokenize import Tokenize
+from Utilities.MemoryReport import MemoryReport
+
+
+class MemoryBenchmark:
+    """This class parses a synthetic corpus under tracemalloc and reports the memory still allocated per message
+    by source line in the F15_Parser and Tokenizer packages while the tokens and ERS of every message are kept,
+    as a route cache would keep them. A warm-up pass fills the intern pool and the decode tables first so
+    that one-time allocations are not attributed to the messages. The peak traced memory shows the transient
+    allocations on top of the retained ones, and the MemoryReport deep sizes of the retained objects are
+    printed for comparison. The tokens are kept either as Tokens lists or, with --columnar, as ColumnarTokens
+    copies of the parsed Tokens lists."""
+
+    PACKAGES = ["F15_Parser", "Tokenizer"]
+    """The packages whose allocations are reported"""
+
+    @staticmethod
+    def parse(routes, columnar=False):
+        # type: ([str], bool) -> [(Tokens, ExtractedRouteSequence)]
+        """Tokenizes and parses routes, keeping the tokens and ERS of each.
+
+            :param routes: The field 15 strings;
+            :param columnar: True to keep the tokens as ColumnarTokens copies;
+            :return: A list of the tokens and ERS of each route;"""
+        parser = ParseF15()
+        results = []
+        for route in routes:
+            tokenizer = Tokenize()
+            tokenizer.set_whitespace(" \n\t\r/")
+            tokenizer.set_string_to_tokenize(route)
+            tokenizer.tokenize()
+            ers = ExtractedRouteSequence()
+            parser.parse_f15(ers, tokenizer.get_tokens())
+            tokens = tokenizer.get_tokens()
+            results.append((ColumnarTokens.from_tokens(tokens, route) if columnar else tokens, ers))
+        return results
+
+    @staticmethod
+    def run(number_of_routes, limit, columnar=False):
+        # type: (int, int, bool) -> None
+        """Runs the benchmark and prints the report.
+
+            :param number_of_routes: The number of routes parsed;
+            :param limit: The maximum number of source lines reported;
+            :param columnar: True to keep the tokens as ColumnarTokens copies;
+            :return: None"""
+        routes = ParseDaemonLoadGenerator.build_routes(number_of_routes)
+        MemoryBenchmark.parse(ParseDaemonLoadGenerator.build_routes(number_of_routes, seed=40), columnar)
+        filters = [tracemalloc.Filter(True, "*" + os.sep + package + os.sep + "*")
+                   for package in MemoryBenchmark.PACKAGES]
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot().filter_traces(filters)
+        tracemalloc.reset_peak()
+        start_memory = tracemalloc.get_traced_memory()[0]
+        results = MemoryBenchmark.parse(routes, columnar)
+        current_memory, peak_memory = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot().filter_traces(filters)
+        tracemalloc.stop()
+
+        print("{0} messages: {1:.0f} bytes retained and {2:.0f} bytes peak per message (all allocations)".format(
+            number_of_routes, (current_memory - start_memory) / number_of_routes,
+            (peak_memory - start_memory) / number_of_routes))
+        print("{0:>14}{1:>16}  {2}".format("Bytes/message", "Blocks/message", "Source line"))
+        for statistic in after.compare_to(before, "lineno")[0:limit]:
+            frame = statistic.traceback[0]
+            print("{0:>14.1f}{1:>16.2f}  {2}:{3}".format(statistic.size_diff / number_of_routes,
+                                                         statistic.count_diff / number_of_routes,
+                                                         os.path.relpath(frame.filename), frame.lineno))
+        token_bytes = sum(MemoryReport.get_tokens_report(tokens)["bytes"] for tokens, _ in results)
+        ers_bytes = sum(MemoryReport.get_ers_report(ers)["bytes"] for _, ers in results)
+        print("Deep size per message: tokens {0:.0f} bytes, ERS {1:.0f} bytes".format(
+            token_bytes / number_of_routes, ers_bytes / number_of_routes))
+
+
+if __name__ == '__main__':
+    argument_parser = argparse.ArgumentParser(description="Report parser memory allocations per message")
+    argument_parser.add_argument("--routes", type=int, default=10000)
+    argument_parser.add_argument("--limit", type=int, default=25)
+    argument_parser.add_argument("--columnar", action="store_true", help="Keep the tokens as ColumnarTokens lists")
+    arguments = argument_parser.parse_args()
+    MemoryBenchmark.run(arguments.routes, arguments.limit, arguments.columnar)
@@ -0,0 +1,119 @@
+import argparse
+import random
+import threading
+import time
+
+from Service.ParseClient import ParseClient
+from Service.ParseDaemon import ParseDaemon
+
+
+class ParseDaemonLoadGenerator:
+    """This class measures the throughput and latency of a ParseDaemon. A number of client threads, each with
+    its own connection, send batches of generated routes as fast as the daemon answers them; the requests
+    per second, routes per second and the p50 / p99 request latencies are reported."""
+
+    @staticmethod
+    def build_routes(number_of_routes, seed=36):
+        # type: (int, int) -> [str]
+        """Generates field 15 strings with a mix of lat/long points, named points and ATS routes.
+
+            :param number_of_routes: The number of routes to generate;
+            :param seed: The random seed so runs are repeatable;
+            :return: The field 15 strings;"""
+        generator = random.Random(seed)
+        routes = []
+        for _ in range(number_of_routes):
+            elements = ["N0450F350"]
+            for idx in range(generator.randint(4, 20)):
+                if generator.random() < 0.5:
+                    elements.append("{0:02d}N{1:03d}W".format(generator.randint(0, 60), generator.randint(0, 60)))
+                else:
+                    elements.append("P{0:03d}".format(generator.randint(0, 500)))
+                    elements.append(generator.choice(["DCT", "UL9", "B9"]))
+            elements.append("ABC")
+            routes.append(" ".join(elements))
+        return routes
+
+    @staticmethod
+    def run(address, clients, requests_per_client, batch_size):
+        # type: ((str, int) | str, int, int, int) -> {}
+        """Runs the load against a daemon.
+
+            :param address: The daemon's (host, port) or Unix domain socket path;
+            :param clients: The number of concurrent client connections;
+            :param requests_per_client: The number of requests sent by each client;
+            :param batch_size: The number of routes in each request;
+            :return: A dictionary with the requests, routes, elapsed seconds, requests and routes per second
+                     and the p50 and p99 request latencies in seconds;"""
+        routes = ParseDaemonLoadGenerator.build_routes(1000)
+        latencies = [[] for _ in range(clients)]
+        errors = []
+
+        def client_thread(client_idx):
+            client = ParseClient(address)
+            try:
+                for request_idx in range(requests_per_client):
+                    start = (client_idx * requests_per_client + request_idx) * batch_size % len(routes)
+                    batch = [routes[(start + idx) % len(routes)] for idx in range(batch_size)]
+                    request_start = time.perf_counter()
+                    response = client.parse(batch)
+                    latencies[client_idx].append(time.perf_counter() - request_start)
+                    if "error" in response:
+                        errors.append(response["error"])
+            finally:
+                client.close()
+
+        threads = [threading.Thread(target=client_thread, args=(idx,)) for idx in range(clients)]
+        start_time = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start_time
+        all_latencies = sorted(latency for client_latencies in latencies for latency in client_latencies)
+        requests = len(all_latencies)
+        return {
+            "requests": requests,
+            "routes": requests * batch_size,
+            "errors": len(errors),
+            "elapsed": elapsed,
+            "requests_per_second": requests / elapsed,
+            "routes_per_second": requests * batch_size / elapsed,
+            "p50_latency": all_latencies[requests // 2] if requests > 0 else 0.0,
+            "p99_latency": all_latencies[min(requests - 1, (requests * 99) // 100)] if requests > 0 else 0.0
+        }
+
+
+if __name__ == '__main__':
+    argument_parser = argparse.ArgumentParser(description="Load generator for the field 15 parse daemon")
+    argument_parser.add_argument("--host", default="127.0.0.1", help="Daemon TCP host")
+    argument_parser.add_argument("--port", type=int, default=None,
+                                 help="Daemon TCP port, a local daemon is started if neither port nor unix is given")
+    argument_parser.add_argument("--unix", default=None, help="Daemon Unix domain socket path")
+    argument_parser.add_argument("--workers", type=int, default=4, help="Workers of a locally started daemon")
+    argument_parser.add_argument("--clients", type=int, nargs="+", default=[1, 4, 16])
+    argument_parser.add_argument("--requests", type=int, default=200, help="Requests per client")
+    argument_parser.add_argument("--batch", type=int, nargs="+", default=[1, 32])
+    arguments = argument_parser.parse_args()
+
+    local_daemon = None
+    if arguments.unix is not None:
+        daemon_address = arguments.unix
+    elif arguments.port is not None:
+        daemon_address = (arguments.host, arguments.port)
+    else:
+        local_daemon = ParseDaemon(workers=arguments.workers)
+        local_daemon.start_background()
+        daemon_address = local_daemon.address
+    try:
+        for batch_size in arguments.batch:
+            for number_of_clients in arguments.clients:
+                result = ParseDaemonLoadGenerator.run(daemon_address, number_of_clients, arguments.requests,
+                                                      batch_size)
+                print("clients {0:>3} batch {1:>3}: {2:>8.0f} requests/s {3:>9.0f} routes/s "
+                      "p50 {4:>7.2f} ms p99 {5:>7.2f} ms errors {6}".format(
+                        number_of_clients, batch_size, result["requests_per_second"], result["routes_per_second"],
+                        result["p50_latency"] * 1000.0, result["p99_latency"] * 1000.0, result["errors"]))
+    finally:
+        if local_daemon is not None:
+            local_daemon.stop_background()
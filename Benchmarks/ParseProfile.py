@@ -0,0 +1,50 @@
+import argparse
+
+from Benchmarks.ParseDaemonLoadGenerator import ParseDaemonLoadGenerator
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from F15_Parser.F15Parse import ParseF15
+from F15_Parser.F15ParseProfiler import F15ParseProfiler
+from Tokenizer.Tokenize import Tokenize
+
+
+class ParseProfile:
+    """This class profiles the parser grammar handlers over a file of field 15 strings, one per line, or over
+    generated routes, prints the handlers and transitions with the highest times and optionally writes the
+    folded stacks for a flame graph, e.g. 'flamegraph.pl profile.folded > profile.svg'."""
+
+    @staticmethod
+    def run(routes, folded_file_name, limit):
+        # type: ([str], str, int) -> F15ParseProfiler
+        """Parses all routes with a profiled parser and prints the report.
+
+            :param routes: The field 15 strings to parse;
+            :param folded_file_name: The file the folded stacks are written to, None to not write them;
+            :param limit: The maximum number of handlers and of transitions reported;
+            :return: The profiler holding the totals;"""
+        profiler = F15ParseProfiler()
+        parser = ParseF15(profiler=profiler)
+        tokenizer = Tokenize()
+        tokenizer.set_whitespace(" \n\t\r/")
+        for route in routes:
+            tokenizer.set_string_to_tokenize(route)
+            tokenizer.tokenize()
+            parser.parse_f15(ExtractedRouteSequence(), tokenizer.get_tokens())
+        print(profiler.get_report(limit))
+        if folded_file_name is not None:
+            profiler.write_folded_stacks(folded_file_name)
+        return profiler
+
+
+if __name__ == '__main__':
+    argument_parser = argparse.ArgumentParser(description="Profile the field 15 parser grammar handlers")
+    argument_parser.add_argument("--input", default=None, help="A file of field 15 strings, one per line")
+    argument_parser.add_argument("--routes", type=int, default=10000, help="Generated routes if no input file")
+    argument_parser.add_argument("--folded", default=None, help="Write folded stacks to this file")
+    argument_parser.add_argument("--limit", type=int, default=25, help="Handlers and transitions reported")
+    arguments = argument_parser.parse_args()
+    if arguments.input is None:
+        profile_routes = ParseDaemonLoadGenerator.build_routes(arguments.routes)
+    else:
+        with open(arguments.input, "r", encoding="latin-1") as input_file:
+            profile_routes = [line.strip() for line in input_file if len(line.strip()) > 0]
+    ParseProfile.run(profile_routes, arguments.folded, arguments.limit)
@@ -0,0 +1,79 @@
+import argparse
+import random
+import time
+
+from RouteAnalysis.RouteProximity import RouteProximity
+
+
+class RouteProximityBenchmark:
+    """This class measures the RouteProximity pre-screen with 10k, 50k and 100k synthetic routes and reports
+    how many of all possible segment pairs remain as candidates for the geodesic check.
+
+    Routes are random walks of straight segments roughly 60NM long between 60S and 70N, avoiding the
+    anti-meridian, each at a single flight level between FL100 and FL410."""
+
+    @staticmethod
+    def build_routes(number_of_routes, segments_per_route, seed=27):
+        # type: (int, int, int) -> [[[float, float, float, float, float]]]
+        """Creates the synthetic routes.
+
+            :param number_of_routes: The number of routes to create;
+            :param segments_per_route: The number of segments in each route;
+            :param seed: The random seed;
+            :return: A list of routes, each a list of [lat 1, lon 1, lat 2, lon 2, altitude in meters];"""
+        generator = random.Random(seed)
+        routes = []
+        for _ in range(number_of_routes):
+            latitude = generator.uniform(-60.0, 70.0)
+            longitude = generator.uniform(-170.0, 170.0)
+            altitude = generator.randrange(100, 420, 10) * 100 * 0.3048
+            route = []
+            for _ in range(segments_per_route):
+                next_latitude = min(max(latitude + generator.uniform(-1.0, 1.0), -60.0), 70.0)
+                next_longitude = min(max(longitude + generator.uniform(-1.0, 1.0), -170.0), 170.0)
+                route.append([latitude, longitude, next_latitude, next_longitude, altitude])
+                latitude, longitude = next_latitude, next_longitude
+            routes.append(route)
+        return routes
+
+    @staticmethod
+    def run(number_of_routes, segments_per_route, lateral_limit_nm, vertical_limit_si, cell_size_degrees):
+        # type: (int, int, float, float, float) -> None
+        """Runs one benchmark configuration and prints the timings and the candidate pair reduction.
+
+            :param number_of_routes: The number of routes;
+            :param segments_per_route: The number of segments in each route;
+            :param lateral_limit_nm: The lateral proximity limit in nautical miles;
+            :param vertical_limit_si: The vertical proximity limit in meters;
+            :param cell_size_degrees: The grid cell size in degrees, zero for the default;
+            :return: None"""
+        routes = RouteProximityBenchmark.build_routes(number_of_routes, segments_per_route)
+        proximity = RouteProximity(lateral_limit_nm, vertical_limit_si, cell_size_degrees)
+        start = time.perf_counter()
+        for route_id, route in enumerate(routes):
+            proximity.add_route_segments(route_id, route)
+        build_time = time.perf_counter() - start
+        start = time.perf_counter()
+        conflicts = proximity.get_conflicts()
+        conflict_time = time.perf_counter() - start
+        statistics = proximity.get_statistics()
+        segments = statistics["segments"]
+        all_pairs = segments * (segments - 1) // 2
+        print("{0:>7} routes {1:>8} segments: hash {2:8.3f}s, screen + check {3:8.3f}s, "
+              "{4:>10} of {5:>13} pairs ({6:.5%}), {7:>9} geodesic checks, {8:>7} conflicts".format(
+                number_of_routes, segments, build_time, conflict_time, statistics["candidate_pairs"],
+                all_pairs, statistics["candidate_pairs"] / max(all_pairs, 1),
+                statistics["geodesic_checks"], len(conflicts)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark route proximity pre-screening")
+    parser.add_argument("--routes", type=int, nargs="+", default=[10000, 50000, 100000])
+    parser.add_argument("--segments", type=int, default=4)
+    parser.add_argument("--lateral", type=float, default=5.0)
+    parser.add_argument("--vertical", type=float, default=300.0)
+    parser.add_argument("--cell-size", type=float, default=0.0)
+    arguments = parser.parse_args()
+    for benchmark_routes in arguments.routes:
+        RouteProximityBenchmark.run(benchmark_routes, arguments.segments, arguments.lateral, arguments.vertical,
+                                    arguments.cell_size)
@@ -0,0 +1,73 @@
+import argparse
+import os
+import sys
+import time
+
+from Benchmarks.ParseDaemonLoadGenerator import ParseDaemonLoadGenerator
+from Service.ThreadParsePool import ThreadParsePool
+from Utilities.Utils import Utils
+
+
+class ThreadScalingBenchmark:
+    """This class measures how the throughput of ThreadParsePool scales with the number of threads. The same
+    routes are parsed with 1, 2, 4, ... threads up to the requested maximum and the messages per second and
+    the speedup over one thread are printed along with whether the GIL is enabled. With the GIL enabled the
+    speedup stays close to one whatever the number of threads; a free-threaded build running without the GIL
+    is needed to parse in parallel.
+
+    The geodesic caches are cleared before each configuration so that every configuration computes the same
+    geodesics rather than the later ones finding them cached."""
+
+    @staticmethod
+    def run_configuration(routes, rounds, workers, chunk_size):
+        # type: ([str], int, int, int) -> float
+        """Parses the routes a number of times with one number of threads.
+
+            :param routes: The field 15 strings;
+            :param rounds: The number of times the routes are parsed;
+            :param workers: The number of threads;
+            :param chunk_size: The number of routes parsed by a thread in a single job;
+            :return: The messages parsed per second;"""
+        Utils.get_inverse_cache().clear()
+        Utils.get_direct_cache().clear()
+        with ThreadParsePool(workers, chunk_size) as pool:
+            start = time.perf_counter()
+            for _ in range(rounds):
+                pool.parse_texts(routes)
+            elapsed = time.perf_counter() - start
+        return rounds * len(routes) / elapsed
+
+    @staticmethod
+    def run(number_of_routes, rounds, max_workers, chunk_size):
+        # type: (int, int, int, int) -> None
+        """Runs every configuration and prints the results.
+
+            :param number_of_routes: The number of distinct routes;
+            :param rounds: The number of times the routes are parsed per configuration;
+            :param max_workers: The largest number of threads measured;
+            :param chunk_size: The number of routes parsed by a thread in a single job;
+            :return: None"""
+        routes = ParseDaemonLoadGenerator.build_routes(number_of_routes)
+        print("Python {0}, free-threaded build: {1}, GIL enabled: {2}, CPUs: {3}".format(
+            sys.version.split()[0], ThreadParsePool.is_free_threaded_build(), ThreadParsePool.is_gil_enabled(),
+            os.cpu_count()))
+        # Warm up the intern pool
+        ThreadScalingBenchmark.run_configuration(routes, 1, 1, chunk_size)
+        print("{0:>8}{1:>14}{2:>10}".format("Threads", "Messages/s", "Speedup"))
+        workers = 1
+        baseline = None
+        while workers <= max_workers:
+            rate = ThreadScalingBenchmark.run_configuration(routes, rounds, workers, chunk_size)
+            baseline = rate if baseline is None else baseline
+            print("{0:>8}{1:>14.0f}{2:>10.2f}".format(workers, rate, rate / baseline))
+            workers = workers * 2
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the scaling of the thread parse pool")
+    parser.add_argument("--routes", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=ThreadParsePool.CHUNK_SIZE)
+    arguments = parser.parse_args()
+    ThreadScalingBenchmark.run(arguments.routes, arguments.rounds, arguments.max_workers, arguments.chunk_size)
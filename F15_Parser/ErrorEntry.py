@@ -0,0 +1,116 @@
+from F15_Parser.ErrorMessageDefinitions import ErrorMessages
+from F15_Parser.ExtractedRouteRecord import ExtractedRouteRecord
+from F15_Parser.F15TokenSyntaxDescriptions import TokenBaseType, TokenSubType
+
+
+class ErrorEntry:
+    """This class is the compact form of an error reported by the parser. It holds the erroneous element, its
+    position and type and the error number of the message in ErrorMessages.error_messages, the message text
+    is not formatted and no ExtractedRouteRecord is created until the error is read through
+    ExtractedRouteSequence.get_all_errors(). Consumers reading only the number of errors or the error numbers
+    never pay for formatting messages. The getters match those of ExtractedRouteRecord for the error
+    attributes."""
+
+    __slots__ = ("name", "start_index", "end_index", "base_type", "sub_type", "error_number", "error_message")
+
+    name: str
+    """The element text as it appears in field 15"""
+
+    start_index: int
+    """The start index of the element in field 15"""
+
+    end_index: int
+    """The end index of the element in field 15"""
+
+    base_type: TokenBaseType
+    """The base type of the element"""
+
+    sub_type: TokenSubType
+    """The subtype of the element"""
+
+    error_number: int
+    """The index of the error message in ErrorMessages.error_messages, None if the error was reported with a
+    message that is not one of these"""
+
+    error_message: str
+    """The unformatted error message, '!' is replaced by the element text when the message is formatted"""
+
+    def __init__(self, name, start_index, end_index, base_type, sub_type, error_number, error_message=None):
+        # type: (str, int, int, TokenBaseType, TokenSubType, int, str) -> None
+        """Constructor.
+
+            :param name: The element text as it appears in field 15;
+            :param start_index: The start index of the element in field 15;
+            :param end_index: The end index of the element in field 15;
+            :param base_type: The base type of the element;
+            :param sub_type: The subtype of the element;
+            :param error_number: The index of the error message in ErrorMessages.error_messages, None if the
+                                 message is given by error_message;
+            :param error_message: The unformatted error message, None to use the message of error_number;
+            :return: None"""
+        self.name = name
+        self.start_index = start_index
+        self.end_index = end_index
+        self.base_type = base_type
+        self.sub_type = sub_type
+        self.error_number = error_number
+        self.error_message = ErrorMessages.error_messages[error_number] if error_message is None else error_message
+
+    def get_name(self):
+        # type: () -> str
+        """Gets the element text.
+
+            :return: The element text as it appears in field 15;"""
+        return self.name
+
+    def get_start_index(self):
+        # type: () -> int
+        """Gets the start index of the element.
+
+            :return: The start index of the element in field 15;"""
+        return self.start_index
+
+    def get_end_index(self):
+        # type: () -> int
+        """Gets the end index of the element.
+
+            :return: The end index of the element in field 15;"""
+        return self.end_index
+
+    def get_base_type(self):
+        # type: () -> TokenBaseType
+        """Gets the base type of the element.
+
+            :return: The base type;"""
+        return self.base_type
+
+    def get_sub_type(self):
+        # type: () -> TokenSubType
+        """Gets the subtype of the element.
+
+            :return: The subtype;"""
+        return self.sub_type
+
+    def get_error_number(self):
+        # type: () -> int
+        """Gets the error number.
+
+            :return: The index of the error message in ErrorMessages.error_messages, None if the error was
+                     reported with another message;"""
+        return self.error_number
+
+    def get_error_text(self):
+        # type: () -> str
+        """Formats the error message for the element.
+
+            :return: The error message with '!' replaced by the element text;"""
+        return self.error_message.replace("!", self.name)
+
+    def as_record(self):
+        # type: () -> ExtractedRouteRecord
+        """Creates the error record for this entry.
+
+            :return: An ExtractedRouteRecord holding the element and the formatted error message;"""
+        record = ExtractedRouteRecord(self.name, self.start_index, self.end_index, self.base_type, self.sub_type)
+        record.append_error_text(self.get_error_text())
+        return record
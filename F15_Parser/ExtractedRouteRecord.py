@@ -1,4 +1,5 @@
 from F15_Parser.F15TokenSyntaxDescriptions import TokenBaseType, TokenSubType
+from F15_Parser.FlightState import FlightState
 
 
 class ExtractedRouteRecord:
@@ -32,25 +33,13 @@ class ExtractedRouteRecord:
     """Contains one of the element subtype definitions (TASRFL, MACHVFR, Point,
     Aerodrome etc.) as defined in the 'F15TokenSyntaxDescriptions.TokenSubType' class."""
 
-    altitude: str = ""
-    """The altitude as extracted from a field 15 altitude element"""
-
-    altitude_si: float = 0.0
-    """The altitude converted into SI units in meters"""
-
-    speed: str = ""
-    """The speed as extracted from a field 15 altitude element"""
-
-    speed_si: float = 0.0
-    """The speed converted into SI units in meters / second"""
+    flight_state: FlightState = FlightState.INITIAL
+    """The shared, immutable altitude, speed and flight rules at this route element"""
 
     break_text: str = ""
     """Free text as entered after the VFR element or other break elements
     defined by EURO-CONTROL IFPS"""
 
-    flight_rules: str = ""
-    """Flight rules at given route elements"""
-
     error_text: str = ""
     """Error reported for this token / record (if an error is reported)"""
 
@@ -96,6 +85,35 @@ class ExtractedRouteRecord:
         self.base_type = base_type
         self.sub_type = sub_type
 
+    def reset(self, string="", start_index=0, end_index=0, base_type=0, sub_type=0):
+        # type: (str, int, int, TokenBaseType, TokenSubType) -> None
+        """Returns a recycled record to the state of a record created with the same arguments, see
+        ParseObjectPool. Every attribute is assigned, the instance dictionary is not touched so that
+        attribute access stays as fast as on a new record.
+
+            :param string: The field 15 element string;
+            :param start_index: The start index of a route element's location in the original field 15 source text
+            :param end_index: The end index of a route element's location in the original field 15 source text
+            :param base_type: The element base type;
+            :param sub_type: The element subtype;
+            :return: None"""
+        self.string = string
+        self.start_index = start_index
+        self.end_index = end_index
+        self.base_type = base_type
+        self.sub_type = sub_type
+        self.flight_state = FlightState.INITIAL
+        self.break_text = ""
+        self.error_text = ""
+        self.stay_time = 0
+        self.altitude_cruise_to = ""
+        self.altitude_cruise_to_si = 0.0
+        self.latitude = 0.0
+        self.longitude = 0.0
+        self.bearing = 0.0
+        self.distance = 0.0
+        self.lat_long_valid = False
+
     #
     def append_break_text(self, break_text):
         # type: (str) -> None
@@ -129,7 +147,7 @@ class ExtractedRouteRecord:
         e.g. F350.
 
             :return: The altitude as given in field 15;"""
-        return self.altitude
+        return self.flight_state.altitude
 
     def get_altitude_cruise_to(self):
         # type: () -> str
@@ -153,7 +171,7 @@ class ExtractedRouteRecord:
         from the altitude values found in field 15 altitude data.
 
             :return: The altitude in SI units converted from field 15 altitude data element;"""
-        return self.altitude_si
+        return self.flight_state.altitude_si
 
     def get_base_type(self):
         # type: () -> TokenBaseType
@@ -209,7 +227,14 @@ class ExtractedRouteRecord:
         """Gets a route elements flight rules, (one of 'I', 'V', 'Y' or 'Z');
 
             :return: The flight rules at this extracted route element"""
-        return self.flight_rules
+        return self.flight_state.flight_rules
+
+    def get_flight_state(self):
+        # type: () -> FlightState
+        """Gets the shared altitude, speed and flight rules state of a route element.
+
+            :return: The flight state of this element;"""
+        return self.flight_state
 
     def get_latitude(self):
         # type: () -> float
@@ -241,7 +266,7 @@ class ExtractedRouteRecord:
         e.g. N0450.
 
             :return: The speed as given in field 15;"""
-        return self.speed
+        return self.flight_state.speed
 
     def get_speed_si(self):
         # type: () -> float
@@ -249,7 +274,7 @@ class ExtractedRouteRecord:
         from the speed values found in field 15 speed data.
 
             :return: The speed in SI units converted from field 15 speed data element;"""
-        return self.speed_si
+        return self.flight_state.speed_si
 
     def get_start_index(self):
         # type: () -> int
@@ -291,7 +316,7 @@ class ExtractedRouteRecord:
 
             :param altitude: The altitude value as a string to set;
             :return: None"""
-        self.altitude = altitude
+        self.flight_state = self.flight_state.with_altitude(altitude)
 
     # Sets a route elements altitude
     def set_altitude_cruise_to(self, altitude_cruise_to):
@@ -321,7 +346,7 @@ class ExtractedRouteRecord:
 
             :param : The altitude to set in SI units converted from field 15 altitude data element;
             :return: None"""
-        self.altitude_si = altitude_si
+        self.flight_state = self.flight_state.with_altitude_si(altitude_si)
 
     def set_base_type(self, base_type):
         # type: (TokenBaseType) -> None
@@ -387,7 +412,16 @@ class ExtractedRouteRecord:
 
             :param flight_rules: The flight rules to set at this extracted route element;
             :return: None"""
-        self.flight_rules = flight_rules
+        self.flight_state = self.flight_state.with_flight_rules(flight_rules)
+
+    def set_flight_state(self, flight_state):
+        # type: (FlightState) -> None
+        """Sets the shared altitude, speed and flight rules state of a route element, e.g. to carry the state
+        of the previous element forward.
+
+            :param flight_state: The flight state to refer to;
+            :return: None"""
+        self.flight_state = flight_state
 
     def set_latitude(self, latitude):
         # type: (float) -> None
@@ -434,7 +468,7 @@ class ExtractedRouteRecord:
 
             :param speed: The speed to set as given in field 15;
             :return: None"""
-        self.speed = speed
+        self.flight_state = self.flight_state.with_speed(speed)
 
     def set_speed_si(self, speed_si):
         # type: (float) -> None
@@ -443,7 +477,7 @@ class ExtractedRouteRecord:
 
             :param speed_si: The speed to set in SI units converted from field 15 speed data element;
             :return: None"""
-        self.speed_si = speed_si
+        self.flight_state = self.flight_state.with_speed_si(speed_si)
 
     def set_start_index(self, start_index):
         # type: (int) -> None
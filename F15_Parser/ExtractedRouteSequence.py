@@ -1,5 +1,7 @@
+from F15_Parser.ErrorEntry import ErrorEntry
 from F15_Parser.ExtractedRouteRecord import ExtractedRouteRecord
 from F15_Parser.F15TokenSyntaxDescriptions import TokenBaseType, TokenSubType
+from F15_Parser.RouteSummary import RouteSummary
 
 
 class ExtractedRouteSequence:
@@ -7,23 +9,39 @@ class ExtractedRouteSequence:
     This class stores 'n' ExtractedRouteRecord instances that together describe a complete route.
     """
 
-    extracted_route_records: [ExtractedRouteRecord] = []
+    extracted_route_records: [ExtractedRouteRecord] = None
     """A list of extracted route records"""
 
-    error_records: [ExtractedRouteRecord] = []
-    """A list of extracted route items with errors"""
+    error_records: [ErrorEntry] = None
+    """A list of the errors in their compact form"""
 
-    derived_flight_rules = ""
+    error_record_cache: [ExtractedRouteRecord] = None
+    """The extracted route items with errors created from error_records by get_all_errors(), None until the
+    errors are first read"""
+
+    derived_flight_rules: str = ""
     """The flight rules derived from parsing field 15, can be 'I', 'V', 'Y' or 'Z'"""
 
-    def __init__(self):
-        # type: () -> None
+    route_summary: RouteSummary = None
+    """The aggregates of the records, None until they are first read or set by the parser"""
+
+    object_pool = None
+    """The pool records are taken from, None to create new records"""
+
+    def __init__(self, object_pool=None):
+        # type: (ParseObjectPool) -> None
         """Constructor without any initialized extracted route record;
         clears everything, ensures class can be 're-used'
 
+            :param object_pool: The pool records are taken from, see ParseObjectPool.get_sequence(), None to
+                                create new records;
             :return: None"""
+        self.object_pool = object_pool
+        self.derived_flight_rules = ""
+        self.route_summary = None
         self.extracted_route_records = []
         self.error_records = []
+        self.error_record_cache = None
         # Create a dummy record that will be used for the ADEP
         self.add_dummy_adep_ades("ADEP")
 
@@ -58,13 +76,30 @@ class ExtractedRouteSequence:
                                   'F15TokenSyntaxDescriptions.TokenBaseType' class.
         :param element_sub_type: A base type as an enumeration value defined in the
                                  'F15TokenSyntaxDescriptions.TokenSubType' class.
-        :param error_message: The error message describing the error for this element;
+        :param error_message: The error message describing the error for this element, '!' is replaced
+                              by the element text when the error is read;
         :return: None"""
-        err_record = ExtractedRouteRecord(element_text, element_start_index,
-                                          element_end_index, element_base_type,
-                                          element_sub_type)
-        err_record.append_error_text(error_message.replace("!", element_text))
-        self.error_records.append(err_record)
+        self.error_records.append(ErrorEntry(element_text, element_start_index, element_end_index,
+                                             element_base_type, element_sub_type, None, error_message))
+
+    def add_error_number(self, element_text, element_start_index, element_end_index,
+                         element_base_type, element_sub_type, error_number):
+        # type: (str, int, int, TokenBaseType, TokenSubType, int) -> None
+        """Adds an error to the extracted route sequence by its error number. The error is stored as a compact
+        entry, the error record and message text are only created when the errors are read with
+        get_all_errors().
+
+        :param element_text: The element text as it appears in field 15;
+        :param element_start_index: The start index of the elements position in the original field 15 test string;
+        :param element_end_index: The end index of the elements position in the original field 15 test string;
+        :param element_base_type: A base type as an enumeration value defined in the
+                                  'F15TokenSyntaxDescriptions.TokenBaseType' class.
+        :param element_sub_type: A base type as an enumeration value defined in the
+                                 'F15TokenSyntaxDescriptions.TokenSubType' class.
+        :param error_number: The index of the error message in ErrorMessages.error_messages;
+        :return: None"""
+        self.error_records.append(ErrorEntry(element_text, element_start_index, element_end_index,
+                                             element_base_type, element_sub_type, error_number))
 
     def append_element(self, record):
         # type: (ExtractedRouteRecord) -> ExtractedRouteRecord
@@ -73,6 +108,7 @@ class ExtractedRouteSequence:
         :param record: An instance of ExtractedRouteRecord to add to this extracted route sequence
         :return: An instance of the ExtractedRouteRecord that was appended by this method;"""
         self.extracted_route_records.append(record)
+        self.route_summary = None
         return self.get_last_element()
 
     def as_xml(self):
@@ -115,6 +151,10 @@ class ExtractedRouteSequence:
         :param element_sub_type: A base type as an enumeration value defined in the
                                  'F15TokenSyntaxDescriptions.TokenSubType' class.
         :return: An instance of the ExtractedRouteRecord that was appended by this method;"""
+        if self.object_pool is not None:
+            return self.append_element(self.object_pool.get_record(element_text, element_start_index,
+                                                                   element_end_index, element_base_type,
+                                                                   element_sub_type))
         return self.append_element(ExtractedRouteRecord(element_text, element_start_index,
                                                         element_end_index, element_base_type,
                                                         element_sub_type))
@@ -131,6 +171,26 @@ class ExtractedRouteSequence:
         """Gets the list of extracted route records that contain errors.
 
         :return: A list of ExtractedRouteRecord instances that contain errors;"""
+        if self.error_record_cache is None:
+            self.error_record_cache = []
+        # Records are created once, errors added since the last call are appended
+        for idx in range(len(self.error_record_cache), len(self.error_records)):
+            self.error_record_cache.append(self.error_records[idx].as_record())
+        return self.error_record_cache
+
+    def get_error_numbers(self):
+        # type: () -> [int]
+        """Gets the error numbers of all errors without creating the error records.
+
+        :return: A list with the index in ErrorMessages.error_messages of each error, None for errors added
+                 with another message;"""
+        return [error.get_error_number() for error in self.error_records]
+
+    def get_error_entries(self):
+        # type: () -> [ErrorEntry]
+        """Gets the errors in their compact form without creating the error records.
+
+        :return: A list of ErrorEntry instances;"""
         return self.error_records
 
     def get_derived_flight_rules(self):
@@ -141,6 +201,18 @@ class ExtractedRouteSequence:
         """
         return self.derived_flight_rules
 
+    def get_route_summary(self):
+        # type: () -> RouteSummary
+        """Gets the aggregates of the records, see RouteSummary. The summary set by the parser is returned
+        as is, otherwise it is accumulated from the records on first use; appending a record discards it, a
+        record changed after the summary is read is not reflected in it.
+
+        :return: The route summary;"""
+        if self.route_summary is None:
+            self.route_summary = RouteSummary()
+            self.route_summary.add_records(self.extracted_route_records)
+        return self.route_summary
+
     def get_element_at(self, index):
         # type: (int) -> ExtractedRouteRecord | None
         """Retrieves an extracted route record at 'index', or returns 'None' if 'index' is out of range.
@@ -170,6 +242,29 @@ class ExtractedRouteSequence:
         else:
             return None
 
+    def get_lat_long_segments(self):
+        # type: () -> [[ExtractedRouteRecord, ExtractedRouteRecord]]
+        """Gets the route segments between consecutive point records that both have a valid latitude and
+        longitude. Connector records (routes, DCT etc.) between two points are skipped; a point without
+        coordinates (e.g. a PRP or the dummy ADEP / ADES) breaks the chain as the geometry of the route
+        through such a point is unknown.
+
+        :return: A list of two element lists, index 0 the segment start point record and index 1 the
+                 segment end point record; the list is empty if less than two consecutive points have
+                 coordinates;"""
+        segments = []
+        previous = None
+        for record in self.extracted_route_records:
+            if record.get_base_type() != TokenBaseType.F15_POINT:
+                continue
+            if not record.is_lat_long_valid():
+                previous = None
+                continue
+            if previous is not None:
+                segments.append([previous, record])
+            previous = record
+        return segments
+
     def get_number_of_elements(self):
         # type: () -> int
         """Gets the number of extracted route records
@@ -202,6 +297,15 @@ class ExtractedRouteSequence:
         """
         self.derived_flight_rules = derived_flight_rules
 
+    def set_route_summary(self, route_summary):
+        # type: (RouteSummary) -> None
+        """Sets the aggregates of the records as accumulated by the parser.
+
+        :param route_summary: The route summary of the records;
+        :return: None
+        """
+        self.route_summary = route_summary
+
     def print_ers(self):
         # type: () -> None
         """Prints the complete extracted route sequence to the console, used as ahelper in debugging
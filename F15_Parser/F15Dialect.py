@@ -0,0 +1,156 @@
+import threading
+
+from F15_Parser.F15Grammar import F15Grammar
+from F15_Parser.F15Parse import ParseF15
+from F15_Parser.F15TokenSyntaxDescriptions import TokenBaseType, TokenSubType, F15TokenSyntaxDefinition
+from Tokenizer.TokenInternPool import TokenInternPool
+
+
+class F15Dialect:
+    """This class is a named field 15 dialect profile, the rule set a message is validated against. A dialect
+    holds its own token syntax definitions with their compiled classifier, its own compiled grammar, the intern
+    pool caching the classifications of its token strings and a parser using all of these. Everything is built
+    once, when the dialect is first requested, and kept, so choosing a dialect per message costs a dictionary
+    lookup and messages of different dialects can be parsed in any order.
+
+    The predefined dialects are:
+        - IFPS: The EUROCONTROL IFPS syntax, ICAO DOC 4444 with the IFPSTOP/IFPSTART and OAT/GAT rule changes,
+          Turkish and Russian ATS route formats and NAT/PTS tracks. This is the default dialect and parses as
+          ParseF15() does, sharing the shared TokenInternPool;
+        - ICAO: Strict ICAO DOC 4444, the IFPS extensions are unrecognised elements.
+
+    Further dialects, e.g. a regional variant of a grammar, are added with register()."""
+
+    IFPS: str = "IFPS"
+    """The name of the EUROCONTROL IFPS dialect"""
+
+    ICAO: str = "ICAO"
+    """The name of the strict ICAO DOC 4444 dialect"""
+
+    DEFAULT: str = IFPS
+    """The name of the dialect used when none is given"""
+
+    IFPS_EXTENSIONS = {TokenSubType.F15_SB_OAT, TokenSubType.F15_SB_GAT, TokenSubType.F15_SB_IFPSTOP,
+                       TokenSubType.F15_SB_IFPSTART, TokenSubType.F15_SB_ATS_TURK, TokenSubType.F15_SB_ATS_RUS,
+                       TokenSubType.F15_SB_NAT, TokenSubType.F15_SB_PTS}
+    """The subtypes of the token descriptions that are EUROCONTROL IFPS extensions to ICAO DOC 4444"""
+
+    dialects: {} = {}
+    """The dialects built or registered so far, a name mapped to the dialect"""
+
+    lock: threading.Lock = threading.Lock()
+    """The lock serialising building and registering dialects"""
+
+    name: str = None
+    """The name of the dialect"""
+
+    syntax_definition: F15TokenSyntaxDefinition = None
+    """The token syntax definitions of the dialect"""
+
+    grammar: F15Grammar = None
+    """The grammar of the dialect"""
+
+    intern_pool: TokenInternPool = None
+    """The pool caching the classifications of token strings by the syntax definitions of the dialect"""
+
+    parser: ParseF15 = None
+    """The parser of the dialect, it holds no parse state and is shared by all callers"""
+
+    def __init__(self, name, syntax_definition=None, grammar=None, intern_pool=None):
+        # type: (str, F15TokenSyntaxDefinition, F15Grammar, TokenInternPool) -> None
+        """Constructor, builds the parser of the dialect.
+
+            :param name: The name of the dialect;
+            :param syntax_definition: The token syntax definitions, the default definitions if None;
+            :param grammar: The grammar, the default grammar if None;
+            :param intern_pool: The pool caching token classifications, it must classify with
+                                syntax_definition; a new pool if None and syntax_definition is given, the shared
+                                pool otherwise;
+            :return: None"""
+        if intern_pool is None:
+            intern_pool = TokenInternPool.get_shared_pool() if syntax_definition is None else \
+                TokenInternPool(syntax_definition=syntax_definition)
+        self.name = name
+        self.syntax_definition = intern_pool.syntax_definition
+        self.grammar = F15Grammar.get_default() if grammar is None else grammar
+        self.intern_pool = intern_pool
+        self.parser = ParseF15(intern_pool=intern_pool, grammar=grammar)
+
+    @staticmethod
+    def get_dialect(name=None):
+        # type: (str) -> F15Dialect
+        """Gets a dialect, building a predefined dialect on first use.
+
+            :param name: The name of the dialect, DEFAULT if None;
+            :return: The dialect;"""
+        if name is None:
+            name = F15Dialect.DEFAULT
+        dialect = F15Dialect.dialects.get(name)
+        if dialect is not None:
+            return dialect
+        with F15Dialect.lock:
+            if name not in F15Dialect.dialects:
+                if name == F15Dialect.IFPS:
+                    F15Dialect.dialects[name] = F15Dialect(name)
+                elif name == F15Dialect.ICAO:
+                    F15Dialect.dialects[name] = F15Dialect(name, F15TokenSyntaxDefinition(
+                        F15Dialect.get_strict_configuration()))
+                else:
+                    raise ValueError("Unknown field 15 dialect: " + name)
+            return F15Dialect.dialects[name]
+
+    @staticmethod
+    def register(dialect):
+        # type: (F15Dialect) -> None
+        """Adds a dialect, or replaces the dialect of the same name.
+
+            :param dialect: The dialect;
+            :return: None"""
+        with F15Dialect.lock:
+            F15Dialect.dialects[dialect.name] = dialect
+
+    @staticmethod
+    def get_dialect_names():
+        # type: () -> [str]
+        """Gets the names of the predefined and registered dialects.
+
+            :return: The sorted dialect names;"""
+        return sorted(set(F15Dialect.dialects) | {F15Dialect.IFPS, F15Dialect.ICAO})
+
+    @staticmethod
+    def get_strict_configuration():
+        # type: () -> [[str, TokenBaseType, TokenSubType]]
+        """Gets the token descriptions of strict ICAO DOC 4444. The descriptions of IFPS extensions are kept
+        in place but classify the token as unknown, so e.g. 'OAT' is reported as an unrecognised element
+        instead of matching a later description as a three letter point.
+
+            :return: A copy of F15_SB_CONFIGURATION with the IFPS_EXTENSIONS descriptions made unknown;"""
+        return [[item[F15TokenSyntaxDefinition.TOKEN_REGEXP_IDX], TokenBaseType.F15_UNKNOWN,
+                 TokenSubType.F15_SB_UNKNOWN]
+                if item[F15TokenSyntaxDefinition.TOKEN_SUBTYPE_IDENTIFIER_IDX] in F15Dialect.IFPS_EXTENSIONS
+                else item for item in F15TokenSyntaxDefinition.F15_SB_CONFIGURATION]
+
+    def get_name(self):
+        # type: () -> str
+        """Gets the name of the dialect.
+
+            :return: The dialect name;"""
+        return self.name
+
+    def get_parser(self):
+        # type: () -> ParseF15
+        """Gets the parser of the dialect.
+
+            :return: The shared parser;"""
+        return self.parser
+
+    def parse_f15(self, ers, tokens, classify=True):
+        # type: (ExtractedRouteSequence, Tokens, bool) -> bool
+        """Parses field 15 tokens against this dialect, see ParseF15.parse_f15().
+
+            :param ers: An instance of ExtractedRouteSequence class being populated by the parser;
+            :param tokens: The field 15 tokens, their base and subtypes are assigned by this dialect;
+            :param classify: False if the base and subtypes have already been assigned with the intern pool of
+                             this dialect, see ParseF15.assign_batch_syntax_descriptions();
+            :return: True if no errors were detected, False otherwise;"""
+        return self.parser.parse_f15(ers, tokens, classify)
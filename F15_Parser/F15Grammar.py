@@ -0,0 +1,319 @@
+from enum import IntEnum, auto
+
+from F15_Parser.F15TokenSyntaxDescriptions import TokenBaseType
+
+
+class GrammarState(IntEnum):
+    """This class contains enumeration values that define the parser states in which the element following
+    the current element is dispatched on its base type. Each state is named after the ParseF15 handler that
+    performs the transition."""
+    POST_ADEP = 0
+    POST_POINT = auto()
+    POST_SID = auto()
+    DCT = auto()
+    FORWARD_SLASH = auto()
+    ROUTE = auto()
+    STAY_TIME = auto()
+    RE_SYNC = auto()
+    RE_SYNC_SLASH = auto()
+    CRUISE_CLIMB_C = auto()
+
+
+class F15Grammar:
+    """This class holds the field 15 grammar as data. For each parser state a specification maps the base type
+    of the next element to an action:
+        - An int: the error number reported for the element, the parser then re-synchronizes;
+        - A str: the name of the ParseF15 handler called with the element, e.g. 'point';
+        - A tuple of str: the names of the handlers called in turn with the element.
+    A key is a TokenBaseType or a tuple of them, the key DEFAULT gives the action of all base types not listed.
+
+    The specification is compiled into a dense table, a list per state indexed by the TokenBaseType value,
+    so a transition is a single index instead of a chain of comparisons. A grammar variant is created with
+    derive() from the changes to an existing grammar and passed to the ParseF15 constructor, the parser code
+    is not changed. Handlers are looked up on the parser at each call so a profiler attached to the parser
+    still sees every handler call."""
+
+    DEFAULT: str = "default"
+    """The specification key of the action taken for all base types not listed"""
+
+    SPECIFICATION: {} = {
+        GrammarState.POST_ADEP: {
+            TokenBaseType.F15_UNKNOWN: 3,
+            (TokenBaseType.F15_SLASH, TokenBaseType.F15_BREAK_START, TokenBaseType.F15_SPEED_VFR,
+             TokenBaseType.F15_SPEED_ALTITUDE, TokenBaseType.F15_BREAK_END, TokenBaseType.F15_STAY,
+             TokenBaseType.F15_C): 23,
+            TokenBaseType.F15_DCT: "dct",
+            TokenBaseType.F15_TRUNCATE: "truncate",
+            TokenBaseType.F15_POINT: "point",
+            TokenBaseType.F15_ROUTE: 24,
+            TokenBaseType.F15_SID_STAR: "sid_star",
+            (TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE, TokenBaseType.F15_SPEED_ALTITUDE_PLUS): 9,
+            TokenBaseType.F15_TOO_LONG: 4,
+            TokenBaseType.F15_STAY_TIME: 10,
+            TokenBaseType.F15_SID: "sid",
+            TokenBaseType.F15_STAR: "star",
+            DEFAULT: 0
+        },
+        GrammarState.POST_POINT: {
+            TokenBaseType.F15_UNKNOWN: 3,
+            TokenBaseType.F15_SLASH: "forward_slash",
+            TokenBaseType.F15_BREAK_START: "break_start",
+            (TokenBaseType.F15_SPEED_VFR, TokenBaseType.F15_SPEED_ALTITUDE): 5,
+            TokenBaseType.F15_BREAK_END: "break_end_error",
+            TokenBaseType.F15_DCT: "dct",
+            TokenBaseType.F15_STAY: "stay",
+            TokenBaseType.F15_TRUNCATE: "truncate",
+            TokenBaseType.F15_C: "cruise_climb_c",
+            TokenBaseType.F15_POINT: "point",
+            TokenBaseType.F15_ROUTE: "route_after_point",
+            TokenBaseType.F15_SID_STAR: "sid_star",
+            (TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE, TokenBaseType.F15_SPEED_ALTITUDE_PLUS): 9,
+            TokenBaseType.F15_TOO_LONG: 4,
+            TokenBaseType.F15_STAY_TIME: 10,
+            TokenBaseType.F15_SID: "sid",
+            TokenBaseType.F15_STAR: "star",
+            DEFAULT: 0
+        },
+        GrammarState.POST_SID: {
+            TokenBaseType.F15_TRUNCATE: "truncate",
+            TokenBaseType.F15_POINT: "point",
+            TokenBaseType.F15_ROUTE: "route",
+            TokenBaseType.F15_SID_STAR: "sid_star",
+            TokenBaseType.F15_TOO_LONG: 4,
+            TokenBaseType.F15_SID: 32,
+            TokenBaseType.F15_STAR: "star",
+            DEFAULT: 31
+        },
+        GrammarState.DCT: {
+            TokenBaseType.F15_TRUNCATE: "truncate",
+            TokenBaseType.F15_POINT: "point",
+            TokenBaseType.F15_C: "cruise_climb_c",
+            DEFAULT: 21
+        },
+        GrammarState.FORWARD_SLASH: {
+            TokenBaseType.F15_UNKNOWN: 3,
+            TokenBaseType.F15_SLASH: 16,
+            TokenBaseType.F15_SPEED_VFR: "assign_speed_vfr",
+            TokenBaseType.F15_SPEED_ALTITUDE: "assign_speed_altitude",
+            TokenBaseType.F15_TOO_LONG: 4,
+            DEFAULT: 50
+        },
+        GrammarState.ROUTE: {
+            TokenBaseType.F15_UNKNOWN: 3,
+            TokenBaseType.F15_SLASH: 12,
+            (TokenBaseType.F15_BREAK_START, TokenBaseType.F15_SPEED_VFR): 13,
+            TokenBaseType.F15_SPEED_ALTITUDE: 55,
+            TokenBaseType.F15_BREAK_END: "break_end_error",
+            TokenBaseType.F15_DCT: 14,
+            TokenBaseType.F15_STAY: 15,
+            TokenBaseType.F15_TRUNCATE: "truncate",
+            TokenBaseType.F15_C: "cruise_climb_c",
+            TokenBaseType.F15_POINT: "point_after_route",
+            TokenBaseType.F15_ROUTE: 53,
+            (TokenBaseType.F15_SID_STAR, TokenBaseType.F15_STAR): 54,
+            (TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE, TokenBaseType.F15_SPEED_ALTITUDE_PLUS): 9,
+            TokenBaseType.F15_TOO_LONG: 4,
+            TokenBaseType.F15_STAY_TIME: 10,
+            TokenBaseType.F15_SID: 30,
+            DEFAULT: 0
+        },
+        GrammarState.STAY_TIME: {
+            TokenBaseType.F15_UNKNOWN: 3,
+            TokenBaseType.F15_BREAK_START: "break_start",
+            TokenBaseType.F15_BREAK_END: "break_end_error",
+            TokenBaseType.F15_DCT: "dct",
+            TokenBaseType.F15_TRUNCATE: "truncate",
+            TokenBaseType.F15_C: "cruise_climb_c",
+            TokenBaseType.F15_POINT: "point",
+            TokenBaseType.F15_ROUTE: "route",
+            TokenBaseType.F15_SID_STAR: "sid_star",
+            TokenBaseType.F15_TOO_LONG: 4,
+            TokenBaseType.F15_SID: "sid",
+            TokenBaseType.F15_STAR: "star",
+            DEFAULT: 39
+        },
+        GrammarState.RE_SYNC: {
+            TokenBaseType.F15_UNKNOWN: 3,
+            TokenBaseType.F15_SLASH: "re_sync_forward_slash",
+            TokenBaseType.F15_BREAK_START: "break_start",
+            TokenBaseType.F15_SPEED_VFR: "assign_speed_vfr",
+            TokenBaseType.F15_BREAK_END: "break_end",
+            TokenBaseType.F15_DCT: "dct",
+            TokenBaseType.F15_STAY: "stay",
+            TokenBaseType.F15_TRUNCATE: "truncate",
+            TokenBaseType.F15_C: "cruise_climb_c",
+            TokenBaseType.F15_POINT: "point",
+            TokenBaseType.F15_ROUTE: "route",
+            TokenBaseType.F15_SID_STAR: "sid_star",
+            TokenBaseType.F15_SPEED_ALTITUDE: "assign_speed_altitude",
+            TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE: "assign_speed_altitude_altitude",
+            TokenBaseType.F15_SPEED_ALTITUDE_PLUS: "assign_speed_altitude_plus",
+            TokenBaseType.F15_TOO_LONG: 4,
+            TokenBaseType.F15_STAY_TIME: 10,
+            TokenBaseType.F15_SID: "sid",
+            TokenBaseType.F15_STAR: "star",
+            DEFAULT: 0
+        },
+        GrammarState.RE_SYNC_SLASH: {
+            TokenBaseType.F15_SPEED_VFR: "assign_speed_vfr",
+            TokenBaseType.F15_POINT: "point",
+            TokenBaseType.F15_SPEED_ALTITUDE: "assign_speed_altitude",
+            TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE: "assign_speed_altitude_altitude",
+            TokenBaseType.F15_SPEED_ALTITUDE_PLUS: "assign_speed_altitude_plus",
+            DEFAULT: 11
+        },
+        GrammarState.CRUISE_CLIMB_C: {
+            TokenBaseType.F15_UNKNOWN: 3,
+            TokenBaseType.F15_SLASH: "cruise_climb_slash",
+            TokenBaseType.F15_BREAK_START: ("add_previous_record", "break_start"),
+            (TokenBaseType.F15_SPEED_VFR, TokenBaseType.F15_SPEED_ALTITUDE): 5,
+            TokenBaseType.F15_BREAK_END: "break_end_error",
+            TokenBaseType.F15_DCT: ("add_previous_record", "dct"),
+            TokenBaseType.F15_STAY: ("add_previous_record", "stay"),
+            TokenBaseType.F15_TRUNCATE: ("add_previous_record", "truncate"),
+            TokenBaseType.F15_C: ("add_previous_record", "cruise_climb_c"),
+            TokenBaseType.F15_POINT: ("add_previous_record", "point"),
+            TokenBaseType.F15_ROUTE: ("add_previous_record", "route"),
+            TokenBaseType.F15_SID_STAR: ("add_previous_record", "sid_star"),
+            (TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE, TokenBaseType.F15_SPEED_ALTITUDE_PLUS): 9,
+            TokenBaseType.F15_TOO_LONG: 4,
+            TokenBaseType.F15_STAY_TIME: 10,
+            TokenBaseType.F15_SID: ("add_previous_record", "sid"),
+            TokenBaseType.F15_STAR: ("add_previous_record", "star"),
+            DEFAULT: 0
+        }
+    }
+    """The ICAO field 15 grammar, the specification of the default grammar"""
+
+    default = None
+    """The shared instance of the default grammar, created on first use"""
+
+    specification: {} = None
+    """The specification this grammar was compiled from, a GrammarState mapped to the actions of the state"""
+
+    table: [[]] = None
+    """The compiled transitions, indexed by GrammarState and TokenBaseType value, each a function called with
+    the parser, the ERS, the tokens and the element"""
+
+    def __init__(self, specification):
+        # type: ({}) -> None
+        """Constructor, compiles a specification.
+
+            :param specification: A GrammarState mapped to the actions of the state for every state, see the
+                                  class description;
+            :return: None"""
+        missing = [state.name for state in GrammarState if state not in specification]
+        if len(missing) > 0:
+            raise ValueError("Grammar states without a specification: " + ", ".join(missing))
+        self.specification = specification
+        self.table = [F15Grammar.__compile_state(state, specification[state]) for state in GrammarState]
+
+    @staticmethod
+    def get_default():
+        # type: () -> F15Grammar
+        """Gets the shared instance of the default grammar.
+
+            :return: The grammar compiled from SPECIFICATION;"""
+        if F15Grammar.default is None:
+            F15Grammar.default = F15Grammar(F15Grammar.SPECIFICATION)
+        return F15Grammar.default
+
+    def derive(self, changes):
+        # type: ({}) -> F15Grammar
+        """Creates a grammar variant of this grammar, this grammar is not changed.
+
+            :param changes: A GrammarState mapped to the actions changed in the state, keyed as in a
+                            specification; a base type listed in a tuple key of this grammar may be changed on
+                            its own;
+            :return: The compiled variant;"""
+        specification = {}
+        for state in GrammarState:
+            actions = dict(self.specification[state])
+            for key, action in changes.get(state, {}).items():
+                for base_type in (key if isinstance(key, tuple) else (key,)):
+                    actions[base_type] = action
+            specification[state] = actions
+        return F15Grammar(specification)
+
+    def get_action(self, state, base_type):
+        # type: (GrammarState, TokenBaseType) -> int | str | (str,)
+        """Gets the action specified for an element in a state.
+
+            :param state: The parser state;
+            :param base_type: The base type of the element;
+            :return: The error number, the handler name or the tuple of handler names;"""
+        actions = self.specification[state]
+        if base_type in actions:
+            return actions[base_type]
+        for key, action in actions.items():
+            if isinstance(key, tuple) and base_type in key:
+                return action
+        return actions[F15Grammar.DEFAULT]
+
+    def get_handler_names(self):
+        # type: () -> {str}
+        """Gets the names of all handlers called by this grammar.
+
+            :return: The set of handler names;"""
+        names = set()
+        for actions in self.specification.values():
+            for action in actions.values():
+                if isinstance(action, str):
+                    names.add(action)
+                elif isinstance(action, tuple):
+                    names.update(action)
+        return names
+
+    def transition(self, parser, state, ers, tokens, token):
+        # type: (ParseF15, GrammarState, ExtractedRouteSequence, TokenCursor, Token) -> None
+        """Performs the action for an element in a state.
+
+            :param parser: The parser whose handlers are called;
+            :param state: The parser state;
+            :param ers: The extracted route sequence being populated;
+            :param tokens: The token cursor positioned on the element;
+            :param token: The element;
+            :return: None"""
+        self.table[state][token.get_token_base_type()](parser, ers, tokens, token)
+
+    @staticmethod
+    def __compile_state(state, actions):
+        # type: (GrammarState, {}) -> []
+        """Compiles the actions of a state into a list indexed by TokenBaseType value.
+
+            :param state: The parser state;
+            :param actions: The actions of the state, keyed as in a specification;
+            :return: The list of transition functions;"""
+        if F15Grammar.DEFAULT not in actions:
+            raise ValueError("Grammar state " + state.name + " has no default action")
+        row = [F15Grammar.__compile_action(actions[F15Grammar.DEFAULT])] * len(TokenBaseType)
+        # Single base types override the tuple keys they are part of, see derive()
+        for key in sorted((key for key in actions if key != F15Grammar.DEFAULT), key=lambda k: isinstance(k, int)):
+            for base_type in (key if isinstance(key, tuple) else (key,)):
+                row[TokenBaseType(base_type)] = F15Grammar.__compile_action(actions[key])
+        return row
+
+    @staticmethod
+    def __compile_action(action):
+        # type: (int | str | (str,)) -> Callable
+        """Compiles an action into a transition function.
+
+            :param action: An error number, a handler name or a tuple of handler names;
+            :return: A function called with the parser, the ERS, the tokens and the element;"""
+        if isinstance(action, bool) or not isinstance(action, (int, str, tuple)):
+            raise ValueError("Invalid grammar action: " + repr(action))
+        if isinstance(action, int):
+            def error(parser, ers, tokens, token):
+                parser.add_error_and_re_sync(ers, tokens, token, action)
+            return error
+        if isinstance(action, str):
+            def call(parser, ers, tokens, token):
+                getattr(parser, action)(ers, tokens, token)
+            return call
+        if len(action) == 0 or not all(isinstance(name, str) for name in action):
+            raise ValueError("Invalid grammar action: " + repr(action))
+
+        def call_all(parser, ers, tokens, token):
+            for name in action:
+                getattr(parser, name)(ers, tokens, token)
+        return call_all
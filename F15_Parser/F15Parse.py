@@ -1,11 +1,14 @@
 import copy
 
-from F15_Parser.ErrorMessageDefinitions import ErrorMessages
 from F15_Parser.ExtractedRouteRecord import ExtractedRouteRecord
 from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from F15_Parser.F15Grammar import F15Grammar, GrammarState
 from F15_Parser.F15TokenSyntaxDescriptions import TokenSubType, TokenBaseType, F15TokenSyntaxDefinition
+from Tokenizer.TokenCursor import TokenCursor
+from Tokenizer.TokenInternPool import TokenInternPool
 from Tokenizer.Tokens import Tokens
 from Tokenizer.Token import Token
+from Utilities.DecodeTables import DecodeTables
 from Utilities.Utils import Utils
 from Utilities.Constants import Constants
 
@@ -49,8 +52,36 @@ class ParseF15:
         - "O": "OAT" - Used to indicated Operational Air Traffic (OAT) section of a flight plan;
         - "S": "IFPS" - Used to indicate a 'break' in the IFR routing as determined by EUROCONTROL"""
 
-    def parse_f15(self, ers, tokens):
-        # type: (ExtractedRouteSequence, Tokens) -> bool
+    intern_pool: TokenInternPool = None
+    """The pool used to intern ERS record strings and to cache token classifications"""
+
+    grammar: F15Grammar = None
+    """The grammar giving the transitions between the handlers of this parser"""
+
+    def __init__(self, intern_pool=None, profiler=None, grammar=None):
+        # type: (TokenInternPool, F15ParseProfiler, F15Grammar) -> None
+        """Constructor.
+
+            :param intern_pool: The pool used to intern record strings and cache token classifications,
+                                the shared pool if None;
+            :param profiler: A profiler accumulating call counts and times of the grammar handlers of this
+                             parser, None to parse without profiling;
+            :param grammar: The grammar parsed, the default ICAO field 15 grammar if None;
+            :return: None"""
+        self.intern_pool = TokenInternPool.get_shared_pool() if intern_pool is None else intern_pool
+        if grammar is None:
+            self.grammar = F15Grammar.get_default()
+        else:
+            # A grammar variant may name any handler, check them once rather than fail part way through a parse
+            unknown = sorted(name for name in grammar.get_handler_names() if not callable(getattr(self, name, None)))
+            if len(unknown) > 0:
+                raise ValueError("Grammar handlers not found in the parser: " + ", ".join(unknown))
+            self.grammar = grammar
+        if profiler is not None:
+            profiler.attach(self)
+
+    def parse_f15(self, ers, tokens, classify=True):
+        # type: (ExtractedRouteSequence, Tokens, bool) -> bool
         """Entry point for the field 15 parser. Field 15 must start with one of two
         element types, either SPEED/ALTITUDE or SPEED/VFR, everything else is an error.
         When the ExtractedRouteRecord class is instantiated, record 0 is automatically created
@@ -70,21 +101,28 @@ class ParseF15:
         :param ers: An instance of ExtractedRouteSequence class being populated by the parser;
         :param tokens: A list of tokens extracted from field 15 used as input to the parser.
                This structure contains a tokenized form of all field 15 tokens used as
-               input to this parser.
+               input to this parser. Apart from their base and subtypes being assigned the
+               tokens are not modified, the parser navigates them with its own TokenCursor.
+        :param classify: False if the base and subtypes of the tokens have already been assigned with the
+               intern pool of this parser, e.g. by assign_batch_syntax_descriptions();
         :return: True if no errors were detected, False otherwise. If False is returned a
                  caller can recover a complete list of all erroneous tokens by calling
                  ExtractedRouteRecord.get_errors();
         """
         # Loop over all the tokens and assign a tokens base and subtype; this identifies a token and is used
         # by the parser to ensure correct grammar and semantics.
-        self.assign_syntax_descriptions(tokens)
+        if classify:
+            self.assign_syntax_descriptions(tokens, self.intern_pool)
+
+        # Walk the tokens with a private cursor, the caller's token list and position are left untouched
+        # so the same tokens can be parsed again or by several threads at once
+        tokens = TokenCursor(tokens)
 
         # Get the first field 15 token
         token = tokens.get_first_token()
         if token is None:
             # Add a dummy error record and report an error
-            ers.add_error("NULL", 0, 0, TokenBaseType.F15_UNKNOWN,
-                          TokenSubType.F15_SB_UNKNOWN, ErrorMessages.error_messages[41])
+            ers.add_error_number("NULL", 0, 0, TokenBaseType.F15_UNKNOWN, TokenSubType.F15_SB_UNKNOWN, 41)
             # Add a dummy ADES
             ers.add_dummy_ades()
             return False
@@ -110,19 +148,8 @@ class ParseF15:
             return ers.get_number_of_errors() == 0
         ades.set_flight_rules(previous.get_flight_rules())
 
-        # Figure out the flight rules from the extracted route
-        if ers.get_first_element().get_flight_rules() == "VFR":
-            ers.set_derived_flight_rules("V")
-            for ers_record in ers.get_all_elements():
-                if ers_record.get_flight_rules() == "IFR":
-                    ers.set_derived_flight_rules("Z")
-                    break
-        else:
-            ers.set_derived_flight_rules("I")
-            for ers_record in ers.get_all_elements():
-                if ers_record.get_flight_rules() == "VFR":
-                    ers.set_derived_flight_rules("Y")
-                    break
+        # Figure out the flight rules and the other route aggregates from the extracted route in one pass
+        ers.set_derived_flight_rules(ers.get_route_summary().get_derived_flight_rules())
 
         # Return True if no errors have been reported
         return ers.get_number_of_errors() == 0
@@ -156,12 +183,12 @@ class ParseF15:
                defined in the ErrorMessageDefinitions class.
         :return: None
         """
-        ers.add_error(token.get_token_string(),
-                      token.get_token_start_index(),
-                      token.get_token_end_index(),
-                      token.get_token_base_type(),
-                      token.get_token_sub_type(),
-                      ErrorMessages.error_messages[error_number])
+        ers.add_error_number(token.get_token_string(),
+                             token.get_token_start_index(),
+                             token.get_token_end_index(),
+                             token.get_token_base_type(),
+                             token.get_token_sub_type(),
+                             error_number)
 
     def add_record(self, ers, token):
         # type: (ExtractedRouteSequence, Token) -> ExtractedRouteRecord
@@ -173,14 +200,27 @@ class ParseF15:
         :return: An instance of the ExtractedRouteRecord class representing the
                  saved extracted route item derived from the token input;
         """
-        ex_route_rec = ers.append_element(ExtractedRouteRecord(token.get_token_string(),
-                                                               token.get_token_start_index(),
-                                                               token.get_token_end_index(),
-                                                               token.get_token_base_type(),
-                                                               token.get_token_sub_type()))
+        ex_route_rec = ers.create_append_element(self.intern_pool.intern(token.get_token_string()),
+                                                 token.get_token_start_index(),
+                                                 token.get_token_end_index(),
+                                                 token.get_token_base_type(),
+                                                 token.get_token_sub_type())
         self.carry_speed_altitude_rules_forward(ers)
         return ex_route_rec
 
+    def add_previous_record(self, ers, tokens, token):
+        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        """This method appends the element preceding 'token' to the ERS, e.g. a 'C' that is not followed by
+        a '/' and is therefore stored as a point before the element following it is processed.
+
+        :param ers: An ExtractedRouteSequence class instance that the preceding token is being appended to;
+        :param tokens: A list of tokens extracted from field 15 used as input to the parser, positioned on
+               'token';
+        :param token: The token following the token being saved;
+        :return: None
+        """
+        self.add_record(ers, tokens.peek_previous_token(1))
+
     def assign_altitude(self, ers, token, ex_route_rec, altitude_string, cruise):
         # type: (ExtractedRouteSequence, Token, ExtractedRouteRecord, str, bool) -> None
         """This method saves the altitude data to both the imperial and SI altitude class members of an
@@ -203,29 +243,49 @@ class ParseF15:
         """
         if cruise:
             ex_route_rec.set_altitude_cruise_to(altitude_string)
+            ex_route_rec.set_altitude_cruise_to_si(self.get_level_si(ers, token, altitude_string))
         else:
-            ex_route_rec.set_altitude(altitude_string)
-        altitude = int(altitude_string[1:])
-        altitude_type = altitude_string[0:1]
-        match altitude_type:
-            # Types 'F' and 'S' are pressure flight levels in imperial ('F') or SI ('S') units
-            # Types 'A' and 'M' are altitudes in imperial ('A') or SI ('M') units
-            case "A":
-                # A = Altitude in hundreds of feet, e.g. A045 = 4,500 feet (1,372 Meters)
-                altitude = (altitude * 100) * Constants.FEET_TO_METERS
-            case "F":
-                # F = Flight Level in hundreds of feet, e.g. F350 = 35,000 feet (10,668 Meters)
-                if altitude % 5 != 0:
-                    self.add_error_no_re_sync(ers, token, 40)
-                altitude = (altitude * 100) * Constants.FEET_TO_METERS
-            case "S" | "M":
-                # S = Flight Level in tens of meters, e.g. S1130 = 11,300 meters
-                # M = Altitude in tens of meters, e.g. M0840 = 8,400 meters
-                altitude = altitude * 10
-        if cruise:
-            ex_route_rec.set_altitude_cruise_to_si(int(altitude + 0.5))
-        else:
-            ex_route_rec.set_altitude_si(int(altitude + 0.5))
+            ex_route_rec.set_flight_state(ex_route_rec.get_flight_state().with_speed_altitude(
+                ex_route_rec.get_speed(), ex_route_rec.get_speed_si(), altitude_string,
+                self.get_level_si(ers, token, altitude_string)))
+
+    def assign_speed_altitude_rules(self, ers, token, ex_route_rec, speed_string, altitude_string,
+                                    flight_rules=None):
+        # type: (ExtractedRouteSequence, Token, ExtractedRouteRecord, str, str, str) -> None
+        """This method assigns the speed, the altitude and optionally the flight rules of a speed / altitude
+        or speed / VFR element to an ERS record in one step, see assign_altitude() and assign_speed() for the
+        conversions. The record refers to the resulting flight state only, the partly assigned states in
+        between are never looked up.
+
+        :param ers: An ExtractedRouteSequence class instance that an error may
+                    be written to if an error is detected;
+        :param token: A token containing a token used to report an error if an error is detected in the token;
+        :param ex_route_rec: An ExtractedRouteRecord record that the speed and altitude are written to;
+        :param speed_string: A speed as a string extracted from field 15, e.g. N0450;
+        :param altitude_string: An altitude as a string extracted from field 15, e.g. F350;
+        :param flight_rules: The flight rules, e.g. IFR, None to keep the flight rules of the record;
+        :return: None
+        """
+        altitude_si = self.get_level_si(ers, token, altitude_string)
+        ex_route_rec.set_flight_state(ex_route_rec.get_flight_state().with_speed_altitude(
+            speed_string, DecodeTables.get_speed_si(speed_string, altitude_si), altitude_string, altitude_si,
+            flight_rules))
+
+    def get_level_si(self, ers, token, altitude_string):
+        # type: (ExtractedRouteSequence, Token, str) -> int
+        """This method converts an altitude to meters, reporting an error for a flight level that is not
+        a multiple of 5.
+
+        :param ers: An ExtractedRouteSequence class instance that an error may
+                    be written to if an error is detected;
+        :param token: A token containing a token used to report an error if an error is detected in the token;
+        :param altitude_string: An altitude as a string extracted from field 15, e.g. F350;
+        :return: The altitude in meters;
+        """
+        # F = Flight Level in hundreds of feet, e.g. F350, must be a multiple of 5
+        if altitude_string[0:1] == "F" and altitude_string[-1:] not in "05":
+            self.add_error_no_re_sync(ers, token, 40)
+        return DecodeTables.get_level_si(altitude_string)
 
     def assign_azimuth_distance_between_points(self, ers):
         # type: (ExtractedRouteSequence) -> None
@@ -434,22 +494,10 @@ class ParseF15:
         :param speed_string: A speed as a string extracted from field 15, e.g. N0450;
         :return: none
         """
-        ex_route_rec.set_speed(speed_string)
-
         # Need the altitude in meters for Mach calculation
-        altitude_si = ex_route_rec.get_altitude_si()
-        speed = int(speed_string[1:])
-        speed_type = speed_string[0:1]
-        match speed_type:
-            case "K":
-                # Kilometers / hour
-                speed = speed * Constants.KMH_TO_METERS_SECOND
-            case "N":
-                # Knots
-                speed = speed * Constants.KNOTS_TO_METERS_SECOND
-            case "M":
-                speed = Utils.mach_to_ms_speed(speed, altitude_si)
-        ex_route_rec.set_speed_si(int(speed + 0.5))
+        ex_route_rec.set_flight_state(ex_route_rec.get_flight_state().with_speed_altitude(
+            speed_string, DecodeTables.get_speed_si(speed_string, ex_route_rec.get_altitude_si()),
+            ex_route_rec.get_altitude(), ex_route_rec.get_altitude_si()))
 
     def assign_speed_altitude(self, ers, tokens, token):
         # type: (ExtractedRouteSequence, Tokens, Token) -> None
@@ -457,8 +505,8 @@ class ParseF15:
         is always preceded by a point, hence the speed and altitude are applied to the preceding point
         which is the last ERS record.
 
-        Note that the altitude must be assigned in meters to the ERS before the speed as the speed given
-        as a Mach number uses the altitude to calculate a speed.
+        As this is a speed altitude element the rules must be IFR, the speed, altitude and rules are assigned
+        together by assign_speed_altitude_rules().
 
         :param ers: An ExtractedRouteSequence class instance containing a point in
                the last ERS record that the speed and altitude will be written to;
@@ -476,22 +524,18 @@ class ParseF15:
         match sub_type:
             case TokenSubType.F15_SB_SPEED_ALTITUDE_MF | TokenSubType.F15_SB_SPEED_ALTITUDE_MS | \
                  TokenSubType.F15_SB_SPEED_ALTITUDE_MA | TokenSubType.F15_SB_SPEED_ALTITUDE_MM:
-                self.assign_altitude(ers, token, ex_route_rec, token_string[4:], False)
-                self.assign_speed(ex_route_rec, token_string[0:4])
+                self.assign_speed_altitude_rules(ers, token, ex_route_rec, token_string[0:4], token_string[4:],
+                                                 self.RULES["I"])
             case TokenSubType.F15_SB_SPEED_ALTITUDE_KS | TokenSubType.F15_SB_SPEED_ALTITUDE_KA | \
                     TokenSubType.F15_SB_SPEED_ALTITUDE_KM | TokenSubType.F15_SB_SPEED_ALTITUDE_NS | \
                     TokenSubType.F15_SB_SPEED_ALTITUDE_NA | TokenSubType.F15_SB_SPEED_ALTITUDE_NM | \
                     TokenSubType.F15_SB_SPEED_ALTITUDE_KF | TokenSubType.F15_SB_SPEED_ALTITUDE_NF:
-                self.assign_altitude(ers, token, ex_route_rec, token_string[5:], False)
-                self.assign_speed(ex_route_rec, token_string[0:5])
+                self.assign_speed_altitude_rules(ers, token, ex_route_rec, token_string[0:5], token_string[5:],
+                                                 self.RULES["I"])
             case _:
-                self.assign_altitude(ers, token, ex_route_rec, "X000", False)
-                self.assign_speed(ex_route_rec, "X0000")
+                self.assign_speed_altitude_rules(ers, token, ex_route_rec, "X0000", "X000")
                 return
 
-        # As this is a speed altitude element, the rules must be IFR
-        ex_route_rec.set_flight_rules(self.RULES["I"])
-
         next_token = tokens.get_next_token()
         if next_token is None:
             return
@@ -536,9 +580,9 @@ class ParseF15:
                  TokenSubType.F15_SB_SPEED_ALTITUDE_NFA | TokenSubType.F15_SB_SPEED_ALTITUDE_NFM | \
                  TokenSubType.F15_SB_SPEED_ALTITUDE_NAF | TokenSubType.F15_SB_SPEED_ALTITUDE_NAS | \
                  TokenSubType.F15_SB_SPEED_ALTITUDE_NAA | TokenSubType.F15_SB_SPEED_ALTITUDE_NAM:
-                self.assign_altitude(ers, token, ex_route_rec, token_string[5:9], False)
+                self.assign_speed_altitude_rules(ers, token, ex_route_rec, token_string[0:5], token_string[5:9],
+                                                 self.RULES["I"])
                 self.assign_altitude(ers, token, ex_route_rec, token_string[9:], True)
-                self.assign_speed(ex_route_rec, token_string[0:5])
             case TokenSubType.F15_SB_SPEED_ALTITUDE_KSF | TokenSubType.F15_SB_SPEED_ALTITUDE_KSS | \
                     TokenSubType.F15_SB_SPEED_ALTITUDE_KSA | TokenSubType.F15_SB_SPEED_ALTITUDE_KSM | \
                     TokenSubType.F15_SB_SPEED_ALTITUDE_KMF | TokenSubType.F15_SB_SPEED_ALTITUDE_KMS | \
@@ -547,31 +591,27 @@ class ParseF15:
                     TokenSubType.F15_SB_SPEED_ALTITUDE_NSA | TokenSubType.F15_SB_SPEED_ALTITUDE_NSM | \
                     TokenSubType.F15_SB_SPEED_ALTITUDE_NMF | TokenSubType.F15_SB_SPEED_ALTITUDE_NMS | \
                     TokenSubType.F15_SB_SPEED_ALTITUDE_NMA | TokenSubType.F15_SB_SPEED_ALTITUDE_NMM:
-                self.assign_altitude(ers, token, ex_route_rec, token_string[5:10], False)
+                self.assign_speed_altitude_rules(ers, token, ex_route_rec, token_string[0:5], token_string[5:10],
+                                                 self.RULES["I"])
                 self.assign_altitude(ers, token, ex_route_rec, token_string[11:], True)
-                self.assign_speed(ex_route_rec, token_string[0:5])
             case TokenSubType.F15_SB_SPEED_ALTITUDE_MFF | TokenSubType.F15_SB_SPEED_ALTITUDE_MFS | \
                     TokenSubType.F15_SB_SPEED_ALTITUDE_MFA | TokenSubType.F15_SB_SPEED_ALTITUDE_MFM | \
                     TokenSubType.F15_SB_SPEED_ALTITUDE_MAF | TokenSubType.F15_SB_SPEED_ALTITUDE_MAS | \
                     TokenSubType.F15_SB_SPEED_ALTITUDE_MAA | TokenSubType.F15_SB_SPEED_ALTITUDE_MAM:
-                self.assign_altitude(ers, token, ex_route_rec, token_string[4:8], False)
+                self.assign_speed_altitude_rules(ers, token, ex_route_rec, token_string[0:4], token_string[4:8],
+                                                 self.RULES["I"])
                 self.assign_altitude(ers, token, ex_route_rec, token_string[9:], True)
-                self.assign_speed(ex_route_rec, token_string[0:4])
             case TokenSubType.F15_SB_SPEED_ALTITUDE_MSF | TokenSubType.F15_SB_SPEED_ALTITUDE_MSS | \
                     TokenSubType.F15_SB_SPEED_ALTITUDE_MSA | TokenSubType.F15_SB_SPEED_ALTITUDE_MSM | \
                     TokenSubType.F15_SB_SPEED_ALTITUDE_MMF | TokenSubType.F15_SB_SPEED_ALTITUDE_MMS | \
                     TokenSubType.F15_SB_SPEED_ALTITUDE_MMA | TokenSubType.F15_SB_SPEED_ALTITUDE_MMM:
-                self.assign_altitude(ers, token, ex_route_rec, token_string[4:9], False)
+                self.assign_speed_altitude_rules(ers, token, ex_route_rec, token_string[0:4], token_string[4:9],
+                                                 self.RULES["I"])
                 self.assign_altitude(ers, token, ex_route_rec, token_string[10:], True)
-                self.assign_speed(ex_route_rec, token_string[0:4])
             case _:
-                self.assign_altitude(ers, token, ex_route_rec, "X000", False)
-                self.assign_speed(ex_route_rec, "X000")
+                self.assign_speed_altitude_rules(ers, token, ex_route_rec, "X000", "X000")
                 return
 
-        # As this is a speed altitude element, the rules must be IFR
-        ex_route_rec.set_flight_rules(self.RULES["I"])
-
         next_token = tokens.get_next_token()
         if next_token is None:
             return
@@ -601,30 +641,26 @@ class ParseF15:
         match sub_type:
             case TokenSubType.F15_SB_SPEED_ALTITUDE_KF_P | TokenSubType.F15_SB_SPEED_ALTITUDE_KA_P | \
                  TokenSubType.F15_SB_SPEED_ALTITUDE_NF_P | TokenSubType.F15_SB_SPEED_ALTITUDE_NA_P:
-                self.assign_altitude(ers, token, ex_route_rec, token_string[5:9], False)
+                self.assign_speed_altitude_rules(ers, token, ex_route_rec, token_string[0:5], token_string[5:9],
+                                                 self.RULES["I"])
                 ex_route_rec.set_altitude_cruise_to(token_string[9:])
-                self.assign_speed(ex_route_rec, token_string[0:5])
             case TokenSubType.F15_SB_SPEED_ALTITUDE_KS_P | TokenSubType.F15_SB_SPEED_ALTITUDE_KM_P | \
                     TokenSubType.F15_SB_SPEED_ALTITUDE_NS_P | TokenSubType.F15_SB_SPEED_ALTITUDE_NM_P:
-                self.assign_altitude(ers, token, ex_route_rec, token_string[5:10], False)
+                self.assign_speed_altitude_rules(ers, token, ex_route_rec, token_string[0:5], token_string[5:10],
+                                                 self.RULES["I"])
                 ex_route_rec.set_altitude_cruise_to(token_string[10:])
-                self.assign_speed(ex_route_rec, token_string[0:5])
             case TokenSubType.F15_SB_SPEED_ALTITUDE_MF_P | TokenSubType.F15_SB_SPEED_ALTITUDE_MA_P:
-                self.assign_altitude(ers, token, ex_route_rec, token_string[4:8], False)
+                self.assign_speed_altitude_rules(ers, token, ex_route_rec, token_string[0:4], token_string[4:8],
+                                                 self.RULES["I"])
                 ex_route_rec.set_altitude_cruise_to(token_string[8:])
-                self.assign_speed(ex_route_rec, token_string[0:4])
             case TokenSubType.F15_SB_SPEED_ALTITUDE_MS_P | TokenSubType.F15_SB_SPEED_ALTITUDE_MM_P:
-                self.assign_altitude(ers, token, ex_route_rec, token_string[4:9], False)
+                self.assign_speed_altitude_rules(ers, token, ex_route_rec, token_string[0:4], token_string[4:9],
+                                                 self.RULES["I"])
                 ex_route_rec.set_altitude_cruise_to(token_string[9:])
-                self.assign_speed(ex_route_rec, token_string[0:4])
             case _:
-                self.assign_altitude(ers, token, ex_route_rec, "X000", False)
-                self.assign_speed(ex_route_rec, "X000")
+                self.assign_speed_altitude_rules(ers, token, ex_route_rec, "X000", "X000")
                 return
 
-        # As this is a speed altitude element, the rules must be IFR
-        ex_route_rec.set_flight_rules(self.RULES["I"])
-
         next_token = tokens.get_next_token()
         if next_token is None:
             return
@@ -655,28 +691,27 @@ class ParseF15:
         vfr_token.set_token_string("VFR")
         ex_route_rec = self.add_record(ers, vfr_token)
 
-        # Assign a default altitude as none is given in a SPEED/VFR element
-        self.assign_altitude(ers, token, ex_route_rec, self.DEFAULT_ALTITUDE, False)
-
+        # Assign a default altitude as none is given in a SPEED/VFR element, together with the speed and rules
         token_string = token.get_token_string()
         sub_type = token.get_token_sub_type()
         match sub_type:
             case TokenBaseType.F15_SPEED_VFR | TokenSubType.F15_SB_SPEED_ALTITUDE_MV:
-                self.assign_speed(ex_route_rec, token_string[0:4])
-                ex_route_rec.set_flight_rules(self.RULES[token_string[4:5]])
+                self.assign_speed_altitude_rules(ers, token, ex_route_rec, token_string[0:4], self.DEFAULT_ALTITUDE,
+                                                 self.RULES[token_string[4:5]])
             case TokenBaseType.F15_SPEED_VFR | TokenSubType.F15_SB_SPEED_ALTITUDE_NV | \
                     TokenBaseType.F15_SPEED_VFR | TokenSubType.F15_SB_SPEED_ALTITUDE_KV:
-                self.assign_speed(ex_route_rec, token_string[0:5])
-                ex_route_rec.set_flight_rules(self.RULES[token_string[5:6]])
+                self.assign_speed_altitude_rules(ers, token, ex_route_rec, token_string[0:5], self.DEFAULT_ALTITUDE,
+                                                 self.RULES[token_string[5:6]])
             case _:
-                self.assign_altitude(ers, token, ex_route_rec, "X000", False)
-                ex_route_rec.set_flight_rules(self.RULES["I"])
+                # The speed carried forward is kept
+                ex_route_rec.set_flight_state(ex_route_rec.get_flight_state().with_speed_altitude(
+                    ex_route_rec.get_speed(), ex_route_rec.get_speed_si(), "X000",
+                    self.get_level_si(ers, token, "X000"), self.RULES["I"]))
 
         # Copy the speed and altitude from the VFR record to the VFR rule change point
-        point_ex_route_rec.set_speed(ex_route_rec.get_speed())
-        point_ex_route_rec.set_speed_si(ex_route_rec.get_speed_si())
-        point_ex_route_rec.set_altitude(ex_route_rec.get_altitude())
-        point_ex_route_rec.set_altitude_si(ex_route_rec.get_altitude_si())
+        point_ex_route_rec.set_flight_state(point_ex_route_rec.get_flight_state().with_speed_altitude(
+            ex_route_rec.get_speed(), ex_route_rec.get_speed_si(),
+            ex_route_rec.get_altitude(), ex_route_rec.get_altitude_si()))
 
         token = tokens.get_next_token()
         if token is None:
@@ -878,13 +913,8 @@ class ParseF15:
                record.
         :return: None
         """
-        current_ex_route_rec = ers.get_last_element()
-        previous_ex_route_rec = ers.get_previous_to_last_element()
-        current_ex_route_rec.set_altitude(previous_ex_route_rec.get_altitude())
-        current_ex_route_rec.set_altitude_si(previous_ex_route_rec.get_altitude_si())
-        current_ex_route_rec.set_speed(previous_ex_route_rec.get_speed())
-        current_ex_route_rec.set_speed_si(previous_ex_route_rec.get_speed_si())
-        current_ex_route_rec.set_flight_rules(previous_ex_route_rec.get_flight_rules())
+        # The state is immutable and shared, carrying it forward does not copy it
+        ers.get_last_element().set_flight_state(ers.get_previous_to_last_element().get_flight_state())
 
     def cruise_climb_c(self, ers, tokens, token):
         # type: (ExtractedRouteSequence, Tokens, Token) -> None
@@ -904,65 +934,7 @@ class ParseF15:
             # Store the 'C' as a point
             self.add_record(ers, token)
             return
-        base_type = next_token.get_token_base_type()
-        match base_type:
-            case TokenBaseType.F15_UNKNOWN:
-                self.add_error_and_re_sync(ers, tokens, next_token, 3)
-            case TokenBaseType.F15_SLASH:
-                # '/' found next, assume cruise climb
-                # Next token should be a point
-                slash_token = next_token
-                next_token = tokens.get_next_token()
-                if next_token is None:
-                    # No further tokens, Store the 'C' as a point
-                    self.add_record(ers, token)
-                    # Report error, only have C/, should be more
-                    self.add_error_and_re_sync(ers, tokens, slash_token, 52)
-                    return
-                # Process the cruise climb point
-                self.cruise_climb_point(ers, tokens, next_token)
-            case TokenBaseType.F15_BREAK_START:
-                self.add_record(ers, token)
-                self.break_start(ers, tokens, next_token)
-            case TokenBaseType.F15_SPEED_VFR | TokenBaseType.F15_SPEED_ALTITUDE:
-                self.add_error_and_re_sync(ers, tokens, next_token, 5)
-            case TokenBaseType.F15_BREAK_END:
-                self.break_end_error(ers, tokens, next_token)
-            case TokenBaseType.F15_DCT:
-                self.add_record(ers, token)
-                self.dct(ers, tokens, next_token)
-            case TokenBaseType.F15_STAY:
-                self.add_record(ers, token)
-                self.stay(ers, tokens, next_token)
-            case TokenBaseType.F15_TRUNCATE:
-                self.add_record(ers, token)
-                self.truncate(ers, tokens)
-            case TokenBaseType.F15_C:
-                self.add_record(ers, token)
-                self.cruise_climb_c(ers, tokens, next_token)
-            case TokenBaseType.F15_POINT:
-                self.add_record(ers, token)
-                self.point(ers, tokens, next_token)
-            case TokenBaseType.F15_ROUTE:
-                self.add_record(ers, token)
-                self.route(ers, tokens, next_token)
-            case TokenBaseType.F15_SID_STAR:
-                self.add_record(ers, token)
-                self.sid_star(ers, tokens, next_token)
-            case TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE | TokenBaseType.F15_SPEED_ALTITUDE_PLUS:
-                self.add_error_and_re_sync(ers, tokens, next_token, 9)
-            case TokenBaseType.F15_TOO_LONG:
-                self.add_error_and_re_sync(ers, tokens, next_token, 4)
-            case TokenBaseType.F15_STAY_TIME:
-                self.add_error_and_re_sync(ers, tokens, next_token, 10)
-            case TokenBaseType.F15_SID:
-                self.add_record(ers, token)
-                self.sid(ers, tokens, next_token)
-            case TokenBaseType.F15_STAR:
-                self.add_record(ers, token)
-                self.star(ers, tokens, next_token)
-            case _:
-                self.add_error_and_re_sync(ers, tokens, token, 0)
+        self.grammar.transition(self, GrammarState.CRUISE_CLIMB_C, ers, tokens, next_token)
 
     def cruise_climb_point(self, ers, tokens, token):
         # type: (ExtractedRouteSequence, Tokens, Token) -> None
@@ -1010,6 +982,30 @@ class ParseF15:
             return
         self.point(ers, tokens, next_token)
 
+    def cruise_climb_slash(self, ers, tokens, token):
+        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        """This method processes the '/' following a 'C' token, a cruise climb element is assumed and the
+        token following the '/' should be the cruise climb point. The 'C' is not stored in the ERS unless
+        field 15 ends after the '/'.
+
+        :param ers: An ExtractedRouteSequence class instance containing the element preceding the 'C' in the last
+               ERS record.
+        :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
+               contains a tokenized form of all field 15 tokens used as input to this parser.
+        :param token: The '/' token following the 'C';
+        :return: None
+        """
+        c_token = tokens.peek_previous_token(1)
+        next_token = tokens.get_next_token()
+        if next_token is None:
+            # No further tokens, Store the 'C' as a point
+            self.add_record(ers, c_token)
+            # Report error, only have C/, should be more
+            self.add_error_and_re_sync(ers, tokens, token, 52)
+            return
+        # Process the cruise climb point
+        self.cruise_climb_point(ers, tokens, next_token)
+
     def dct(self, ers, tokens, token):
         # type: (ExtractedRouteSequence, Tokens, Token) -> None
         """This method processes a DCT element.
@@ -1025,16 +1021,7 @@ class ParseF15:
         next_token = tokens.get_next_token()
         if next_token is None:
             return
-        base_type = next_token.get_token_base_type()
-        match base_type:
-            case TokenBaseType.F15_TRUNCATE:
-                self.truncate(ers, tokens)
-            case TokenBaseType.F15_POINT:
-                self.point(ers, tokens, next_token)
-            case TokenBaseType.F15_C:
-                self.cruise_climb_c(ers, tokens, next_token)
-            case _:
-                self.add_error_and_re_sync(ers, tokens, next_token, 21)
+        self.grammar.transition(self, GrammarState.DCT, ers, tokens, next_token)
 
     def forward_slash(self, ers, tokens, token):
         # type: (ExtractedRouteSequence, Tokens, Token) -> None
@@ -1054,27 +1041,7 @@ class ParseF15:
         if next_token is None:
             self.add_error_and_re_sync(ers, tokens, token, 20)
             return
-        base_type = next_token.get_token_base_type()
-        match base_type:
-            case TokenBaseType.F15_UNKNOWN:
-                self.add_error_and_re_sync(ers, tokens, next_token, 3)
-            case TokenBaseType.F15_SLASH:
-                self.add_error_and_re_sync(ers, tokens, next_token, 16)
-            case TokenBaseType.F15_SPEED_VFR:
-                self.assign_speed_vfr(ers, tokens, next_token)
-            case TokenBaseType.F15_SPEED_ALTITUDE:
-                self.assign_speed_altitude(ers, tokens, next_token)
-            case TokenBaseType.F15_TOO_LONG:
-                self.add_error_and_re_sync(ers, tokens, next_token, 4)
-            case _:
-                # TokenBaseType.F15_BREAK_START | TokenBaseType.F15_BREAK_END |
-                # TokenBaseType.F15_DCT | TokenBaseType.F15_STAY |
-                # TokenBaseType.F15_TRUNCATE | TokenBaseType.F15_C |
-                # TokenBaseType.F15_POINT | TokenBaseType.F15_ROUTE |
-                # TokenBaseType.F15_SID_STAR | TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE |
-                # TokenBaseType.F15_SPEED_ALTITUDE_PLUS | TokenBaseType.F15_STAY_TIME |
-                # TokenBaseType.F15_SID | TokenBaseType.F15_STAR
-                self.add_error_and_re_sync(ers, tokens, next_token, 50)
+        self.grammar.transition(self, GrammarState.FORWARD_SLASH, ers, tokens, next_token)
 
     def post_adep(self, ers, tokens, token):
         # type: (ExtractedRouteSequence, Tokens, Token) -> None
@@ -1088,37 +1055,7 @@ class ParseF15:
         :param token: The first token in the tokens list.
         :return: None
         """
-        base_type = token.get_token_base_type()
-        match base_type:
-            case TokenBaseType.F15_UNKNOWN:
-                self.add_error_and_re_sync(ers, tokens, token, 3)
-            case TokenBaseType.F15_SLASH | TokenBaseType.F15_BREAK_START | \
-                    TokenBaseType.F15_SPEED_VFR | TokenBaseType.F15_SPEED_ALTITUDE | \
-                    TokenBaseType.F15_BREAK_END | TokenBaseType.F15_STAY | \
-                    TokenBaseType.F15_C:
-                self.add_error_and_re_sync(ers, tokens, token, 23)
-            case TokenBaseType.F15_DCT:
-                self.dct(ers, tokens, token)
-            case TokenBaseType.F15_TRUNCATE:
-                self.truncate(ers, tokens)
-            case TokenBaseType.F15_POINT:
-                self.point(ers, tokens, token)
-            case TokenBaseType.F15_ROUTE:
-                self.add_error_and_re_sync(ers, tokens, token, 24)
-            case TokenBaseType.F15_SID_STAR:
-                self.sid_star(ers, tokens, token)
-            case TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE | TokenBaseType.F15_SPEED_ALTITUDE_PLUS:
-                self.add_error_and_re_sync(ers, tokens, token, 9)
-            case TokenBaseType.F15_TOO_LONG:
-                self.add_error_and_re_sync(ers, tokens, token, 4)
-            case TokenBaseType.F15_STAY_TIME:
-                self.add_error_and_re_sync(ers, tokens, token, 10)
-            case TokenBaseType.F15_SID:
-                self.sid(ers, tokens, token)
-            case TokenBaseType.F15_STAR:
-                self.star(ers, tokens, token)
-            case _:
-                self.add_error_and_re_sync(ers, tokens, token, 0)
+        self.grammar.transition(self, GrammarState.POST_ADEP, ers, tokens, token)
 
     def post_point(self, ers, tokens, token):
         # type: (ExtractedRouteSequence, Tokens, Token) -> None
@@ -1130,51 +1067,7 @@ class ParseF15:
         :param token: A token being checked if it can follow an IFR point;
         :return: None
         """
-        base_type = token.get_token_base_type()
-        match base_type:
-            case TokenBaseType.F15_UNKNOWN:
-                self.add_error_and_re_sync(ers, tokens, token, 3)
-            case TokenBaseType.F15_SLASH:
-                self.forward_slash(ers, tokens, token)
-            case TokenBaseType.F15_BREAK_START:
-                self.break_start(ers, tokens, token)
-            case TokenBaseType.F15_SPEED_VFR | TokenBaseType.F15_SPEED_ALTITUDE:
-                self.add_error_and_re_sync(ers, tokens, token, 5)
-            case TokenBaseType.F15_BREAK_END:
-                self.break_end_error(ers, tokens, token)
-            case TokenBaseType.F15_DCT:
-                self.dct(ers, tokens, token)
-            case TokenBaseType.F15_STAY:
-                self.stay(ers, tokens, token)
-            case TokenBaseType.F15_TRUNCATE:
-                self.truncate(ers, tokens)
-            case TokenBaseType.F15_C:
-                self.cruise_climb_c(ers, tokens, token)
-            case TokenBaseType.F15_POINT:
-                self.point(ers, tokens, token)
-            case TokenBaseType.F15_ROUTE:
-                last_ers_rec = ers.get_last_element()
-                sub_type = last_ers_rec.get_sub_type()
-                if sub_type == TokenSubType.F15_SB_PRP_BD or sub_type == TokenSubType.F15_SB_LL_DEG or \
-                   sub_type == TokenSubType.F15_SB_LL_MIN or sub_type == TokenSubType.F15_SB_LLBD_DEG or \
-                   sub_type == TokenSubType.F15_SB_LLBD_MIN:
-                    self.add_error_and_re_sync(ers, tokens, token, 47)
-                else:
-                    self.route(ers, tokens, token)
-            case TokenBaseType.F15_SID_STAR:
-                self.sid_star(ers, tokens, token)
-            case TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE | TokenBaseType.F15_SPEED_ALTITUDE_PLUS:
-                self.add_error_and_re_sync(ers, tokens, token, 9)
-            case TokenBaseType.F15_TOO_LONG:
-                self.add_error_and_re_sync(ers, tokens, token, 4)
-            case TokenBaseType.F15_STAY_TIME:
-                self.add_error_and_re_sync(ers, tokens, token, 10)
-            case TokenBaseType.F15_SID:
-                self.sid(ers, tokens, token)
-            case TokenBaseType.F15_STAR:
-                self.star(ers, tokens, token)
-            case _:
-                self.add_error_and_re_sync(ers, tokens, token, 0)
+        self.grammar.transition(self, GrammarState.POST_POINT, ers, tokens, token)
 
     def post_sid(self, ers, tokens):
         # type: (ExtractedRouteSequence, Tokens) -> None
@@ -1189,30 +1082,7 @@ class ParseF15:
         next_token = tokens.get_next_token()
         if next_token is None:
             return
-        base_type = next_token.get_token_base_type()
-        match base_type:
-            case TokenBaseType.F15_TRUNCATE:
-                self.truncate(ers, tokens)
-            case TokenBaseType.F15_POINT:
-                self.point(ers, tokens, next_token)
-            case TokenBaseType.F15_ROUTE:
-                self.route(ers, tokens, next_token)
-            case TokenBaseType.F15_SID_STAR:
-                self.sid_star(ers, tokens, next_token)
-            case TokenBaseType.F15_TOO_LONG:
-                self.add_error_and_re_sync(ers, tokens, next_token, 4)
-            case TokenBaseType.F15_SID:
-                self.add_error_and_re_sync(ers, tokens, next_token, 32)
-            case TokenBaseType.F15_STAR:
-                self.star(ers, tokens, next_token)
-            case _:
-                # TokenBaseType.F15_UNKNOWN | TokenBaseType.F15_SLASH |
-                # TokenBaseType.F15_BREAK_START | TokenBaseType.F15_SPEED_VFR |
-                # TokenBaseType.F15_SPEED_ALTITUDE | TokenBaseType.F15_BREAK_END |
-                # TokenBaseType.F15_DCT | TokenBaseType.F15_STAY |
-                # TokenBaseType.F15_C | TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE |
-                # TokenBaseType.F15_SPEED_ALTITUDE_PLUS | TokenBaseType.F15_STAY_TIME:
-                self.add_error_and_re_sync(ers, tokens, next_token, 31)
+        self.grammar.transition(self, GrammarState.POST_SID, ers, tokens, next_token)
 
     def point(self, ers, tokens, token):
         # type: (ExtractedRouteSequence, Tokens, Token) -> None
@@ -1240,6 +1110,25 @@ class ParseF15:
 
         self.post_point(ers, tokens, next_token)
 
+    def point_after_route(self, ers, tokens, token):
+        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        """This method processes a point element following an ATS route. A Lat/Long or bearing distance point
+        cannot follow an ATS route, an error is reported for such points but the point is processed as any
+        other point.
+
+        :param ers: An ExtractedRouteSequence class instance containing an ATS route record in the last ERS record.
+        :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
+               contains a tokenized form of all field 15 tokens used as input to this parser.
+        :param token: A point token following an ATS route;
+        :return: None
+        """
+        sub_type = token.get_token_sub_type()
+        if sub_type == TokenSubType.F15_SB_PRP_BD or sub_type == TokenSubType.F15_SB_LL_DEG or \
+            sub_type == TokenSubType.F15_SB_LL_MIN or sub_type == TokenSubType.F15_SB_LLBD_DEG or \
+                sub_type == TokenSubType.F15_SB_LLBD_MIN:
+            self.add_error_and_re_sync(ers, tokens, token, 48)
+        self.point(ers, tokens, token)
+
     def resolve_real_bd_point(self, ers, ex_route_rec, bearing, distance):
         # type: (ExtractedRouteSequence, ExtractedRouteRecord, float, float) -> None
         """This method calculates the coordinates for a point given by a Lat / Long / Bearing / Distance
@@ -1273,68 +1162,27 @@ class ParseF15:
         token = tokens.get_next_token()
         if token is None:
             return
-        base_type = token.get_token_base_type()
-        match base_type:
-            case TokenBaseType.F15_UNKNOWN:
-                self.add_error_and_re_sync(ers, tokens, token, 3)
-            case TokenBaseType.F15_SLASH:
-                # Skip the '/' token, only interested in what follows
-                next_token = tokens.get_next_token()
-                if next_token is None:
-                    # Field 15 cannot end with a '/'
-                    self.add_error_and_re_sync(ers, tokens, token, 25)
-                    return
-                next_base_type = next_token.get_token_base_type()
-                match next_base_type:
-                    case TokenBaseType.F15_SPEED_VFR:
-                        self.assign_speed_vfr(ers, tokens, next_token)
-                    case TokenBaseType.F15_POINT:
-                        self.point(ers, tokens, next_token)
-                    case TokenBaseType.F15_SPEED_ALTITUDE:
-                        self.assign_speed_altitude(ers, tokens, next_token)
-                    case TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE:
-                        self.assign_speed_altitude_altitude(ers, tokens, next_token)
-                    case TokenBaseType.F15_SPEED_ALTITUDE_PLUS:
-                        self.assign_speed_altitude_plus(ers, tokens, next_token)
-                    case _:
-                        self.add_error_and_re_sync(ers, tokens, next_token, 11)
-            case TokenBaseType.F15_BREAK_START:
-                self.break_start(ers, tokens, token)
-            case TokenBaseType.F15_SPEED_VFR:
-                self.assign_speed_vfr(ers, tokens, token)
-            case TokenBaseType.F15_BREAK_END:
-                self.break_end(ers, tokens, token)
-            case TokenBaseType.F15_DCT:
-                self.dct(ers, tokens, token)
-            case TokenBaseType.F15_STAY:
-                self.stay(ers, tokens, token)
-            case TokenBaseType.F15_TRUNCATE:
-                self.truncate(ers, tokens)
-            case TokenBaseType.F15_C:
-                self.cruise_climb_c(ers, tokens, token)
-            case TokenBaseType.F15_POINT:
-                self.point(ers, tokens, token)
-            case TokenBaseType.F15_ROUTE:
-                self.route(ers, tokens, token)
-            case TokenBaseType.F15_SID_STAR:
-                self.sid_star(ers, tokens, token)
-            case TokenBaseType.F15_SPEED_ALTITUDE:
-                self.assign_speed_altitude(ers, tokens, token)
-            case TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE:
-                self.assign_speed_altitude_altitude(ers, tokens, token)
-            case TokenBaseType.F15_SPEED_ALTITUDE_PLUS:
-                self.assign_speed_altitude_plus(ers, tokens, token)
-            case TokenBaseType.F15_TOO_LONG:
-                self.add_error_and_re_sync(ers, tokens, token, 4)
-            case TokenBaseType.F15_STAY_TIME:
-                self.add_error_and_re_sync(ers, tokens, token, 10)
-            case TokenBaseType.F15_SID:
-                self.sid(ers, tokens, token)
-            case TokenBaseType.F15_STAR:
-                self.star(ers, tokens, token)
-            case _:
-                # In theory this should never happen
-                self.add_error_and_re_sync(ers, tokens, token, 0)
+        self.grammar.transition(self, GrammarState.RE_SYNC, ers, tokens, token)
+
+    def re_sync_forward_slash(self, ers, tokens, token):
+        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        """This method re-synchronizes the parser on a '/' token found after an error. The '/' is skipped,
+        parsing continues with the token following it.
+
+        :param ers: An ExtractedRouteSequence class instance containing an erroneous element record in
+               the last ERS record.
+        :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
+               contains a tokenized form of all field 15 tokens used as input to this parser.
+        :param token: The '/' token;
+        :return: None
+        """
+        # Skip the '/' token, only interested in what follows
+        next_token = tokens.get_next_token()
+        if next_token is None:
+            # Field 15 cannot end with a '/'
+            self.add_error_and_re_sync(ers, tokens, token, 25)
+            return
+        self.grammar.transition(self, GrammarState.RE_SYNC_SLASH, ers, tokens, next_token)
 
     def route(self, ers, tokens, token):
         # type: (ExtractedRouteSequence, Tokens, Token) -> None
@@ -1352,50 +1200,26 @@ class ParseF15:
         next_token = tokens.get_next_token()
         if next_token is None:
             return
-        base_type = next_token.get_token_base_type()
-        match base_type:
-            case TokenBaseType.F15_UNKNOWN:
-                self.add_error_and_re_sync(ers, tokens, next_token, 3)
-            case TokenBaseType.F15_SLASH:
-                self.add_error_and_re_sync(ers, tokens, next_token, 12)
-            case TokenBaseType.F15_BREAK_START:
-                self.add_error_and_re_sync(ers, tokens, next_token, 13)
-            case TokenBaseType.F15_SPEED_VFR:
-                self.add_error_and_re_sync(ers, tokens, next_token, 13)
-            case TokenBaseType.F15_SPEED_ALTITUDE:
-                self.add_error_and_re_sync(ers, tokens, next_token, 55)
-            case TokenBaseType.F15_BREAK_END:
-                self.break_end_error(ers, tokens, next_token)
-            case TokenBaseType.F15_DCT:
-                self.add_error_and_re_sync(ers, tokens, next_token, 14)
-            case TokenBaseType.F15_STAY:
-                self.add_error_and_re_sync(ers, tokens, next_token, 15)
-            case TokenBaseType.F15_TRUNCATE:
-                self.truncate(ers, tokens)
-            case TokenBaseType.F15_C:
-                self.cruise_climb_c(ers, tokens, next_token)
-            case TokenBaseType.F15_POINT:
-                # A Lat/Long point cannot follow an ATS route
-                sub_type = next_token.get_token_sub_type()
-                if sub_type == TokenSubType.F15_SB_PRP_BD or sub_type == TokenSubType.F15_SB_LL_DEG or \
-                    sub_type == TokenSubType.F15_SB_LL_MIN or sub_type == TokenSubType.F15_SB_LLBD_DEG or \
-                        sub_type == TokenSubType.F15_SB_LLBD_MIN:
-                    self.add_error_and_re_sync(ers, tokens, next_token, 48)
-                self.point(ers, tokens, next_token)
-            case TokenBaseType.F15_ROUTE:
-                self.add_error_and_re_sync(ers, tokens, next_token, 53)
-            case TokenBaseType.F15_SID_STAR | TokenBaseType.F15_STAR:
-                self.add_error_and_re_sync(ers, tokens, next_token, 54)
-            case TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE | TokenBaseType.F15_SPEED_ALTITUDE_PLUS:
-                self.add_error_and_re_sync(ers, tokens, next_token, 9)
-            case TokenBaseType.F15_TOO_LONG:
-                self.add_error_and_re_sync(ers, tokens, next_token, 4)
-            case TokenBaseType.F15_STAY_TIME:
-                self.add_error_and_re_sync(ers, tokens, next_token, 10)
-            case TokenBaseType.F15_SID:
-                self.add_error_and_re_sync(ers, tokens, next_token, 30)
-            case _:
-                self.add_error_and_re_sync(ers, tokens, next_token, 0)
+        self.grammar.transition(self, GrammarState.ROUTE, ers, tokens, next_token)
+
+    def route_after_point(self, ers, tokens, token):
+        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        """This method processes an ATS route element following a point. An ATS route cannot follow a Lat/Long
+        or bearing distance point, an error is reported in such a case.
+
+        :param ers: An ExtractedRouteSequence class instance containing a point record in the last ERS record.
+        :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
+               contains a tokenized form of all field 15 tokens used as input to this parser.
+        :param token: An ATS route token following a point;
+        :return: None
+        """
+        sub_type = ers.get_last_element().get_sub_type()
+        if sub_type == TokenSubType.F15_SB_PRP_BD or sub_type == TokenSubType.F15_SB_LL_DEG or \
+           sub_type == TokenSubType.F15_SB_LL_MIN or sub_type == TokenSubType.F15_SB_LLBD_DEG or \
+           sub_type == TokenSubType.F15_SB_LLBD_MIN:
+            self.add_error_and_re_sync(ers, tokens, token, 47)
+        else:
+            self.route(ers, tokens, token)
 
     @staticmethod
     def set_azimuth_and_distance(point_1, point_2):
@@ -1569,41 +1393,10 @@ class ParseF15:
             return
 
         # Determine the next node
-        base_type = next_token.get_token_base_type()
-        match base_type:
-            case TokenBaseType.F15_UNKNOWN:
-                self.add_error_and_re_sync(ers, tokens, next_token, 3)
-            case TokenBaseType.F15_BREAK_START:
-                self.break_start(ers, tokens, next_token)
-            case TokenBaseType.F15_BREAK_END:
-                self.break_end_error(ers, tokens, next_token)
-            case TokenBaseType.F15_DCT:
-                self.dct(ers, tokens, next_token)
-            case TokenBaseType.F15_TRUNCATE:
-                self.truncate(ers, tokens)
-            case TokenBaseType.F15_C:
-                self.cruise_climb_c(ers, tokens, next_token)
-            case TokenBaseType.F15_POINT:
-                self.point(ers, tokens, next_token)
-            case TokenBaseType.F15_ROUTE:
-                self.route(ers, tokens, next_token)
-            case TokenBaseType.F15_SID_STAR:
-                self.sid_star(ers, tokens, next_token)
-            case TokenBaseType.F15_TOO_LONG:
-                self.add_error_and_re_sync(ers, tokens, next_token, 4)
-            case TokenBaseType.F15_SID:
-                self.sid(ers, tokens, next_token)
-            case TokenBaseType.F15_STAR:
-                self.star(ers, tokens, next_token)
-            case _:
-                # TokenBaseType.F15_SLASH | TokenBaseType.F15_SPEED_VFR |
-                # TokenBaseType.F15_SPEED_ALTITUDE | TokenBaseType.F15_STAY |
-                # TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE | TokenBaseType.F15_SPEED_ALTITUDE_PLUS |
-                # TokenBaseType.F15_STAY_TIME
-                self.add_error_and_re_sync(ers, tokens, next_token, 39)
+        self.grammar.transition(self, GrammarState.STAY_TIME, ers, tokens, next_token)
 
-    def truncate(self, ers, tokens):
-        # type: (ExtractedRouteSequence, Tokens) -> None
+    def truncate(self, ers, tokens, token=None):
+        # type: (ExtractedRouteSequence, Tokens, Token) -> None
         """This method processes the 'T' truncate field 15 token. The 'T' character indicates that the
         field 15 has been truncated. No elements should occur after this element. The 'T' is not saved
         to the ERS. If there are any other tokens following the 'T' an error is reported.
@@ -1612,6 +1405,7 @@ class ParseF15:
                irrespective of its type.
         :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
                contains a tokenized form of all field 15 tokens used as input to this parser.
+        :param token: The 'T' token, not used;
         :return: A token being processed to determine if field 15 is being correctly truncated;
         """
         next_token = tokens.get_next_token()
@@ -1687,20 +1481,54 @@ class ParseF15:
         self.assign_speed_vfr(ers, tokens, token)
 
     @staticmethod
-    def assign_syntax_descriptions(tokens):
-        # type: (Tokens) -> None
+    def assign_syntax_descriptions(tokens, intern_pool=None):
+        # type: (Tokens, TokenInternPool) -> None
         """ This method loops over all the tokens produced by the Tokenizer and assigns a token base and
         subtype to each token. The type definitions are obtained from the definitions in the
-        'F15TokenSyntaxDescriptions' class.
+        'F15TokenSyntaxDescriptions' class, through the classification cache of an intern pool.
         :param tokens: The tokens being looped over having their base and subtypes assigned;
+        :param intern_pool: The pool caching token classifications, the shared pool if None;
         :return: None
         """
-        f15tsa = F15TokenSyntaxDefinition()
+        if intern_pool is None:
+            intern_pool = TokenInternPool.get_shared_pool()
         for token in tokens.get_tokens():
             token_string = token.get_token_string()
-            result = f15tsa.get_token_type(token_string)
+            result = intern_pool.get_token_type(token_string)
             token.set_token_base_type(result[F15TokenSyntaxDefinition.TOKEN_BASE_IDENTIFIER_IDX])
             token.set_token_sub_type(result[F15TokenSyntaxDefinition.TOKEN_SUBTYPE_IDENTIFIER_IDX])
             if len(token_string) > F15TokenSyntaxDefinition.MAX_TOKEN_LENGTH:
                 token.set_token_base_type(TokenBaseType.F15_TOO_LONG)
                 token.set_token_sub_type(TokenSubType.F15_SB_UNKNOWN)
+
+    @staticmethod
+    def assign_batch_syntax_descriptions(token_lists, intern_pool=None):
+        # type: ([Tokens], TokenInternPool) -> int
+        """ This method assigns a token base and subtype to all tokens of a batch of messages, as
+        assign_syntax_descriptions() does for each message. The distinct token strings of the whole batch are
+        collected first and each is classified once, the results are then assigned to every token with that
+        string, so the classification cost grows with the vocabulary of the batch rather than its number of
+        tokens. The messages are parsed afterwards with parse_f15(ers, tokens, classify=False).
+        :param token_lists: The tokens of each message in the batch, Tokens or TokenCursor instances;
+        :param intern_pool: The pool caching token classifications, the shared pool if None;
+        :return: The number of distinct token strings classified;
+        """
+        if intern_pool is None:
+            intern_pool = TokenInternPool.get_shared_pool()
+        token_types = {}
+        for tokens in token_lists:
+            for token in tokens.get_tokens():
+                token_types[token.get_token_string()] = None
+        for token_string in token_types:
+            if len(token_string) > F15TokenSyntaxDefinition.MAX_TOKEN_LENGTH:
+                token_types[token_string] = (TokenBaseType.F15_TOO_LONG, TokenSubType.F15_SB_UNKNOWN)
+            else:
+                result = intern_pool.get_token_type(token_string)
+                token_types[token_string] = (result[F15TokenSyntaxDefinition.TOKEN_BASE_IDENTIFIER_IDX],
+                                             result[F15TokenSyntaxDefinition.TOKEN_SUBTYPE_IDENTIFIER_IDX])
+        for tokens in token_lists:
+            for token in tokens.get_tokens():
+                base_type, sub_type = token_types[token.get_token_string()]
+                token.set_token_base_type(base_type)
+                token.set_token_sub_type(sub_type)
+        return len(token_types)
@@ -0,0 +1,214 @@
+import threading
+import time
+
+from Tokenizer.Token import Token
+
+
+class F15ParseProfiler:
+    """This class profiles the grammar handlers of a ParseF15 instance, e.g. post_adep(), post_point(), point(),
+    route() or break_text_save(). Each handler calls the handler for the next token through 'self', directly or
+    through the grammar table which looks the handler up on the parser, so attaching a profiler to a parser
+    instance shadows each handler with an instance attribute that times the call and then calls the class method.
+    A parser without a profiler attached runs unchanged and pays nothing.
+
+    For each handler the number of calls, the inclusive time (including the handlers it called) and the
+    exclusive time (excluding them) are accumulated. Handlers call each other recursively along the route, the
+    inclusive time of a call made while the same handler is already active is not added again so that
+    inclusive times do not exceed the total parse time. For each transition, a handler (the state) calling another
+    handler for a token of a given base type, the number of calls and the inclusive time of the called handler
+    are accumulated. The exclusive time is also accumulated per call stack and can be written as folded stacks,
+    one line per stack such as 'parse_f15;assign_speed_altitude;post_adep;point 125', the format read by
+    flame graph tools. Times are in microseconds.
+
+    The call stack is kept per thread so a profiled parser may be shared between threads, the totals are
+    updated under a lock."""
+
+    ROOT_STATE: str = "-"
+    """The state of a transition into a handler called from outside the parser"""
+
+    NO_TOKEN: str = "-"
+    """The base type of a transition into a handler called without a token"""
+
+    handlers: {} = None
+    """A handler name mapped to a three element list: the number of calls, the inclusive and the exclusive time
+    in nanoseconds"""
+
+    transitions: {} = None
+    """A (state, token base type name, handler name) tuple mapped to a two element list: the number of calls and
+    the inclusive time of the handler in nanoseconds"""
+
+    stacks: {} = None
+    """A call stack, a tuple of handler names, mapped to the exclusive time of its last handler in nanoseconds"""
+
+    lock: threading.Lock = None
+    """The lock protecting the totals"""
+
+    local: threading.local = None
+    """Thread local storage holding the call stack of each thread in the attribute 'frames', a list of three
+    element lists: the handler name, the start time and the inclusive time of the handlers called so far"""
+
+    def __init__(self):
+        # type: () -> None
+        """Constructor.
+
+            :return: None"""
+        self.handlers = {}
+        self.transitions = {}
+        self.stacks = {}
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    def attach(self, parser):
+        # type: (ParseF15) -> None
+        """Starts profiling a parser instance by shadowing all of its public methods.
+
+            :param parser: The ParseF15 instance to profile;
+            :return: None"""
+        for name in dir(type(parser)):
+            if name.startswith("_"):
+                continue
+            method = getattr(parser, name)
+            if callable(method):
+                setattr(parser, name, self.__wrap(name, method))
+
+    def detach(self, parser):
+        # type: (ParseF15) -> None
+        """Stops profiling a parser instance, the accumulated totals are kept.
+
+            :param parser: The ParseF15 instance profiled;
+            :return: None"""
+        for name in list(vars(parser)):
+            if getattr(vars(parser)[name], "f15_profiler", None) is self:
+                delattr(parser, name)
+
+    def get_handler_statistics(self):
+        # type: () -> [(str, int, float, float)]
+        """Gets the totals for each handler, the handlers with the highest exclusive time first.
+
+            :return: A list of (handler name, calls, inclusive time, exclusive time) tuples, times in
+                     microseconds;"""
+        with self.lock:
+            result = [(name, total[0], total[1] / 1000.0, total[2] / 1000.0)
+                      for name, total in self.handlers.items()]
+        return sorted(result, key=lambda item: (-item[3], item[0]))
+
+    def get_transition_statistics(self):
+        # type: () -> [(str, str, str, int, float)]
+        """Gets the totals for each transition, the transitions with the highest inclusive time first.
+
+            :return: A list of (state, token base type name, handler name, calls, inclusive time) tuples,
+                     the time in microseconds;"""
+        with self.lock:
+            result = [key + (total[0], total[1] / 1000.0) for key, total in self.transitions.items()]
+        return sorted(result, key=lambda item: (-item[4], item[0:3]))
+
+    def get_folded_stacks(self):
+        # type: () -> [str]
+        """Gets the exclusive time of each call stack in the folded stack format read by flame graph tools.
+
+            :return: A list of lines, each the handler names of a stack separated by ';', a space and the
+                     exclusive time in whole microseconds, stacks of less than one microsecond are omitted;"""
+        with self.lock:
+            stacks = sorted(self.stacks.items())
+        return [";".join(stack) + " " + str(exclusive // 1000) for stack, exclusive in stacks if exclusive >= 1000]
+
+    def write_folded_stacks(self, file_name):
+        # type: (str) -> None
+        """Writes the folded stacks to a file, see get_folded_stacks().
+
+            :param file_name: The name of the file to write;
+            :return: None"""
+        with open(file_name, "w", encoding="utf-8") as file:
+            for line in self.get_folded_stacks():
+                file.write(line + "\n")
+
+    def get_report(self, limit=20):
+        # type: (int) -> str
+        """Gets a text report of the handlers and transitions with the highest times.
+
+            :param limit: The maximum number of handlers and of transitions reported;
+            :return: The report;"""
+        lines = ["{0:<40}{1:>10}{2:>16}{3:>16}".format("Handler", "Calls", "Inclusive us", "Exclusive us")]
+        for name, calls, inclusive, exclusive in self.get_handler_statistics()[0:limit]:
+            lines.append("{0:<40}{1:>10}{2:>16.1f}{3:>16.1f}".format(name, calls, inclusive, exclusive))
+        lines.append("")
+        lines.append("{0:<80}{1:>10}{2:>16}".format("State -> handler [token base type]", "Calls", "Inclusive us"))
+        for state, base_type, name, calls, inclusive in self.get_transition_statistics()[0:limit]:
+            lines.append("{0:<80}{1:>10}{2:>16.1f}".format(state + " -> " + name + " [" + base_type + "]", calls,
+                                                            inclusive))
+        return "\n".join(lines)
+
+    def clear(self):
+        # type: () -> None
+        """Resets all totals.
+
+            :return: None"""
+        with self.lock:
+            self.handlers = {}
+            self.transitions = {}
+            self.stacks = {}
+
+    def __wrap(self, name, method):
+        # type: (str, Callable) -> Callable
+        """Creates the profiling replacement of a handler.
+
+            :param name: The handler name;
+            :param method: The bound handler method;
+            :return: A function timing each call and calling the handler;"""
+        profiler = self
+
+        def profiled(*args):
+            frames = getattr(profiler.local, "frames", None)
+            if frames is None:
+                frames = profiler.local.frames = []
+            frame = [name, time.perf_counter_ns(), 0]
+            frames.append(frame)
+            try:
+                return method(*args)
+            finally:
+                inclusive = time.perf_counter_ns() - frame[1]
+                frames.pop()
+                stack = tuple(item[0] for item in frames) + (name,)
+                state = frames[-1][0] if len(frames) > 0 else profiler.ROOT_STATE
+                if len(frames) > 0:
+                    frames[-1][2] = frames[-1][2] + inclusive
+                # The outermost active call of a recursive handler already includes this call
+                recursive = name in stack[0:-1]
+                profiler.__add(name, state, profiler.__get_base_type_name(args), stack,
+                               0 if recursive else inclusive, inclusive - frame[2])
+
+        profiled.f15_profiler = self
+        return profiled
+
+    def __add(self, name, state, base_type_name, stack, inclusive, exclusive):
+        # type: (str, str, str, (str,), int, int) -> None
+        """Adds a handler call to the totals.
+
+            :param name: The handler name;
+            :param state: The name of the calling handler;
+            :param base_type_name: The name of the base type of the token passed to the handler;
+            :param stack: The call stack ending with the handler;
+            :param inclusive: The inclusive time in nanoseconds, zero for a recursive call;
+            :param exclusive: The exclusive time in nanoseconds;
+            :return: None"""
+        with self.lock:
+            total = self.handlers.setdefault(name, [0, 0, 0])
+            total[0] = total[0] + 1
+            total[1] = total[1] + inclusive
+            total[2] = total[2] + exclusive
+            total = self.transitions.setdefault((state, base_type_name, name), [0, 0])
+            total[0] = total[0] + 1
+            total[1] = total[1] + inclusive
+            self.stacks[stack] = self.stacks.get(stack, 0) + exclusive
+
+    @staticmethod
+    def __get_base_type_name(args):
+        # type: (()) -> str
+        """Gets the base type of the token a handler was called for.
+
+            :param args: The handler arguments;
+            :return: The name of the base type of the first token argument, NO_TOKEN if there is none;"""
+        for arg in args:
+            if isinstance(arg, Token):
+                return getattr(arg.get_token_base_type(), "name", F15ParseProfiler.NO_TOKEN)
+        return F15ParseProfiler.NO_TOKEN
@@ -161,6 +161,10 @@ class F15TokenSyntaxDefinition:
     MAX_TOKEN_LENGTH: int = 25
     """Maximum length of a single token"""
 
+    classifier = None
+    """All regular expressions in F15_SB_CONFIGURATION compiled into a single regular expression on first use,
+    see get_classifier()"""
+
     F15_SB_CONFIGURATION: [str, TokenBaseType, TokenSubType] = list([
         # Regular expression, base type ID, subtype ID...
         # FIXED Text types
@@ -379,6 +383,18 @@ class F15TokenSyntaxDefinition:
         ["K[0-9]{4}M[0-9]{4}PLUS", TokenBaseType.F15_SPEED_ALTITUDE_PLUS, TokenSubType.F15_SB_SPEED_ALTITUDE_KM_P]
     ])
 
+    def __init__(self, configuration=None):
+        # type: ([[str, TokenBaseType, TokenSubType]]) -> None
+        """Constructor.
+
+        :param configuration: Token descriptions used instead of F15_SB_CONFIGURATION, e.g. those of a field 15
+               dialect, None to use F15_SB_CONFIGURATION; the classifier of the descriptions is compiled here;
+        :return: None
+        """
+        if configuration is not None:
+            self.F15_SB_CONFIGURATION = configuration
+            self.classifier = F15TokenSyntaxDefinition.compile_classifier(configuration)
+
     def get_token_type(self, token_string=""):
         # type: (str) -> [str, TokenBaseType, TokenSubType]
         """Gets and returns a record from all token descriptions for a given token passed in as the
@@ -391,10 +407,39 @@ class F15TokenSyntaxDefinition:
                is a field 15 element such as a point, or route element etc.
         :return: A list containing a single 'record' from the F15_SB_CONFIGURATION base and subtype definitions.
         """
-        for item in self.F15_SB_CONFIGURATION:
-            if re.fullmatch(item[self.TOKEN_REGEXP_IDX], token_string):
-                return item
-        return ["", TokenBaseType.F15_UNKNOWN, TokenSubType.F15_SB_UNKNOWN]
+        classifier = self.classifier
+        if classifier is None:
+            classifier = F15TokenSyntaxDefinition.get_classifier()
+        match = classifier.fullmatch(token_string)
+        if match is None:
+            return ["", TokenBaseType.F15_UNKNOWN, TokenSubType.F15_SB_UNKNOWN]
+        return self.F15_SB_CONFIGURATION[int(match.lastgroup[1:])]
+
+    @staticmethod
+    def get_classifier():
+        # type: () -> re.Pattern
+        """Gets the classifier, a single regular expression combining all regular expressions in
+        F15_SB_CONFIGURATION as alternatives in table order. Alternative 'n' is the named group 'tn', a
+        full match tries the alternatives in order and the name of the outermost group matched identifies
+        the first record matching the whole token, as when matching each regular expression in turn.
+        The classifier is compiled on first use, the re module's cache covers compiling it again.
+        :return: The compiled classifier;
+        """
+        if F15TokenSyntaxDefinition.classifier is None:
+            F15TokenSyntaxDefinition.classifier = F15TokenSyntaxDefinition.compile_classifier(
+                F15TokenSyntaxDefinition.F15_SB_CONFIGURATION)
+        return F15TokenSyntaxDefinition.classifier
+
+    @staticmethod
+    def compile_classifier(configuration):
+        # type: ([[str, TokenBaseType, TokenSubType]]) -> re.Pattern
+        """Compiles the classifier of a list of token descriptions, see get_classifier().
+        :param configuration: The token descriptions, in the format of F15_SB_CONFIGURATION;
+        :return: The compiled classifier;
+        """
+        return re.compile("|".join(
+            "(?P<t{0}>{1})".format(idx, item[F15TokenSyntaxDefinition.TOKEN_REGEXP_IDX])
+            for idx, item in enumerate(configuration)))
 
     def print_descriptions(self):
         # type: () -> None
@@ -0,0 +1,144 @@
+class FlightState:
+    """This class holds the speed, altitude and flight rules in force at a route element. Most consecutive
+    elements of a route share the same state, so states are immutable and interned: every ERS record refers
+    to a shared instance and carrying the state forward to a new record is a single reference assignment.
+    A new state is only looked up when a speed/altitude element or a flight rule change modifies it.
+
+    Instances must only be created with get_state() or the with_* methods and are never modified."""
+
+    __slots__ = ("altitude", "altitude_si", "speed", "speed_si", "flight_rules")
+
+    MAX_INTERNED_STATES: int = 65536
+    """Once this many distinct states are interned further states are created without being interned, this
+    bounds the memory used when parsing many unrelated routes"""
+
+    interned_states: {} = {}
+    """All interned states keyed by their values (and the value types so that 3048 and 3048.0 differ)"""
+
+    INITIAL = None
+    """The state of a record that has not been assigned a speed, altitude or flight rules"""
+
+    altitude: str
+    """The altitude as extracted from a field 15 altitude element"""
+
+    altitude_si: float
+    """The altitude converted into SI units in meters"""
+
+    speed: str
+    """The speed as extracted from a field 15 altitude element"""
+
+    speed_si: float
+    """The speed converted into SI units in meters / second"""
+
+    flight_rules: str
+    """Flight rules at given route elements"""
+
+    def __init__(self, altitude, altitude_si, speed, speed_si, flight_rules):
+        # type: (str, float, str, float, str) -> None
+        """Creates a state, use get_state() instead to obtain an interned state.
+
+            :param altitude: The altitude as given in field 15, e.g. F350;
+            :param altitude_si: The altitude in meters;
+            :param speed: The speed as given in field 15, e.g. N0450;
+            :param speed_si: The speed in meters / second;
+            :param flight_rules: The flight rules, e.g. IFR;
+            :return: None"""
+        object.__setattr__(self, "altitude", altitude)
+        object.__setattr__(self, "altitude_si", altitude_si)
+        object.__setattr__(self, "speed", speed)
+        object.__setattr__(self, "speed_si", speed_si)
+        object.__setattr__(self, "flight_rules", flight_rules)
+
+    def __setattr__(self, name, value):
+        # type: (str, object) -> None
+        """States are shared between records and cannot be modified.
+
+            :raise AttributeError: Always;"""
+        raise AttributeError("FlightState is immutable")
+
+    def __reduce__(self):
+        # type: () -> ()
+        """States are pickled by value and interned again when unpickled, e.g. when an ERS is returned
+        from another process.
+
+            :return: The function and arguments recreating this state;"""
+        return FlightState.get_state, (self.altitude, self.altitude_si, self.speed, self.speed_si, self.flight_rules)
+
+    @staticmethod
+    def get_state(altitude="", altitude_si=0.0, speed="", speed_si=0.0, flight_rules=""):
+        # type: (str, float, str, float, str) -> FlightState
+        """Gets the interned state with the given values, creating it if it does not exist.
+
+            :param altitude: The altitude as given in field 15, e.g. F350;
+            :param altitude_si: The altitude in meters;
+            :param speed: The speed as given in field 15, e.g. N0450;
+            :param speed_si: The speed in meters / second;
+            :param flight_rules: The flight rules, e.g. IFR;
+            :return: The shared state instance;"""
+        key = (altitude, altitude_si, speed, speed_si, flight_rules, type(altitude_si), type(speed_si))
+        state = FlightState.interned_states.get(key)
+        if state is None:
+            state = FlightState(altitude, altitude_si, speed, speed_si, flight_rules)
+            if len(FlightState.interned_states) < FlightState.MAX_INTERNED_STATES:
+                state = FlightState.interned_states.setdefault(key, state)
+        return state
+
+    def with_altitude(self, altitude):
+        # type: (str) -> FlightState
+        """Gets the state that differs from this state by its altitude.
+
+            :param altitude: The altitude as given in field 15, e.g. F350;
+            :return: The shared state instance;"""
+        return FlightState.get_state(altitude, self.altitude_si, self.speed, self.speed_si, self.flight_rules)
+
+    def with_altitude_si(self, altitude_si):
+        # type: (float) -> FlightState
+        """Gets the state that differs from this state by its altitude in SI units.
+
+            :param altitude_si: The altitude in meters;
+            :return: The shared state instance;"""
+        return FlightState.get_state(self.altitude, altitude_si, self.speed, self.speed_si, self.flight_rules)
+
+    def with_speed(self, speed):
+        # type: (str) -> FlightState
+        """Gets the state that differs from this state by its speed.
+
+            :param speed: The speed as given in field 15, e.g. N0450;
+            :return: The shared state instance;"""
+        return FlightState.get_state(self.altitude, self.altitude_si, speed, self.speed_si, self.flight_rules)
+
+    def with_speed_si(self, speed_si):
+        # type: (float) -> FlightState
+        """Gets the state that differs from this state by its speed in SI units.
+
+            :param speed_si: The speed in meters / second;
+            :return: The shared state instance;"""
+        return FlightState.get_state(self.altitude, self.altitude_si, self.speed, speed_si, self.flight_rules)
+
+    def with_flight_rules(self, flight_rules):
+        # type: (str) -> FlightState
+        """Gets the state that differs from this state by its flight rules.
+
+            :param flight_rules: The flight rules, e.g. IFR;
+            :return: The shared state instance;"""
+        return FlightState.get_state(self.altitude, self.altitude_si, self.speed, self.speed_si, flight_rules)
+
+    def with_speed_altitude(self, speed, speed_si, altitude, altitude_si, flight_rules=None):
+        # type: (str, float, str, float, str) -> FlightState
+        """Gets the state that differs from this state by its speed and altitude, and optionally its flight
+        rules, as assigned by a field 15 speed/altitude element. The parser sets all values of an element
+        with this single lookup rather than with one with_* lookup per value, which would also intern the
+        partly assigned states in between.
+
+            :param speed: The speed as given in field 15, e.g. N0450;
+            :param speed_si: The speed in meters / second;
+            :param altitude: The altitude as given in field 15, e.g. F350;
+            :param altitude_si: The altitude in meters;
+            :param flight_rules: The flight rules, e.g. IFR, None to keep the flight rules of this state;
+            :return: The shared state instance;"""
+        if flight_rules is None:
+            flight_rules = self.flight_rules
+        return FlightState.get_state(altitude, altitude_si, speed, speed_si, flight_rules)
+
+
+FlightState.INITIAL = FlightState.get_state()
@@ -0,0 +1,222 @@
+from F15_Parser.ExtractedRouteRecord import ExtractedRouteRecord
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from Tokenizer.Token import Token
+from Tokenizer.Tokens import Tokens
+
+
+class ParseObjectPool:
+    """This class recycles the objects created for each parsed message, the Tokens list and its Token
+    instances and, if enabled, the ExtractedRouteSequence and its ExtractedRouteRecord instances. In steady
+    state batch parsing the objects released after a message has been processed are handed out again for the
+    next message instead of being freed and allocated.
+
+    Pooling is opt-in: a Tokenize instance takes tokens from a pool set with Tokenize.set_object_pool() and an
+    ExtractedRouteSequence obtained from get_sequence() takes its records from the pool. The caller releases
+    the objects of a message once it no longer uses them, e.g. once the ERS has been encoded, and must not
+    use them afterwards. A recycled object is reset to the state of a newly constructed object by running its
+    constructor again, or ExtractedRouteRecord.reset() for a record, which assign every attribute. The
+    instance dictionaries are never cleared or updated directly, an object whose dictionary has been
+    materialised loses the inline attribute layout that makes attribute access fast on recent Python
+    versions. Objects released twice are only pooled once.
+
+    Recycling pays when resetting an object is cheaper than allocating it. A token is reset by its
+    constructor alone, but a record has to reassign all of its attributes while a new record only assigns
+    five and takes the others from the class, which on CPython costs more than the allocation saved; records
+    are therefore only recycled if recycle_records is set, see Benchmarks/BatchModeBenchmark.py.
+
+    Each free list holds at most max_size objects, objects released to a full list are left to be freed.
+    Taking and releasing objects is safe between threads, the list operations used are atomic and the
+    statistics are approximate."""
+
+    MAX_SIZE: int = 65536
+    """The default maximum number of objects held in each free list"""
+
+    shared_pool = None
+    """The pool shared by default by the batch parsers, created on first use"""
+
+    max_size: int = MAX_SIZE
+    """The maximum number of objects held in each free list"""
+
+    recycle_records: bool = False
+    """True to recycle extracted route sequences and their records as well as tokens"""
+
+    free_tokens: [Token] = None
+    """The released Token instances"""
+
+    free_token_lists: [Tokens] = None
+    """The released Tokens instances"""
+
+    free_records: [ExtractedRouteRecord] = None
+    """The released ExtractedRouteRecord instances"""
+
+    free_sequences: [ExtractedRouteSequence] = None
+    """The released ExtractedRouteSequence instances"""
+
+    allocations: int = 0
+    """The number of objects requested that were newly created"""
+
+    reuses: int = 0
+    """The number of objects requested that were taken from a free list"""
+
+    def __init__(self, max_size=MAX_SIZE, recycle_records=False):
+        # type: (int, bool) -> None
+        """Constructor creating an empty pool.
+
+            :param max_size: The maximum number of objects held in each free list;
+            :param recycle_records: True to recycle extracted route sequences and their records as well as
+                                    tokens;
+            :return: None"""
+        if max_size < 0:
+            raise ValueError("The pool size cannot be negative")
+        self.max_size = max_size
+        self.recycle_records = recycle_records
+        self.free_tokens = []
+        self.free_token_lists = []
+        self.free_records = []
+        self.free_sequences = []
+        self.allocations = 0
+        self.reuses = 0
+
+    @staticmethod
+    def get_shared_pool():
+        # type: () -> ParseObjectPool
+        """Gets the pool shared by the batch parsers, creating it on first use.
+
+            :return: The shared pool;"""
+        if ParseObjectPool.shared_pool is None:
+            ParseObjectPool.shared_pool = ParseObjectPool()
+        return ParseObjectPool.shared_pool
+
+    def get_token(self, token_string, token_start_index, token_end_index):
+        # type: (str, int, int) -> Token
+        """Gets a token, see Token.__init__().
+
+            :param token_string: The text that is the token;
+            :param token_start_index: The zero based start index of the token text in the original string;
+            :param token_end_index: The zero based end index of the token text in the original string;
+            :return: A recycled or new token;"""
+        try:
+            token = self.free_tokens.pop()
+        except IndexError:
+            self.allocations = self.allocations + 1
+            return Token(token_string, token_start_index, token_end_index)
+        self.reuses = self.reuses + 1
+        # The constructor assigns every attribute
+        token.__init__(token_string, token_start_index, token_end_index)
+        return token
+
+    def get_tokens(self):
+        # type: () -> Tokens
+        """Gets an empty token list.
+
+            :return: A recycled or new token list;"""
+        try:
+            tokens = self.free_token_lists.pop()
+        except IndexError:
+            self.allocations = self.allocations + 1
+            return Tokens()
+        self.reuses = self.reuses + 1
+        tokens.__init__()
+        return tokens
+
+    def get_record(self, string, start_index, end_index, base_type, sub_type):
+        # type: (str, int, int, TokenBaseType, TokenSubType) -> ExtractedRouteRecord
+        """Gets a route record, see ExtractedRouteRecord.__init__().
+
+            :param string: The field 15 element string;
+            :param start_index: The start index of the element in the original field 15 text;
+            :param end_index: The end index of the element in the original field 15 text;
+            :param base_type: The base type of the element;
+            :param sub_type: The subtype of the element;
+            :return: A recycled or new record;"""
+        try:
+            record = self.free_records.pop()
+        except IndexError:
+            self.allocations = self.allocations + 1
+            return ExtractedRouteRecord(string, start_index, end_index, base_type, sub_type)
+        self.reuses = self.reuses + 1
+        record.reset(string, start_index, end_index, base_type, sub_type)
+        return record
+
+    def get_sequence(self):
+        # type: () -> ExtractedRouteSequence
+        """Gets an extracted route sequence, taking its records from this pool if records are recycled.
+
+            :return: A recycled or new extracted route sequence holding the dummy ADEP record;"""
+        if not self.recycle_records:
+            return ExtractedRouteSequence()
+        try:
+            ers = self.free_sequences.pop()
+        except IndexError:
+            self.allocations = self.allocations + 1
+            return ExtractedRouteSequence(self)
+        self.reuses = self.reuses + 1
+        ers.__init__(self)
+        return ers
+
+    def release_tokens(self, tokens):
+        # type: (Tokens) -> None
+        """Returns a token list and its tokens to the pool.
+
+            :param tokens: The token list, it must not be used afterwards;
+            :return: None"""
+        if tokens.tokens is None:
+            # Already released
+            return
+        self.__release(self.free_tokens, tokens.tokens)
+        tokens.tokens = None
+        self.__release(self.free_token_lists, [tokens])
+
+    def release_sequence(self, ers):
+        # type: (ExtractedRouteSequence) -> None
+        """Returns an extracted route sequence obtained from get_sequence() and its records to the pool.
+
+            :param ers: The extracted route sequence, neither it nor its records may be used afterwards;
+            :return: None"""
+        if ers.object_pool is not self:
+            # Already released, not from this pool or records are not recycled
+            return
+        self.__release(self.free_records, ers.extracted_route_records)
+        ers.object_pool = None
+        ers.extracted_route_records = None
+        self.__release(self.free_sequences, [ers])
+
+    def get_statistics(self):
+        # type: () -> {}
+        """Gets the pool statistics.
+
+            :return: A dictionary with the numbers of objects requested and reused from the free lists, the
+                     reuse rate (0.0 to 1.0) and the number of objects in each free list;"""
+        requests = self.allocations + self.reuses
+        return {
+            "requests": requests,
+            "reuses": self.reuses,
+            "reuse_rate": self.reuses / requests if requests > 0 else 0.0,
+            "free_tokens": len(self.free_tokens),
+            "free_token_lists": len(self.free_token_lists),
+            "free_records": len(self.free_records),
+            "free_sequences": len(self.free_sequences)
+        }
+
+    def clear(self):
+        # type: () -> None
+        """Empties the free lists and resets the statistics.
+
+            :return: None"""
+        self.free_tokens = []
+        self.free_token_lists = []
+        self.free_records = []
+        self.free_sequences = []
+        self.allocations = 0
+        self.reuses = 0
+
+    def __release(self, free_list, items):
+        # type: ([], []) -> None
+        """Adds objects to a free list up to its maximum size.
+
+            :param free_list: The free list;
+            :param items: The objects released;
+            :return: None"""
+        space = self.max_size - len(free_list)
+        if space > 0:
+            free_list.extend(items[0:space])
@@ -0,0 +1,272 @@
+from F15_Parser.ExtractedRouteRecord import ExtractedRouteRecord
+from F15_Parser.F15TokenSyntaxDescriptions import TokenBaseType
+
+
+class RouteSummary:
+    """This class holds aggregates of the records of an extracted route sequence: the derived flight rules,
+    the numbers of points, connectors, flight rule changes and break sections, the total geodesic distance,
+    the lowest and highest level, the highest speed and the bounding box of the points with a position.
+
+    The aggregates are accumulated record by record with add_records(), see
+    ExtractedRouteSequence.get_route_summary(); parse_f15() accumulates them in the pass over the records it
+    makes to derive the flight rules, so consumers read them without going over the records again."""
+
+    CONNECTOR_TYPES = (TokenBaseType.F15_DCT, TokenBaseType.F15_ROUTE, TokenBaseType.F15_SID_STAR,
+                       TokenBaseType.F15_SID, TokenBaseType.F15_STAR, TokenBaseType.F15_BREAK_START,
+                       TokenBaseType.F15_BREAK_END, TokenBaseType.F15_SPEED_VFR)
+    """The base types of the records counted as connectors: ATS routes, DCT, SID, STAR and rule changes"""
+
+    records: int = 0
+    """The number of records accumulated"""
+
+    first_flight_rules: str = ""
+    """The flight rules of the first record, i.e. the ADEP"""
+
+    has_ifr: bool = False
+    """True if a record has IFR rules"""
+
+    has_vfr: bool = False
+    """True if a record has VFR rules"""
+
+    last_flight_rules: str = ""
+    """The flight rules of the last record with flight rules"""
+
+    points: int = 0
+    """The number of point records, including the ADEP and ADES"""
+
+    connectors: int = 0
+    """The number of connector records, see CONNECTOR_TYPES"""
+
+    rule_changes: int = 0
+    """The number of times the flight rules change from one record to the next"""
+
+    break_sections: int = 0
+    """The number of break sections, i.e. of VFR, OAT and IFPSTOP break start records"""
+
+    total_distance: float = 0.0
+    """The sum of the distances in meters between the points with a position"""
+
+    min_altitude_si: float = None
+    """The lowest level in meters, None if no record has a level"""
+
+    max_altitude_si: float = None
+    """The highest level in meters, None if no record has a level"""
+
+    max_speed_si: float = None
+    """The highest speed in meters / second, None if no record has a speed"""
+
+    min_latitude: float = None
+    """The southernmost latitude of the points with a position, None if no point has a position"""
+
+    max_latitude: float = None
+    """The northernmost latitude of the points with a position, None if no point has a position"""
+
+    min_longitude: float = None
+    """The lowest longitude in the range -180 to 180 of the points with a position"""
+
+    max_longitude: float = None
+    """The highest longitude in the range -180 to 180 of the points with a position"""
+
+    min_longitude_360: float = None
+    """The lowest longitude in the range 0 to 360 of the points with a position"""
+
+    max_longitude_360: float = None
+    """The highest longitude in the range 0 to 360 of the points with a position"""
+
+    def __init__(self):
+        # type: () -> None
+        """Constructor of an empty summary.
+
+            :return: None"""
+        self.records = 0
+        self.first_flight_rules = ""
+        self.has_ifr = False
+        self.has_vfr = False
+        self.last_flight_rules = ""
+        self.points = 0
+        self.connectors = 0
+        self.rule_changes = 0
+        self.break_sections = 0
+        self.total_distance = 0.0
+        self.min_altitude_si = None
+        self.max_altitude_si = None
+        self.max_speed_si = None
+        self.min_latitude = None
+        self.max_latitude = None
+        self.min_longitude = None
+        self.max_longitude = None
+        self.min_longitude_360 = None
+        self.max_longitude_360 = None
+
+    def add_records(self, records):
+        # type: ([ExtractedRouteRecord]) -> None
+        """Accumulates records in route order.
+
+            :param records: The records following those accumulated so far;
+            :return: None"""
+        # The aggregates are kept in local variables while the records are accumulated
+        point, break_start, connector_types = TokenBaseType.F15_POINT, TokenBaseType.F15_BREAK_START, \
+            self.CONNECTOR_TYPES
+        count, last_flight_rules, points, connectors = self.records, self.last_flight_rules, self.points, \
+            self.connectors
+        min_altitude_si, max_altitude_si, max_speed_si = self.min_altitude_si, self.max_altitude_si, \
+            self.max_speed_si
+        for record in records:
+            state = record.flight_state
+            flight_rules = state.flight_rules
+            if count == 0:
+                self.first_flight_rules = flight_rules
+            count = count + 1
+            if flight_rules != last_flight_rules and flight_rules != "":
+                if flight_rules == "IFR":
+                    self.has_ifr = True
+                elif flight_rules == "VFR":
+                    self.has_vfr = True
+                if last_flight_rules != "":
+                    self.rule_changes = self.rule_changes + 1
+                last_flight_rules = flight_rules
+            base_type = record.base_type
+            if base_type == point:
+                points = points + 1
+            elif base_type in connector_types:
+                connectors = connectors + 1
+                if base_type == break_start:
+                    self.break_sections = self.break_sections + 1
+            if state.altitude != "":
+                altitude_si = state.altitude_si
+                if min_altitude_si is None or altitude_si < min_altitude_si:
+                    min_altitude_si = altitude_si
+                if max_altitude_si is None or altitude_si > max_altitude_si:
+                    max_altitude_si = altitude_si
+            if state.speed != "" and (max_speed_si is None or state.speed_si > max_speed_si):
+                max_speed_si = state.speed_si
+            if record.lat_long_valid:
+                self.total_distance = self.total_distance + record.distance
+                self.__add_position(record.latitude, record.longitude)
+        self.records, self.last_flight_rules, self.points, self.connectors = count, last_flight_rules, points, \
+            connectors
+        self.min_altitude_si, self.max_altitude_si, self.max_speed_si = min_altitude_si, max_altitude_si, \
+            max_speed_si
+
+    def get_derived_flight_rules(self):
+        # type: () -> str
+        """Gets the flight rules of the route as derived by parse_f15(): 'V' for VFR from the ADEP, 'Z' if
+        the route changes to IFR, 'I' for IFR from the ADEP and 'Y' if the route changes to VFR.
+
+            :return: One of 'I', 'V', 'Y' or 'Z';"""
+        if self.first_flight_rules == "VFR":
+            return "Z" if self.has_ifr else "V"
+        return "Y" if self.has_vfr else "I"
+
+    def get_number_of_points(self):
+        # type: () -> int
+        """Gets the number of point records.
+
+            :return: The number of points, including the ADEP and ADES;"""
+        return self.points
+
+    def get_number_of_connectors(self):
+        # type: () -> int
+        """Gets the number of connector records, see CONNECTOR_TYPES.
+
+            :return: The number of connectors;"""
+        return self.connectors
+
+    def get_number_of_rule_changes(self):
+        # type: () -> int
+        """Gets the number of times the flight rules change along the route.
+
+            :return: The number of rule changes;"""
+        return self.rule_changes
+
+    def get_number_of_break_sections(self):
+        # type: () -> int
+        """Gets the number of VFR, OAT and IFPSTOP break sections.
+
+            :return: The number of break sections;"""
+        return self.break_sections
+
+    def get_total_distance(self):
+        # type: () -> float
+        """Gets the sum of the geodesic distances between consecutive points with a position; distances to and
+        from points without a position, e.g. published points, are not known and not included.
+
+            :return: The total distance in meters;"""
+        return self.total_distance
+
+    def get_min_altitude_si(self):
+        # type: () -> float | None
+        """Gets the lowest level along the route.
+
+            :return: The level in meters, None if no record has a level;"""
+        return self.min_altitude_si
+
+    def get_max_altitude_si(self):
+        # type: () -> float | None
+        """Gets the highest level along the route.
+
+            :return: The level in meters, None if no record has a level;"""
+        return self.max_altitude_si
+
+    def get_max_speed_si(self):
+        # type: () -> float | None
+        """Gets the highest speed along the route.
+
+            :return: The speed in meters / second, None if no record has a speed;"""
+        return self.max_speed_si
+
+    def get_bounding_box(self):
+        # type: () -> (float, float, float, float) | None
+        """Gets the smallest latitude / longitude box containing the points with a position. The box of a
+        route crossing the antimeridian, i.e. one whose points are closer together in longitude measured
+        from 0 to 360 degrees, has a western longitude greater than its eastern longitude.
+
+            :return: The southern latitude, western longitude, northern latitude and eastern longitude in
+                     decimal degrees, None if no point has a position;"""
+        if self.min_latitude is None:
+            return None
+        if self.max_longitude_360 - self.min_longitude_360 < self.max_longitude - self.min_longitude:
+            west = self.min_longitude_360 - 360.0 if self.min_longitude_360 > 180.0 else self.min_longitude_360
+            east = self.max_longitude_360 - 360.0 if self.max_longitude_360 > 180.0 else self.max_longitude_360
+            return self.min_latitude, west, self.max_latitude, east
+        return self.min_latitude, self.min_longitude, self.max_latitude, self.max_longitude
+
+    def get_statistics(self):
+        # type: () -> {}
+        """Gets all aggregates.
+
+            :return: A dictionary with the derived flight rules, the numbers of points, connectors, rule changes
+                     and break sections, the total distance, the lowest and highest levels, the highest speed and
+                     the bounding box;"""
+        return {
+            "derived_flight_rules": self.get_derived_flight_rules(),
+            "points": self.points,
+            "connectors": self.connectors,
+            "rule_changes": self.rule_changes,
+            "break_sections": self.break_sections,
+            "total_distance": self.total_distance,
+            "min_altitude_si": self.min_altitude_si,
+            "max_altitude_si": self.max_altitude_si,
+            "max_speed_si": self.max_speed_si,
+            "bounding_box": self.get_bounding_box()
+        }
+
+    def __add_position(self, latitude, longitude):
+        # type: (float, float) -> None
+        """Extends the bounding box to a point.
+
+            :param latitude: The latitude in decimal degrees;
+            :param longitude: The longitude in decimal degrees, -180 to 180;
+            :return: None"""
+        longitude_360 = longitude % 360.0
+        if self.min_latitude is None:
+            self.min_latitude = self.max_latitude = latitude
+            self.min_longitude = self.max_longitude = longitude
+            self.min_longitude_360 = self.max_longitude_360 = longitude_360
+            return
+        self.min_latitude = min(self.min_latitude, latitude)
+        self.max_latitude = max(self.max_latitude, latitude)
+        self.min_longitude = min(self.min_longitude, longitude)
+        self.max_longitude = max(self.max_longitude, longitude)
+        self.min_longitude_360 = min(self.min_longitude_360, longitude_360)
+        self.max_longitude_360 = max(self.max_longitude_360, longitude_360)
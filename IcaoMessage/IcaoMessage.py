@@ -0,0 +1,242 @@
+import re
+
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from F15_Parser.F15Dialect import F15Dialect
+from Tokenizer.Tokenize import Tokenize
+
+
+class IcaoMessage:
+    """This class holds a single ICAO ATS message such as '(FPL-ABC123-IS -B738/M-SDE3FGHIJ1RWY/LB1 -EGLL0800
+    -N0450F350 ... -EDDF0105 ...)' together with the location of each of its fields. Fields are not copied out of
+    the message, they are stored as start and end indexes into the message text so that field 15 can be
+    tokenized in place and the token indexes remain relative to the start of the message."""
+
+    FIELD_SEQUENCES = {
+        "FPL": [3, 7, 8, 9, 10, 13, 15, 16, 18, 19],
+        "CPL": [3, 7, 8, 9, 10, 13, 14, 15, 16, 18, 19],
+        "CHG": [3, 7, 13, 16]
+    }
+    """The ICAO field numbers in the order they appear in each message type supporting field 15; CHG messages
+    may be followed by an optional field 18 and one or more field 22 amendments"""
+
+    FIELD_SEPARATOR: str = "-"
+    """The character preceding each field after field 3"""
+
+    FIELD_WHITESPACE: str = " \n\t\r"
+    """Characters trimmed from the start and end of each field"""
+
+    AMENDMENT_PATTERN = re.compile(r"(\d{1,2})/")
+    """Regular expression matching the field number at the start of a field 22 amendment"""
+
+    text: str = ""
+    """The message text from the opening to the closing bracket"""
+
+    stream_offset: int = 0
+    """The index of the opening bracket in the stream or file the message was read from"""
+
+    message_type: str = ""
+    """The message type, i.e. the first three letters of field 3"""
+
+    fields: {} = None
+    """The field number mapped to the start and end index of the field in the message text"""
+
+    amendments: {} = None
+    """For CHG messages the amended field number mapped to the start and end index of the amended data"""
+
+    def __init__(self, text, stream_offset=0):
+        # type: (str, int) -> None
+        """Constructor splitting a message into its fields.
+
+            :param text: The message text including the opening and closing brackets;
+            :param stream_offset: The index of the opening bracket in the stream or file the message was read from;
+            :return: None"""
+        self.text = text
+        self.stream_offset = stream_offset
+        self.fields = {}
+        self.amendments = {}
+        self.__split_fields()
+
+    def get_text(self):
+        # type: () -> str
+        """Gets the message text including the opening and closing brackets.
+
+            :return: The message text;"""
+        return self.text
+
+    def get_stream_offset(self):
+        # type: () -> int
+        """Gets the index of the opening bracket in the stream or file the message was read from.
+
+            :return: The stream offset of the message;"""
+        return self.stream_offset
+
+    def get_message_type(self):
+        # type: () -> str
+        """Gets the message type, e.g. 'FPL', 'CPL' or 'CHG'.
+
+            :return: The message type;"""
+        return self.message_type
+
+    def get_field_bounds(self, field_number):
+        # type: (int) -> (int, int) | None
+        """Gets the location of a field in the message text.
+
+            :param field_number: The ICAO field number, e.g. 15;
+            :return: The start and end index of the field in the message text or None if the message does
+                     not contain the field;"""
+        return self.fields.get(field_number)
+
+    def get_amendment_bounds(self, field_number):
+        # type: (int) -> (int, int) | None
+        """Gets the location of the amended data for a field in a field 22 of a CHG message.
+
+            :param field_number: The ICAO field number being amended, e.g. 15;
+            :return: The start and end index of the amended data in the message text or None if the field
+                     is not amended;"""
+        return self.amendments.get(field_number)
+
+    def get_field(self, field_number):
+        # type: (int) -> str | None
+        """Gets the text of a field, this creates a copy of the field.
+
+            :param field_number: The ICAO field number, e.g. 16;
+            :return: The field text or None if the message does not contain the field;"""
+        bounds = self.fields.get(field_number)
+        if bounds is None:
+            return None
+        return self.text[bounds[0]:bounds[1]]
+
+    def get_route_bounds(self):
+        # type: () -> (int, int) | None
+        """Gets the location of the route to be parsed, field 15 for FPL and CPL messages or the field 15
+        amendment of a CHG message.
+
+            :return: The start and end index of the route in the message text or None if there is no route;"""
+        return self.__get_effective_bounds(15)
+
+    def get_adep(self):
+        # type: () -> str | None
+        """Gets the departure aerodrome location indicator from field 13, or from a field 13 amendment
+        for CHG messages.
+
+            :return: The ADEP location indicator or None if there is no field 13;"""
+        return self.__get_location_indicator(13)
+
+    def get_ades(self):
+        # type: () -> str | None
+        """Gets the destination aerodrome location indicator from field 16, or from a field 16 amendment
+        for CHG messages.
+
+            :return: The ADES location indicator or None if there is no field 16;"""
+        return self.__get_location_indicator(16)
+
+    def parse_route(self, tokenizer=None, dialect=None):
+        # type: (Tokenize, str) -> ExtractedRouteSequence | None
+        """Tokenizes and parses the route of this message in place. The ADEP and ADES records of the
+        extracted route sequence are named after the location indicators in fields 13 and 16 and all
+        element and error indexes are relative to the start of the message text.
+
+            :param tokenizer: A tokenizer to re-use, a new tokenizer splitting on " \\n\\t\\r/" is
+                              created if None;
+            :param dialect: The name of the field 15 dialect the route is parsed against, see F15Dialect, the
+                            default dialect if None;
+            :return: The extracted route sequence or None if the message contains no route;"""
+        bounds = self.get_route_bounds()
+        if bounds is None:
+            return None
+        if tokenizer is None:
+            tokenizer = Tokenize()
+            tokenizer.set_whitespace(" \n\t\r/")
+        tokenizer.set_string_to_tokenize(self.text)
+        tokenizer.set_bounds(bounds[0], bounds[1])
+        tokenizer.tokenize()
+        ers = ExtractedRouteSequence()
+        F15Dialect.get_dialect(dialect).parse_f15(ers, tokenizer.get_tokens())
+        self.__set_aerodrome(ers.get_first_element(), 13)
+        self.__set_aerodrome(ers.get_last_element(), 16)
+        return ers
+
+    def __split_fields(self):
+        # type: () -> None
+        """Locates each field in the message text and assigns its field number. Fields not described for
+        the message type are ignored.
+
+            :return: None"""
+        bounds = []
+        start = 1
+        end = len(self.text) - 1 if self.text.endswith(")") else len(self.text)
+        while start <= end:
+            separator = self.text.find(self.FIELD_SEPARATOR, start, end)
+            if separator < 0:
+                separator = end
+            bounds.append(self.__trim(start, separator))
+            start = separator + 1
+        self.message_type = self.text[bounds[0][0]:bounds[0][0] + 3]
+        sequence = self.FIELD_SEQUENCES.get(self.message_type, [3])
+        for idx, field_bounds in enumerate(bounds):
+            if idx < len(sequence):
+                self.fields[sequence[idx]] = field_bounds
+            elif self.message_type == "CHG":
+                self.__add_chg_field(field_bounds)
+
+    def __add_chg_field(self, field_bounds):
+        # type: ((int, int)) -> None
+        """Assigns a field following field 16 of a CHG message to either field 18 or a field 22 amendment.
+
+            :param field_bounds: The start and end index of the field in the message text;
+            :return: None"""
+        amendment = self.AMENDMENT_PATTERN.match(self.text, field_bounds[0], field_bounds[1])
+        if amendment is None:
+            self.fields[18] = field_bounds
+        else:
+            self.amendments[int(amendment.group(1))] = self.__trim(amendment.end(), field_bounds[1])
+
+    def __trim(self, start, end):
+        # type: (int, int) -> (int, int)
+        """Removes whitespace at the start and end of a field.
+
+            :param start: The start index of the field in the message text;
+            :param end: The end index of the field in the message text;
+            :return: The trimmed start and end index;"""
+        while start < end and self.text[start] in self.FIELD_WHITESPACE:
+            start = start + 1
+        while end > start and self.text[end - 1] in self.FIELD_WHITESPACE:
+            end = end - 1
+        return start, end
+
+    def __get_effective_bounds(self, field_number):
+        # type: (int) -> (int, int) | None
+        """Gets the location of a field taking any CHG amendment into account.
+
+            :param field_number: The ICAO field number;
+            :return: The start and end index of the field or its amendment, None if neither exist;"""
+        bounds = self.amendments.get(field_number)
+        if bounds is None and self.message_type != "CHG":
+            bounds = self.fields.get(field_number)
+        return bounds
+
+    def __get_location_indicator(self, field_number):
+        # type: (int) -> str | None
+        """Gets the aerodrome location indicator at the start of field 13 or 16.
+
+            :param field_number: The ICAO field number, 13 or 16;
+            :return: The location indicator or None if there is no field;"""
+        bounds = self.amendments.get(field_number, self.fields.get(field_number))
+        if bounds is None:
+            return None
+        return self.text[bounds[0]:min(bounds[0] + 4, bounds[1])]
+
+    def __set_aerodrome(self, record, field_number):
+        # type: (ExtractedRouteRecord, int) -> None
+        """Names a dummy ADEP or ADES record after the location indicator in field 13 or 16 and points its
+        indexes at the location indicator.
+
+            :param record: The dummy ADEP or ADES record;
+            :param field_number: The ICAO field number, 13 or 16;
+            :return: None"""
+        bounds = self.amendments.get(field_number, self.fields.get(field_number))
+        if bounds is None or bounds[0] == bounds[1]:
+            return
+        record.set_name(self.text[bounds[0]:min(bounds[0] + 4, bounds[1])])
+        record.set_start_index(bounds[0])
+        record.set_end_index(min(bounds[0] + 4, bounds[1]))
@@ -0,0 +1,97 @@
+import io
+
+from IcaoMessage.IcaoMessage import IcaoMessage
+from Tokenizer.Tokenize import Tokenize
+
+
+class IcaoMessageFramer:
+    """This class frames ICAO ATS messages found in a string, stream or file. A message starts with an opening
+    bracket and ends with the next closing bracket, anything between messages such as AFTN or AMHS headers is
+    skipped. Streams are read in chunks so files of any size can be processed, a message may straddle chunk
+    boundaries."""
+
+    CHUNK_SIZE: int = 65536
+    """The number of characters read from a stream at a time"""
+
+    MAX_MESSAGE_LENGTH: int = 65536
+    """An unterminated message longer than this is discarded so a missing closing bracket cannot consume
+    the rest of a stream"""
+
+    chunk_size: int = CHUNK_SIZE
+    """The number of characters read from a stream at a time"""
+
+    tokenizer: Tokenize = None
+    """The tokenizer re-used for parsing the routes of all messages framed by this instance"""
+
+    def __init__(self, chunk_size=CHUNK_SIZE):
+        # type: (int) -> None
+        """Constructor.
+
+            :param chunk_size: The number of characters read from a stream at a time;
+            :return: None"""
+        self.chunk_size = chunk_size
+        self.tokenizer = Tokenize()
+        self.tokenizer.set_whitespace(" \n\t\r/")
+
+    def frame_string(self, text):
+        # type: (str) -> Generator[IcaoMessage]
+        """Frames all messages in a string.
+
+            :param text: A string containing zero or more ICAO messages;
+            :return: A generator yielding each complete message in the order found;"""
+        return self.frame_stream(io.StringIO(text))
+
+    def frame_file(self, file_name, encoding="latin-1"):
+        # type: (str, str) -> Generator[IcaoMessage]
+        """Frames all messages in a file.
+
+            :param file_name: The name of a file containing zero or more ICAO messages;
+            :param encoding: The file encoding, latin-1 accepts any byte;
+            :return: A generator yielding each complete message in the order found;"""
+        with open(file_name, "r", encoding=encoding, newline="") as stream:
+            yield from self.frame_stream(stream)
+
+    def frame_stream(self, stream):
+        # type: (io.TextIOBase) -> Generator[IcaoMessage]
+        """Frames all messages in a text stream. The stream offset of each message is the index of its
+        opening bracket counted from the position the stream was at when framing started.
+
+            :param stream: A text stream containing zero or more ICAO messages;
+            :return: A generator yielding each complete message in the order found;"""
+        buffer = ""
+        buffer_offset = 0
+        while True:
+            chunk = stream.read(self.chunk_size)
+            if len(chunk) == 0:
+                break
+            buffer = buffer + chunk
+            position = 0
+            while True:
+                start = buffer.find("(", position)
+                if start < 0:
+                    position = len(buffer)
+                    break
+                end = buffer.find(")", start + 1)
+                if end < 0:
+                    position = start
+                    if len(buffer) - start > self.MAX_MESSAGE_LENGTH:
+                        position = len(buffer)
+                    break
+                # A second opening bracket before the closing bracket means the first message was truncated
+                start = buffer.rfind("(", start, end)
+                yield IcaoMessage(buffer[start:end + 1], buffer_offset + start)
+                position = end + 1
+            buffer = buffer[position:]
+            buffer_offset = buffer_offset + position
+
+    def parse_routes(self, messages):
+        # type: (Iterable[IcaoMessage]) -> Generator[(IcaoMessage, ExtractedRouteSequence)]
+        """Parses the route of each message that has one, messages without a route such as ARR or DLA
+        are skipped.
+
+            :param messages: Framed messages, e.g. as returned by frame_file();
+            :return: A generator yielding the message and its extracted route sequence;"""
+        for message in messages:
+            ers = message.parse_route(self.tokenizer)
+            if ers is not None:
+                yield message, ers
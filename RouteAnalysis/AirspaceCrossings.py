@@ -0,0 +1,338 @@
+import json
+
+from F15_Parser.ExtractedRouteRecord import ExtractedRouteRecord
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from RouteAnalysis.AirspaceVolume import AirspaceVolume
+from RouteAnalysis.STRTree import STRTree
+
+
+class AirspaceCrossingEvent:
+    """This class represents a single entry into or exit from an airspace volume along an extracted route
+    sequence (ERS)."""
+
+    ENTRY = "ENTRY"
+    """Event type for entering a volume"""
+
+    EXIT = "EXIT"
+    """Event type for leaving a volume"""
+
+    event_type: str = ""
+    """One of ENTRY or EXIT"""
+
+    volume: AirspaceVolume = None
+    """The volume entered or left"""
+
+    latitude: float = 0.0
+    """The latitude of the entry / exit point in decimal degrees"""
+
+    longitude: float = 0.0
+    """The longitude of the entry / exit point in decimal degrees"""
+
+    altitude_si: float = 0.0
+    """The altitude in meters at the entry / exit point"""
+
+    segment_index: int = 0
+    """The index of the ERS segment, as returned by ExtractedRouteSequence.get_lat_long_segments(),
+    on which the event occurs"""
+
+    fraction: float = 0.0
+    """The fraction along the segment at which the event occurs, 0.0 is the segment start point"""
+
+    def __init__(self, event_type, volume, latitude, longitude, altitude_si, segment_index, fraction):
+        # type: (str, AirspaceVolume, float, float, float, int, float) -> None
+        """Creates a crossing event.
+
+            :param event_type: One of ENTRY or EXIT;
+            :param volume: The volume entered or left;
+            :param latitude: The latitude of the entry / exit point;
+            :param longitude: The longitude of the entry / exit point;
+            :param altitude_si: The altitude in meters at the entry / exit point;
+            :param segment_index: The index of the ERS segment on which the event occurs;
+            :param fraction: The fraction along the segment at which the event occurs;
+            :return: None"""
+        self.event_type = event_type
+        self.volume = volume
+        self.latitude = latitude
+        self.longitude = longitude
+        self.altitude_si = altitude_si
+        self.segment_index = segment_index
+        self.fraction = fraction
+
+    def get_event_type(self):
+        # type: () -> str
+        """Gets the event type.
+
+            :return: One of ENTRY or EXIT;"""
+        return self.event_type
+
+    def get_volume(self):
+        # type: () -> AirspaceVolume
+        """Gets the volume entered or left.
+
+            :return: The airspace volume;"""
+        return self.volume
+
+    def get_latitude(self):
+        # type: () -> float
+        """Gets the latitude of the entry / exit point.
+
+            :return: The latitude in decimal degrees;"""
+        return self.latitude
+
+    def get_longitude(self):
+        # type: () -> float
+        """Gets the longitude of the entry / exit point.
+
+            :return: The longitude in decimal degrees;"""
+        return self.longitude
+
+    def get_altitude_si(self):
+        # type: () -> float
+        """Gets the altitude at the entry / exit point.
+
+            :return: The altitude in meters;"""
+        return self.altitude_si
+
+    def get_segment_index(self):
+        # type: () -> int
+        """Gets the index of the ERS segment on which the event occurs.
+
+            :return: The segment index;"""
+        return self.segment_index
+
+    def get_fraction(self):
+        # type: () -> float
+        """Gets the fraction along the segment at which the event occurs.
+
+            :return: The fraction, 0.0 is the segment start point, 1.0 the segment end point;"""
+        return self.fraction
+
+    def to_string(self):
+        # type: () -> str
+        """Converts the event to a formatted string.
+
+            :return: The event as a single line string;"""
+        return "{0:<6}".format(self.get_event_type()) + \
+               " {0:<12}".format(self.get_volume().name) + \
+               "{0:>4}".format(self.get_segment_index()) + \
+               "{0:>7.3f}".format(self.get_fraction()) + \
+               "{0:>9.3f}".format(self.get_latitude()) + \
+               "{0:>9.3f}".format(self.get_longitude()) + \
+               "{0:>8.0f}".format(self.get_altitude_si())
+
+
+class AirspaceCrossings:
+    """This class detects the airspace volumes (sectors, FIRs etc.) crossed by extracted route sequences.
+
+    Volumes are indexed laterally in an STR-tree; each ERS segment between two points with known
+    coordinates is intersected with the volumes whose bounding boxes overlap the segment bounding box.
+    A segment is flown at the altitude of its start point, this is the altitude carried forward by the
+    parser, so vertical limits are applied per segment and a level change at a point may enter or leave
+    a volume at that point.
+
+    A segment whose end point longitudes are more than 180 degrees apart crosses the anti-meridian; it is
+    intersected as a continuous line past longitude +/-180 with the volumes on either side, volumes must
+    be split at the anti-meridian (see AirspaceVolume).
+
+    Volumes are loaded from a GeoJSON FeatureCollection with Polygon or MultiPolygon geometries; the
+    feature properties used are:
+        - 'name': The volume name;
+        - 'type': The volume type, e.g. 'SECTOR' or 'FIR';
+        - 'lower_limit_si': The lower limit in meters, default 0;
+        - 'upper_limit_si': The upper limit in meters, default unlimited.
+    A MultiPolygon feature results in one volume per polygon, all with the same name."""
+
+    volumes: [AirspaceVolume] = None
+    """The volumes loaded into this instance"""
+
+    index: STRTree = None
+    """Lateral index over all volumes, built on first use"""
+
+    def __init__(self):
+        # type: () -> None
+        """Constructor creating an instance without any volumes.
+
+            :return: None"""
+        self.volumes = []
+        self.index = None
+
+    def add_volume(self, volume):
+        # type: (AirspaceVolume) -> None
+        """Adds a single volume; the index is rebuilt on the next query.
+
+            :param volume: The volume to add;
+            :return: None"""
+        self.volumes.append(volume)
+        self.index = None
+
+    def load_geojson(self, file_name):
+        # type: (str) -> int
+        """Loads airspace volumes from a local GeoJSON file.
+
+            :param file_name: The name of the GeoJSON file to load;
+            :return: The number of volumes loaded;"""
+        with open(file_name, "r", encoding="utf-8") as geojson_file:
+            return self.load_geojson_dict(json.load(geojson_file))
+
+    def load_geojson_dict(self, geojson):
+        # type: (dict) -> int
+        """Loads airspace volumes from a GeoJSON FeatureCollection already decoded into a dictionary.
+
+            :param geojson: The decoded GeoJSON FeatureCollection;
+            :return: The number of volumes loaded;"""
+        number_loaded = 0
+        for feature in geojson.get("features", []):
+            geometry = feature.get("geometry") or {}
+            properties = feature.get("properties") or {}
+            match geometry.get("type"):
+                case "Polygon":
+                    polygons = [geometry["coordinates"]]
+                case "MultiPolygon":
+                    polygons = geometry["coordinates"]
+                case _:
+                    continue
+            for rings in polygons:
+                self.add_volume(AirspaceVolume(properties.get("name", ""),
+                                               properties.get("type", ""),
+                                               rings,
+                                               float(properties.get("lower_limit_si", 0.0)),
+                                               float(properties.get("upper_limit_si", float("inf")))))
+                number_loaded = number_loaded + 1
+        return number_loaded
+
+    def get_crossings(self, ers):
+        # type: (ExtractedRouteSequence) -> [AirspaceCrossingEvent]
+        """Determines the ordered entry and exit events of an ERS with all loaded volumes. A volume
+        containing the first point of a segment chain is entered at that point, a volume still occupied
+        at the last point of a chain is left at that point so events always come in entry / exit pairs.
+
+            :param ers: The extracted route sequence to analyse;
+            :return: A list of crossing events ordered along the route;"""
+        events = []
+        index = self.get_index()
+        inside = set()
+        segments = ers.get_lat_long_segments()
+        for segment_index, segment in enumerate(segments):
+            start, end = segment
+            if segment_index > 0 and segments[segment_index - 1][1] is not start:
+                # A new chain of segments starts, leave everything occupied at the end of the previous chain
+                self.__close_chain(events, inside, segments[segment_index - 1], segment_index - 1)
+            self.__add_segment_events(index, events, inside, segment_index, start, end)
+        if len(segments) > 0:
+            self.__close_chain(events, inside, segments[-1], len(segments) - 1)
+        return events
+
+    def get_crossings_batch(self, ers_list):
+        # type: ([ExtractedRouteSequence]) -> [[AirspaceCrossingEvent]]
+        """Determines the crossing events for many extracted route sequences; the index is built once
+        and shared by all routes.
+
+            :param ers_list: The extracted route sequences to analyse;
+            :return: A list with one list of crossing events per ERS, in the order of the input;"""
+        self.get_index()
+        return [self.get_crossings(ers) for ers in ers_list]
+
+    def get_index(self):
+        # type: () -> STRTree
+        """Gets the lateral index over all volumes, building it if volumes have been added since the
+        last query.
+
+            :return: The STR-tree index;"""
+        if self.index is None:
+            self.index = STRTree([[volume.bounding_box, volume] for volume in self.volumes])
+        return self.index
+
+    def get_volumes(self):
+        # type: () -> [AirspaceVolume]
+        """Gets all loaded volumes.
+
+            :return: The list of volumes;"""
+        return self.volumes
+
+    @staticmethod
+    def __close_chain(events, inside, segment, segment_index):
+        # type: ([AirspaceCrossingEvent], set, [ExtractedRouteRecord, ExtractedRouteRecord], int) -> None
+        """Appends exit events at the last point of a chain of segments for all volumes still occupied.
+
+            :param events: The list of events being populated;
+            :param inside: The set of volumes occupied at the end of the chain, cleared by this method;
+            :param segment: The last segment of the chain as [start point record, end point record];
+            :param segment_index: The index of the last segment of the chain;
+            :return: None"""
+        start, end = segment
+        for volume in sorted(inside, key=lambda item: item.name):
+            events.append(AirspaceCrossingEvent(AirspaceCrossingEvent.EXIT, volume,
+                                                end.get_latitude(), end.get_longitude(),
+                                                start.get_altitude_si(), segment_index, 1.0))
+        inside.clear()
+
+    @staticmethod
+    def __add_segment_events(index, events, inside, segment_index, start, end):
+        # type: (STRTree, [AirspaceCrossingEvent], set, int, ExtractedRouteRecord, ExtractedRouteRecord) -> None
+        """Appends the events for a single segment, updating the set of volumes occupied.
+
+            :param index: The lateral volume index;
+            :param events: The list of events being populated;
+            :param inside: The set of volumes occupied at the segment start, updated to those occupied at
+                           the segment end;
+            :param segment_index: The index of the segment in the ERS segment list;
+            :param start: The segment start point record;
+            :param end: The segment end point record;
+            :return: None"""
+        lat_1 = start.get_latitude()
+        lon_1 = start.get_longitude()
+        lat_2 = end.get_latitude()
+        lon_2 = end.get_longitude()
+        altitude_si = start.get_altitude_si()
+        if abs(lon_2 - lon_1) > 180.0:
+            # The shorter way round crosses the anti-meridian; the segment is unwrapped to continue past
+            # longitude +/-180 and a copy shifted by 360 degrees covers the volumes on the far side
+            shift = -360.0 if lon_2 > lon_1 else 360.0
+            copies = [(lon_1, lon_2 + shift), (lon_1 - shift, lon_2)]
+        else:
+            copies = [(lon_1, lon_2)]
+
+        # Each candidate volume is intersected with the first copy of the segment overlapping it
+        candidates = {}
+        for copy in copies:
+            for volume in index.query((min(copy), min(lat_1, lat_2), max(copy), max(lat_1, lat_2))):
+                candidates.setdefault(volume, copy)
+
+        # Volumes occupied at the start point at the altitude flown on this segment; the difference to
+        # the volumes occupied on arrival at this point are level change entries / exits
+        start_inside = set()
+        for volume, copy in candidates.items():
+            if volume.contains_altitude(altitude_si) and volume.contains_point(lat_1, copy[0]):
+                start_inside.add(volume)
+        segment_events = []
+        for volume in inside - start_inside:
+            segment_events.append([0.0, 0, AirspaceCrossingEvent.EXIT, volume, lon_1, lon_2])
+        for volume in start_inside - inside:
+            segment_events.append([0.0, 1, AirspaceCrossingEvent.ENTRY, volume, lon_1, lon_2])
+
+        # Lateral boundary crossings along the segment
+        inside.clear()
+        for volume, copy in candidates.items():
+            if not volume.contains_altitude(altitude_si):
+                continue
+            occupied = volume in start_inside
+            for fraction in volume.get_boundary_crossings(lat_1, copy[0], lat_2, copy[1]):
+                occupied = not occupied
+                if occupied:
+                    segment_events.append([fraction, 1, AirspaceCrossingEvent.ENTRY, volume, copy[0], copy[1]])
+                else:
+                    segment_events.append([fraction, 0, AirspaceCrossingEvent.EXIT, volume, copy[0], copy[1]])
+            if occupied:
+                inside.add(volume)
+
+        # Order by position along the segment, exits before entries at the same position
+        segment_events.sort(key=lambda item: (item[0], item[1]))
+        for fraction, _, event_type, volume, copy_lon_1, copy_lon_2 in segment_events:
+            longitude = copy_lon_1 + (copy_lon_2 - copy_lon_1) * fraction
+            if longitude > 180.0:
+                longitude = longitude - 360.0
+            elif longitude < -180.0:
+                longitude = longitude + 360.0
+            events.append(AirspaceCrossingEvent(event_type, volume,
+                                                lat_1 + (lat_2 - lat_1) * fraction,
+                                                longitude, altitude_si, segment_index, fraction))
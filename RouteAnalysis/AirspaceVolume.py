@@ -0,0 +1,156 @@
+from RouteAnalysis.STRTree import STRTree
+
+
+class AirspaceVolume:
+    """This class represents a single airspace volume such as a sector or FIR. A volume is described by
+    a lateral boundary given as a polygon with optional holes and by vertical limits given in meters.
+
+    The polygon rings are stored as lists of (longitude, latitude) tuples, the coordinate order used by
+    GeoJSON. All geometric tests are carried out in the longitude / latitude plane; polygons crossing
+    the anti-meridian must be split into two volumes by the data provider.
+
+    Boundaries with more than EDGE_INDEX_THRESHOLD edges, e.g. real FIR boundaries with thousands of
+    vertices, get their own STR-tree over the edge bounding boxes so a test only visits the edges near the
+    point or segment being tested."""
+
+    EDGE_INDEX_THRESHOLD: int = 32
+    """The number of edges above which the edges are indexed in an STR-tree"""
+
+    name: str = ""
+    """The name of the volume, e.g. the sector or FIR designator"""
+
+    volume_type: str = ""
+    """The type of the volume, e.g. 'SECTOR' or 'FIR'"""
+
+    lower_limit_si: float = 0.0
+    """The lower vertical limit of the volume in meters"""
+
+    upper_limit_si: float = 0.0
+    """The upper vertical limit of the volume in meters"""
+
+    rings: [[(float, float)]] = None
+    """The polygon rings as lists of (longitude, latitude) tuples, index 0 is the outer boundary,
+    all further rings are holes"""
+
+    bounding_box: (float, float, float, float) = None
+    """The bounding box of the outer ring as (min longitude, min latitude, max longitude, max latitude)"""
+
+    edges: [(float, float, float, float)] = None
+    """The edges of all rings as (longitude a, latitude a, longitude b, latitude b)"""
+
+    edge_index: STRTree = None
+    """Index over the edge bounding boxes, built on first use for boundaries with many edges"""
+
+    def __init__(self, name="", volume_type="", rings=None, lower_limit_si=0.0, upper_limit_si=float("inf")):
+        # type: (str, str, [[(float, float)]], float, float) -> None
+        """Creates an airspace volume with its lateral boundary and vertical limits.
+
+            :param name: The name of the volume;
+            :param volume_type: The type of the volume, e.g. 'SECTOR' or 'FIR';
+            :param rings: The polygon rings as lists of (longitude, latitude) tuples, the first ring is the
+                          outer boundary, all further rings are holes;
+            :param lower_limit_si: The lower vertical limit in meters;
+            :param upper_limit_si: The upper vertical limit in meters;
+            :return: None"""
+        self.name = name
+        self.volume_type = volume_type
+        self.lower_limit_si = lower_limit_si
+        self.upper_limit_si = upper_limit_si
+        self.rings = []
+        for ring in rings or []:
+            ring = [(float(point[0]), float(point[1])) for point in ring]
+            if len(ring) > 1 and ring[0] == ring[-1]:
+                # GeoJSON rings are closed, the closing point is implied here
+                ring = ring[:-1]
+            self.rings.append(ring)
+        self.edges = []
+        for ring in self.rings:
+            for i in range(len(ring)):
+                self.edges.append(ring[i - 1] + ring[i])
+        self.edge_index = None
+        if len(self.rings) > 0 and len(self.rings[0]) > 0:
+            longitudes = [point[0] for point in self.rings[0]]
+            latitudes = [point[1] for point in self.rings[0]]
+            self.bounding_box = (min(longitudes), min(latitudes), max(longitudes), max(latitudes))
+        else:
+            self.bounding_box = (0.0, 0.0, 0.0, 0.0)
+
+    def contains_altitude(self, altitude_si):
+        # type: (float) -> bool
+        """Checks if an altitude lies within the vertical limits of this volume; the lower limit is
+        inclusive, the upper limit exclusive so adjacent stacked volumes never both contain an altitude.
+
+            :param altitude_si: The altitude in meters;
+            :return: True if the altitude is within the vertical limits, False otherwise;"""
+        return self.lower_limit_si <= altitude_si < self.upper_limit_si
+
+    def contains_point(self, latitude, longitude):
+        # type: (float, float) -> bool
+        """Checks if a point lies inside the lateral boundary of this volume using the even-odd rule,
+        i.e. points inside a hole are outside the volume.
+
+            :param latitude: The latitude of the point in decimal degrees;
+            :param longitude: The longitude of the point in decimal degrees;
+            :return: True if the point is inside the lateral boundary, False otherwise;"""
+        min_lon, min_lat, max_lon, max_lat = self.bounding_box
+        if longitude < min_lon or longitude > max_lon or latitude < min_lat or latitude > max_lat:
+            return False
+        inside = False
+        for lon_j, lat_j, lon_i, lat_i in self.__get_edges((longitude, latitude, max_lon, latitude)):
+            if (lat_i > latitude) != (lat_j > latitude):
+                crossing = (lon_j - lon_i) * (latitude - lat_i) / (lat_j - lat_i) + lon_i
+                if longitude < crossing:
+                    inside = not inside
+        return inside
+
+    def get_boundary_crossings(self, latitude_1, longitude_1, latitude_2, longitude_2):
+        # type: (float, float, float, float) -> [float]
+        """Calculates where a straight segment in the longitude / latitude plane crosses the lateral
+        boundary of this volume. The segment must not cross the anti-meridian, i.e. its longitudes are
+        taken as given and the segment spans abs(longitude_2 - longitude_1) degrees.
+
+        Ring vertices on the line through the segment are counted with the same half-open rule used by
+        contains_point(), they lie on the left of the segment; a segment passing through a vertex crosses
+        the boundary only if the two edges meeting at that vertex lie on opposite sides of the segment, a
+        segment grazing a vertex or running along an edge does not cross the boundary there.
+
+            :param latitude_1: The latitude of the segment start point;
+            :param longitude_1: The longitude of the segment start point;
+            :param latitude_2: The latitude of the segment end point;
+            :param longitude_2: The longitude of the segment end point;
+            :return: A sorted list of fractions in the range 0.0 < fraction <= 1.0 along the segment
+                     at which the boundary is crossed;"""
+        d_lon = longitude_2 - longitude_1
+        d_lat = latitude_2 - latitude_1
+        fractions = []
+        query = (min(longitude_1, longitude_2), min(latitude_1, latitude_2),
+                 max(longitude_1, longitude_2), max(latitude_1, latitude_2))
+        for lon_i, lat_i, lon_j, lat_j in self.__get_edges(query):
+            # Side of each edge end point relative to the line through the segment
+            side_i = d_lon * (lat_i - latitude_1) - d_lat * (lon_i - longitude_1)
+            side_j = d_lon * (lat_j - latitude_1) - d_lat * (lon_j - longitude_1)
+            if (side_i >= 0.0) == (side_j >= 0.0):
+                # Both end points on the same side, this includes edges along the segment
+                continue
+            e_lon = lon_j - lon_i
+            e_lat = lat_j - lat_i
+            denominator = d_lon * e_lat - d_lat * e_lon
+            fraction = ((lon_i - longitude_1) * e_lat - (lat_i - latitude_1) * e_lon) / denominator
+            if 0.0 < fraction <= 1.0:
+                fractions.append(fraction)
+        fractions.sort()
+        return fractions
+
+    def __get_edges(self, bounding_box):
+        # type: ((float, float, float, float)) -> [(float, float, float, float)]
+        """Gets the edges that may intersect a bounding box, all edges for boundaries with few edges.
+
+            :param bounding_box: The bounding box as (min longitude, min latitude, max longitude, max latitude);
+            :return: A list of edges as (longitude a, latitude a, longitude b, latitude b);"""
+        if len(self.edges) <= self.EDGE_INDEX_THRESHOLD:
+            return self.edges
+        if self.edge_index is None:
+            self.edge_index = STRTree([[(min(edge[0], edge[2]), min(edge[1], edge[3]),
+                                         max(edge[0], edge[2]), max(edge[1], edge[3])), edge]
+                                       for edge in self.edges])
+        return self.edge_index.query(bounding_box)
@@ -0,0 +1,450 @@
+import math
+
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from Utilities.Constants import Constants
+from Utilities.Utils import Utils
+
+
+class RouteProximityConflict:
+    """This class represents a pair of route segments, from two different routes, that come within the
+    lateral and vertical proximity limits of each other."""
+
+    route_id_1: object = None
+    """The identifier of the first route"""
+
+    segment_index_1: int = 0
+    """The index of the segment in the first route"""
+
+    route_id_2: object = None
+    """The identifier of the second route"""
+
+    segment_index_2: int = 0
+    """The index of the segment in the second route"""
+
+    lateral_distance_si: float = 0.0
+    """The geodesic distance in meters between the closest points of the two segments"""
+
+    vertical_distance_si: float = 0.0
+    """The difference in meters between the altitudes of the two segments"""
+
+    latitude: float = 0.0
+    """The latitude of the closest point on the first segment"""
+
+    longitude: float = 0.0
+    """The longitude of the closest point on the first segment"""
+
+    def __init__(self, route_id_1, segment_index_1, route_id_2, segment_index_2,
+                 lateral_distance_si, vertical_distance_si, latitude, longitude):
+        # type: (object, int, object, int, float, float, float, float) -> None
+        """Creates a conflict record.
+
+            :param route_id_1: The identifier of the first route;
+            :param segment_index_1: The index of the segment in the first route;
+            :param route_id_2: The identifier of the second route;
+            :param segment_index_2: The index of the segment in the second route;
+            :param lateral_distance_si: The geodesic distance in meters between the closest points;
+            :param vertical_distance_si: The altitude difference in meters;
+            :param latitude: The latitude of the closest point on the first segment;
+            :param longitude: The longitude of the closest point on the first segment;
+            :return: None"""
+        self.route_id_1 = route_id_1
+        self.segment_index_1 = segment_index_1
+        self.route_id_2 = route_id_2
+        self.segment_index_2 = segment_index_2
+        self.lateral_distance_si = lateral_distance_si
+        self.vertical_distance_si = vertical_distance_si
+        self.latitude = latitude
+        self.longitude = longitude
+
+    def get_route_ids(self):
+        # type: () -> (object, object)
+        """Gets the identifiers of both routes.
+
+            :return: A tuple with the first and second route identifier;"""
+        return self.route_id_1, self.route_id_2
+
+    def get_segment_indices(self):
+        # type: () -> (int, int)
+        """Gets the segment indices in both routes.
+
+            :return: A tuple with the segment index in the first and second route;"""
+        return self.segment_index_1, self.segment_index_2
+
+    def get_lateral_distance_si(self):
+        # type: () -> float
+        """Gets the lateral distance between the closest points of the two segments.
+
+            :return: The geodesic distance in meters;"""
+        return self.lateral_distance_si
+
+    def get_vertical_distance_si(self):
+        # type: () -> float
+        """Gets the vertical distance between the two segments.
+
+            :return: The altitude difference in meters;"""
+        return self.vertical_distance_si
+
+    def get_latitude(self):
+        # type: () -> float
+        """Gets the latitude of the closest point on the first segment.
+
+            :return: The latitude in decimal degrees;"""
+        return self.latitude
+
+    def get_longitude(self):
+        # type: () -> float
+        """Gets the longitude of the closest point on the first segment.
+
+            :return: The longitude in decimal degrees;"""
+        return self.longitude
+
+
+class RouteProximity:
+    """This class finds pairs of routes that come within a lateral distance (nautical miles) and a vertical
+    distance (meters) of each other.
+
+    Comparing every segment with every other segment is O(n^2); instead each segment is hashed into the
+    cells of a latitude / longitude grid that its lateral corridor touches, and into a single altitude band
+    whose height equals the vertical limit. Only segments sharing a grid cell in the same or an adjacent
+    altitude band are candidate pairs; these are checked with a geodesic distance between the closest
+    points of the two segments.
+
+    Both limits are exclusive: two segments are in proximity when their lateral distance is less than the
+    lateral limit and their altitudes differ by less than the vertical limit.
+
+    A segment is the straight line between its end points in the latitude / longitude plane, the same
+    definition used by AirspaceCrossings. The closest points are first estimated in a local equirectangular
+    projection around the two segments; when the geodesic distance between the estimated points is not
+    below the lateral limit but within the corridor margin of it, the points are refined by minimising the
+    geodesic distance along each segment in turn. The estimate is exact for crossing segments and within a
+    fraction of a percent for segments spanning a few degrees; it degrades with segment length and
+    latitude change, so pairs of segments spanning tens of degrees whose estimated distance exceeds the
+    limit by more than the corridor margin may be missed. The corridor used for hashing is widened by the
+    same margin. Routes crossing the anti-meridian are not supported."""
+
+    CORRIDOR_MARGIN: float = 1.1
+    """Factor applied to the hashing corridor and to the lateral limit when deciding whether a planar
+    estimate of the closest points needs geodesic refinement"""
+
+    REFINE_ITERATIONS: int = 3
+    """The number of times the closest point on each segment is refined in turn"""
+
+    REFINE_STEPS: int = 20
+    """The number of golden section steps used to refine the closest point on a segment"""
+
+    lateral_limit_nm: float = 0.0
+    """The lateral proximity limit in nautical miles"""
+
+    vertical_limit_si: float = 0.0
+    """The vertical proximity limit in meters"""
+
+    cell_size_degrees: float = 0.0
+    """The size of a grid cell in degrees of latitude and longitude"""
+
+    segments: [] = None
+    """All segments added as [route id, segment index, lat 1, lon 1, lat 2, lon 2, altitude]"""
+
+    segment_counts: {} = None
+    """The number of segments added per route id, segment indices continue from this value"""
+
+    grid: {} = None
+    """The spatial hash mapping (latitude cell, longitude cell, altitude band) to segment numbers"""
+
+    statistics: {} = None
+    """Counters describing the work done by the last call to get_conflicts()"""
+
+    def __init__(self, lateral_limit_nm=5.0, vertical_limit_si=300.0, cell_size_degrees=0.0):
+        # type: (float, float, float) -> None
+        """Creates an empty proximity engine.
+
+            :param lateral_limit_nm: The lateral proximity limit in nautical miles, segments are in proximity
+                                     when their lateral distance is less than this value;
+            :param vertical_limit_si: The vertical proximity limit in meters, segments are in proximity
+                                      when their altitudes differ by less than this value;
+            :param cell_size_degrees: The grid cell size in degrees; zero selects a cell size equal to the
+                                      lateral limit;
+            :return: None"""
+        if not lateral_limit_nm > 0.0:
+            raise ValueError("The lateral limit must be greater than zero, got " + str(lateral_limit_nm))
+        if not vertical_limit_si > 0.0:
+            raise ValueError("The vertical limit must be greater than zero, got " + str(vertical_limit_si))
+        if cell_size_degrees < 0.0:
+            raise ValueError("The cell size must not be negative, got " + str(cell_size_degrees))
+        self.lateral_limit_nm = lateral_limit_nm
+        self.vertical_limit_si = vertical_limit_si
+        if cell_size_degrees > 0.0:
+            self.cell_size_degrees = cell_size_degrees
+        else:
+            self.cell_size_degrees = lateral_limit_nm / 60.0
+        self.segments = []
+        self.segment_counts = {}
+        self.grid = {}
+        self.statistics = {}
+
+    def add_route(self, route_id, ers):
+        # type: (object, ExtractedRouteSequence) -> int
+        """Adds all segments of an extracted route sequence that have coordinates at both ends. Each
+        segment is flown at the altitude of its start point.
+
+            :param route_id: An identifier for the route reported in conflicts;
+            :param ers: The extracted route sequence;
+            :return: The number of segments added;"""
+        segments = []
+        for start, end in ers.get_lat_long_segments():
+            segments.append([start.get_latitude(), start.get_longitude(),
+                             end.get_latitude(), end.get_longitude(), start.get_altitude_si()])
+        return self.add_route_segments(route_id, segments)
+
+    def add_route_segments(self, route_id, segments):
+        # type: (object, [[float, float, float, float, float]]) -> int
+        """Adds the segments of a route given as plain values. Segments may be added to the same route id
+        more than once, the segment indices continue from those already added.
+
+            :param route_id: An identifier for the route reported in conflicts;
+            :param segments: A list of segments, each as [lat 1, lon 1, lat 2, lon 2, altitude in meters];
+            :return: The number of segments added;"""
+        first_index = self.segment_counts.get(route_id, 0)
+        self.segment_counts[route_id] = first_index + len(segments)
+        for segment_index, segment in enumerate(segments, first_index):
+            number = len(self.segments)
+            self.segments.append([route_id, segment_index] + list(segment))
+            band = int(segment[4] // self.vertical_limit_si)
+            for cell in self.__get_cells(segment[0], segment[1], segment[2], segment[3]):
+                key = (cell[0], cell[1], band)
+                bucket = self.grid.get(key)
+                if bucket is None:
+                    self.grid[key] = [number]
+                else:
+                    bucket.append(number)
+        return len(segments)
+
+    def get_candidate_pairs(self):
+        # type: () -> {(int, int)}
+        """Gets the segment pairs sharing a grid cell in the same or an adjacent altitude band, excluding
+        pairs from the same route.
+
+            :return: A set of (segment number, segment number) tuples with the lower number first, numbers
+                     index the segments in the order they were added;"""
+        pairs = set()
+        segments = self.segments
+        for key, bucket in self.grid.items():
+            above = self.grid.get((key[0], key[1], key[2] + 1), [])
+            for i in range(len(bucket)):
+                number_1 = bucket[i]
+                route_1 = segments[number_1][0]
+                for number_2 in bucket[i + 1:]:
+                    if segments[number_2][0] != route_1:
+                        pairs.add((number_1, number_2) if number_1 < number_2 else (number_2, number_1))
+                for number_2 in above:
+                    if segments[number_2][0] != route_1:
+                        pairs.add((number_1, number_2) if number_1 < number_2 else (number_2, number_1))
+        return pairs
+
+    def get_conflicts(self):
+        # type: () -> [RouteProximityConflict]
+        """Finds all segment pairs from different routes within the lateral and vertical limits.
+
+            :return: A list of conflicts ordered by segment numbers;"""
+        lateral_limit_si = self.lateral_limit_nm * Constants.NM_TO_METERS
+        utils = Utils()
+        conflicts = []
+        pairs = sorted(self.get_candidate_pairs())
+        refine_limit_si = lateral_limit_si * self.CORRIDOR_MARGIN
+        vertical_checks = 0
+        refinements = 0
+        for number_1, number_2 in pairs:
+            segment_1 = self.segments[number_1]
+            segment_2 = self.segments[number_2]
+            vertical_distance = abs(segment_1[6] - segment_2[6])
+            if vertical_distance >= self.vertical_limit_si:
+                continue
+            vertical_checks = vertical_checks + 1
+            point_1, point_2 = self.__get_closest_points(segment_1, segment_2)
+            lateral_distance = utils.get_bearing_distance_between_points(
+                point_1[0], point_1[1], point_2[0], point_2[1])[1]
+            if lateral_limit_si <= lateral_distance < refine_limit_si:
+                refinements = refinements + 1
+                point_1, point_2, lateral_distance = self.__refine_closest_points(
+                    utils, segment_1, segment_2, point_1, point_2, lateral_distance)
+            if lateral_distance < lateral_limit_si:
+                conflicts.append(RouteProximityConflict(segment_1[0], segment_1[1], segment_2[0], segment_2[1],
+                                                        lateral_distance, vertical_distance,
+                                                        point_1[0], point_1[1]))
+        self.statistics = {"segments": len(self.segments),
+                           "grid_cells": len(self.grid),
+                           "candidate_pairs": len(pairs),
+                           "geodesic_checks": vertical_checks,
+                           "refinements": refinements,
+                           "conflicts": len(conflicts)}
+        return conflicts
+
+    def get_statistics(self):
+        # type: () -> {}
+        """Gets counters describing the work done by the last call to get_conflicts().
+
+            :return: A dictionary with the number of segments, grid cells, candidate pairs, geodesic checks,
+                     geodesic refinements and conflicts;"""
+        return self.statistics
+
+    def __get_cells(self, lat_1, lon_1, lat_2, lon_2):
+        # type: (float, float, float, float) -> {(int, int)}
+        """Gets the grid cells touched by the corridor of half the lateral limit either side of a segment.
+        The segment is sampled at intervals of half the corridor width and the cells covered by a box
+        around each sample are collected.
+
+            :param lat_1: The latitude of the segment start point;
+            :param lon_1: The longitude of the segment start point;
+            :param lat_2: The latitude of the segment end point;
+            :param lon_2: The longitude of the segment end point;
+            :return: A set of (latitude cell, longitude cell) tuples;"""
+        cell_size = self.cell_size_degrees
+        half_width = self.lateral_limit_nm / 2.0 / 60.0
+        step = half_width
+        pad_lat = (half_width + step / 2.0) * self.CORRIDOR_MARGIN
+        cos_lat = max(math.cos(math.radians(max(abs(lat_1), abs(lat_2)) + pad_lat)), 0.01)
+        pad_lon = pad_lat / cos_lat
+        length = max(abs(lat_2 - lat_1), abs(lon_2 - lon_1) * cos_lat)
+        samples = int(length / step) + 1
+        cells = set()
+        for sample in range(samples + 1):
+            fraction = sample / samples
+            latitude = lat_1 + (lat_2 - lat_1) * fraction
+            longitude = lon_1 + (lon_2 - lon_1) * fraction
+            for lat_cell in range(math.floor((latitude - pad_lat) / cell_size),
+                                  math.floor((latitude + pad_lat) / cell_size) + 1):
+                for lon_cell in range(math.floor((longitude - pad_lon) / cell_size),
+                                      math.floor((longitude + pad_lon) / cell_size) + 1):
+                    cells.add((lat_cell, lon_cell))
+        return cells
+
+    @staticmethod
+    def __get_closest_points(segment_1, segment_2):
+        # type: ([], []) -> ([float, float], [float, float])
+        """Estimates the closest points of two segments in a local equirectangular projection centred on
+        the first segment start point and scaled by the cosine of the mean latitude of both segments.
+
+            :param segment_1: The first segment as stored in self.segments;
+            :param segment_2: The second segment as stored in self.segments;
+            :return: A tuple of two [latitude, longitude] lists, the closest point on each segment;"""
+        origin_lat = segment_1[2]
+        origin_lon = segment_1[3]
+        scale = math.cos(math.radians((segment_1[2] + segment_1[4] + segment_2[2] + segment_2[4]) / 4.0))
+        a_1 = ((segment_1[3] - origin_lon) * scale, segment_1[2] - origin_lat)
+        a_2 = ((segment_1[5] - origin_lon) * scale, segment_1[4] - origin_lat)
+        b_1 = ((segment_2[3] - origin_lon) * scale, segment_2[2] - origin_lat)
+        b_2 = ((segment_2[5] - origin_lon) * scale, segment_2[4] - origin_lat)
+
+        d_a = (a_2[0] - a_1[0], a_2[1] - a_1[1])
+        d_b = (b_2[0] - b_1[0], b_2[1] - b_1[1])
+        denominator = d_a[0] * d_b[1] - d_a[1] * d_b[0]
+        if denominator != 0.0:
+            s = ((b_1[0] - a_1[0]) * d_b[1] - (b_1[1] - a_1[1]) * d_b[0]) / denominator
+            t = ((b_1[0] - a_1[0]) * d_a[1] - (b_1[1] - a_1[1]) * d_a[0]) / denominator
+            if 0.0 <= s <= 1.0 and 0.0 <= t <= 1.0:
+                # The segments intersect
+                fractions = (s, t)
+            else:
+                fractions = None
+        else:
+            fractions = None
+        if fractions is None:
+            # The closest points include at least one segment end point
+            candidates = [(0.0, RouteProximity.__project(b_1, b_2, a_1)),
+                          (1.0, RouteProximity.__project(b_1, b_2, a_2)),
+                          (RouteProximity.__project(a_1, a_2, b_1), 0.0),
+                          (RouteProximity.__project(a_1, a_2, b_2), 1.0)]
+            best = None
+            for s, t in candidates:
+                d_x = a_1[0] + d_a[0] * s - b_1[0] - d_b[0] * t
+                d_y = a_1[1] + d_a[1] * s - b_1[1] - d_b[1] * t
+                distance = d_x * d_x + d_y * d_y
+                if best is None or distance < best:
+                    best = distance
+                    fractions = (s, t)
+        s, t = fractions
+        return [segment_1[2] + (segment_1[4] - segment_1[2]) * s, segment_1[3] + (segment_1[5] - segment_1[3]) * s], \
+               [segment_2[2] + (segment_2[4] - segment_2[2]) * t, segment_2[3] + (segment_2[5] - segment_2[3]) * t]
+
+    def __refine_closest_points(self, utils, segment_1, segment_2, point_1, point_2, distance):
+        # type: (Utils, [], [], [float, float], [float, float], float) -> ([float, float], [float, float], float)
+        """Refines the closest points of two segments by minimising the geodesic distance along each
+        segment in turn, keeping the other point fixed.
+
+            :param utils: The Utils instance used for geodesic distances;
+            :param segment_1: The first segment as stored in self.segments;
+            :param segment_2: The second segment as stored in self.segments;
+            :param point_1: The estimated closest point on the first segment as [latitude, longitude];
+            :param point_2: The estimated closest point on the second segment as [latitude, longitude];
+            :param distance: The geodesic distance in meters between the estimated points;
+            :return: A tuple of the refined closest point on each segment and the distance between them;"""
+        for _ in range(self.REFINE_ITERATIONS):
+            candidate_1, _ = self.__minimise_along(utils, segment_1, point_2)
+            candidate_2, candidate_distance = self.__minimise_along(utils, segment_2, candidate_1)
+            if candidate_distance >= distance:
+                break
+            point_1, point_2, distance = candidate_1, candidate_2, candidate_distance
+        return point_1, point_2, distance
+
+    def __minimise_along(self, utils, segment, point):
+        # type: (Utils, [], [float, float]) -> ([float, float], float)
+        """Finds the point on a segment with the shortest geodesic distance to a fixed point using a golden
+        section search over the fraction along the segment.
+
+            :param utils: The Utils instance used for geodesic distances;
+            :param segment: The segment as stored in self.segments;
+            :param point: The fixed point as [latitude, longitude];
+            :return: A tuple of the closest point on the segment as [latitude, longitude] and its distance;"""
+        ratio = (math.sqrt(5.0) - 1.0) / 2.0
+        low = 0.0
+        high = 1.0
+        best = None
+        for _ in range(self.REFINE_STEPS):
+            fraction_1 = high - (high - low) * ratio
+            fraction_2 = low + (high - low) * ratio
+            result_1 = self.__distance_at(utils, segment, fraction_1, point)
+            result_2 = self.__distance_at(utils, segment, fraction_2, point)
+            if result_1[1] < result_2[1]:
+                high = fraction_2
+                better = result_1
+            else:
+                low = fraction_1
+                better = result_2
+            if best is None or better[1] < best[1]:
+                best = better
+        for fraction in (0.0, 1.0):
+            result = self.__distance_at(utils, segment, fraction, point)
+            if result[1] < best[1]:
+                best = result
+        return best
+
+    @staticmethod
+    def __distance_at(utils, segment, fraction, point):
+        # type: (Utils, [], float, [float, float]) -> ([float, float], float)
+        """Calculates the geodesic distance from a point on a segment to a fixed point.
+
+            :param utils: The Utils instance used for geodesic distances;
+            :param segment: The segment as stored in self.segments;
+            :param fraction: The fraction along the segment, 0.0 is the segment start point;
+            :param point: The fixed point as [latitude, longitude];
+            :return: A tuple of the point on the segment as [latitude, longitude] and its distance;"""
+        latitude = segment[2] + (segment[4] - segment[2]) * fraction
+        longitude = segment[3] + (segment[5] - segment[3]) * fraction
+        return [latitude, longitude], \
+            utils.get_bearing_distance_between_points(latitude, longitude, point[0], point[1])[1]
+
+    @staticmethod
+    def __project(start, end, point):
+        # type: ((float, float), (float, float), (float, float)) -> float
+        """Projects a point onto a segment in the plane.
+
+            :param start: The segment start point;
+            :param end: The segment end point;
+            :param point: The point to project;
+            :return: The fraction along the segment of the closest point, limited to 0.0 to 1.0;"""
+        d_x = end[0] - start[0]
+        d_y = end[1] - start[1]
+        length = d_x * d_x + d_y * d_y
+        if length == 0.0:
+            return 0.0
+        fraction = ((point[0] - start[0]) * d_x + (point[1] - start[1]) * d_y) / length
+        return min(max(fraction, 0.0), 1.0)
@@ -0,0 +1,101 @@
+import math
+
+
+class STRTree:
+    """This class is a static R-tree built with the Sort-Tile-Recursive (STR) packing algorithm. Items are
+    indexed by their bounding box given as (min x, min y, max x, max y); once built the tree is read only
+    and can be queried for all items whose bounding box intersects a query bounding box.
+
+    STR packing sorts the items by the x centre of their bounding boxes, cuts them into vertical slices
+    and sorts each slice by the y centre before grouping them into nodes. This produces nodes with little
+    overlap which keeps the number of nodes visited by a query small."""
+
+    NODE_CAPACITY: int = 10
+    """The maximum number of entries in a single tree node"""
+
+    root: [] = None
+    """The root node; a node is a list [bounding box, is leaf, children] where the children of a leaf
+    node are [bounding box, item] entries"""
+
+    size: int = 0
+    """The number of items stored in the tree"""
+
+    def __init__(self, entries, node_capacity=NODE_CAPACITY):
+        # type: ([[(float, float, float, float), object]], int) -> None
+        """Builds the tree from a list of entries.
+
+            :param entries: A list of two element lists, index 0 the bounding box of an item as
+                            (min x, min y, max x, max y), index 1 the item itself;
+            :param node_capacity: The maximum number of entries in a single tree node;
+            :return: None"""
+        self.size = len(entries)
+        self.root = None
+        if self.size == 0:
+            return
+        level = [[entry[0], True, entry[1]] for entry in entries]
+        leaf = True
+        while True:
+            level = self.__pack(level, node_capacity, leaf)
+            leaf = False
+            if len(level) == 1:
+                break
+        self.root = level[0]
+
+    def query(self, bounding_box):
+        # type: ((float, float, float, float)) -> []
+        """Retrieves all items whose bounding box intersects the given bounding box.
+
+            :param bounding_box: The query bounding box as (min x, min y, max x, max y);
+            :return: A list of the items intersecting the query bounding box, in no particular order;"""
+        result = []
+        if self.root is None:
+            return result
+        min_x, min_y, max_x, max_y = bounding_box
+        stack = [self.root]
+        while len(stack) > 0:
+            node_box, is_leaf, children = stack.pop()
+            if node_box[0] > max_x or node_box[2] < min_x or node_box[1] > max_y or node_box[3] < min_y:
+                continue
+            if is_leaf:
+                for child_box, item in children:
+                    if child_box[0] <= max_x and child_box[2] >= min_x and \
+                            child_box[1] <= max_y and child_box[3] >= min_y:
+                        result.append(item)
+            else:
+                stack.extend(children)
+        return result
+
+    def get_size(self):
+        # type: () -> int
+        """Gets the number of items stored in the tree.
+
+            :return: The number of items in the tree;"""
+        return self.size
+
+    @staticmethod
+    def __pack(level, node_capacity, leaf):
+        # type: ([], int, bool) -> []
+        """Packs one level of the tree into parent nodes using the STR algorithm.
+
+            :param level: The nodes (or item entries for the leaf level) to be packed;
+            :param node_capacity: The maximum number of entries in a single node;
+            :param leaf: True if the entries being packed are items, False if they are nodes;
+            :return: The list of parent nodes;"""
+        number_of_nodes = math.ceil(len(level) / node_capacity)
+        number_of_slices = math.ceil(math.sqrt(number_of_nodes))
+        slice_size = number_of_slices * node_capacity
+        level.sort(key=lambda entry: entry[0][0] + entry[0][2])
+        parents = []
+        for slice_start in range(0, len(level), slice_size):
+            vertical_slice = level[slice_start:slice_start + slice_size]
+            vertical_slice.sort(key=lambda entry: entry[0][1] + entry[0][3])
+            for node_start in range(0, len(vertical_slice), node_capacity):
+                group = vertical_slice[node_start:node_start + node_capacity]
+                box = (min(entry[0][0] for entry in group), min(entry[0][1] for entry in group),
+                       max(entry[0][2] for entry in group), max(entry[0][3] for entry in group))
+                if leaf:
+                    children = [[entry[0], entry[2]] for entry in group]
+                else:
+                    children = group
+                parents.append([box, leaf, children])
+        return parents
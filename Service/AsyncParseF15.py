@@ -0,0 +1,218 @@
+import asyncio
+import collections
+import time
+
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from F15_Parser.F15Dialect import F15Dialect
+from F15_Parser.F15Parse import ParseF15
+from Tokenizer.Tokenize import Tokenize
+
+
+class AsyncParseF15:
+    """This class is an asyncio front end to the field 15 tokenizer and parser. Tokenizing, parsing and the
+    geodesic calculations made by the parser are CPU bound and would stall an event loop, so each message is
+    parsed in an executor: the event loop's default thread pool, or any thread or process pool executor
+    given to the constructor. A process pool runs messages in parallel, the extracted route sequences are
+    pickled back to the event loop's process.
+
+    The number of messages being parsed at once is limited by a semaphore and parse_batch() reads its input
+    through a bounded queue, so a fast producer is held back rather than queueing an unbounded amount of
+    work. The latency of each message, from the call until its result is available including any time spent
+    waiting for a free slot, is recorded for the statistics."""
+
+    MAX_CONCURRENCY: int = 8
+    """The default maximum number of messages parsed at once"""
+
+    QUEUE_SIZE: int = 64
+    """The default maximum number of messages read ahead by parse_batch()"""
+
+    LATENCY_WINDOW: int = 10000
+    """The number of most recent message latencies kept for the latency percentiles"""
+
+    executor = None
+    """The executor messages are parsed in, None for the event loop's default executor"""
+
+    queue_size: int = QUEUE_SIZE
+    """The maximum number of messages read ahead by parse_batch()"""
+
+    whitespace: str = ""
+    """Whitespace token delimiter characters"""
+
+    semaphore: asyncio.Semaphore = None
+    """Limits the number of messages being parsed at once"""
+
+    messages: int = 0
+    """The number of messages parsed"""
+
+    in_flight: int = 0
+    """The number of messages currently waiting for or being parsed"""
+
+    total_latency: float = 0.0
+    """The sum of all message latencies in seconds"""
+
+    latencies: collections.deque = None
+    """The most recent message latencies in seconds"""
+
+    def __init__(self, executor=None, max_concurrency=MAX_CONCURRENCY, queue_size=QUEUE_SIZE,
+                 whitespace=" \n\t\r/"):
+        # type: (concurrent.futures.Executor, int, int, str) -> None
+        """Constructor.
+
+            :param executor: A thread or process pool executor to parse messages in, None for the event loop's
+                             default executor;
+            :param max_concurrency: The maximum number of messages parsed at once;
+            :param queue_size: The maximum number of messages read ahead by parse_batch();
+            :param whitespace: The whitespace characters used to tokenize field 15;
+            :return: None"""
+        if max_concurrency <= 0 or queue_size <= 0:
+            raise ValueError("The concurrency and queue size must be positive")
+        self.executor = executor
+        self.queue_size = queue_size
+        self.whitespace = whitespace
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.messages = 0
+        self.in_flight = 0
+        self.total_latency = 0.0
+        self.latencies = collections.deque(maxlen=self.LATENCY_WINDOW)
+
+    @staticmethod
+    def parse_text(field_15, whitespace=" \n\t\r/", dialect=None, object_pool=None):
+        # type: (str, str, str, ParseObjectPool) -> ExtractedRouteSequence
+        """Tokenizes and parses a field 15 string; this is the work run in the executor.
+
+            :param field_15: The field 15 string to parse;
+            :param whitespace: The whitespace characters used to tokenize field 15;
+            :param dialect: The name of the field 15 dialect the string is parsed against, see F15Dialect,
+                            the default dialect if None;
+            :param object_pool: The pool the tokens and the ERS are taken from, the tokens are returned to it
+                                after parsing and the caller returns the ERS with release_sequence(); None to
+                                create new objects;
+            :return: The extracted route sequence;"""
+        tokenizer = Tokenize()
+        tokenizer.set_whitespace(whitespace)
+        tokenizer.set_object_pool(object_pool)
+        tokenizer.set_string_to_tokenize(field_15)
+        tokenizer.tokenize()
+        ers = ExtractedRouteSequence() if object_pool is None else object_pool.get_sequence()
+        F15Dialect.get_dialect(dialect).parse_f15(ers, tokenizer.get_tokens())
+        if object_pool is not None:
+            object_pool.release_tokens(tokenizer.get_tokens())
+        return ers
+
+    @staticmethod
+    def parse_texts(field_15s, whitespace=" \n\t\r/", dialect=None, object_pool=None):
+        # type: ([str], str, str, ParseObjectPool) -> [ExtractedRouteSequence]
+        """Tokenizes and parses a batch of field 15 strings. The tokens of the whole batch are classified
+        together, each distinct token string once, before the strings are parsed in turn.
+
+            :param field_15s: The field 15 strings to parse;
+            :param whitespace: The whitespace characters used to tokenize field 15;
+            :param dialect: The name of the field 15 dialect the strings are parsed against, see F15Dialect,
+                            the default dialect if None;
+            :param object_pool: The pool the tokens and the ERSs are taken from, see parse_text(), None to
+                                create new objects;
+            :return: The extracted route sequence of each string;"""
+        f15_dialect = F15Dialect.get_dialect(dialect)
+        tokenizer = Tokenize()
+        tokenizer.set_whitespace(whitespace)
+        tokenizer.set_object_pool(object_pool)
+        token_lists = []
+        for field_15 in field_15s:
+            tokenizer.set_string_to_tokenize(field_15)
+            tokenizer.tokenize()
+            token_lists.append(tokenizer.get_tokens())
+        ParseF15.assign_batch_syntax_descriptions(token_lists, f15_dialect.intern_pool)
+        results = []
+        for tokens in token_lists:
+            ers = ExtractedRouteSequence() if object_pool is None else object_pool.get_sequence()
+            f15_dialect.parse_f15(ers, tokens, False)
+            results.append(ers)
+            if object_pool is not None:
+                object_pool.release_tokens(tokens)
+        return results
+
+    async def parse_f15_async(self, field_15, dialect=None):
+        # type: (str, str) -> ExtractedRouteSequence
+        """Parses a field 15 string in the executor without blocking the event loop. If the maximum number
+        of messages are already being parsed the call waits for one of them to finish.
+
+            :param field_15: The field 15 string to parse;
+            :param dialect: The name of the field 15 dialect the string is parsed against, the default dialect
+                            if None;
+            :return: The extracted route sequence;"""
+        start = time.perf_counter()
+        self.in_flight = self.in_flight + 1
+        try:
+            async with self.semaphore:
+                ers = await asyncio.get_running_loop().run_in_executor(
+                    self.executor, AsyncParseF15.parse_text, field_15, self.whitespace, dialect)
+        finally:
+            self.in_flight = self.in_flight - 1
+        latency = time.perf_counter() - start
+        self.messages = self.messages + 1
+        self.total_latency = self.total_latency + latency
+        self.latencies.append(latency)
+        return ers
+
+    async def parse_batch(self, field_15s):
+        # type: (Iterable[str] | AsyncIterable[str]) -> AsyncGenerator[ExtractedRouteSequence]
+        """Parses a batch of field 15 strings, yielding the results in input order. Messages are read from
+        the input into a bounded queue; once queue_size messages are waiting to be consumed no further
+        messages are read until the caller consumes a result.
+
+            :param field_15s: An iterable or asynchronous iterable of field 15 strings;
+            :return: An asynchronous generator yielding the extracted route sequence of each string;"""
+        queue = asyncio.Queue(self.queue_size)
+        producer = asyncio.ensure_future(self.__produce(field_15s, queue))
+        try:
+            while True:
+                task = await queue.get()
+                if task is None:
+                    break
+                yield await task
+            # Re-raise any error reading the input
+            await producer
+        finally:
+            producer.cancel()
+            while not queue.empty():
+                task = queue.get_nowait()
+                if task is not None:
+                    task.cancel()
+
+    def get_statistics(self):
+        # type: () -> {}
+        """Gets the latency statistics.
+
+            :return: A dictionary with the number of messages parsed and in flight, and the mean, minimum,
+                     median, 95th percentile and maximum latency in seconds; the minimum, percentiles and
+                     maximum are over the most recent LATENCY_WINDOW messages;"""
+        recent = sorted(self.latencies)
+        return {
+            "messages": self.messages,
+            "in_flight": self.in_flight,
+            "mean_latency": self.total_latency / self.messages if self.messages > 0 else 0.0,
+            "min_latency": recent[0] if len(recent) > 0 else 0.0,
+            "p50_latency": recent[len(recent) // 2] if len(recent) > 0 else 0.0,
+            "p95_latency": recent[min(len(recent) - 1, (len(recent) * 95) // 100)] if len(recent) > 0 else 0.0,
+            "max_latency": recent[-1] if len(recent) > 0 else 0.0
+        }
+
+    async def __produce(self, field_15s, queue):
+        # type: (Iterable[str] | AsyncIterable[str], asyncio.Queue) -> None
+        """Reads the input of parse_batch(), starting to parse each string and queueing its task. None is
+        queued once the input is exhausted or reading it fails, but not when the producer is cancelled.
+
+            :param field_15s: An iterable or asynchronous iterable of field 15 strings;
+            :param queue: The bounded queue of tasks;
+            :return: None"""
+        try:
+            if hasattr(field_15s, "__aiter__"):
+                async for field_15 in field_15s:
+                    await queue.put(asyncio.ensure_future(self.parse_f15_async(field_15)))
+            else:
+                for field_15 in field_15s:
+                    await queue.put(asyncio.ensure_future(self.parse_f15_async(field_15)))
+        except Exception:
+            await queue.put(None)
+            raise
+        await queue.put(None)
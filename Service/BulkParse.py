@@ -0,0 +1,320 @@
+import argparse
+import collections
+import concurrent.futures
+import fnmatch
+import json
+import os
+import sys
+import time
+from xml.sax.saxutils import quoteattr
+
+from F15_Parser.F15Dialect import F15Dialect
+from F15_Parser.ParseObjectPool import ParseObjectPool
+from IcaoMessage.IcaoMessage import IcaoMessage
+from IcaoMessage.IcaoMessageFramer import IcaoMessageFramer
+from Service.AsyncParseF15 import AsyncParseF15
+from Service.ErsCodec import ErsCodec
+from Utilities.GcControl import GcControl
+
+
+class BulkParse:
+    """This class parses field 15 strings or complete ICAO messages in bulk, e.g. to re-process an archive.
+    Input is read from files, directory trees or stdin: in 'f15' mode every non blank line is a field 15
+    string, in 'icao' mode the input is framed into ICAO messages and the route of each FPL, CPL or CHG
+    message is parsed. Items are parsed in chunks by a pool of worker processes, at most a few chunks per
+    worker are in flight so memory use does not depend on the input size. Chunks are written in input order.
+
+    Output formats are:
+        - 'ndjson': one JSON object per line with the source, the position (line number or message offset)
+          and the ERS encoded by ErsCodec.encode();
+        - 'xml': an <ers_list> document of <route> elements containing ExtractedRouteSequence.as_xml();
+        - 'binary': the ERSs encoded by ErsCodec.encode_binary() one after the other.
+
+    In batch mode field 15 routes are parsed with the objects of a ParseObjectPool, each ERS is released as
+    soon as it has been encoded, and the cyclic garbage collector is suspended while a chunk is parsed, see
+    GcControl."""
+
+    FORMATS = ["ndjson", "xml", "binary"]
+    """The supported output formats"""
+
+    INPUT_FORMATS = ["f15", "icao"]
+    """The supported input formats"""
+
+    CHUNK_SIZE: int = 256
+    """The default number of items parsed by a worker in a single job"""
+
+    BUFFER_SIZE: int = 1024 * 1024
+    """The size of the output buffer in bytes"""
+
+    input_format: str = "f15"
+    """One of INPUT_FORMATS"""
+
+    output_format: str = "ndjson"
+    """One of FORMATS"""
+
+    workers: int = 1
+    """The number of worker processes, 1 to parse in the calling process"""
+
+    chunk_size: int = CHUNK_SIZE
+    """The number of items parsed by a worker in a single job"""
+
+    pattern: str = None
+    """The file name pattern of files read from directories, e.g. '*.txt', None to read all files"""
+
+    dialect: str = None
+    """The name of the field 15 dialect routes are parsed against, see F15Dialect, None for the default dialect"""
+
+    pooling: bool = False
+    """True to recycle the tokens and ERS records of field 15 routes through the shared ParseObjectPool"""
+
+    gc_mode: str = GcControl.NONE
+    """The garbage collection mode while a chunk is parsed, one of GcControl.MODES"""
+
+    statistics: collections.Counter = None
+    """Counts of items, routes, routes with errors, errors, skipped items and input bytes"""
+
+    def __init__(self, input_format="f15", output_format="ndjson", workers=1, chunk_size=CHUNK_SIZE,
+                 pattern=None, dialect=None, pooling=False, gc_mode=GcControl.NONE):
+        # type: (str, str, int, int, str, str, bool, str) -> None
+        """Constructor.
+
+            :param input_format: 'f15' for one field 15 per line or 'icao' for ICAO messages;
+            :param output_format: 'ndjson', 'xml' or 'binary';
+            :param workers: The number of worker processes, 1 to parse in the calling process;
+            :param chunk_size: The number of items parsed by a worker in a single job;
+            :param pattern: The file name pattern of files read from directories, e.g. '*.txt', None for all files;
+            :param dialect: The name of the field 15 dialect routes are parsed against, None for the default;
+            :param pooling: True to recycle the tokens and ERS records of field 15 routes;
+            :param gc_mode: The garbage collection mode while a chunk is parsed, one of GcControl.MODES;
+            :return: None"""
+        if input_format not in self.INPUT_FORMATS or output_format not in self.FORMATS:
+            raise ValueError("Unsupported input or output format")
+        if gc_mode not in GcControl.MODES:
+            raise ValueError("Unsupported garbage collection mode")
+        if workers <= 0 or chunk_size <= 0:
+            raise ValueError("The number of workers and the chunk size must be positive")
+        self.input_format = input_format
+        self.output_format = output_format
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.pattern = pattern
+        self.dialect = F15Dialect.get_dialect(dialect).get_name()
+        self.pooling = pooling
+        self.gc_mode = gc_mode
+        self.statistics = collections.Counter()
+
+    def run(self, paths, output):
+        # type: ([str], io.BufferedIOBase) -> {}
+        """Parses all items of the given inputs and writes the results.
+
+            :param paths: Files and directories to read, '-' reads stdin;
+            :param output: A binary stream the results are written to;
+            :return: The statistics, see get_statistics();"""
+        self.statistics = collections.Counter()
+        start = time.perf_counter()
+        if self.output_format == "xml":
+            output.write(b"<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n<ers_list>\n")
+        if self.workers == 1:
+            for chunk in self.__read_chunks(paths):
+                self.__write(output, BulkParse.parse_chunk(chunk, self.input_format, self.output_format,
+                                                           self.dialect, self.pooling, self.gc_mode))
+        else:
+            with concurrent.futures.ProcessPoolExecutor(self.workers) as executor:
+                pending = collections.deque()
+                for chunk in self.__read_chunks(paths):
+                    pending.append(executor.submit(BulkParse.parse_chunk, chunk, self.input_format,
+                                                   self.output_format, self.dialect, self.pooling, self.gc_mode))
+                    if len(pending) >= self.workers * 2:
+                        self.__write(output, pending.popleft().result())
+                while len(pending) > 0:
+                    self.__write(output, pending.popleft().result())
+        if self.output_format == "xml":
+            output.write(b"</ers_list>\n")
+        output.flush()
+        self.statistics["elapsed_ms"] = int((time.perf_counter() - start) * 1000.0)
+        return self.get_statistics()
+
+    def get_statistics(self):
+        # type: () -> {}
+        """Gets the statistics of the last run.
+
+            :return: A dictionary with the numbers of items read, routes parsed, routes with errors, errors,
+                     skipped items (messages without a route) and input bytes, the elapsed time in seconds
+                     and the routes and input megabytes per second;"""
+        elapsed = self.statistics["elapsed_ms"] / 1000.0
+        return {
+            "items": self.statistics["items"],
+            "routes": self.statistics["routes"],
+            "routes_with_errors": self.statistics["routes_with_errors"],
+            "errors": self.statistics["errors"],
+            "skipped": self.statistics["skipped"],
+            "input_bytes": self.statistics["input_bytes"],
+            "elapsed": elapsed,
+            "routes_per_second": self.statistics["routes"] / elapsed if elapsed > 0 else 0.0,
+            "megabytes_per_second": self.statistics["input_bytes"] / 1000000.0 / elapsed if elapsed > 0 else 0.0
+        }
+
+    @staticmethod
+    def parse_chunk(chunk, input_format, output_format, dialect=None, pooling=False, gc_mode=GcControl.NONE):
+        # type: ([(str, int, str)], str, str, str, bool, str) -> (bytes, {})
+        """Parses and encodes a chunk of items; this is the work run by the workers.
+
+            :param chunk: A list of (source, position, text) items, the text is a field 15 string or an
+                          ICAO message depending on the input format;
+            :param input_format: 'f15' or 'icao';
+            :param output_format: 'ndjson', 'xml' or 'binary';
+            :param dialect: The name of the field 15 dialect routes are parsed against, None for the default;
+            :param pooling: True to recycle the tokens and ERS records of field 15 routes through the shared
+                            ParseObjectPool of the process;
+            :param gc_mode: The garbage collection mode while the chunk is parsed, one of GcControl.MODES;
+            :return: The encoded output of the chunk and the statistics counts of the chunk;"""
+        with GcControl(gc_mode):
+            return BulkParse.__parse_chunk(chunk, input_format, output_format, dialect,
+                                           ParseObjectPool.get_shared_pool() if pooling else None)
+
+    @staticmethod
+    def __parse_chunk(chunk, input_format, output_format, dialect, object_pool):
+        # type: ([(str, int, str)], str, str, str, ParseObjectPool) -> (bytes, {})
+        """Parses and encodes a chunk of items, see parse_chunk().
+
+            :param chunk: A list of (source, position, text) items;
+            :param input_format: 'f15' or 'icao';
+            :param output_format: 'ndjson', 'xml' or 'binary';
+            :param dialect: The name of the field 15 dialect routes are parsed against, None for the default;
+            :param object_pool: The pool field 15 routes are parsed with, None to create new objects;
+            :return: The encoded output of the chunk and the statistics counts of the chunk;"""
+        parts = []
+        counts = collections.Counter()
+        if input_format == "f15":
+            # The tokens of all routes in the chunk are classified together
+            routes = iter(AsyncParseF15.parse_texts([text for _, _, text in chunk], dialect=dialect,
+                                                    object_pool=object_pool))
+        for source, position, text in chunk:
+            counts["items"] = counts["items"] + 1
+            counts["input_bytes"] = counts["input_bytes"] + len(text)
+            if input_format == "icao":
+                ers = IcaoMessage(text).parse_route(dialect=dialect)
+                if ers is None:
+                    counts["skipped"] = counts["skipped"] + 1
+                    continue
+            else:
+                ers = next(routes)
+            counts["routes"] = counts["routes"] + 1
+            if ers.get_number_of_errors() > 0:
+                counts["routes_with_errors"] = counts["routes_with_errors"] + 1
+                counts["errors"] = counts["errors"] + ers.get_number_of_errors()
+            match output_format:
+                case "ndjson":
+                    parts.append(json.dumps({"source": source, "position": position, "ers": ErsCodec.encode(ers)},
+                                            separators=(",", ":")).encode("utf-8") + b"\n")
+                case "xml":
+                    parts.append(("<route source=" + quoteattr(source) + " position=\"" + str(position) +
+                                  "\">\n" + ers.as_xml() + "\n</route>\n").encode("utf-8"))
+                case "binary":
+                    parts.append(ErsCodec.encode_binary(ers))
+            if object_pool is not None:
+                object_pool.release_sequence(ers)
+        return b"".join(parts), counts
+
+    def __write(self, output, result):
+        # type: (io.BufferedIOBase, (bytes, {})) -> None
+        """Writes the output of a chunk and adds its statistics.
+
+            :param output: The binary output stream;
+            :param result: The encoded output and statistics counts of the chunk;
+            :return: None"""
+        output.write(result[0])
+        self.statistics.update(result[1])
+
+    def __read_chunks(self, paths):
+        # type: ([str]) -> Generator[[(str, int, str)]]
+        """Reads all items of the inputs and groups them into chunks.
+
+            :param paths: Files and directories to read, '-' reads stdin;
+            :return: A generator yielding lists of (source, position, text) items;"""
+        chunk = []
+        for item in self.__read_items(paths):
+            chunk.append(item)
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+        if len(chunk) > 0:
+            yield chunk
+
+    def __read_items(self, paths):
+        # type: ([str]) -> Generator[(str, int, str)]
+        """Reads the items of all inputs.
+
+            :param paths: Files and directories to read, '-' reads stdin;
+            :return: A generator yielding (source, position, text) items;"""
+        for path in paths:
+            if path == "-":
+                yield from self.__read_stream("<stdin>", sys.stdin)
+            elif os.path.isdir(path):
+                for directory, directory_names, file_names in os.walk(path):
+                    directory_names.sort()
+                    for file_name in sorted(file_names):
+                        if self.pattern is None or fnmatch.fnmatch(file_name, self.pattern):
+                            yield from self.__read_file(os.path.join(directory, file_name))
+            else:
+                yield from self.__read_file(path)
+
+    def __read_file(self, path):
+        # type: (str) -> Generator[(str, int, str)]
+        """Reads the items of a file.
+
+            :param path: The file to read;
+            :return: A generator yielding (source, position, text) items;"""
+        with open(path, "r", encoding="latin-1", newline="", buffering=self.BUFFER_SIZE) as stream:
+            yield from self.__read_stream(path, stream)
+
+    def __read_stream(self, source, stream):
+        # type: (str, io.TextIOBase) -> Generator[(str, int, str)]
+        """Reads the items of a text stream, field 15 lines or framed ICAO messages.
+
+            :param source: The name of the input reported with each item;
+            :param stream: The text stream;
+            :return: A generator yielding (source, position, text) items, the position is the one based line
+                     number for field 15 input or the message offset for ICAO input;"""
+        if self.input_format == "icao":
+            for message in IcaoMessageFramer().frame_stream(stream):
+                yield source, message.get_stream_offset(), message.get_text()
+        else:
+            for line_number, line in enumerate(stream, 1):
+                line = line.strip()
+                if len(line) > 0:
+                    yield source, line_number, line
+
+
+if __name__ == '__main__':
+    argument_parser = argparse.ArgumentParser(description="Bulk ICAO field 15 parser")
+    argument_parser.add_argument("paths", nargs="*", default=["-"],
+                                 help="Files or directories to parse, '-' for stdin (default)")
+    argument_parser.add_argument("--input-format", choices=BulkParse.INPUT_FORMATS, default="f15",
+                                 help="'f15' for one field 15 per line, 'icao' for ICAO messages")
+    argument_parser.add_argument("--format", choices=BulkParse.FORMATS, default="ndjson", help="Output format")
+    argument_parser.add_argument("--output", default="-", help="Output file, '-' for stdout (default)")
+    argument_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    argument_parser.add_argument("--chunk-size", type=int, default=BulkParse.CHUNK_SIZE, help="Items per job")
+    argument_parser.add_argument("--pattern", default=None,
+                                 help="File name pattern of files read from directories, e.g. '*.txt'")
+    argument_parser.add_argument("--dialect", choices=F15Dialect.get_dialect_names(), default=F15Dialect.DEFAULT,
+                                 help="Field 15 dialect routes are parsed against")
+    argument_parser.add_argument("--pool", action="store_true",
+                                 help="Recycle the tokens and records of field 15 routes between routes")
+    argument_parser.add_argument("--gc", choices=GcControl.MODES, default=GcControl.NONE,
+                                 help="Garbage collection mode while a chunk is parsed")
+    arguments = argument_parser.parse_args()
+
+    bulk_parse = BulkParse(arguments.input_format, arguments.format, arguments.workers, arguments.chunk_size,
+                           arguments.pattern, arguments.dialect, arguments.pool, arguments.gc)
+    if arguments.output == "-":
+        result = bulk_parse.run(arguments.paths, sys.stdout.buffer)
+    else:
+        with open(arguments.output, "wb", buffering=BulkParse.BUFFER_SIZE) as output_file:
+            result = bulk_parse.run(arguments.paths, output_file)
+    print("{0} items, {1} routes, {2} routes with errors, {3} errors, {4} skipped in {5:.2f} s: "
+          "{6:.0f} routes/s, {7:.2f} MB/s".format(result["items"], result["routes"], result["routes_with_errors"],
+                                                   result["errors"], result["skipped"], result["elapsed"],
+                                                   result["routes_per_second"], result["megabytes_per_second"]),
+          file=sys.stderr)
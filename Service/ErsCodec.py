@@ -0,0 +1,168 @@
+import struct
+
+from F15_Parser.ExtractedRouteRecord import ExtractedRouteRecord
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+
+
+class ErsCodec:
+    """This class encodes extracted route sequences into compact structures of lists, strings and numbers
+    that can be serialised as JSON. Each record is a list of values in the order given by RECORD_FIELDS
+    rather than a dictionary, so field names are not repeated for every record; clients map the values
+    to names with the field list returned in each encoded ERS.
+
+    The binary encoding holds the same values. An ERS is a 4 byte big endian length followed by the derived
+    flight rules and the numbers of records and errors; each record or error is a fixed size block of its
+    numeric values (BINARY_RECORD / BINARY_ERROR) followed by its strings, each a 4 byte length and UTF-8
+    text, in the order of BINARY_RECORD_STRINGS / BINARY_ERROR_STRINGS. The counts and string lengths are 4
+    bytes as break and error texts hold field 15 input, which may be of any length."""
+
+    RECORD_FIELDS = ["name", "start_index", "end_index", "base_type", "sub_type", "speed", "speed_si",
+                     "altitude", "altitude_si", "bearing", "distance", "flight_rules", "stay_time",
+                     "altitude_cruise_to", "altitude_cruise_to_si", "latitude", "longitude", "lat_long_valid",
+                     "break_text"]
+    """The names of the values in an encoded ERS record"""
+
+    ERROR_FIELDS = ["name", "start_index", "end_index", "base_type", "sub_type", "error_text"]
+    """The names of the values in an encoded error record"""
+
+    BINARY_LENGTH = struct.Struct(">I")
+    """The length of a binary encoded ERS following the length itself"""
+
+    BINARY_HEADER = struct.Struct(">II")
+    """The numbers of records and errors of a binary encoded ERS"""
+
+    BINARY_STRING_LENGTH = struct.Struct(">I")
+    """The length of a binary encoded string"""
+
+    BINARY_RECORD = struct.Struct(">iiHHddddidddB")
+    """The numeric values of a binary encoded record: start_index, end_index, base_type, sub_type, speed_si,
+    altitude_si, bearing, distance, stay_time, altitude_cruise_to_si, latitude, longitude and lat_long_valid"""
+
+    BINARY_RECORD_STRINGS = ["name", "speed", "altitude", "flight_rules", "altitude_cruise_to", "break_text"]
+    """The strings following the numeric values of a binary encoded record"""
+
+    BINARY_ERROR = struct.Struct(">iiHH")
+    """The numeric values of a binary encoded error: start_index, end_index, base_type and sub_type"""
+
+    BINARY_ERROR_STRINGS = ["name", "error_text"]
+    """The strings following the numeric values of a binary encoded error"""
+
+    @staticmethod
+    def encode(ers):
+        # type: (ExtractedRouteSequence) -> {}
+        """Encodes an extracted route sequence.
+
+            :param ers: The extracted route sequence to encode;
+            :return: A dictionary with the derived flight rules and the lists of encoded records and errors;"""
+        return {
+            "derived_flight_rules": ers.get_derived_flight_rules(),
+            "records": [ErsCodec.encode_record(record) for record in ers.get_all_elements()],
+            "errors": [ErsCodec.encode_error(error) for error in ers.get_error_entries()]
+        }
+
+    @staticmethod
+    def encode_record(record):
+        # type: (ExtractedRouteRecord) -> []
+        """Encodes a single ERS record.
+
+            :param record: The record to encode;
+            :return: The record values in the order of RECORD_FIELDS;"""
+        return [record.get_name(), record.get_start_index(), record.get_end_index(),
+                int(record.get_base_type()), int(record.get_sub_type()), record.get_speed(),
+                record.get_speed_si(), record.get_altitude(), record.get_altitude_si(), record.get_bearing(),
+                record.get_distance(), record.get_flight_rules(), record.get_stay_time(),
+                record.get_altitude_cruise_to(), record.get_altitude_cruise_to_si(), record.get_latitude(),
+                record.get_longitude(), record.is_lat_long_valid(), record.get_break_text()]
+
+    @staticmethod
+    def encode_error(record):
+        # type: (ErrorEntry | ExtractedRouteRecord) -> []
+        """Encodes a single error.
+
+            :param record: The error entry or error record to encode;
+            :return: The error values in the order of ERROR_FIELDS;"""
+        return [record.get_name(), record.get_start_index(), record.get_end_index(),
+                int(record.get_base_type()), int(record.get_sub_type()), record.get_error_text()]
+
+    @staticmethod
+    def encode_binary(ers):
+        # type: (ExtractedRouteSequence) -> bytes
+        """Encodes an extracted route sequence in the binary encoding.
+
+            :param ers: The extracted route sequence to encode;
+            :return: The length prefixed binary encoded ERS;"""
+        parts = [ErsCodec.__encode_string(ers.get_derived_flight_rules()),
+                 ErsCodec.BINARY_HEADER.pack(ers.get_number_of_elements(), ers.get_number_of_errors())]
+        names = ErsCodec.RECORD_FIELDS
+        for record in ers.get_all_elements():
+            values = ErsCodec.encode_record(record)
+            parts.append(ErsCodec.BINARY_RECORD.pack(
+                values[1], values[2], values[3], values[4], values[6], values[8], values[9], values[10],
+                values[12], values[14], values[15], values[16], values[17]))
+            for name in ErsCodec.BINARY_RECORD_STRINGS:
+                parts.append(ErsCodec.__encode_string(values[names.index(name)]))
+        for error in ers.get_error_entries():
+            values = ErsCodec.encode_error(error)
+            parts.append(ErsCodec.BINARY_ERROR.pack(values[1], values[2], values[3], values[4]))
+            parts.append(ErsCodec.__encode_string(values[0]))
+            parts.append(ErsCodec.__encode_string(values[5]))
+        body = b"".join(parts)
+        return ErsCodec.BINARY_LENGTH.pack(len(body)) + body
+
+    @staticmethod
+    def decode_binary(data, offset=0):
+        # type: (bytes, int) -> ({}, int)
+        """Decodes a binary encoded ERS into the structure returned by encode().
+
+            :param data: A buffer containing one or more binary encoded ERSs;
+            :param offset: The offset of the ERS in the buffer;
+            :return: The decoded ERS and the offset following it in the buffer;"""
+        length = ErsCodec.BINARY_LENGTH.unpack_from(data, offset)[0]
+        offset = offset + ErsCodec.BINARY_LENGTH.size
+        end = offset + length
+        derived_flight_rules, offset = ErsCodec.__decode_string(data, offset)
+        number_of_records, number_of_errors = ErsCodec.BINARY_HEADER.unpack_from(data, offset)
+        offset = offset + ErsCodec.BINARY_HEADER.size
+        records = []
+        for _ in range(number_of_records):
+            numbers = ErsCodec.BINARY_RECORD.unpack_from(data, offset)
+            offset = offset + ErsCodec.BINARY_RECORD.size
+            strings = []
+            for _ in ErsCodec.BINARY_RECORD_STRINGS:
+                string, offset = ErsCodec.__decode_string(data, offset)
+                strings.append(string)
+            records.append([strings[0], numbers[0], numbers[1], numbers[2], numbers[3], strings[1], numbers[4],
+                            strings[2], numbers[5], numbers[6], numbers[7], strings[3], numbers[8], strings[4],
+                            numbers[9], numbers[10], numbers[11], numbers[12] != 0, strings[5]])
+        errors = []
+        for _ in range(number_of_errors):
+            numbers = ErsCodec.BINARY_ERROR.unpack_from(data, offset)
+            offset = offset + ErsCodec.BINARY_ERROR.size
+            name, offset = ErsCodec.__decode_string(data, offset)
+            error_text, offset = ErsCodec.__decode_string(data, offset)
+            errors.append([name, numbers[0], numbers[1], numbers[2], numbers[3], error_text])
+        if offset != end:
+            raise ValueError("Corrupt binary ERS")
+        return {"derived_flight_rules": derived_flight_rules, "records": records, "errors": errors}, end
+
+    @staticmethod
+    def __encode_string(string):
+        # type: (str) -> bytes
+        """Encodes a string as a 4 byte length followed by its UTF-8 text.
+
+            :param string: The string to encode;
+            :return: The encoded string;"""
+        encoded = string.encode("utf-8")
+        return ErsCodec.BINARY_STRING_LENGTH.pack(len(encoded)) + encoded
+
+    @staticmethod
+    def __decode_string(data, offset):
+        # type: (bytes, int) -> (str, int)
+        """Decodes a string encoded by __encode_string().
+
+            :param data: The buffer containing the string;
+            :param offset: The offset of the string in the buffer;
+            :return: The string and the offset following it in the buffer;"""
+        length = ErsCodec.BINARY_STRING_LENGTH.unpack_from(data, offset)[0]
+        offset = offset + ErsCodec.BINARY_STRING_LENGTH.size
+        return str(data[offset:offset + length], "utf-8"), offset + length
@@ -0,0 +1,70 @@
+import json
+import socket
+
+from Service.ParseDaemon import ParseDaemon
+
+
+class ParseClient:
+    """This class is a blocking client for the ParseDaemon. A client holds one connection and sends one
+    request at a time; use one client per thread."""
+
+    connection: socket.socket = None
+    """The connection to the daemon"""
+
+    next_id: int = 0
+    """The id of the next request"""
+
+    def __init__(self, address):
+        # type: ((str, int) | str) -> None
+        """Connects to a daemon.
+
+            :param address: The (host, port) of a TCP daemon or the path of a Unix domain socket;
+            :return: None"""
+        if isinstance(address, str):
+            self.connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self.connection = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.connection.connect(address)
+        self.next_id = 0
+
+    def parse(self, routes):
+        # type: ([str]) -> {}
+        """Sends a batch of routes and waits for the response.
+
+            :param routes: The field 15 strings to parse;
+            :return: The response, see ParseDaemon;"""
+        self.next_id = self.next_id + 1
+        return self.request({"id": self.next_id, "routes": routes})
+
+    def request(self, request):
+        # type: ({}) -> {}
+        """Sends a request and waits for the response.
+
+            :param request: The request, see ParseDaemon;
+            :return: The response;
+            :raise ConnectionError: If the daemon closes the connection;"""
+        self.connection.sendall(ParseDaemon.encode_frame(request))
+        length = ParseDaemon.HEADER.unpack(self.__receive(ParseDaemon.HEADER.size))[0]
+        return json.loads(self.__receive(length))
+
+    def close(self):
+        # type: () -> None
+        """Closes the connection.
+
+            :return: None"""
+        self.connection.close()
+
+    def __receive(self, length):
+        # type: (int) -> bytes
+        """Receives exactly length bytes.
+
+            :param length: The number of bytes to receive;
+            :return: The bytes received;"""
+        data = bytearray()
+        while len(data) < length:
+            chunk = self.connection.recv(length - len(data))
+            if len(chunk) == 0:
+                raise ConnectionError("Connection closed by the daemon")
+            data.extend(chunk)
+        return bytes(data)
@@ -0,0 +1,244 @@
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import os
+import struct
+import threading
+
+from Service.AsyncParseF15 import AsyncParseF15
+from Service.ErsCodec import ErsCodec
+
+
+class ParseDaemon:
+    """This class is a long running field 15 parse service listening on a TCP or Unix domain socket, so that
+    components not written in Python can parse field 15 without starting an interpreter per message.
+
+    Every request and response is a frame: a 4 byte big endian unsigned length followed by that many bytes
+    of UTF-8 JSON. A request is {"id": <any>, "routes": [<field 15>, ...]}, a batch of one or more field 15
+    strings. The response is {"id": <request id>, "record_fields": [...], "error_fields": [...],
+    "results": [<encoded ERS>, ...]} with one result per route in request order (see ErsCodec), or
+    {"id": <request id>, "error": <text>} if the request could not be processed. A connection can send any
+    number of requests, responses are returned in request order; connections are served concurrently.
+
+    The routes of a request are split into jobs of JOB_SIZE routes that are parsed and encoded by a pool
+    of worker processes (or threads). The workers are started and warmed up before the daemon accepts
+    connections so no request pays the import and table set up cost."""
+
+    HEADER = struct.Struct(">I")
+    """The frame header, the length of the JSON payload"""
+
+    MAX_FRAME_SIZE: int = 16 * 1024 * 1024
+    """Frames larger than this are rejected and the connection is closed"""
+
+    JOB_SIZE: int = 16
+    """The maximum number of routes parsed by a worker in a single job"""
+
+    host: str = "127.0.0.1"
+    """The TCP host to listen on, not used for a Unix domain socket"""
+
+    port: int = 0
+    """The TCP port to listen on, 0 for any free port, not used for a Unix domain socket"""
+
+    unix_path: str = None
+    """The path of the Unix domain socket to listen on, None to listen on TCP"""
+
+    workers: int = 1
+    """The number of worker processes or threads"""
+
+    processes: bool = True
+    """True to parse in worker processes, False to parse in worker threads"""
+
+    executor: concurrent.futures.Executor = None
+    """The worker pool"""
+
+    server: asyncio.AbstractServer = None
+    """The listening server while the daemon is running"""
+
+    address = None
+    """The address the daemon is listening on, (host, port) for TCP or the socket path, once started"""
+
+    loop: asyncio.AbstractEventLoop = None
+    """The event loop running the daemon"""
+
+    stop_event: asyncio.Event = None
+    """Set to stop a daemon running in a background thread"""
+
+    thread: threading.Thread = None
+    """The background thread running the daemon, if started with start_background()"""
+
+    def __init__(self, host="127.0.0.1", port=0, unix_path=None, workers=os.cpu_count() or 1, processes=True):
+        # type: (str, int, str, int, bool) -> None
+        """Constructor.
+
+            :param host: The TCP host to listen on;
+            :param port: The TCP port to listen on, 0 for any free port;
+            :param unix_path: The path of a Unix domain socket to listen on instead of TCP;
+            :param workers: The number of worker processes or threads;
+            :param processes: True to parse in worker processes, False to parse in worker threads;
+            :return: None"""
+        if workers <= 0:
+            raise ValueError("The number of workers must be positive")
+        self.host = host
+        self.port = port
+        self.unix_path = unix_path
+        self.workers = workers
+        self.processes = processes
+
+    @staticmethod
+    def encode_frame(message):
+        # type: ({}) -> bytes
+        """Encodes a request or response as a frame.
+
+            :param message: The request or response;
+            :return: The length prefixed JSON frame;"""
+        payload = json.dumps(message, separators=(",", ":")).encode("utf-8")
+        return ParseDaemon.HEADER.pack(len(payload)) + payload
+
+    @staticmethod
+    def parse_routes(routes):
+        # type: ([str]) -> [{}]
+        """Parses and encodes a job of routes; this is the work run by the workers.
+
+            :param routes: The field 15 strings to parse;
+            :return: The encoded extracted route sequence of each route;"""
+        return [ErsCodec.encode(AsyncParseF15.parse_text(route)) for route in routes]
+
+    async def start(self):
+        # type: () -> None
+        """Starts the workers, warms them up and starts listening.
+
+            :return: None"""
+        self.loop = asyncio.get_running_loop()
+        if self.processes:
+            self.executor = concurrent.futures.ProcessPoolExecutor(self.workers)
+        else:
+            self.executor = concurrent.futures.ThreadPoolExecutor(self.workers)
+        await asyncio.gather(*[self.loop.run_in_executor(self.executor, ParseDaemon.parse_routes,
+                                                         ["N0450F350 00N000E M082F350 00N001E"])
+                               for _ in range(self.workers)])
+        if self.unix_path is not None:
+            self.server = await asyncio.start_unix_server(self.__serve_connection, path=self.unix_path)
+            self.address = self.unix_path
+        else:
+            self.server = await asyncio.start_server(self.__serve_connection, self.host, self.port)
+            self.address = self.server.sockets[0].getsockname()[0:2]
+
+    async def stop(self):
+        # type: () -> None
+        """Stops listening and shuts the workers down.
+
+            :return: None"""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+        if self.unix_path is not None and os.path.exists(self.unix_path):
+            os.unlink(self.unix_path)
+
+    def serve_forever(self):
+        # type: () -> None
+        """Runs the daemon in the current thread until interrupted.
+
+            :return: None"""
+        try:
+            asyncio.run(self.__run_until_stopped(None))
+        except KeyboardInterrupt:
+            pass
+
+    def start_background(self):
+        # type: () -> None
+        """Runs the daemon in a background thread, returning once it is listening.
+
+            :return: None"""
+        started = threading.Event()
+        self.thread = threading.Thread(target=asyncio.run, args=(self.__run_until_stopped(started),), daemon=True)
+        self.thread.start()
+        started.wait()
+
+    def stop_background(self):
+        # type: () -> None
+        """Stops a daemon started with start_background() and waits for it to finish.
+
+            :return: None"""
+        self.loop.call_soon_threadsafe(self.stop_event.set)
+        self.thread.join()
+
+    async def __run_until_stopped(self, started):
+        # type: (threading.Event) -> None
+        """Starts the daemon and runs it until the stop event is set.
+
+            :param started: Set once the daemon is listening, may be None;
+            :return: None"""
+        self.stop_event = asyncio.Event()
+        await self.start()
+        try:
+            if started is not None:
+                started.set()
+            await self.stop_event.wait()
+        finally:
+            await self.stop()
+
+    async def __serve_connection(self, reader, writer):
+        # type: (asyncio.StreamReader, asyncio.StreamWriter) -> None
+        """Serves the requests of a single connection until the client closes it.
+
+            :param reader: The connection's reader;
+            :param writer: The connection's writer;
+            :return: None"""
+        try:
+            while True:
+                try:
+                    header = await reader.readexactly(self.HEADER.size)
+                except asyncio.IncompleteReadError:
+                    break
+                length = self.HEADER.unpack(header)[0]
+                if length > self.MAX_FRAME_SIZE:
+                    writer.write(self.encode_frame({"id": None, "error": "Frame too large"}))
+                    break
+                response = await self.__handle_request(await reader.readexactly(length))
+                writer.write(self.encode_frame(response))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def __handle_request(self, payload):
+        # type: (bytes) -> {}
+        """Parses the routes of a request in the worker pool.
+
+            :param payload: The JSON request;
+            :return: The response;"""
+        request_id = None
+        try:
+            request = json.loads(payload)
+            request_id = request.get("id")
+            routes = request["routes"]
+            if not isinstance(routes, list) or not all(isinstance(route, str) for route in routes):
+                raise ValueError("'routes' must be a list of strings")
+        except (ValueError, KeyError, AttributeError) as error:
+            return {"id": request_id, "error": "Invalid request: " + str(error)}
+        jobs = [self.loop.run_in_executor(self.executor, ParseDaemon.parse_routes, routes[idx:idx + self.JOB_SIZE])
+                for idx in range(0, len(routes), self.JOB_SIZE)]
+        try:
+            results = [result for job in await asyncio.gather(*jobs) for result in job]
+        except Exception as error:
+            return {"id": request_id, "error": "Parse failed: " + repr(error)}
+        return {"id": request_id, "record_fields": ErsCodec.RECORD_FIELDS, "error_fields": ErsCodec.ERROR_FIELDS,
+                "results": results}
+
+
+if __name__ == '__main__':
+    argument_parser = argparse.ArgumentParser(description="Field 15 parse service daemon")
+    argument_parser.add_argument("--host", default="127.0.0.1", help="TCP host to listen on")
+    argument_parser.add_argument("--port", type=int, default=7015, help="TCP port to listen on")
+    argument_parser.add_argument("--unix", default=None, help="Unix domain socket path to listen on instead of TCP")
+    argument_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of workers")
+    argument_parser.add_argument("--threads", action="store_true", help="Use worker threads instead of processes")
+    arguments = argument_parser.parse_args()
+    daemon = ParseDaemon(arguments.host, arguments.port, arguments.unix, arguments.workers, not arguments.threads)
+    daemon.serve_forever()
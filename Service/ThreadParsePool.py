@@ -0,0 +1,231 @@
+import collections
+import concurrent.futures
+import os
+import sys
+import sysconfig
+import threading
+
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from F15_Parser.F15Dialect import F15Dialect
+from F15_Parser.F15Grammar import F15Grammar
+from F15_Parser.F15Parse import ParseF15
+from F15_Parser.F15TokenSyntaxDescriptions import F15TokenSyntaxDefinition
+from Tokenizer.TokenInternPool import TokenInternPool
+from Tokenizer.Tokenize import Tokenize
+from Utilities.GeodesyBackend import KarneyBackend
+from Utilities.Utils import Utils
+
+
+class ThreadParsePool:
+    """This class parses batches of field 15 strings on a pool of threads in the calling process, so the
+    extracted route sequences are returned without being pickled as they are from worker processes. On a
+    free-threaded CPython build running with the GIL disabled the threads parse in parallel; with the GIL
+    enabled only one thread runs Python code at a time and more threads do not parse faster.
+
+    The threads share the read-only state of the parser: the compiled token classifier, the grammar, the
+    dialect's parser and the geodesy backend, all of which are created on the calling thread before any
+    worker starts, see prepare_shared_state(). The shared caches they use, the TokenInternPool
+    classifications, the interned FlightState instances and the geodesic caches, are safe to use from
+    several threads. Everything that belongs to a message, its tokenizer, tokens and ERS, is only used by
+    the thread parsing it; each thread keeps its own Tokenize instance in thread-local storage.
+
+    A batch is split into chunks, each chunk is tokenized, classified as a batch and parsed by one thread,
+    and the results are returned in input order. The number of threads defaults to the number of CPUs if
+    the GIL is disabled and to one, parsing in the calling thread, if it is enabled."""
+
+    CHUNK_SIZE: int = 64
+    """The default number of strings parsed by a thread in a single job"""
+
+    workers: int = 1
+    """The number of threads, 1 to parse in the calling thread"""
+
+    chunk_size: int = CHUNK_SIZE
+    """The number of strings parsed by a thread in a single job"""
+
+    whitespace: str = ""
+    """Whitespace token delimiter characters"""
+
+    dialect: F15Dialect = None
+    """The field 15 dialect the strings are parsed against"""
+
+    executor: concurrent.futures.ThreadPoolExecutor = None
+    """The thread pool, None if strings are parsed in the calling thread"""
+
+    local: threading.local = None
+    """The per thread state, the tokenizer of each thread"""
+
+    statistics: collections.Counter = None
+    """Counts of messages and chunks parsed"""
+
+    thread_messages: collections.Counter = None
+    """The number of messages parsed by each thread, keyed by thread identifier"""
+
+    def __init__(self, workers=None, chunk_size=CHUNK_SIZE, dialect=None, whitespace=" \n\t\r/"):
+        # type: (int, int, str, str) -> None
+        """Constructor, prepares the shared state and starts the threads.
+
+            :param workers: The number of threads, 1 to parse in the calling thread, None for
+                            get_default_workers();
+            :param chunk_size: The number of strings parsed by a thread in a single job;
+            :param dialect: The name of the field 15 dialect the strings are parsed against, see F15Dialect, the
+                            default dialect if None;
+            :param whitespace: The whitespace characters used to tokenize field 15;
+            :return: None"""
+        if workers is None:
+            workers = ThreadParsePool.get_default_workers()
+        if workers <= 0 or chunk_size <= 0:
+            raise ValueError("The number of workers and the chunk size must be positive")
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.whitespace = whitespace
+        self.dialect = ThreadParsePool.prepare_shared_state(dialect)
+        self.executor = None
+        if workers > 1:
+            self.executor = concurrent.futures.ThreadPoolExecutor(workers, thread_name_prefix="f15-parse")
+        self.local = threading.local()
+        self.statistics = collections.Counter()
+        self.thread_messages = collections.Counter()
+
+    @staticmethod
+    def is_gil_enabled():
+        # type: () -> bool
+        """Checks at run time whether the GIL is enabled. A free-threaded build may still run with the GIL,
+        e.g. if it was enabled with PYTHON_GIL=1 or by importing an extension that does not support running
+        without it.
+
+            :return: True if the GIL is enabled, always True before Python 3.13;"""
+        is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+        return True if is_gil_enabled is None else is_gil_enabled()
+
+    @staticmethod
+    def is_free_threaded_build():
+        # type: () -> bool
+        """Checks whether the interpreter is a free-threaded build, i.e. one that can run without the GIL.
+
+            :return: True for a free-threaded build;"""
+        return sysconfig.get_config_var("Py_GIL_DISABLED") == 1
+
+    @staticmethod
+    def get_default_workers():
+        # type: () -> int
+        """Gets the default number of threads: the number of CPUs available to the process if the GIL is
+        disabled, otherwise one as threads would only take turns.
+
+            :return: The default number of threads;"""
+        if ThreadParsePool.is_gil_enabled():
+            return 1
+        process_cpu_count = getattr(os, "process_cpu_count", os.cpu_count)
+        return process_cpu_count() or 1
+
+    @staticmethod
+    def prepare_shared_state(dialect=None):
+        # type: (str) -> F15Dialect
+        """Creates the state shared by all parsing threads that is otherwise created on first use: the
+        compiled classifier, the grammar, the dialect and its parser, the shared intern pool, the geodesy
+        backend with its ellipsoid and the geodesic caches. Creating them before the threads start means
+        that no thread creates them while another uses them.
+
+            :param dialect: The name of the field 15 dialect, the default dialect if None;
+            :return: The dialect;"""
+        F15TokenSyntaxDefinition.get_classifier()
+        F15Grammar.get_default()
+        TokenInternPool.get_shared_pool()
+        f15_dialect = F15Dialect.get_dialect(dialect)
+        if isinstance(Utils.get_geodesy_backend(), KarneyBackend):
+            Utils.get_geode()
+        Utils.get_inverse_cache()
+        Utils.get_direct_cache()
+        return f15_dialect
+
+    def parse_texts(self, field_15s):
+        # type: ([str]) -> [ExtractedRouteSequence]
+        """Tokenizes and parses a batch of field 15 strings on the threads.
+
+            :param field_15s: The field 15 strings to parse;
+            :return: The extracted route sequence of each string in input order;"""
+        chunks = [field_15s[index:index + self.chunk_size] for index in range(0, len(field_15s), self.chunk_size)]
+        if self.executor is None:
+            chunk_results = [self.__parse_chunk(chunk) for chunk in chunks]
+        else:
+            chunk_results = list(self.executor.map(self.__parse_chunk, chunks))
+        results = []
+        for thread_ident, chunk_result in chunk_results:
+            self.thread_messages[thread_ident] = self.thread_messages[thread_ident] + len(chunk_result)
+            results.extend(chunk_result)
+        self.statistics["messages"] = self.statistics["messages"] + len(results)
+        self.statistics["chunks"] = self.statistics["chunks"] + len(chunks)
+        return results
+
+    def get_statistics(self):
+        # type: () -> {}
+        """Gets the statistics of the batches parsed so far.
+
+            :return: A dictionary with the numbers of threads, of messages and chunks parsed and of threads
+                     that parsed messages, and whether the GIL is enabled;"""
+        return {
+            "workers": self.workers,
+            "messages": self.statistics["messages"],
+            "chunks": self.statistics["chunks"],
+            "threads_used": len(self.thread_messages),
+            "gil_enabled": ThreadParsePool.is_gil_enabled()
+        }
+
+    def close(self):
+        # type: () -> None
+        """Stops the threads once the jobs submitted have finished.
+
+            :return: None"""
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def __enter__(self):
+        # type: () -> ThreadParsePool
+        """Uses the pool as a context manager that closes it on exit.
+
+            :return: This pool;"""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # type: (type, BaseException, object) -> bool
+        """Closes the pool.
+
+            :param exc_type: The type of the exception raised, None if there was none;
+            :param exc_value: The exception raised, None if there was none;
+            :param traceback: The traceback of the exception, None if there was none;
+            :return: False, exceptions are not suppressed;"""
+        self.close()
+        return False
+
+    def __get_tokenizer(self):
+        # type: () -> Tokenize
+        """Gets the tokenizer of the calling thread, creating it on first use.
+
+            :return: The tokenizer of the thread;"""
+        tokenizer = getattr(self.local, "tokenizer", None)
+        if tokenizer is None:
+            tokenizer = Tokenize()
+            tokenizer.set_whitespace(self.whitespace)
+            self.local.tokenizer = tokenizer
+        return tokenizer
+
+    def __parse_chunk(self, field_15s):
+        # type: ([str]) -> (int, [ExtractedRouteSequence])
+        """Tokenizes and parses a chunk of field 15 strings; this is the work run by the threads. The tokens
+        of the chunk are classified together, each distinct token string once.
+
+            :param field_15s: The field 15 strings to parse;
+            :return: The identifier of the thread and the extracted route sequence of each string;"""
+        tokenizer = self.__get_tokenizer()
+        token_lists = []
+        for field_15 in field_15s:
+            tokenizer.set_string_to_tokenize(field_15)
+            tokenizer.tokenize()
+            token_lists.append(tokenizer.get_tokens())
+        ParseF15.assign_batch_syntax_descriptions(token_lists, self.dialect.intern_pool)
+        results = []
+        for tokens in token_lists:
+            ers = ExtractedRouteSequence()
+            self.dialect.parse_f15(ers, tokens, False)
+            results.append(ers)
+        return threading.get_ident(), results
@@ -0,0 +1,51 @@
+from Tokenizer.Token import Token
+
+
+class BytesToken(Token):
+    """This class is a token created by the BytesTokenize class. Instead of a copy of its text it holds a
+    reference to the shared buffer that was tokenized along with its start and end index; the text is decoded
+    into a string the first time it is requested, e.g. when the token is classified or parsed."""
+
+    buffer: memoryview = None
+    """The buffer the token was extracted from, shared by all tokens of the buffer"""
+
+    def __init__(self, buffer, token_start_index=0, token_end_index=0):
+        # type: (memoryview, int, int) -> None
+        """Creates a token referring to part of a buffer. The base and subtype members are initialised
+        as 'unknown'.
+
+            :param buffer: The buffer the token was extracted from;
+            :param token_start_index: The zero based start index of the token in the buffer;
+            :param token_end_index: The zero based end index of the token in the buffer;
+            :return: None"""
+        super().__init__(None, token_start_index, token_end_index)
+        self.buffer = buffer
+
+    def get_token_string(self):
+        # type: () -> str
+        """This method gets a token's string, decoding it from the buffer on first use. Latin-1 is used
+        so every byte maps to exactly one character and the token indexes stay valid for the string.
+
+            :return: The text that stored in this token instance;"""
+        if self.token_string is None:
+            self.token_string = str(self.buffer[self.token_start_index:self.token_end_index], "latin-1")
+        return self.token_string
+
+    def get_token_bytes(self):
+        # type: () -> memoryview
+        """This method gets the token's text as a view into the buffer without copying or decoding it.
+
+            :return: A memoryview of the token's bytes;"""
+        return self.buffer[self.token_start_index:self.token_end_index]
+
+    def __deepcopy__(self, memo):
+        # type: ({}) -> Token
+        """Copies this token as a plain Token; a memoryview cannot be copied and the copy is
+        expected to be modified independently of the buffer.
+
+            :param memo: The deepcopy memo dictionary;
+            :return: A Token with the same text, indexes and types as this token;"""
+        token = Token(self.get_token_string(), self.token_start_index, self.token_end_index)
+        token.set_token_base_type(self.token_base_type)
+        token.set_token_sub_type(self.token_sub_type)
+        return token
@@ -0,0 +1,132 @@
+from Tokenizer.BytesToken import BytesToken
+from Tokenizer.Tokens import Tokens
+
+
+class BytesTokenize:
+    """This class tokenizes an ASCII buffer given as bytes, bytearray or memoryview without decoding it.
+    Whitespace is recognised with a 256 entry lookup table indexed by byte value, each token is stored as
+    a BytesToken holding its start and end index into the shared buffer and is only decoded to a string
+    when its text is requested. The tokens are stored in a 'Tokens' class instance and can be passed to
+    the parser exactly like the tokens created by the Tokenize class."""
+
+    NOT_WHITESPACE: int = 0
+    """Lookup table value for a byte that is part of a token"""
+
+    DISCARD: int = 1
+    """Lookup table value for a whitespace byte that is discarded"""
+
+    SAVE: int = 2
+    """Lookup table value for a whitespace byte that is saved as a token of its own, i.e. a forward slash"""
+
+    buffer: memoryview = None
+    """The input buffer containing the tokens to be extracted"""
+
+    whitespace_table: bytearray = None
+    """Lookup table indexed by byte value containing NOT_WHITESPACE, DISCARD or SAVE"""
+
+    start_index: int = 0
+    """Index of the first byte of the buffer to be tokenized"""
+
+    end_index: int = -1
+    """Index one past the last byte of the buffer to be tokenized, -1 for the end of the buffer"""
+
+    tokens: Tokens = None
+    """List of extracted tokens"""
+
+    def __init__(self):
+        # type: () -> None
+        """Constructor without a buffer to tokenize; unlike the Tokenize class the default whitespace
+        is the field 15 whitespace \" \\\\n\\\\t\\\\r/\".
+
+            :return: None"""
+        self.buffer = memoryview(b"")
+        self.tokens = Tokens()
+        self.start_index = 0
+        self.end_index = -1
+        self.set_whitespace(b" \n\t\r/")
+
+    def tokenize(self):
+        # type: () -> None
+        """Tokenize the buffer using the assigned whitespace byte set. Any whitespace byte will be discarded
+        and treated as a token separator apart from a forward slash '/' which will result in a forward
+        slash token. Only the bytes between the start and end index are tokenized, token indexes are
+        always relative to the start of the buffer.
+
+            :return: None"""
+        self.tokens = Tokens()
+        buffer = self.buffer
+        table = self.whitespace_table
+        tokens = self.tokens.get_tokens()
+        end_index = len(buffer) if self.end_index < 0 else self.end_index
+        token_start = -1
+        for idx, byte in enumerate(buffer[self.start_index:end_index], self.start_index):
+            kind = table[byte]
+            if kind == self.NOT_WHITESPACE:
+                if token_start < 0:
+                    token_start = idx
+                continue
+            if token_start >= 0:
+                tokens.append(BytesToken(buffer, token_start, idx))
+                token_start = -1
+            if kind == self.SAVE:
+                tokens.append(BytesToken(buffer, idx, idx + 1))
+        if token_start >= 0:
+            tokens.append(BytesToken(buffer, token_start, end_index))
+
+    def set_buffer_to_tokenize(self, buffer):
+        # type: (bytes | bytearray | memoryview) -> None
+        """Sets the buffer to tokenize, the complete buffer will be tokenized unless bounds are set afterwards.
+        The buffer is not copied, a bytearray must not be modified while its tokens are in use.
+
+            :param buffer: An ASCII buffer that will be tokenized by this class;
+            :return: None"""
+        self.buffer = memoryview(buffer).cast("B")
+        self.start_index = 0
+        self.end_index = -1
+
+    def get_buffer_to_tokenize(self):
+        # type: () -> memoryview
+        """Retrieves the buffer that has been tokenized.
+
+            :return: A memoryview of the buffer that was tokenized;"""
+        return self.buffer
+
+    def set_bounds(self, start_index=0, end_index=-1):
+        # type: (int, int) -> None
+        """Restricts tokenizing to part of the buffer. Token indexes remain relative to the start of the buffer.
+
+            :param start_index: Index of the first byte to tokenize;
+            :param end_index: Index one past the last byte to tokenize, -1 for the end of the buffer;
+            :return: None"""
+        self.start_index = start_index
+        self.end_index = end_index
+
+    def set_whitespace(self, whitespace=b""):
+        # type: (bytes | str) -> None
+        """Set the token whitespace delimiter characters and rebuild the lookup table.
+
+        Note that a forward slash '/' character will be treated as whitespace
+        but will be saved as a token. All other whitespace characters are
+        consumed by the tokenizer.
+
+            :param whitespace: The bytes (or an ASCII string) considered as whitespace when tokenizing;
+            :return: None"""
+        if isinstance(whitespace, str):
+            whitespace = whitespace.encode("ascii")
+        self.whitespace_table = bytearray(256)
+        for byte in whitespace:
+            self.whitespace_table[byte] = self.SAVE if byte == ord("/") else self.DISCARD
+
+    def get_whitespace(self):
+        # type: () -> bytes
+        """Retrieve the token whitespace delimiter characters.
+
+            :return: The bytes treated as whitespace characters;"""
+        return bytes(byte for byte in range(256) if self.whitespace_table[byte] != self.NOT_WHITESPACE)
+
+    def get_tokens(self):
+        # type: () -> Tokens
+        """Retrieve the list of tokens stored in this class.
+
+            :return: A list containing zero or more BytesToken classes"""
+        return self.tokens
@@ -0,0 +1,399 @@
+import re
+from array import array
+
+from F15_Parser.F15TokenSyntaxDescriptions import TokenBaseType, TokenSubType
+from Tokenizer.Token import Token
+from Tokenizer.Tokens import Tokens
+
+
+class ColumnarToken(Token):
+    """This class is a token of a ColumnarTokens list, created when a caller asks for the token. Its indexes and
+    types are copied from the columns of the list when it is created and the setters write through to the
+    columns, its text is sliced from the source string on first use."""
+
+    columns = None
+    """The ColumnarTokens list the token belongs to"""
+
+    index: int = 0
+    """The position of the token in the list"""
+
+    def __init__(self, columns, index, token_string=None):
+        # type: (ColumnarTokens, int, str) -> None
+        """Creates a proxy for a token of a list.
+
+            :param columns: The ColumnarTokens list;
+            :param index: The position of the token in the list;
+            :param token_string: The token text if it has been sliced already, None to slice it on first use;
+            :return: None"""
+        self.columns = columns
+        self.index = index
+        self.token_string = token_string
+        self.token_start_index = columns.starts[index]
+        self.token_end_index = columns.ends[index]
+        self.token_base_type = ColumnarTokens.BASE_TYPES[columns.base_types[index]]
+        self.token_sub_type = ColumnarTokens.SUB_TYPES[columns.sub_types[index]]
+
+    def set_token_string(self, token_string):
+        # type: (str) -> None
+        """This method sets the token string, it replaces the text taken from the source string.
+
+            :param token_string: The text that will be stored in this token instance;
+            :return: None"""
+        self.token_string = token_string
+        self.columns.token_strings[self.index] = token_string
+
+    def get_token_string(self):
+        # type: () -> str
+        """This method gets a token's string, slicing it from the source string on first use.
+
+            :return: The text that stored in this token instance;"""
+        if self.token_string is None:
+            self.token_string = self.columns.get_token_string_at(self.index)
+        return self.token_string
+
+    def set_token_start_index(self, token_start_index):
+        # type: (int) -> None
+        """This method sets the token start index, in the start column as well.
+
+            :param token_start_index: The zero based start index of the token in the source string;
+            :return: None"""
+        self.token_start_index = token_start_index
+        self.columns.starts[self.index] = token_start_index
+
+    def set_token_end_index(self, token_end_index):
+        # type: (int) -> None
+        """This method sets the token end index, in the end column as well.
+
+            :param token_end_index: The zero based end index of the token in the source string;
+            :return: None"""
+        self.token_end_index = token_end_index
+        self.columns.ends[self.index] = token_end_index
+
+    def set_token_base_type(self, token_base_type):
+        # type: (TokenBaseType) -> None
+        """This method sets the token base type, in the base type column as well.
+
+            :param token_base_type: The base type;
+            :return: None"""
+        self.token_base_type = token_base_type
+        self.columns.base_types[self.index] = token_base_type
+
+    def set_token_sub_type(self, token_sub_type):
+        # type: (TokenSubType) -> None
+        """This method sets the token subtype, in the subtype column as well.
+
+            :param token_sub_type: The subtype;
+            :return: None"""
+        self.token_sub_type = token_sub_type
+        self.columns.sub_types[self.index] = token_sub_type
+
+    def __deepcopy__(self, memo):
+        # type: ({}) -> Token
+        """Copies this token as a plain Token; the copy is expected to be modified independently of the list.
+
+            :param memo: The deepcopy memo dictionary;
+            :return: A Token with the same text, indexes and types as this token;"""
+        token = Token(self.get_token_string(), self.token_start_index, self.token_end_index)
+        token.set_token_base_type(self.token_base_type)
+        token.set_token_sub_type(self.token_sub_type)
+        return token
+
+
+class ColumnarTokens(Tokens):
+    """This class is a token list that stores its tokens as columns beside the string they were extracted
+    from instead of as a list of Token instances: the start and end indexes in array('i') columns and the
+    base and subtypes as their enumeration values in array('B') columns. A token costs ten bytes instead of
+    a Token instance with its own string.
+
+    The Tokens methods are all supported. Token strings are sliced from the source string when they are
+    requested and Token objects are only created for the positions a caller asks for with get_token_at(),
+    get_next_token() etc.; these are ColumnarToken proxies that write through to the columns. get_tokens()
+    creates a proxy for every token. The proxies copy the columns when they are created, the type columns
+    are therefore replaced with set_token_types(), which updates the proxies that exist, rather than written
+    directly.
+
+    The parser needs the text and indexes of nearly every token, so it has no columnar path: a ColumnarTokens
+    list given to it is classified and parsed through get_tokens(), which is slower than parsing a Tokens
+    list and keeps a proxy for every token. A list is better parsed as a Tokens list and kept afterwards, e.g.
+    in a cache, as a columnar copy made by from_tokens().
+
+    Tokens appended or inserted are copied into the columns; a token whose text is not the slice of the
+    source string at its indexes keeps its text in token_strings. ColumnarTokens lists are not recycled by a
+    ParseObjectPool."""
+
+    BASE_TYPES: [TokenBaseType] = list(TokenBaseType)
+    """The base types indexed by their value, the values run from zero without gaps"""
+
+    SUB_TYPES: [TokenSubType] = list(TokenSubType)
+    """The subtypes indexed by their value, the values run from zero without gaps"""
+
+    source_string: str = ""
+    """The string the tokens were extracted from"""
+
+    starts: array = None
+    """The zero based start index of each token in the source string"""
+
+    ends: array = None
+    """The zero based end index of each token in the source string"""
+
+    base_types: array = None
+    """The base type value of each token"""
+
+    sub_types: array = None
+    """The subtype value of each token"""
+
+    token_strings: {int: str} = None
+    """The text of the tokens that is not the slice of the source string at their indexes, by position"""
+
+    proxies: [ColumnarToken] = None
+    """The proxies created so far by position, None until the first one is requested"""
+
+    def __init__(self, source_string=""):
+        # type: (str) -> None
+        """This constructor creates an 'empty' token list for tokens extracted from a string.
+
+            :param source_string: The string the tokens are extracted from;
+            :return: None"""
+        super().__init__()
+        self.tokens = None
+        self.source_string = source_string
+        self.starts = array("i")
+        self.ends = array("i")
+        self.base_types = array("B")
+        self.sub_types = array("B")
+        self.token_strings = {}
+        self.proxies = None
+
+    @staticmethod
+    def from_tokens(tokens, source_string):
+        # type: (Tokens, str) -> ColumnarTokens
+        """Creates a columnar copy of a token list, e.g. to keep the classified tokens of a parsed message in
+        less memory than their Token instances take.
+
+            :param tokens: The token list, a Tokens instance;
+            :param source_string: The string the tokens were extracted from;
+            :return: The columnar token list;"""
+        columnar = ColumnarTokens(source_string)
+        token_list = tokens.get_tokens()
+        columnar.starts = array("i", [token.get_token_start_index() for token in token_list])
+        columnar.ends = array("i", [token.get_token_end_index() for token in token_list])
+        columnar.base_types = array("B", [token.get_token_base_type() for token in token_list])
+        columnar.sub_types = array("B", [token.get_token_sub_type() for token in token_list])
+        for index, token in enumerate(token_list):
+            token_string = token.get_token_string()
+            if token_string != source_string[token.get_token_start_index():token.get_token_end_index()]:
+                columnar.token_strings[index] = token_string
+        return columnar
+
+    def scan(self, whitespace=" \n\t\r/", start_index=0, end_index=-1):
+        # type: (str, int, int) -> None
+        """Appends the tokens of the source string separated by whitespace characters, as Tokenize.tokenize()
+        does: whitespace is discarded apart from a forward slash which, if it is one of the whitespace
+        characters, is a token of its own. The token boundaries are found by a regular expression, the
+        token strings are not created.
+
+            :param whitespace: The whitespace token delimiter characters;
+            :param start_index: Index of the first character of the source string to tokenize;
+            :param end_index: Index one past the last character to tokenize, -1 for the end of the string;
+            :return: None"""
+        if end_index < 0:
+            end_index = len(self.source_string)
+        if len(whitespace) == 0:
+            pattern = "(?s:.+)"
+        elif "/" in whitespace:
+            pattern = "[^" + re.escape(whitespace) + "]+|/"
+        else:
+            pattern = "[^" + re.escape(whitespace) + "]+"
+        spans = [match.span() for match in re.compile(pattern).finditer(self.source_string, start_index, end_index)]
+        self.starts.extend([span[0] for span in spans])
+        self.ends.extend([span[1] for span in spans])
+        added = len(spans)
+        self.base_types.frombytes(bytes(added))
+        self.sub_types.frombytes(bytes(added))
+        if self.proxies is not None:
+            self.proxies.extend([None] * added)
+
+    def get_source_string(self):
+        # type: () -> str
+        """Gets the string the tokens were extracted from.
+
+            :return: The source string;"""
+        return self.source_string
+
+    def get_token_string_at(self, index):
+        # type: (int) -> str
+        """Gets the text of a token without creating its proxy.
+
+            :param index: The position of the token, it must be in range;
+            :return: The token text;"""
+        token_string = self.token_strings.get(index)
+        if token_string is None:
+            token_string = self.source_string[self.starts[index]:self.ends[index]]
+        return token_string
+
+    def get_token_strings(self):
+        # type: () -> [str]
+        """Gets the text of every token without creating any proxies.
+
+            :return: The token texts in order;"""
+        source_string = self.source_string
+        token_strings = [source_string[start:end] for start, end in zip(self.starts, self.ends)]
+        for index, token_string in self.token_strings.items():
+            token_strings[index] = token_string
+        return token_strings
+
+    def set_token_types(self, base_types, sub_types):
+        # type: ([TokenBaseType], [TokenSubType]) -> None
+        """Replaces the base and subtypes of all tokens, including those of the proxies already created.
+
+            :param base_types: The base type of each token;
+            :param sub_types: The subtype of each token;
+            :return: None"""
+        if len(base_types) != len(self.starts) or len(sub_types) != len(self.starts):
+            raise ValueError("The number of types does not match the number of tokens")
+        self.base_types = array("B", base_types)
+        self.sub_types = array("B", sub_types)
+        if self.proxies is not None:
+            for proxy in self.proxies:
+                if proxy is not None:
+                    proxy.token_base_type = base_types[proxy.index]
+                    proxy.token_sub_type = sub_types[proxy.index]
+
+    def get_number_of_tokens(self):
+        # type: () -> int
+        """This method gets and returns the number of tokens stored in this class.
+
+            :return: The number of tokens in this class instance;"""
+        return len(self.starts)
+
+    def append_token(self, token):
+        # type: (Token) -> None
+        """This method appends a copy of a token's text, indexes and types to the columns.
+
+            :param token: A Token instance to append to the list of tokens in this class;
+            :return: None"""
+        self.insert_token(token, len(self.starts))
+
+    def insert_token(self, token, index):
+        # type: (Token, int) -> None
+        """This method inserts a copy of a token's text, indexes and types before the token identified with
+        the index 'index'; proxies of the following tokens move with their tokens.
+
+            :param token: The Token instance to insert into the list of tokens in this class;
+            :param index: The index before which the new token will be inserted;
+            :return: None"""
+        number_of_tokens = len(self.starts)
+        if index < 0:
+            index = max(number_of_tokens + index, 0)
+        index = min(index, number_of_tokens)
+        start_index = token.get_token_start_index()
+        end_index = token.get_token_end_index()
+        token_string = token.get_token_string()
+        self.starts.insert(index, start_index)
+        self.ends.insert(index, end_index)
+        self.base_types.insert(index, token.get_token_base_type())
+        self.sub_types.insert(index, token.get_token_sub_type())
+        if index < number_of_tokens:
+            self.token_strings = {(position + 1 if position >= index else position): text
+                                  for position, text in self.token_strings.items()}
+            if self.proxies is not None:
+                for proxy in self.proxies[index:]:
+                    if proxy is not None:
+                        proxy.index = proxy.index + 1
+        if token_string != self.source_string[start_index:end_index]:
+            self.token_strings[index] = token_string
+        if self.proxies is not None:
+            self.proxies.insert(index, None)
+
+    def create_append_token(self, token_text, token_start_index, token_end_index):
+        # type: (str, int, int) -> None
+        """This method appends a token with a start and end index, its types are 'unknown'.
+
+            :param token_text: The text for this new token;
+            :param token_start_index: The tokens zero based start index for its position in the original
+                                      string it was extracted from;
+            :param token_end_index: The tokens zero based end index for its position in the original
+                                    string it was extracted from;
+            :return: None"""
+        if token_text != self.source_string[token_start_index:token_end_index]:
+            self.token_strings[len(self.starts)] = token_text
+        self.starts.append(token_start_index)
+        self.ends.append(token_end_index)
+        self.base_types.append(TokenBaseType.F15_UNKNOWN)
+        self.sub_types.append(TokenSubType.F15_SB_UNKNOWN)
+        if self.proxies is not None:
+            self.proxies.append(None)
+
+    def get_tokens(self):
+        # type: () -> [Token]
+        """This method gets a list of the proxies of all tokens, creating those not yet requested.
+
+            :return: The list of tokens stored in this class;"""
+        if self.proxies is None:
+            self.proxies = self.create_tokens()
+            return list(self.proxies)
+        return [self.__get_proxy(index) for index in range(len(self.starts))]
+
+    def create_tokens(self):
+        # type: () -> [Token]
+        """Creates a new proxy for every token, with the token strings sliced together, without keeping them
+        in this list. This is for a caller that only reads the tokens and drops the proxies afterwards, so
+        that only the columns remain once it is done. The proxies write through to the columns but do not see
+        changes made through other proxies or set_token_types().
+
+            :return: A list with a new proxy for each token;"""
+        return [ColumnarToken(self, index, token_string) for index, token_string in enumerate(self.get_token_strings())]
+
+    def get_token_at(self, index):
+        # type: (int) -> Token | None
+        """This method gets the proxy of the token at 'index', creating it on first request, 'None' if 'index'
+        is out of range.
+
+            :param index: The index for the token to be returned;
+            :return: The proxy of the token at the position 'index' or None if the index is out of range;"""
+        if index < 0 or index >= len(self.starts):
+            return None
+        return self.__get_proxy(index)
+
+    def remove_tokens_from_end_of_list(self, split_index):
+        # type: (int) -> None
+        """This method removes tokens from the list above the split_index
+
+        :param split_index: Index above which all tokens will be removed
+        :return: None
+        """
+        number_of_tokens = len(range(len(self.starts))[:split_index + 1])
+        del self.starts[number_of_tokens:]
+        del self.ends[number_of_tokens:]
+        del self.base_types[number_of_tokens:]
+        del self.sub_types[number_of_tokens:]
+        self.token_strings = {position: text for position, text in self.token_strings.items()
+                              if position < number_of_tokens}
+        if self.proxies is not None:
+            del self.proxies[number_of_tokens:]
+
+    def print_tokens(self):
+        # type: () -> None
+        """This method prints the complete list of tokens. The method is provided to assist in debugging.
+
+            :return: None"""
+        self.tokens = self.get_tokens()
+        try:
+            super().print_tokens()
+        finally:
+            self.tokens = None
+
+    def __get_proxy(self, index):
+        # type: (int) -> ColumnarToken
+        """Gets the proxy of a token, creating it on first request.
+
+            :param index: The position of the token, it must be in range;
+            :return: The proxy of the token;"""
+        if self.proxies is None:
+            self.proxies = [None] * len(self.starts)
+        proxy = self.proxies[index]
+        if proxy is None:
+            proxy = ColumnarToken(self, index)
+            self.proxies[index] = proxy
+        return proxy
+
@@ -0,0 +1,89 @@
+from Tokenizer.Token import Token
+
+
+class StreamTokenize:
+    """This class tokenizes text read from a file object, socket file or any iterable of chunks. Tokens are
+    yielded one at a time as soon as they are complete instead of being collected into a 'Tokens' instance,
+    so memory use depends on the chunk size (and the longest token), not on the size of the input. A token
+    straddling chunk boundaries is joined before it is yielded and all token indexes are relative to the
+    start of the input, not to the chunk the token was found in."""
+
+    CHUNK_SIZE: int = 65536
+    """The number of characters read from a stream at a time"""
+
+    whitespace: str = ""
+    """Whitespace token delimiter characters"""
+
+    chunk_size: int = CHUNK_SIZE
+    """The number of characters read from a stream at a time"""
+
+    def __init__(self, chunk_size=CHUNK_SIZE):
+        # type: (int) -> None
+        """Constructor assigning the field 15 whitespace \" \\\\n\\\\t\\\\r/\".
+
+            :param chunk_size: The number of characters read from a stream at a time;
+            :return: None"""
+        self.chunk_size = chunk_size
+        self.whitespace = " \n\t\r/"
+
+    def tokenize_stream(self, stream):
+        # type: (io.IOBase) -> Generator[Token]
+        """Tokenize a text or binary stream, binary data is decoded as latin-1 so that every byte is one
+        character and indexes are byte offsets.
+
+            :param stream: A file object or socket file supporting read(size);
+            :return: A generator yielding each token in the order found;"""
+        return self.tokenize_chunks(iter(lambda: stream.read(self.chunk_size), stream.read(0)))
+
+    def tokenize_chunks(self, chunks):
+        # type: (Iterable[str | bytes]) -> Generator[Token]
+        """Tokenize an iterable of chunks using the assigned whitespace character set. Any whitespace character
+        is discarded and treated as a token separator apart from a forward slash '/' which will result in a
+        forward slash token.
+
+            :param chunks: An iterable of strings, or bytes decoded as latin-1;
+            :return: A generator yielding each token in the order found;"""
+        whitespace = self.whitespace
+        offset = 0
+        pending = ""
+        pending_start = 0
+        for chunk in chunks:
+            if not isinstance(chunk, str):
+                chunk = str(chunk, "latin-1")
+            token_start = 0
+            for idx, item in enumerate(chunk):
+                if item not in whitespace:
+                    continue
+                if idx > token_start or len(pending) > 0:
+                    if len(pending) > 0:
+                        yield Token(pending + chunk[token_start:idx], pending_start, offset + idx)
+                        pending = ""
+                    else:
+                        yield Token(chunk[token_start:idx], offset + token_start, offset + idx)
+                if item == "/":
+                    # We have to save the forward slash token
+                    yield Token(item, offset + idx, offset + idx + 1)
+                token_start = idx + 1
+            if token_start < len(chunk):
+                # The token continues in the next chunk
+                if len(pending) == 0:
+                    pending_start = offset + token_start
+                pending = pending + chunk[token_start:]
+            offset = offset + len(chunk)
+        if len(pending) > 0:
+            yield Token(pending, pending_start, offset)
+
+    def set_whitespace(self, whitespace=""):
+        # type: (str) -> None
+        """Set a string representing the token whitespace delimiter characters.
+
+            :param whitespace: The string containing characters considered as whitespace when tokenizing;
+            :return: None"""
+        self.whitespace = whitespace
+
+    def get_whitespace(self):
+        # type: () -> str
+        """Retrieve the string representing the token whitespace delimiter characters.
+
+            :return: A string containing characters treated as whitespace characters;"""
+        return self.whitespace
@@ -0,0 +1,95 @@
+from Tokenizer.Token import Token
+from Tokenizer.Tokens import Tokens
+
+
+class TokenCursor:
+    """This class is a lightweight cursor over the token list of a Tokens instance. It provides the same
+    navigation methods as the Tokens class but keeps its own position, so the token list itself is never
+    modified by navigating it. Any number of cursors can walk the same token list at the same time, which
+    allows one token list to be parsed by several threads or parsed again without being reset."""
+
+    tokens: [Token] = None
+    """The token list being navigated, shared with the Tokens instance and not modified"""
+
+    current_token: int = 0
+    """The index of the current token"""
+
+    def __init__(self, tokens):
+        # type: (Tokens | [Token]) -> None
+        """Creates a cursor positioned on the first token.
+
+            :param tokens: A Tokens instance or a list of Token instances;
+            :return: None"""
+        self.tokens = tokens.get_tokens() if isinstance(tokens, (Tokens, TokenCursor)) else tokens
+        self.current_token = 0
+
+    def get_number_of_tokens(self):
+        # type: () -> int
+        """Gets the number of tokens in the token list.
+
+            :return: The number of tokens;"""
+        return len(self.tokens)
+
+    def get_tokens(self):
+        # type: () -> [Token]
+        """Gets the token list.
+
+            :return: The list of tokens navigated by this cursor;"""
+        return self.tokens
+
+    def get_token_at(self, index):
+        # type: (int) -> Token | None
+        """Gets the token at 'index', 'None' if 'index' is out of range; the cursor position is not changed.
+
+            :param index: The index for the token to be returned;
+            :return: The token at the index or None if the index is out of range;"""
+        if index < 0 or index >= len(self.tokens):
+            return None
+        return self.tokens[index]
+
+    def get_first_token(self):
+        # type: () -> Token
+        """Moves the cursor to the first token and gets it.
+
+            :return: The first token or None if there are no tokens;"""
+        self.current_token = 0
+        return self.get_token_at(0)
+
+    def get_next_token(self):
+        # type: () -> Token
+        """Moves the cursor to the next token and gets it.
+
+            :return: The next token or None if the cursor has moved past the last token;"""
+        self.current_token = self.current_token + 1
+        return self.get_token_at(self.current_token)
+
+    def get_previous_token(self):
+        # type: () -> Token
+        """Moves the cursor to the previous token and gets it.
+
+            :return: The previous token or None if the cursor has moved before the first token;"""
+        self.current_token = self.current_token - 1
+        return self.get_token_at(self.current_token)
+
+    def peek_next_token(self, look_ahead=1):
+        # type: (int) -> Token
+        """Gets a token after the current token without moving the cursor.
+
+            :param look_ahead: The number of tokens to look ahead;
+            :return: The token or None if out of range;"""
+        return self.get_token_at(self.current_token + look_ahead)
+
+    def peek_previous_token(self, look_behind=1):
+        # type: (int) -> Token
+        """Gets a token before the current token without moving the cursor.
+
+            :param look_behind: The number of tokens to look behind;
+            :return: The token or None if out of range;"""
+        return self.get_token_at(self.current_token - look_behind)
+
+    def get_current_token(self):
+        # type: () -> Token
+        """Gets the current token without moving the cursor.
+
+            :return: The current token or None if the cursor is out of range;"""
+        return self.get_token_at(self.current_token)
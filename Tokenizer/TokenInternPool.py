@@ -0,0 +1,158 @@
+from F15_Parser.F15TokenSyntaxDescriptions import F15TokenSyntaxDefinition
+
+
+class TokenInternPool:
+    """This class is a bounded pool of token strings shared across messages. Interning a token string returns
+    the pooled instance of an equal string, so tokens and ERS records holding common strings such as 'DCT',
+    '/', 'IFR' or frequently filed points and ATS routes refer to a single copy. The pool also caches the
+    syntax classification of each string so that known tokens skip the regular expression search in
+    F15TokenSyntaxDefinition.get_token_type().
+
+    When the pool is full it is cleared before the next string is added, strings interned earlier remain
+    valid but are no longer shared with later tokens. Strings longer than the maximum field 15 token length
+    are never pooled. Counters are updated without locking and are approximate when the pool is shared
+    between threads, the pool contents are always consistent."""
+
+    MAX_SIZE: int = 65536
+    """The default maximum number of strings held in the pool"""
+
+    shared_pool = None
+    """The pool shared by default by all tokenizers and parsers, created on first use"""
+
+    max_size: int = MAX_SIZE
+    """The maximum number of strings held in the pool"""
+
+    pool: {} = None
+    """A token string mapped to a two element list, index 0 the pooled string, index 1 its classification
+    as returned by F15TokenSyntaxDefinition.get_token_type() or None if not classified yet"""
+
+    syntax_definition: F15TokenSyntaxDefinition = None
+    """The token syntax definitions used to classify strings"""
+
+    intern_lookups: int = 0
+    """The number of strings interned"""
+
+    intern_hits: int = 0
+    """The number of strings interned that were already pooled"""
+
+    type_lookups: int = 0
+    """The number of classifications requested"""
+
+    type_hits: int = 0
+    """The number of classifications found in the pool"""
+
+    clears: int = 0
+    """The number of times the pool was cleared because it was full"""
+
+    def __init__(self, max_size=MAX_SIZE, syntax_definition=None):
+        # type: (int, F15TokenSyntaxDefinition) -> None
+        """Constructor creating an empty pool.
+
+            :param max_size: The maximum number of strings held in the pool;
+            :param syntax_definition: The token syntax definitions used to classify strings, e.g. those of a
+                                      field 15 dialect, the default definitions if None;
+            :return: None"""
+        if max_size <= 0:
+            raise ValueError("The pool size must be positive")
+        self.max_size = max_size
+        self.pool = {}
+        self.syntax_definition = F15TokenSyntaxDefinition() if syntax_definition is None else syntax_definition
+        self.intern_lookups = 0
+        self.intern_hits = 0
+        self.type_lookups = 0
+        self.type_hits = 0
+        self.clears = 0
+
+    @staticmethod
+    def get_shared_pool():
+        # type: () -> TokenInternPool
+        """Gets the pool shared by default by all tokenizers and parsers.
+
+            :return: The shared pool;"""
+        if TokenInternPool.shared_pool is None:
+            TokenInternPool.shared_pool = TokenInternPool()
+        return TokenInternPool.shared_pool
+
+    def intern(self, token_string):
+        # type: (str) -> str
+        """Gets the pooled instance of a string, adding the string to the pool if it is not pooled.
+
+            :param token_string: The token string to intern;
+            :return: The pooled string equal to token_string, or token_string itself if it is too long to pool;"""
+        self.intern_lookups = self.intern_lookups + 1
+        entry = self.pool.get(token_string)
+        if entry is not None:
+            self.intern_hits = self.intern_hits + 1
+            return entry[0]
+        return self.__add(token_string)[0]
+
+    def get_token_type(self, token_string):
+        # type: (str) -> [str, TokenBaseType, TokenSubType]
+        """Gets the classification of a token string, classifying and pooling the string if it has not
+        been classified before.
+
+            :param token_string: The token string to classify;
+            :return: The record from F15TokenSyntaxDefinition.F15_SB_CONFIGURATION matching the string, see
+                     F15TokenSyntaxDefinition.get_token_type();"""
+        self.type_lookups = self.type_lookups + 1
+        entry = self.pool.get(token_string)
+        if entry is not None and entry[1] is not None:
+            self.type_hits = self.type_hits + 1
+            return entry[1]
+        token_type = self.syntax_definition.get_token_type(token_string)
+        if entry is None:
+            entry = self.__add(token_string)
+        entry[1] = token_type
+        return token_type
+
+    def get_size(self):
+        # type: () -> int
+        """Gets the number of strings held in the pool.
+
+            :return: The pool size;"""
+        return len(self.pool)
+
+    def get_statistics(self):
+        # type: () -> {}
+        """Gets the pool statistics.
+
+            :return: A dictionary with the pool size and maximum size, the number of intern and classification
+                     lookups, their hits and hit rates (0.0 to 1.0) and the number of times the pool was
+                     cleared because it was full;"""
+        return {
+            "size": len(self.pool),
+            "max_size": self.max_size,
+            "intern_lookups": self.intern_lookups,
+            "intern_hits": self.intern_hits,
+            "intern_hit_rate": self.intern_hits / self.intern_lookups if self.intern_lookups > 0 else 0.0,
+            "type_lookups": self.type_lookups,
+            "type_hits": self.type_hits,
+            "type_hit_rate": self.type_hits / self.type_lookups if self.type_lookups > 0 else 0.0,
+            "clears": self.clears
+        }
+
+    def clear(self):
+        # type: () -> None
+        """Removes all strings from the pool and resets the statistics.
+
+            :return: None"""
+        self.pool = {}
+        self.intern_lookups = 0
+        self.intern_hits = 0
+        self.type_lookups = 0
+        self.type_hits = 0
+        self.clears = 0
+
+    def __add(self, token_string):
+        # type: (str) -> []
+        """Adds a string to the pool, clearing the pool first if it is full.
+
+            :param token_string: The token string to add;
+            :return: The pool entry for the string, an entry that is not pooled if the string is too long;"""
+        entry = [token_string, None]
+        if len(token_string) > F15TokenSyntaxDefinition.MAX_TOKEN_LENGTH:
+            return entry
+        if len(self.pool) >= self.max_size:
+            self.pool = {}
+            self.clears = self.clears + 1
+        return self.pool.setdefault(token_string, entry)
@@ -1,3 +1,5 @@
+from Tokenizer.ColumnarTokens import ColumnarTokens
+from Tokenizer.TokenInternPool import TokenInternPool
 from Tokenizer.Tokens import Tokens
 
 
@@ -14,9 +16,24 @@ class Tokenize:
     whitespace: str = ""
     """Whitespace token delimiter characters"""
 
-    tokens: Tokens = Tokens()
+    start_index: int = 0
+    """Index of the first character of the input string to be tokenized"""
+
+    end_index: int = -1
+    """Index one past the last character of the input string to be tokenized, -1 for the end of the string"""
+
+    tokens: Tokens = None
     """List of extracted tokens"""
 
+    intern_pool: TokenInternPool = None
+    """The pool token strings are interned in, None to keep each token's own copy"""
+
+    object_pool = None
+    """The pool the token list and tokens are taken from, None to create new ones"""
+
+    columnar: bool = False
+    """True to store the tokens in a ColumnarTokens list instead of a list of Token instances"""
+
     def __init__(self):
         """Constructor without a string to tokenize and assigning a default whitespace string
         regular expressions \" \\\\n\\\\t\\\\r\".
@@ -25,6 +42,11 @@ class Tokenize:
         self.string_to_tokenize = ""
         self.tokens = Tokens()
         self.whitespace = " \n\t\r"
+        self.start_index = 0
+        self.end_index = -1
+        self.intern_pool = TokenInternPool.get_shared_pool()
+        self.object_pool = None
+        self.columnar = False
 
     def tokenize(self):
         # type: () -> None
@@ -32,12 +54,23 @@ class Tokenize:
         in the parameter 'whitespace' will be discarded and treated as whitespace token separators
         apart from a forward slash '/' which will result in a forward slash token.
         A string given as "E1 E2 E3" will yield 3 tokens using the default whitespace character set.
+        Only the characters between the start and end index are tokenized, token indexes are always
+        relative to the start of the complete input string.
+
+        If columnar is set the tokens are stored in a ColumnarTokens list, neither the intern pool nor the
+        object pool is used then.
 
             :return: None"""
-        self.tokens = Tokens()
-        idx = 0
+        if self.columnar:
+            self.tokens = ColumnarTokens(self.string_to_tokenize)
+            self.tokens.scan(self.whitespace, self.start_index, self.end_index)
+            return
+        self.tokens = Tokens() if self.object_pool is None else self.object_pool.get_tokens()
+        idx = self.start_index
+        end_index = len(self.string_to_tokenize) if self.end_index < 0 else self.end_index
         token_text = ""
-        for item in self.string_to_tokenize:
+        while idx < end_index:
+            item = self.string_to_tokenize[idx]
             if item in self.whitespace:
                 if len(token_text) > 0:
                     self.__save_token(token_text, idx)
@@ -53,11 +86,24 @@ class Tokenize:
 
     def set_string_to_tokenize(self, string_to_tokenize=""):
         # type: (str) -> None
-        """Sets a string to tokenize
+        """Sets a string to tokenize, the complete string will be tokenized unless bounds are set afterwards.
 
             :param string_to_tokenize: A string that will be tokenized by this class;
             :return: None"""
         self.string_to_tokenize = string_to_tokenize
+        self.start_index = 0
+        self.end_index = -1
+
+    def set_bounds(self, start_index=0, end_index=-1):
+        # type: (int, int) -> None
+        """Restricts tokenizing to part of the string to tokenize without copying it, e.g. field 15 inside a
+        complete ICAO message. Token indexes remain relative to the start of the complete string.
+
+            :param start_index: Index of the first character to tokenize;
+            :param end_index: Index one past the last character to tokenize, -1 for the end of the string;
+            :return: None"""
+        self.start_index = start_index
+        self.end_index = end_index
 
     def get_string_to_tokenize(self):
         # type: () -> str
@@ -86,6 +132,54 @@ class Tokenize:
             :return: A string containing characters treated as whitespace characters;"""
         return self.whitespace
 
+    def set_intern_pool(self, intern_pool=None):
+        # type: (TokenInternPool) -> None
+        """Sets the pool that token strings are interned in so that equal token strings across messages
+        share a single copy.
+
+            :param intern_pool: The pool to intern token strings in, None to disable interning;
+            :return: None"""
+        self.intern_pool = intern_pool
+
+    def get_intern_pool(self):
+        # type: () -> TokenInternPool | None
+        """Retrieve the pool that token strings are interned in.
+
+            :return: The intern pool or None if interning is disabled;"""
+        return self.intern_pool
+
+    def set_object_pool(self, object_pool=None):
+        # type: (ParseObjectPool) -> None
+        """Sets the pool the token list and tokens of each tokenize() call are taken from. The caller
+        returns them with ParseObjectPool.release_tokens() once they have been parsed.
+
+            :param object_pool: The pool, None to create new token lists and tokens;
+            :return: None"""
+        self.object_pool = object_pool
+
+    def get_object_pool(self):
+        # type: () -> ParseObjectPool | None
+        """Retrieve the pool the token list and tokens are taken from.
+
+            :return: The object pool or None if pooling is disabled;"""
+        return self.object_pool
+
+    def set_columnar(self, columnar=False):
+        # type: (bool) -> None
+        """Selects the token list created by tokenize(). A ColumnarTokens list stores the token indexes and
+        types in arrays beside the string to tokenize and only creates Token objects on request.
+
+            :param columnar: True for a ColumnarTokens list, False for a Tokens list of Token instances;
+            :return: None"""
+        self.columnar = columnar
+
+    def get_columnar(self):
+        # type: () -> bool
+        """Retrieve whether tokenize() creates a ColumnarTokens list.
+
+            :return: True for a ColumnarTokens list, False for a Tokens list;"""
+        return self.columnar
+
     def get_tokens(self):
         # type: () -> Tokens
         """Retrieve the list of tokens stored in this class.
@@ -101,5 +195,10 @@ class Tokenize:
             :param idx: The index identifying a token in the list of tokens;
             :return: None"""
         if len(token_text) > 0:
-            self.tokens.create_append_token(
-                token_text, idx - len(token_text), idx)
+            if self.intern_pool is not None:
+                token_text = self.intern_pool.intern(token_text)
+            if self.object_pool is not None:
+                self.tokens.append_token(self.object_pool.get_token(token_text, idx - len(token_text), idx))
+            else:
+                self.tokens.create_append_token(
+                    token_text, idx - len(token_text), idx)
@@ -0,0 +1,22 @@
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from F15_Parser.F15Parse import ParseF15
+from Tokenizer.Tokenize import Tokenize
+
+
+class F15ParseHelper:
+    """This class contains helpers shared by unit tests that need a parsed field 15."""
+
+    @staticmethod
+    def parse_field_15(field_15):
+        # type: (str) -> ExtractedRouteSequence
+        """Tokenizes and parses a field 15 string.
+
+            :param field_15: The field 15 string to parse;
+            :return: The extracted route sequence;"""
+        tokenizer = Tokenize()
+        tokenizer.set_whitespace(" \n\t\r/")
+        tokenizer.set_string_to_tokenize(field_15)
+        tokenizer.tokenize()
+        ers = ExtractedRouteSequence()
+        ParseF15().parse_f15(ers, tokenizer.get_tokens())
+        return ers
@@ -0,0 +1,144 @@
+import unittest
+
+import math
+
+from RouteAnalysis.AirspaceCrossings import AirspaceCrossings, AirspaceCrossingEvent
+from RouteAnalysis.AirspaceVolume import AirspaceVolume
+from RouteAnalysis.STRTree import STRTree
+from UnitTests.F15ParseHelper import F15ParseHelper
+
+
+class AirspaceCrossingsTest(unittest.TestCase):
+    crossings = None
+
+    @classmethod
+    def setUpClass(cls):
+        # Two laterally adjacent sectors from FL100 to FL300 and one sector above them
+        cls.crossings = AirspaceCrossings()
+        cls.crossings.load_geojson_dict({
+            "type": "FeatureCollection",
+            "features": [
+                {"type": "Feature",
+                 "properties": {"name": "WEST", "type": "SECTOR", "lower_limit_si": 3048, "upper_limit_si": 9144},
+                 "geometry": {"type": "Polygon",
+                              "coordinates": [[[-1.0, -1.0], [1.0, -1.0], [1.0, 1.0], [-1.0, 1.0], [-1.0, -1.0]]]}},
+                {"type": "Feature",
+                 "properties": {"name": "EAST", "type": "SECTOR", "lower_limit_si": 3048, "upper_limit_si": 9144},
+                 "geometry": {"type": "Polygon",
+                              "coordinates": [[[1.0, -1.0], [3.0, -1.0], [3.0, 1.0], [1.0, 1.0], [1.0, -1.0]]]}},
+                {"type": "Feature",
+                 "properties": {"name": "UPPER", "type": "SECTOR", "lower_limit_si": 9144},
+                 "geometry": {"type": "Polygon",
+                              "coordinates": [[[-1.0, -1.0], [3.0, -1.0], [3.0, 1.0], [-1.0, 1.0], [-1.0, -1.0]]]}},
+                {"type": "Feature", "properties": {"name": "IGNORED"},
+                 "geometry": {"type": "Point", "coordinates": [0.0, 0.0]}}
+            ]})
+
+    def test_str_tree_01(self):
+        tree = STRTree([[(float(i), float(i), i + 0.5, i + 0.5), i] for i in range(100)])
+        self.assertEqual(100, tree.get_size())
+        self.assertEqual([10], tree.query((10.1, 10.1, 10.2, 10.2)))
+        self.assertEqual([10, 11, 12], sorted(tree.query((10.2, 10.2, 12.2, 12.2))))
+        self.assertEqual([], tree.query((200.0, 200.0, 201.0, 201.0)))
+        self.assertEqual([], STRTree([]).query((0.0, 0.0, 1.0, 1.0)))
+
+    def test_airspace_volume_01(self):
+        volume = AirspaceVolume("HOLE", "FIR",
+                                [[(0.0, 0.0), (4.0, 0.0), (4.0, 4.0), (0.0, 4.0), (0.0, 0.0)],
+                                 [(1.0, 1.0), (3.0, 1.0), (3.0, 3.0), (1.0, 3.0), (1.0, 1.0)]], 0.0, 1000.0)
+        self.assertTrue(volume.contains_point(0.5, 0.5))
+        self.assertFalse(volume.contains_point(2.0, 2.0))
+        self.assertFalse(volume.contains_point(5.0, 2.0))
+        self.assertTrue(volume.contains_altitude(0.0))
+        self.assertFalse(volume.contains_altitude(1000.0))
+        self.assertEqual([0.125, 0.625, 0.875], volume.get_boundary_crossings(2.0, 0.5, 2.0, 4.5))
+
+    def test_get_crossings_01(self):
+        # Level route at FL200 through both lower sectors
+        events = self.crossings.get_crossings(F15ParseHelper.parse_field_15("N0450F200 00N001W 00N002E 00N004E"))
+        self.assertEqual(["ENTRY WEST", "EXIT WEST", "ENTRY EAST", "EXIT EAST"], self.__summary(events))
+        self.assertAlmostEqual(-1.0, events[0].get_longitude())
+        self.assertAlmostEqual(1.0, events[1].get_longitude())
+        self.assertEqual(0, events[1].get_segment_index())
+        self.assertAlmostEqual(3.0, events[3].get_longitude())
+        self.assertEqual(1, events[3].get_segment_index())
+
+    def test_get_crossings_02(self):
+        # Climb to FL350 at a point inside WEST, leaving WEST vertically into UPPER
+        events = self.crossings.get_crossings(
+            F15ParseHelper.parse_field_15("N0450F200 00N002W 00N000E/N0450F350 00N002E"))
+        self.assertEqual(["ENTRY WEST", "EXIT WEST", "ENTRY UPPER", "EXIT UPPER"], self.__summary(events))
+        self.assertAlmostEqual(0.0, events[1].get_longitude())
+        self.assertEqual(0.0, events[1].get_fraction())
+        self.assertEqual(AirspaceCrossingEvent.EXIT, events[3].get_event_type())
+        self.assertAlmostEqual(2.0, events[3].get_longitude())
+
+    def test_get_crossings_03(self):
+        # Route south of all sectors and a route without coordinates
+        self.assertEqual([], self.crossings.get_crossings(F15ParseHelper.parse_field_15("N0450F200 05S002W 05S004E")))
+        self.assertEqual([], self.crossings.get_crossings(F15ParseHelper.parse_field_15("N0450F200 ABC B9 DEF")))
+        batch = self.crossings.get_crossings_batch([F15ParseHelper.parse_field_15("N0450F200 00N000E 00N002E"),
+                                                    F15ParseHelper.parse_field_15("N0450F200 ABC")])
+        self.assertEqual(["ENTRY WEST", "EXIT WEST", "ENTRY EAST", "EXIT EAST"], self.__summary(batch[0]))
+        self.assertEqual([], batch[1])
+
+    def test_airspace_volume_02(self):
+        # Segments grazing a vertex do not cross, segments through a vertex cross once
+        diamond = AirspaceVolume("DIAMOND", "SECTOR", [[(0.0, 0.0), (2.0, 1.0), (0.0, 2.0), (-2.0, 1.0)]])
+        self.assertEqual([], diamond.get_boundary_crossings(-1.0, 2.0, 1.0, 2.0))
+        self.assertEqual([], diamond.get_boundary_crossings(0.0, -1.0, 0.0, 1.0))
+        crossings = diamond.get_boundary_crossings(1.0, -3.0, 1.0, 3.0)
+        self.assertEqual(2, len(crossings))
+        self.assertAlmostEqual(1.0 / 6.0, crossings[0])
+        self.assertAlmostEqual(5.0 / 6.0, crossings[1])
+        crossings = AirspaceCrossings()
+        crossings.add_volume(diamond)
+        self.assertEqual([], crossings.get_crossings(F15ParseHelper.parse_field_15("N0450F200 01S002E 01N002E")))
+
+    def test_airspace_volume_03(self):
+        # A boundary with many vertices uses an edge index and gives the same results
+        circle = AirspaceVolume("CIRCLE", "FIR", [[(math.cos(math.radians(angle)), math.sin(math.radians(angle)))
+                                                   for angle in range(0, 360)]])
+        self.assertGreater(len(circle.edges), AirspaceVolume.EDGE_INDEX_THRESHOLD)
+        self.assertTrue(circle.contains_point(0.0, 0.0))
+        self.assertTrue(circle.contains_point(0.5, -0.5))
+        self.assertFalse(circle.contains_point(0.0, 1.5))
+        self.assertFalse(circle.contains_point(0.9, 0.9))
+        crossings = circle.get_boundary_crossings(0.0, -2.0, 0.0, 2.0)
+        self.assertEqual(2, len(crossings))
+        self.assertAlmostEqual(0.25, crossings[0])
+        self.assertAlmostEqual(0.75, crossings[1])
+        self.assertIsNotNone(circle.edge_index)
+
+    def test_get_crossings_04(self):
+        # An eastbound route across the anti-meridian through volumes split at longitude 180
+        crossings = AirspaceCrossings()
+        crossings.add_volume(AirspaceVolume("EAST180", "FIR", [[(178.0, -1.0), (180.0, -1.0), (180.0, 1.0),
+                                                                (178.0, 1.0)]]))
+        crossings.add_volume(AirspaceVolume("WEST180", "FIR", [[(-180.0, -1.0), (-178.0, -1.0), (-178.0, 1.0),
+                                                                (-180.0, 1.0)]]))
+        crossings.add_volume(AirspaceVolume("GREENWICH", "FIR", [[(-1.0, -1.0), (1.0, -1.0), (1.0, 1.0),
+                                                                  (-1.0, 1.0)]]))
+        events = crossings.get_crossings(F15ParseHelper.parse_field_15("N0450F200 00N177E 00N177W"))
+        self.assertEqual(["ENTRY EAST180", "EXIT EAST180", "ENTRY WEST180", "EXIT WEST180"], self.__summary(events))
+        self.assertAlmostEqual(1.0 / 6.0, events[0].get_fraction())
+        self.assertAlmostEqual(0.5, events[1].get_fraction())
+        self.assertAlmostEqual(180.0, events[1].get_longitude())
+        self.assertAlmostEqual(0.5, events[2].get_fraction())
+        self.assertAlmostEqual(-180.0, events[2].get_longitude())
+        self.assertAlmostEqual(5.0 / 6.0, events[3].get_fraction())
+        self.assertAlmostEqual(-178.0, events[3].get_longitude())
+        # Westbound from inside WEST180
+        events = crossings.get_crossings(F15ParseHelper.parse_field_15("N0450F200 00N179W 00N179E"))
+        self.assertEqual(["ENTRY WEST180", "EXIT WEST180", "ENTRY EAST180", "EXIT EAST180"], self.__summary(events))
+        self.assertEqual(0.0, events[0].get_fraction())
+        self.assertAlmostEqual(0.5, events[1].get_fraction())
+        self.assertEqual(1.0, events[3].get_fraction())
+
+    @staticmethod
+    def __summary(events):
+        return [event.get_event_type() + " " + event.get_volume().name for event in events]
+
+
+if __name__ == '__main__':
+    unittest.main()
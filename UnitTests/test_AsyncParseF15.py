@@ -0,0 +1,73 @@
+import asyncio
+import concurrent.futures
+import unittest
+
+from Service.AsyncParseF15 import AsyncParseF15
+from UnitTests.F15ParseHelper import F15ParseHelper
+
+
+class AsyncParseF15Test(unittest.TestCase):
+    ROUTES = ["N0450M0825 00N000E B9 00N001E VFR IFR 00N001W/N0350F100 01N001W 01S001W 02S001W180060",
+              "N0450F350 ABC UL9 DEF DCT 50N010W DCT GHI/N0460F370 JKL",
+              "N0100VFR PQR DCT IFR STU/N0250F150 VWX2A",
+              "N0450F350 ABC B9 NOLAN1D"]
+
+    def test_parse_f15_async_01(self):
+        async def run():
+            parser = AsyncParseF15()
+            return await parser.parse_f15_async(self.ROUTES[0]), parser.get_statistics()
+
+        ers, statistics = asyncio.run(run())
+        self.assertEqual(F15ParseHelper.parse_field_15(self.ROUTES[0]).as_xml(), ers.as_xml())
+        self.assertEqual(1, statistics["messages"])
+        self.assertEqual(0, statistics["in_flight"])
+        self.assertGreater(statistics["max_latency"], 0.0)
+        self.assertRaises(ValueError, AsyncParseF15, None, 0)
+
+    def test_parse_batch_01(self):
+        # Results are in input order for plain and asynchronous iterables, with thread and process executors
+        expected = [F15ParseHelper.parse_field_15(route).as_xml() for route in self.ROUTES * 5]
+
+        async def routes():
+            for route in self.ROUTES * 5:
+                await asyncio.sleep(0)
+                yield route
+
+        async def run(executor, source):
+            parser = AsyncParseF15(executor, 3, 4)
+            results = [ers.as_xml() async for ers in parser.parse_batch(source)]
+            return results, parser.get_statistics()
+
+        for executor_type in [concurrent.futures.ThreadPoolExecutor, concurrent.futures.ProcessPoolExecutor]:
+            with executor_type(2) as executor:
+                results, statistics = asyncio.run(run(executor, self.ROUTES * 5))
+                self.assertEqual(expected, results)
+                self.assertEqual(20, statistics["messages"])
+                results, statistics = asyncio.run(run(executor, routes()))
+                self.assertEqual(expected, results)
+
+    def test_parse_batch_02(self):
+        # The input is not read further ahead than the queue size while results are not consumed
+        read = []
+
+        def routes():
+            for idx in range(50):
+                read.append(idx)
+                yield self.ROUTES[idx % len(self.ROUTES)]
+
+        async def run():
+            parser = AsyncParseF15(None, 2, 4)
+            consumed = 0
+            async for _ in parser.parse_batch(routes()):
+                consumed = consumed + 1
+                self.assertLessEqual(len(read) - consumed, 4 + 1)
+                if consumed == 10:
+                    break
+            return consumed
+
+        self.assertEqual(10, asyncio.run(run()))
+        self.assertLess(len(read), 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+from Benchmarks.ParseDaemonLoadGenerator import ParseDaemonLoadGenerator
+from F15_Parser.F15Dialect import F15Dialect
+from F15_Parser.F15Parse import ParseF15
+from F15_Parser.F15TokenSyntaxDescriptions import TokenBaseType
+from Service.AsyncParseF15 import AsyncParseF15
+from Tokenizer.TokenInternPool import TokenInternPool
+from Tokenizer.Tokenize import Tokenize
+
+
+class BatchSyntaxDescriptionsTest(unittest.TestCase):
+
+    @staticmethod
+    def tokenize(field_15s):
+        token_lists = []
+        for field_15 in field_15s:
+            tokenizer = Tokenize()
+            tokenizer.set_whitespace(" \n\t\r/")
+            tokenizer.set_string_to_tokenize(field_15)
+            tokenizer.tokenize()
+            token_lists.append(tokenizer.get_tokens())
+        return token_lists
+
+    def test_assign_batch_01(self):
+        field_15s = ["N0450F350 LNZ DCT ABC UL610 DEF", "N0450F350 LNZ DCT ABC ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+                     "N0450F350 LNZ DCT 50N010E ?"]
+        expected = self.tokenize(field_15s)
+        for tokens in expected:
+            ParseF15.assign_syntax_descriptions(tokens)
+        token_lists = self.tokenize(field_15s)
+        pool = TokenInternPool()
+        # Each distinct token string is classified once
+        self.assertEqual(9, ParseF15.assign_batch_syntax_descriptions(token_lists, pool))
+        self.assertEqual(8, pool.get_statistics()["type_lookups"])
+        for tokens, expected_tokens in zip(token_lists, expected):
+            self.assertEqual([(token.get_token_base_type(), token.get_token_sub_type())
+                              for token in expected_tokens.get_tokens()],
+                             [(token.get_token_base_type(), token.get_token_sub_type())
+                              for token in tokens.get_tokens()])
+        self.assertIs(TokenBaseType.F15_TOO_LONG, token_lists[1].get_token_at(4).get_token_base_type())
+        self.assertIs(TokenBaseType.F15_UNKNOWN, token_lists[2].get_token_at(4).get_token_base_type())
+
+    def test_parse_texts_01(self):
+        field_15s = ParseDaemonLoadGenerator.build_routes(200) + ["N0450F350 LNZ OAT ABC GAT DEF", ""]
+        for dialect in [F15Dialect.IFPS, F15Dialect.ICAO]:
+            results = AsyncParseF15.parse_texts(field_15s, dialect=dialect)
+            self.assertEqual(len(field_15s), len(results))
+            for field_15, ers in zip(field_15s, results):
+                self.assertEqual(AsyncParseF15.parse_text(field_15, dialect=dialect).as_xml(), ers.as_xml())
+
+
+if __name__ == '__main__':
+    unittest.main()
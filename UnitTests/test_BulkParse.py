@@ -0,0 +1,91 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+import xml.dom.minidom
+
+from Service.BulkParse import BulkParse
+from Service.ErsCodec import ErsCodec
+from UnitTests.F15ParseHelper import F15ParseHelper
+
+
+class BulkParseTest(unittest.TestCase):
+    ROUTES = ["N0450F350 LNZ UL610 ABC", "N0450F350 00N000E B9 00N001E", "M082F370 DCT 50N010E DCT 51N011E"]
+
+    FPL = "(FPL-ABC123-IS\n-B738/M-SDE3FGHIJ1RWY/LB1\n-EGLL0800\n-N0450F350 00N000E B9 00N001E\n" \
+          "-EDDF0105 EDDK\n-DOF/240101)"
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        os.makedirs(os.path.join(self.directory.name, "sub"))
+        self.__write_file("a.txt", "\n".join(self.ROUTES[0:2]) + "\n\n")
+        self.__write_file(os.path.join("sub", "b.txt"), self.ROUTES[2] + "\n")
+        self.__write_file("c.msg", "ZCZC\r\n" + self.FPL + "\r\nNNNN\r\n(ARR-ABC123-EGLL-EDDF1030)")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_ndjson_01(self):
+        bulk_parse = BulkParse(pattern="*.txt")
+        output = io.BytesIO()
+        statistics = bulk_parse.run([self.directory.name], output)
+        lines = [json.loads(line) for line in output.getvalue().decode("utf-8").splitlines()]
+        self.assertEqual([1, 2, 1], [line["position"] for line in lines])
+        self.assertTrue(lines[2]["source"].endswith("b.txt"))
+        for line, route in zip(lines, self.ROUTES):
+            self.assertEqual(ErsCodec.encode(F15ParseHelper.parse_field_15(route)), line["ers"])
+        self.assertEqual(3, statistics["items"])
+        self.assertEqual(3, statistics["routes"])
+        self.assertEqual(1, statistics["routes_with_errors"])
+        self.assertEqual(1, statistics["errors"])
+        self.assertEqual(sum(len(route) for route in self.ROUTES), statistics["input_bytes"])
+
+    def test_icao_xml_01(self):
+        bulk_parse = BulkParse("icao", "xml")
+        output = io.BytesIO()
+        statistics = bulk_parse.run([os.path.join(self.directory.name, "c.msg")], output)
+        document = xml.dom.minidom.parseString(output.getvalue())
+        routes = document.getElementsByTagName("route")
+        self.assertEqual(1, len(routes))
+        self.assertEqual("6", routes[0].getAttribute("position"))
+        self.assertEqual(2, statistics["items"])
+        self.assertEqual(1, statistics["skipped"])
+        self.assertEqual(1, statistics["routes"])
+
+    def test_binary_workers_01(self):
+        # The output is the same, and in the same order, when parsing in worker processes
+        self.__write_file("many.txt", "\n".join(self.ROUTES * 20))
+        paths = [os.path.join(self.directory.name, "many.txt")]
+        output = io.BytesIO()
+        BulkParse(output_format="binary", chunk_size=7).run(paths, output)
+        parallel_output = io.BytesIO()
+        statistics = BulkParse(output_format="binary", workers=2, chunk_size=7).run(paths, parallel_output)
+        self.assertEqual(output.getvalue(), parallel_output.getvalue())
+        self.assertEqual(60, statistics["routes"])
+        data = output.getvalue()
+        offset = 0
+        for route in self.ROUTES * 20:
+            ers, offset = ErsCodec.decode_binary(data, offset)
+            self.assertEqual(ErsCodec.encode(F15ParseHelper.parse_field_15(route)), ers)
+        self.assertEqual(len(data), offset)
+
+    def test_binary_long_strings_01(self):
+        # Strings and error texts longer than 65535 bytes are encoded
+        ers = F15ParseHelper.parse_field_15("N0450F350 ABC " + "\u00c4" * 40000 + " DEF")
+        self.assertGreater(len(ers.get_error_entries()[0].get_name().encode("utf-8")), 65535)
+        data = ErsCodec.encode_binary(ers)
+        self.assertEqual((ErsCodec.encode(ers), len(data)), ErsCodec.decode_binary(data))
+
+    def test_invalid_01(self):
+        self.assertRaises(ValueError, BulkParse, "f14")
+        self.assertRaises(ValueError, BulkParse, "f15", "csv")
+        self.assertRaises(ValueError, BulkParse, workers=0)
+
+    def __write_file(self, file_name, text):
+        with open(os.path.join(self.directory.name, file_name), "w", encoding="latin-1", newline="") as file:
+            file.write(text)
+
+
+if __name__ == '__main__':
+    unittest.main()
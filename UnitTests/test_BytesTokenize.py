@@ -0,0 +1,62 @@
+import copy
+import unittest
+
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from F15_Parser.F15Parse import ParseF15
+from Tokenizer.BytesTokenize import BytesTokenize
+from Tokenizer.Token import Token
+from Tokenizer.Tokenize import Tokenize
+from UnitTests.F15ParseHelper import F15ParseHelper
+
+
+class BytesTokenizeTest(unittest.TestCase):
+    FIELD_15 = "N0450M0825 00N000E B9 00N001E VFR IFR 00N001W/N0350F100 01N001W\r\n01S001W\t02S001W180060 "
+
+    def test_bytes_tokenize_01(self):
+        # The same tokens and indexes as the string tokenizer for bytes, bytearray and memoryview buffers
+        tokenizer = Tokenize()
+        tokenizer.set_whitespace(" \n\t\r/")
+        tokenizer.set_string_to_tokenize(self.FIELD_15)
+        tokenizer.tokenize()
+        expected = [(token.get_token_string(), token.get_token_start_index(), token.get_token_end_index())
+                    for token in tokenizer.get_tokens().get_tokens()]
+        bytes_tokenizer = BytesTokenize()
+        for buffer in [self.FIELD_15.encode("ascii"), bytearray(self.FIELD_15, "ascii"),
+                       memoryview(self.FIELD_15.encode("ascii"))]:
+            bytes_tokenizer.set_buffer_to_tokenize(buffer)
+            bytes_tokenizer.tokenize()
+            self.assertEqual(expected, [(token.get_token_string(), token.get_token_start_index(),
+                                         token.get_token_end_index())
+                                        for token in bytes_tokenizer.get_tokens().get_tokens()])
+
+    def test_bytes_tokenize_02(self):
+        # Tokens are decoded lazily, bounds and whitespace are honoured
+        tokenizer = BytesTokenize()
+        tokenizer.set_whitespace(" -")
+        self.assertEqual(b" -", tokenizer.get_whitespace())
+        tokenizer.set_buffer_to_tokenize(b"(FPL-A/B C-D)")
+        tokenizer.set_bounds(5, 12)
+        tokenizer.tokenize()
+        tokens = tokenizer.get_tokens()
+        self.assertEqual(3, tokens.get_number_of_tokens())
+        self.assertIsNone(tokens.get_first_token().token_string)
+        self.assertEqual(b"A/B", bytes(tokens.get_first_token().get_token_bytes()))
+        self.assertEqual("A/B", tokens.get_first_token().get_token_string())
+        self.assertEqual("D", tokens.get_token_at(2).get_token_string())
+        self.assertEqual(11, tokens.get_token_at(2).get_token_start_index())
+
+    def test_bytes_parse_01(self):
+        # The parser accepts bytes tokens, including the copied SPEED/VFR token
+        tokenizer = BytesTokenize()
+        tokenizer.set_buffer_to_tokenize(b"N0450F100 ABC N0400VFR DEF")
+        tokenizer.tokenize()
+        ers = ExtractedRouteSequence()
+        ParseF15().parse_f15(ers, tokenizer.get_tokens())
+        expected = F15ParseHelper.parse_field_15("N0450F100 ABC N0400VFR DEF")
+        self.assertEqual([element.unit_test_only() for element in expected.get_all_elements()],
+                         [element.unit_test_only() for element in ers.get_all_elements()])
+        self.assertIs(type(copy.deepcopy(tokenizer.get_tokens().get_first_token())), Token)
+
+
+if __name__ == '__main__':
+    unittest.main()
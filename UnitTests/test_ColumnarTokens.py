@@ -0,0 +1,133 @@
+import copy
+import unittest
+
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from F15_Parser.F15Parse import ParseF15
+from F15_Parser.F15TokenSyntaxDescriptions import TokenBaseType, TokenSubType
+from Tokenizer.ColumnarTokens import ColumnarTokens
+from Tokenizer.Token import Token
+from Tokenizer.Tokenize import Tokenize
+from UnitTests.F15ParseHelper import F15ParseHelper
+
+
+class ColumnarTokensTest(unittest.TestCase):
+    FIELD_15 = "N0450M0825 00N000E B9 00N001E VFR IFR 00N001W/N0350F100 01N001W\r\n01S001W\t02S001W180060 "
+
+    @staticmethod
+    def tokenize(string, whitespace, columnar, start_index=0, end_index=-1):
+        tokenizer = Tokenize()
+        tokenizer.set_whitespace(whitespace)
+        tokenizer.set_columnar(columnar)
+        tokenizer.set_string_to_tokenize(string)
+        tokenizer.set_bounds(start_index, end_index)
+        tokenizer.tokenize()
+        return [(token.get_token_string(), token.get_token_start_index(), token.get_token_end_index())
+                for token in tokenizer.get_tokens().get_tokens()]
+
+    def test_columnar_tokens_01(self):
+        # The same tokens and indexes as a Tokens list for any whitespace and bounds
+        for whitespace in [" \n\t\r/", " \n\t\r", " ", ""]:
+            self.assertEqual(self.tokenize(self.FIELD_15, whitespace, False),
+                             self.tokenize(self.FIELD_15, whitespace, True))
+        self.assertEqual(self.tokenize(self.FIELD_15, " /", False, 13, 50),
+                         self.tokenize(self.FIELD_15, " /", True, 13, 50))
+        self.assertEqual([], self.tokenize("   ", " ", True))
+        self.assertEqual([("/", 2, 3)], self.tokenize("  / ", " /", True))
+        for value, base_type in enumerate(ColumnarTokens.BASE_TYPES):
+            self.assertEqual(value, base_type)
+        for value, sub_type in enumerate(ColumnarTokens.SUB_TYPES):
+            self.assertEqual(value, sub_type)
+
+    def test_columnar_tokens_02(self):
+        # Proxies are only created on request and write through to the columns
+        tokens = ColumnarTokens("ABC DEF GHI")
+        tokens.scan()
+        self.assertEqual(3, tokens.get_number_of_tokens())
+        self.assertIsNone(tokens.proxies)
+        self.assertEqual(["ABC", "DEF", "GHI"], tokens.get_token_strings())
+        token = tokens.get_next_token()
+        self.assertIsNone(token.token_string)
+        self.assertEqual("DEF", token.get_token_string())
+        self.assertIs(token, tokens.get_token_at(1))
+        self.assertEqual([None, token, None], tokens.proxies)
+        self.assertIsNone(tokens.get_token_at(3))
+        token.set_token_base_type(TokenBaseType.F15_POINT)
+        token.set_token_string("XYZ")
+        self.assertEqual(TokenBaseType.F15_POINT, tokens.base_types[1])
+        self.assertEqual(["ABC", "XYZ", "GHI"], tokens.get_token_strings())
+        tokens.set_token_types([TokenBaseType.F15_SLASH] * 3, [TokenSubType.F15_SB_UNKNOWN] * 3)
+        self.assertIs(TokenBaseType.F15_SLASH, token.get_token_base_type())
+        self.assertRaises(ValueError, tokens.set_token_types, [TokenBaseType.F15_SLASH], [])
+        copied = copy.deepcopy(token)
+        self.assertIs(type(copied), Token)
+        self.assertEqual(("XYZ", 4, 7), (copied.get_token_string(), copied.get_token_start_index(),
+                                         copied.get_token_end_index()))
+
+    def test_columnar_tokens_03(self):
+        # Appended, inserted and removed tokens keep the columns, texts and proxies in step
+        tokens = ColumnarTokens("ABC DEF")
+        tokens.scan()
+        last = tokens.get_token_at(1)
+        tokens.create_append_token("GHI", 8, 11)
+        inserted = Token("/", 3, 4)
+        inserted.set_token_base_type(TokenBaseType.F15_SLASH)
+        tokens.insert_token(inserted, 1)
+        self.assertEqual(["ABC", "/", "DEF", "GHI"], tokens.get_token_strings())
+        self.assertEqual([0, 3, 4, 8], list(tokens.starts))
+        self.assertEqual(2, last.index)
+        self.assertIs(last, tokens.get_token_at(2))
+        self.assertIs(TokenBaseType.F15_SLASH, tokens.get_token_at(1).get_token_base_type())
+        tokens.remove_tokens_from_end_of_list(1)
+        self.assertEqual(["ABC", "/"], [token.get_token_string() for token in tokens.get_tokens()])
+        self.assertEqual({1: "/"}, tokens.token_strings)
+
+    def test_columnar_parse_01(self):
+        # The parser reads a columnar list through its proxies and gives the same ERS as for a Tokens list
+        for field_15 in [self.FIELD_15, "N0450F100 ABC N0400VFR DEF", "N0450F100 " + "A" * 40 + " DEF", ""]:
+            tokenizer = Tokenize()
+            tokenizer.set_whitespace(" \n\t\r/")
+            tokenizer.set_columnar(True)
+            tokenizer.set_string_to_tokenize(field_15)
+            tokenizer.tokenize()
+            tokens = tokenizer.get_tokens()
+            ers = ExtractedRouteSequence()
+            ParseF15().parse_f15(ers, tokens)
+            expected = F15ParseHelper.parse_field_15(field_15)
+            self.assertEqual([element.unit_test_only() for element in expected.get_all_elements()],
+                             [element.unit_test_only() for element in ers.get_all_elements()])
+            self.assertEqual(expected.get_derived_flight_rules(), ers.get_derived_flight_rules())
+
+    def test_from_tokens_01(self):
+        # A columnar copy of a parsed Tokens list holds the same tokens without creating proxies
+        tokenizer = Tokenize()
+        tokenizer.set_whitespace(" \n\t\r/")
+        tokenizer.set_string_to_tokenize(self.FIELD_15)
+        tokenizer.tokenize()
+        tokens = tokenizer.get_tokens()
+        tokens.get_token_at(2).set_token_string("B10")
+        ParseF15().parse_f15(ExtractedRouteSequence(), tokens)
+        columnar = ColumnarTokens.from_tokens(tokens, self.FIELD_15)
+        self.assertIsNone(columnar.proxies)
+        self.assertEqual({2: "B10"}, columnar.token_strings)
+        self.assertEqual([token.get_token_string() for token in tokens.get_tokens()], columnar.get_token_strings())
+        self.assertEqual([(token.get_token_start_index(), token.get_token_end_index(), token.get_token_base_type(),
+                           token.get_token_sub_type()) for token in tokens.get_tokens()],
+                         [(token.get_token_start_index(), token.get_token_end_index(), token.get_token_base_type(),
+                           token.get_token_sub_type()) for token in columnar.get_tokens()])
+
+    def test_columnar_parse_02(self):
+        # A batch may mix Tokens and ColumnarTokens lists
+        columnar = ColumnarTokens("N0450F100 ABC DCT DEF")
+        columnar.scan()
+        tokenizer = Tokenize()
+        tokenizer.set_whitespace(" \n\t\r/")
+        tokenizer.set_string_to_tokenize("N0450F100 ABC DCT XYZ")
+        tokenizer.tokenize()
+        self.assertEqual(5, ParseF15.assign_batch_syntax_descriptions([columnar, tokenizer.get_tokens()]))
+        self.assertEqual([token.get_token_base_type() for token in tokenizer.get_tokens().get_tokens()],
+                         [token.get_token_base_type() for token in columnar.get_tokens()])
+        self.assertEqual(TokenBaseType.F15_SPEED_ALTITUDE, columnar.base_types[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+
+from Utilities.Constants import Constants
+from Utilities.DecodeTables import DecodeTables
+from Utilities.Utils import Utils
+
+
+class DecodeTablesTest(unittest.TestCase):
+
+    def test_get_level_si_01(self):
+        self.assertEqual(10668, DecodeTables.get_level_si("F350"))
+        self.assertEqual(1372, DecodeTables.get_level_si("A045"))
+        self.assertEqual(11300, DecodeTables.get_level_si("S1130"))
+        self.assertEqual(8400, DecodeTables.get_level_si("M0840"))
+        self.assertIs(DecodeTables.get_level_si("F350"), DecodeTables.level_table["F350"])
+        # The complete domain matches the direct conversion
+        for level in range(1000):
+            expected = int((level * 100) * Constants.FEET_TO_METERS + 0.5)
+            self.assertEqual(expected, DecodeTables.get_level_si("F{0:03d}".format(level)))
+            self.assertEqual(expected, DecodeTables.get_level_si("A{0:03d}".format(level)))
+        for level in range(0, 10000, 7):
+            self.assertEqual(level * 10, DecodeTables.get_level_si("S{0:04d}".format(level)))
+
+    def test_get_speed_si_01(self):
+        self.assertEqual(231, DecodeTables.get_speed_si("N0450", 0))
+        self.assertEqual(231, DecodeTables.get_speed_si("K0830", 10000))
+        self.assertEqual(281, DecodeTables.get_speed_si("M082", 0))
+        self.assertEqual(243, DecodeTables.get_speed_si("M082", 10668))
+        self.assertEqual(243, DecodeTables.mach_table[("M082", 10668)])
+        for speed in range(0, 10000, 3):
+            self.assertEqual(int(speed * Constants.KNOTS_TO_METERS_SECOND + 0.5),
+                             DecodeTables.get_speed_si("N{0:04d}".format(speed), 0))
+            self.assertEqual(int(speed * Constants.KMH_TO_METERS_SECOND + 0.5),
+                             DecodeTables.get_speed_si("K{0:04d}".format(speed), 0))
+        for mach in range(1000):
+            for altitude_si in [0, 3048, 10668, 12497]:
+                self.assertEqual(int(Utils.mach_to_ms_speed(mach, altitude_si) + 0.5),
+                                 DecodeTables.get_speed_si("M{0:03d}".format(mach), altitude_si))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import pickle
+import unittest
+
+from F15_Parser.ErrorEntry import ErrorEntry
+from F15_Parser.ErrorMessageDefinitions import ErrorMessages
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from F15_Parser.F15TokenSyntaxDescriptions import TokenBaseType, TokenSubType
+from UnitTests.F15ParseHelper import F15ParseHelper
+
+
+class ErrorEntryTest(unittest.TestCase):
+
+    def test_lazy_errors_01(self):
+        ers = F15ParseHelper.parse_field_15("N0450F350 00N000E B9 00N001E XXXXXXXXXXXXXXXXXXXXXXXXXXXXXX")
+        self.assertEqual(2, ers.get_number_of_errors())
+        self.assertEqual([47, 4], ers.get_error_numbers())
+        self.assertIsNone(ers.error_record_cache)
+        entry = ers.get_error_entries()[0]
+        self.assertIsInstance(entry, ErrorEntry)
+        self.assertEqual(("B9", 18, 20), (entry.get_name(), entry.get_start_index(), entry.get_end_index()))
+        self.assertEqual(TokenBaseType.F15_ROUTE, entry.get_base_type())
+        # Records and messages are created when the errors are read, the same records on every call
+        errors = ers.get_all_errors()
+        self.assertEqual(ErrorMessages.error_messages[47].replace("!", "B9"), errors[0].get_error_text())
+        self.assertEqual(entry.get_error_text(), errors[0].get_error_text())
+        self.assertEqual((18, 20), (errors[0].get_start_index(), errors[0].get_end_index()))
+        self.assertIs(errors[1], ers.get_all_errors()[1])
+        self.assertIn("B9", ers.as_xml())
+
+    def test_add_error_01(self):
+        ers = ExtractedRouteSequence()
+        ers.add_error("ABC", 1, 4, TokenBaseType.F15_POINT, TokenSubType.F15_SB_PRP, "Custom '!' error")
+        self.assertEqual([None], ers.get_error_numbers())
+        self.assertEqual("Custom 'ABC' error", ers.get_all_errors()[0].get_error_text())
+        # Errors added after the errors were read are included in the next read
+        ers.add_error_number("DEF", 5, 8, TokenBaseType.F15_UNKNOWN, TokenSubType.F15_SB_UNKNOWN, 3)
+        self.assertEqual(["ABC", "DEF"], [error.get_name() for error in ers.get_all_errors()])
+        copy = pickle.loads(pickle.dumps(ers))
+        self.assertEqual(ers.as_xml(), copy.as_xml())
+        self.assertEqual([None, 3], copy.get_error_numbers())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from F15_Parser.F15Dialect import F15Dialect
+from F15_Parser.F15Grammar import F15Grammar, GrammarState
+from F15_Parser.F15TokenSyntaxDescriptions import TokenBaseType, TokenSubType, F15TokenSyntaxDefinition
+from Service.AsyncParseF15 import AsyncParseF15
+from Tokenizer.TokenInternPool import TokenInternPool
+from Tokenizer.Tokenize import Tokenize
+from UnitTests.F15ParseHelper import F15ParseHelper
+
+
+class F15DialectTest(unittest.TestCase):
+
+    def test_get_dialect_01(self):
+        ifps = F15Dialect.get_dialect(F15Dialect.IFPS)
+        icao = F15Dialect.get_dialect(F15Dialect.ICAO)
+        # Dialects are built once
+        self.assertIs(ifps, F15Dialect.get_dialect())
+        self.assertIs(icao, F15Dialect.get_dialect(F15Dialect.ICAO))
+        self.assertIs(TokenInternPool.get_shared_pool(), ifps.intern_pool)
+        self.assertIsNot(ifps.intern_pool, icao.intern_pool)
+        self.assertIs(icao.syntax_definition, icao.intern_pool.syntax_definition)
+        self.assertIn(F15Dialect.ICAO, F15Dialect.get_dialect_names())
+        with self.assertRaises(ValueError):
+            F15Dialect.get_dialect("NO_SUCH_DIALECT")
+
+    def test_strict_configuration_01(self):
+        configuration = F15Dialect.get_strict_configuration()
+        self.assertEqual(len(F15TokenSyntaxDefinition.F15_SB_CONFIGURATION), len(configuration))
+        definition = F15TokenSyntaxDefinition(configuration)
+        for token_string in ["OAT", "GAT", "IFPSTOP", "IFPSTART", "NATA", "PTS3", "ABC123", "ABCD1"]:
+            self.assertIs(TokenBaseType.F15_UNKNOWN, definition.get_token_type(token_string)[1], token_string)
+        for token_string in ["VFR", "IFR", "DCT", "UN123", "ABC", "50N010E", "N0450F350"]:
+            self.assertEqual(F15TokenSyntaxDefinition().get_token_type(token_string),
+                             definition.get_token_type(token_string), token_string)
+
+    def test_parse_01(self):
+        field_15 = "N0450F350 LNZ OAT ABC GAT DEF UN123 GHI"
+        # The default dialect parses as ParseF15() does
+        ers = AsyncParseF15.parse_text(field_15)
+        self.assertEqual(F15ParseHelper.parse_field_15(field_15).as_xml(), ers.as_xml())
+        self.assertEqual(0, ers.get_number_of_errors())
+        self.assertEqual("O", ers.get_element_at(2).get_flight_rules()[0])
+
+        ers = AsyncParseF15.parse_text(field_15, dialect=F15Dialect.ICAO)
+        self.assertEqual([3, 3], ers.get_error_numbers())
+        self.assertEqual(["OAT", "GAT"], [error.get_name() for error in ers.get_all_errors()])
+        self.assertEqual(TokenSubType.F15_SB_UNKNOWN, ers.get_all_errors()[0].get_sub_type())
+
+        # The same tokens parsed against each dialect in turn
+        tokenizer = Tokenize()
+        tokenizer.set_whitespace(" \n\t\r/")
+        tokenizer.set_string_to_tokenize(field_15)
+        tokenizer.tokenize()
+        for name in [F15Dialect.ICAO, F15Dialect.IFPS, F15Dialect.ICAO]:
+            ers = ExtractedRouteSequence()
+            self.assertEqual(name == F15Dialect.IFPS,
+                             F15Dialect.get_dialect(name).parse_f15(ers, tokenizer.get_tokens()))
+
+    def test_register_01(self):
+        grammar = F15Grammar.get_default().derive({GrammarState.POST_ADEP: {TokenBaseType.F15_ROUTE: "route"}})
+        F15Dialect.register(F15Dialect("TEST", grammar=grammar))
+        try:
+            self.assertIn("TEST", F15Dialect.get_dialect_names())
+            self.assertEqual([24], AsyncParseF15.parse_text("N0450F350 UN123 ABC").get_error_numbers())
+            self.assertEqual([], AsyncParseF15.parse_text("N0450F350 UN123 ABC", dialect="TEST").get_error_numbers())
+        finally:
+            del F15Dialect.dialects["TEST"]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from F15_Parser.F15Grammar import F15Grammar, GrammarState
+from F15_Parser.F15Parse import ParseF15
+from F15_Parser.F15TokenSyntaxDescriptions import TokenBaseType
+from Tokenizer.Tokenize import Tokenize
+
+
+class F15GrammarTest(unittest.TestCase):
+
+    @staticmethod
+    def parse(parser, field_15):
+        tokenizer = Tokenize()
+        tokenizer.set_whitespace(" \n\t\r/")
+        tokenizer.set_string_to_tokenize(field_15)
+        tokenizer.tokenize()
+        ers = ExtractedRouteSequence()
+        parser.parse_f15(ers, tokenizer.get_tokens())
+        return ers
+
+    def test_table_01(self):
+        grammar = F15Grammar.get_default()
+        self.assertIs(grammar, F15Grammar.get_default())
+        # One row per state, one transition per base type
+        self.assertEqual(len(GrammarState), len(grammar.table))
+        for row in grammar.table:
+            self.assertEqual(len(TokenBaseType), len(row))
+            for transition in row:
+                self.assertTrue(callable(transition))
+        self.assertEqual(23, grammar.get_action(GrammarState.POST_ADEP, TokenBaseType.F15_C))
+        self.assertEqual("point", grammar.get_action(GrammarState.POST_ADEP, TokenBaseType.F15_POINT))
+        self.assertEqual(("add_previous_record", "dct"),
+                         grammar.get_action(GrammarState.CRUISE_CLIMB_C, TokenBaseType.F15_DCT))
+        for name in grammar.get_handler_names():
+            self.assertTrue(callable(getattr(ParseF15, name)), name)
+
+    def test_derive_01(self):
+        field_15 = "N0450F350 UL610 ABC"
+        ers = self.parse(ParseF15(), field_15)
+        self.assertEqual(1, ers.get_number_of_errors())
+        self.assertEqual([24], ers.get_error_numbers())
+
+        # A variant allowing a route to follow the ADEP, the default grammar is not changed
+        grammar = F15Grammar.get_default().derive({GrammarState.POST_ADEP: {TokenBaseType.F15_ROUTE: "route"}})
+        self.assertEqual(24, F15Grammar.get_default().get_action(GrammarState.POST_ADEP, TokenBaseType.F15_ROUTE))
+        ers = self.parse(ParseF15(grammar=grammar), field_15)
+        self.assertEqual(0, ers.get_number_of_errors())
+        self.assertEqual("UL610", ers.get_element_at(1).get_name())
+        self.assertEqual("ABC", ers.get_element_at(2).get_name())
+
+        # Changing one base type of a tuple key leaves the other base types of the key unchanged
+        grammar = F15Grammar.get_default().derive({GrammarState.POST_ADEP: {TokenBaseType.F15_STAY: 99}})
+        self.assertEqual(99, grammar.get_action(GrammarState.POST_ADEP, TokenBaseType.F15_STAY))
+        self.assertEqual(23, grammar.get_action(GrammarState.POST_ADEP, TokenBaseType.F15_C))
+
+    def test_invalid_01(self):
+        with self.assertRaises(ValueError):
+            F15Grammar({GrammarState.POST_ADEP: {F15Grammar.DEFAULT: 0}})
+        with self.assertRaises(ValueError):
+            F15Grammar.get_default().derive({GrammarState.DCT: {TokenBaseType.F15_POINT: 1.5}})
+        with self.assertRaises(ValueError):
+            F15Grammar.get_default().derive({GrammarState.DCT: {F15Grammar.DEFAULT: ()}})
+        grammar = F15Grammar.get_default().derive({GrammarState.DCT: {TokenBaseType.F15_POINT: "no_such_handler"}})
+        with self.assertRaises(ValueError):
+            ParseF15(grammar=grammar)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from F15_Parser.F15Parse import ParseF15
+from F15_Parser.F15ParseProfiler import F15ParseProfiler
+from Tokenizer.Tokenize import Tokenize
+from UnitTests.F15ParseHelper import F15ParseHelper
+
+
+class F15ParseProfilerTest(unittest.TestCase):
+
+    @staticmethod
+    def parse(parser, field_15):
+        tokenizer = Tokenize()
+        tokenizer.set_whitespace(" \n\t\r/")
+        tokenizer.set_string_to_tokenize(field_15)
+        tokenizer.tokenize()
+        ers = ExtractedRouteSequence()
+        parser.parse_f15(ers, tokenizer.get_tokens())
+        return ers
+
+    def test_profile_01(self):
+        profiler = F15ParseProfiler()
+        parser = ParseF15(profiler=profiler)
+        field_15 = "N0450F350 LNZ UL610 ABC DCT 50N010E VFR"
+        ers = self.parse(parser, field_15)
+        # Profiling does not change the result
+        self.assertEqual(F15ParseHelper.parse_field_15(field_15).as_xml(), ers.as_xml())
+        handlers = {name: (calls, inclusive, exclusive)
+                    for name, calls, inclusive, exclusive in profiler.get_handler_statistics()}
+        self.assertEqual(1, handlers["parse_f15"][0])
+        self.assertEqual(1, handlers["route"][0])
+        self.assertEqual(1, handlers["dct"][0])
+        self.assertEqual(1, handlers["break_start"][0])
+        # Recursive calls are not counted twice, no inclusive time exceeds the time of the whole parse
+        for calls, inclusive, exclusive in handlers.values():
+            self.assertLessEqual(exclusive, inclusive)
+            self.assertLessEqual(inclusive, handlers["parse_f15"][1])
+        self.assertAlmostEqual(handlers["parse_f15"][1], sum(exclusive for _, _, exclusive in handlers.values()),
+                               delta=1.0)
+        transitions = {item[0:3]: item[3] for item in profiler.get_transition_statistics()}
+        self.assertEqual(1, transitions[("-", "-", "parse_f15")])
+        self.assertEqual(1, transitions[("parse_f15", "F15_SPEED_ALTITUDE", "assign_speed_altitude")])
+        self.assertEqual(1, transitions[("post_point", "F15_ROUTE", "route_after_point")])
+        self.assertEqual(1, transitions[("route_after_point", "F15_ROUTE", "route")])
+        self.assertEqual(1, transitions[("post_point", "F15_BREAK_START", "break_start")])
+        self.assertIn("post_point -> route_after_point [F15_ROUTE]", profiler.get_report())
+
+    def test_folded_stacks_01(self):
+        profiler = F15ParseProfiler()
+        parser = ParseF15(profiler=profiler)
+        for _ in range(20):
+            self.parse(parser, "N0450F350 LNZ UL610 ABC")
+        lines = profiler.get_folded_stacks()
+        self.assertIn("parse_f15;assign_speed_altitude;post_adep;point",
+                      [line.rsplit(" ", 1)[0] for line in lines])
+        for line in lines:
+            stack, value = line.rsplit(" ", 1)
+            self.assertTrue(stack.startswith("parse_f15"))
+            self.assertGreater(int(value), 0)
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "profile.folded")
+            profiler.write_folded_stacks(file_name)
+            with open(file_name, "r", encoding="utf-8") as file:
+                self.assertEqual(lines, file.read().splitlines())
+
+    def test_detach_01(self):
+        profiler = F15ParseProfiler()
+        parser = ParseF15(profiler=profiler)
+        self.parse(parser, "N0450F350 LNZ")
+        profiler.detach(parser)
+        self.assertEqual(["intern_pool", "grammar"], list(vars(parser)))
+        self.parse(parser, "N0450F350 LNZ")
+        self.assertEqual(1, dict((item[0], item[1]) for item in profiler.get_handler_statistics())["parse_f15"])
+        profiler.clear()
+        self.assertEqual([], profiler.get_handler_statistics())
+        self.assertEqual([], profiler.get_folded_stacks())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+from F15_Parser.FlightState import FlightState
+from UnitTests.F15ParseHelper import F15ParseHelper
+
+
+class FlightStateTest(unittest.TestCase):
+
+    def test_flight_state_01(self):
+        state = FlightState.get_state("F350", 10668, "N0450", 232, "IFR")
+        self.assertIs(state, FlightState.get_state("F350", 10668, "N0450", 232, "IFR"))
+        self.assertIs(state, state.with_altitude("F350"))
+        self.assertIsNot(state, state.with_altitude_si(10668.0))
+        self.assertEqual("VFR", state.with_flight_rules("VFR").flight_rules)
+        self.assertEqual("IFR", state.flight_rules)
+        self.assertRaises(AttributeError, setattr, state, "altitude", "F360")
+
+    def test_shared_states_01(self):
+        # Consecutive records share a state until a speed/altitude element or rule change
+        ers = F15ParseHelper.parse_field_15("N0450F350 ABC DEF GHI/N0460F370 JKL MNO VFR")
+        elements = ers.get_all_elements()
+        self.assertEqual(["ADEP", "ABC", "DEF", "GHI", "JKL", "MNO", "VFR", "ADES"],
+                         [element.get_name() for element in elements])
+        self.assertIs(elements[0].get_flight_state(), elements[2].get_flight_state())
+        self.assertIsNot(elements[2].get_flight_state(), elements[3].get_flight_state())
+        self.assertIs(elements[3].get_flight_state(), elements[5].get_flight_state())
+        self.assertEqual("GHI IFR N0460 F370", elements[3].unit_test_only())
+        self.assertEqual("VFR VFR N0460 F370", elements[6].unit_test_only())
+
+    def test_interned_states_01(self):
+        # Speed/altitude and speed/VFR elements intern only the final state of each record, not the partly
+        # assigned states in between
+        interned_states = dict(FlightState.interned_states)
+        FlightState.interned_states.clear()
+        try:
+            ers = F15ParseHelper.parse_field_15("N0450F350 ABC/M082F370 DEF/N0460F3500370 GHI/N0400VFR JKL")
+            states = set(element.get_flight_state() for element in ers.get_all_elements())
+            self.assertEqual(states, set(FlightState.interned_states.values()))
+        finally:
+            FlightState.interned_states.clear()
+            FlightState.interned_states.update(interned_states)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+
+from Utilities.GeodesicCache import GeodesicCache
+from Utilities.Utils import Utils
+
+
+class GeodesicCacheTest(unittest.TestCase):
+
+    def test_eviction_01(self):
+        cache = GeodesicCache(3)
+        for index in range(3):
+            cache.put((float(index),), (index,))
+        # Using the oldest result makes the second result the least recently used
+        self.assertEqual((0,), cache.get((0.0,)))
+        cache.put((3.0,), (3,))
+        self.assertIsNone(cache.get((1.0,)))
+        self.assertEqual((2,), cache.get((2.0,)))
+        self.assertEqual(3, cache.get_size())
+        self.assertEqual({"size": 3, "max_size": 3, "lookups": 3, "hits": 2, "hit_rate": 2 / 3, "evictions": 1},
+                         cache.get_statistics())
+        cache.clear()
+        self.assertEqual(0, cache.get_size())
+        self.assertEqual(0.0, cache.get_statistics()["hit_rate"])
+
+    def test_eviction_02(self):
+        cache = GeodesicCache(0)
+        cache.put((1.0,), (1,))
+        self.assertIsNone(cache.get((1.0,)))
+        self.assertEqual(0, cache.get_size())
+        with self.assertRaises(ValueError):
+            GeodesicCache(-1)
+
+    def test_save_load_01(self):
+        cache = GeodesicCache()
+        cache.put((50.0, 10.0, 51.0, 11.0), (33.5, 131000.0))
+        cache.put((-0.0, 10.0, 0.0, 11.0), (90.0, 111000.0))
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "cache.marshal")
+            cache.save(file_name)
+            self.assertEqual([file_name], [os.path.join(directory, name) for name in os.listdir(directory)])
+            loaded = GeodesicCache()
+            self.assertEqual(2, loaded.load(file_name))
+            self.assertEqual(list(cache.results.items()), list(loaded.results.items()))
+            # Missing and unreadable files are ignored
+            self.assertEqual(0, loaded.load(os.path.join(directory, "missing.marshal")))
+            with open(file_name, "wb") as file:
+                file.write(b"not a cache")
+            self.assertEqual(0, loaded.load(file_name))
+            self.assertEqual(2, loaded.get_size())
+
+    def test_utils_01(self):
+        geode = Utils.get_geode()
+        cache = Utils.get_inverse_cache()
+        utils = Utils()
+        # 0.0 and -0.0 are equal but give different azimuths, they are cached separately
+        for points in [(50.5, 10.25, 51.0, -11.75), (-0.0, 0.0, 0.0, 0.0), (0.0, 0.0, 0.0, 0.0)]:
+            result = geode.Inverse(*points)
+            self.assertEqual([result['azi1'], result['s12']], utils.get_bearing_distance_between_points(*points))
+            # A repeated point pair is found in the cache
+            hits = cache.get_statistics()["hits"]
+            self.assertEqual([result['azi1'], result['s12']], utils.get_bearing_distance_between_points(*points))
+            self.assertEqual(hits + 1, cache.get_statistics()["hits"])
+
+    def test_utils_02(self):
+        geode = Utils.get_geode()
+        cache = Utils.get_direct_cache()
+        utils = Utils()
+        result = geode.Direct(50.5, 10.25, 45.0, 100000.0)
+        lookups = cache.get_statistics()["lookups"]
+        for index in range(2):
+            self.assertEqual([result['lat2'], result['lon2']],
+                             utils.get_bearing_distance_projected_point(50.5, 10.25, 45.0, 100000.0))
+        self.assertEqual(lookups + 2, cache.get_statistics()["lookups"])
+        with tempfile.TemporaryDirectory() as directory:
+            Utils.save_geodesic_caches(os.path.join(directory, "caches"))
+            self.assertGreater(Utils.load_geodesic_caches(os.path.join(directory, "caches")), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+from Benchmarks.GeodesyBackendBenchmark import GeodesyBackendBenchmark
+from Utilities.GeodesyBackend import GeodesyBackend, KarneyBackend, SphericalBackend, VincentyBackend
+from Utilities.Utils import Utils
+
+
+class GeodesyBackendTest(unittest.TestCase):
+
+    def test_error_bounds_01(self):
+        point_pairs = GeodesyBackendBenchmark.build_point_pairs(2000)
+        projections = GeodesyBackendBenchmark.build_projections(point_pairs)
+        for backend in [VincentyBackend(), SphericalBackend()]:
+            distance_error, azimuth_error, position_error = GeodesyBackendBenchmark.get_errors(
+                backend, point_pairs, projections)
+            self.assertLessEqual(distance_error, backend.DISTANCE_ERROR, backend.get_name())
+            self.assertLessEqual(azimuth_error, backend.AZIMUTH_ERROR, backend.get_name())
+            self.assertLessEqual(position_error, backend.POSITION_ERROR, backend.get_name())
+
+    def test_special_points_01(self):
+        # Coincident, antipodal, polar and date line crossing points
+        for pair in [(50.0, 10.0, 50.0, 10.0), (0.0, 0.0, 0.0, 180.0), (10.0, 20.0, -10.0, -160.0),
+                     (90.0, 0.0, 45.0, 90.0), (10.0, 179.5, 10.5, -179.5)]:
+            azimuth, distance = KarneyBackend().inverse(*pair)
+            backend_distance = VincentyBackend().inverse(*pair)[1]
+            self.assertAlmostEqual(distance, backend_distance, delta=max(distance, 1.0) * 1e-9, msg=pair)
+            backend_distance = SphericalBackend().inverse(*pair)[1]
+            self.assertAlmostEqual(distance, backend_distance, delta=max(distance, 1.0) * 0.006, msg=pair)
+        for backend in GeodesyBackend.get_backends():
+            latitude, longitude = backend.direct(10.0, 179.5, 90.0, 200000.0)
+            self.assertTrue(-180.0 <= longitude < -178.0, backend.get_name())
+
+    def test_utils_01(self):
+        self.assertIsInstance(Utils.get_geodesy_backend(), KarneyBackend)
+        utils = Utils()
+        karney = utils.get_bearing_distance_between_points(50.0, 10.0, 51.0, 11.0)
+        try:
+            Utils.set_geodesy_backend("spherical")
+            self.assertIsInstance(Utils.get_geodesy_backend(), SphericalBackend)
+            # The cached Karney results are not returned by the new backend
+            self.assertEqual(list(SphericalBackend().inverse(50.0, 10.0, 51.0, 11.0)),
+                             utils.get_bearing_distance_between_points(50.0, 10.0, 51.0, 11.0))
+            self.assertNotEqual(karney, utils.get_bearing_distance_between_points(50.0, 10.0, 51.0, 11.0))
+            self.assertEqual(list(SphericalBackend().direct(50.0, 10.0, 45.0, 100000.0)),
+                             utils.get_bearing_distance_projected_point(50.0, 10.0, 45.0, 100000.0))
+            with self.assertRaises(ValueError):
+                Utils.set_geodesy_backend("flat")
+        finally:
+            Utils.set_geodesy_backend(KarneyBackend())
+        self.assertEqual(karney, utils.get_bearing_distance_between_points(50.0, 10.0, 51.0, 11.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import io
+import unittest
+
+from IcaoMessage.IcaoMessage import IcaoMessage
+from IcaoMessage.IcaoMessageFramer import IcaoMessageFramer
+from Tokenizer.Tokenize import Tokenize
+
+
+class IcaoMessageTest(unittest.TestCase):
+    FPL = "(FPL-ABC123-IS\n-B738/M-SDE3FGHIJ1RWY/LB1\n-EGLL0800\n-N0450F350 00N000E B9 00N001E\n" \
+          "-EDDF0105 EDDK\n-DOF/240101)"
+
+    def test_tokenize_bounds_01(self):
+        tokenizer = Tokenize()
+        tokenizer.set_whitespace(" \n\t\r/")
+        tokenizer.set_string_to_tokenize("-EGLL0800 -N0450F350 ABC/N0400F300 DEF -EDDF")
+        tokenizer.set_bounds(11, 39)
+        tokenizer.tokenize()
+        tokens = tokenizer.get_tokens()
+        self.assertEqual(["N0450F350", "ABC", "/", "N0400F300", "DEF"],
+                         [tokens.get_token_at(idx).get_token_string() for idx in range(tokens.get_number_of_tokens())])
+        self.assertEqual(11, tokens.get_first_token().get_token_start_index())
+        self.assertEqual(38, tokens.get_token_at(4).get_token_end_index())
+        # Setting a new string clears the bounds
+        tokenizer.set_string_to_tokenize("A B")
+        tokenizer.tokenize()
+        self.assertEqual(2, tokenizer.get_tokens().get_number_of_tokens())
+
+    def test_fpl_01(self):
+        message = IcaoMessage(self.FPL, 10)
+        self.assertEqual("FPL", message.get_message_type())
+        self.assertEqual(10, message.get_stream_offset())
+        self.assertEqual("ABC123", message.get_field(7))
+        self.assertEqual("SDE3FGHIJ1RWY/LB1", message.get_field(10))
+        self.assertEqual("EGLL0800", message.get_field(13))
+        self.assertEqual("DOF/240101", message.get_field(18))
+        self.assertIsNone(message.get_field(19))
+        self.assertEqual("EGLL", message.get_adep())
+        self.assertEqual("EDDF", message.get_ades())
+        start, end = message.get_route_bounds()
+        self.assertEqual("N0450F350 00N000E B9 00N001E", self.FPL[start:end])
+
+    def test_fpl_parse_route_01(self):
+        message = IcaoMessage(self.FPL)
+        ers = message.parse_route()
+        self.assertEqual("EGLL IFR N0450 F350", ers.get_first_element().unit_test_only())
+        self.assertEqual("EDDF IFR", ers.get_last_element().unit_test_only())
+        self.assertEqual(self.FPL.find("EGLL"), ers.get_first_element().get_start_index())
+        # Indexes are relative to the message, errors can be highlighted in the message text
+        self.assertEqual(1, ers.get_number_of_errors())
+        error = ers.get_all_errors()[0]
+        self.assertEqual("B9", self.FPL[error.get_start_index():error.get_end_index()])
+
+    def test_chg_01(self):
+        message = IcaoMessage("(CHG-ABC123-EGLL0800-EDDF-DOF/240101-15/N0460F370 DCT ABC DCT-16/EDDM0100)")
+        self.assertEqual("CHG", message.get_message_type())
+        self.assertEqual("DOF/240101", message.get_field(18))
+        self.assertEqual("EDDF", message.get_field(16))
+        self.assertEqual("EGLL", message.get_adep())
+        self.assertEqual("EDDM", message.get_ades())
+        ers = message.parse_route()
+        self.assertEqual(["EGLL", "DCT", "ABC", "DCT", "EDDM"],
+                         [element.get_name() for element in ers.get_all_elements()])
+        # A CHG without a field 15 amendment has no route
+        self.assertIsNone(IcaoMessage("(CHG-ABC123-EGLL0800-EDDF-0-8/VG)").parse_route())
+
+    def test_framer_01(self):
+        stream = "ZCZC ABC123\r\nFF EDDFZQZX\r\n" + self.FPL + "\r\nNNNN\r\n(ARR-ABC123-EGLL-EDDF1030)" + \
+                 "(FPL-TRUNCATED-IS(CPL-DEF456-IS-A320/M-S/C-LFPG0800-ABC/1020F330" + \
+                 "-N0440F330 00N000E 00N001E-LIRF0130-0)"
+        # A small chunk size makes messages straddle chunk boundaries
+        framer = IcaoMessageFramer(7)
+        messages = list(framer.frame_stream(io.StringIO(stream)))
+        self.assertEqual(["FPL", "ARR", "CPL"], [message.get_message_type() for message in messages])
+        self.assertEqual(self.FPL, messages[0].get_text())
+        self.assertEqual(stream.find("(FPL"), messages[0].get_stream_offset())
+        self.assertEqual(stream.find("(CPL"), messages[2].get_stream_offset())
+        self.assertEqual("N0440F330 00N000E 00N001E", messages[2].get_field(15))
+        routes = list(framer.parse_routes(messages))
+        self.assertEqual(["FPL", "CPL"], [message.get_message_type() for message, ers in routes])
+        self.assertEqual("LFPG", routes[1][1].get_first_element().get_name())
+        self.assertEqual("LIRF", routes[1][1].get_last_element().get_name())
+        self.assertEqual(0, len(list(framer.frame_string("(FPL-UNTERMINATED"))))
+
+
+if __name__ == '__main__':
+    unittest.main()
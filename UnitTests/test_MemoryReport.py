@@ -0,0 +1,52 @@
+import sys
+import unittest
+
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from Tokenizer.Tokenize import Tokenize
+from UnitTests.F15ParseHelper import F15ParseHelper
+from Utilities.MemoryReport import MemoryReport
+
+
+class MemoryReportTest(unittest.TestCase):
+
+    def test_deep_size_01(self):
+        text = "ABCDEFGHIJ" * 10
+        self.assertEqual(sys.getsizeof([]), MemoryReport.get_deep_size([]))
+        # Each object is counted once, small integers are shared
+        self.assertEqual(sys.getsizeof([text, text, 1]) + sys.getsizeof(text),
+                         MemoryReport.get_deep_size([text, text, 1]))
+        self.assertEqual(sys.getsizeof({1000: None}) + sys.getsizeof(1000), MemoryReport.get_deep_size({1000: None}))
+
+    def test_ers_report_01(self):
+        # The first parse fills the intern pool and decode tables, measure the second
+        F15ParseHelper.parse_field_15("N0450F350 LNZ UL610 ABC DCT 50N010E B9 00N001E DCT DEF")
+        ers = F15ParseHelper.parse_field_15("N0450F350 LNZ UL610 ABC DCT 50N010E B9 00N001E")
+        report = MemoryReport.get_ers_report(ers)
+        self.assertEqual(ers.get_number_of_elements(), report["records"])
+        self.assertEqual(1, report["errors"])
+        self.assertGreater(report["record_bytes"], 0)
+        self.assertGreater(report["error_bytes"], 0)
+        self.assertGreater(report["shared_bytes"], 0)
+        self.assertGreater(report["bytes"], report["record_bytes"] + report["error_bytes"])
+        self.assertAlmostEqual(report["record_bytes"] / report["records"], report["bytes_per_record"])
+        self.assertEqual(report["bytes"], MemoryReport.get_deep_size(ers))
+        # A longer route owns more memory, an empty ERS owns only its ADEP record
+        longer = MemoryReport.get_ers_report(
+            F15ParseHelper.parse_field_15("N0450F350 LNZ UL610 ABC DCT 50N010E B9 00N001E DCT DEF"))
+        self.assertGreater(longer["bytes"], report["bytes"])
+        self.assertEqual(1, MemoryReport.get_ers_report(ExtractedRouteSequence())["records"])
+        self.assertIn("records=", MemoryReport.format_report(report))
+
+    def test_tokens_report_01(self):
+        tokenizer = Tokenize()
+        tokenizer.set_whitespace(" ")
+        tokenizer.set_string_to_tokenize("N0450F350 LNZ UL610 ABC")
+        tokenizer.tokenize()
+        report = MemoryReport.get_tokens_report(tokenizer.get_tokens())
+        self.assertEqual(4, report["tokens"])
+        self.assertGreater(report["bytes"], report["token_bytes"])
+        self.assertAlmostEqual(report["token_bytes"] / 4, report["bytes_per_token"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import json
+import os
+import tempfile
+import unittest
+
+from Service.ErsCodec import ErsCodec
+from Service.ParseClient import ParseClient
+from Service.ParseDaemon import ParseDaemon
+from UnitTests.F15ParseHelper import F15ParseHelper
+
+
+class ParseDaemonTest(unittest.TestCase):
+    ROUTES = ["N0450M0825 00N000E B9 00N001E VFR IFR 00N001W/N0350F100 01N001W 01S001W 02S001W180060",
+              "N0450F350 ABC UL9 DEF DCT 50N010W DCT GHI/N0460F370 JKL",
+              "N0450F350 ABC B9 NOLAN1D"]
+
+    def test_tcp_daemon_01(self):
+        expected = [json.loads(json.dumps(ErsCodec.encode(F15ParseHelper.parse_field_15(route))))
+                    for route in self.ROUTES * 7]
+        daemon = ParseDaemon(workers=2)
+        daemon.start_background()
+        try:
+            client = ParseClient(daemon.address)
+            response = client.parse(self.ROUTES * 7)
+            self.assertEqual(1, response["id"])
+            self.assertEqual(expected, response["results"])
+            self.assertEqual(ErsCodec.RECORD_FIELDS, response["record_fields"])
+            self.assertEqual("ADEP", response["results"][0]["records"][0][ErsCodec.RECORD_FIELDS.index("name")])
+            # Invalid requests are answered with an error and the connection remains usable
+            self.assertIn("error", client.request({"id": "bad", "routes": "N0450F350 ABC"}))
+            self.assertEqual("bad", client.request({"id": "bad", "route": []})["id"])
+            self.assertEqual(expected[0:1], client.parse(self.ROUTES[0:1])["results"])
+            client.close()
+        finally:
+            daemon.stop_background()
+
+    def test_unix_daemon_01(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "parse.sock")
+            daemon = ParseDaemon(unix_path=path, workers=2, processes=False)
+            daemon.start_background()
+            try:
+                clients = [ParseClient(path) for _ in range(2)]
+                for client in clients:
+                    response = client.parse(self.ROUTES)
+                    self.assertEqual(3, len(response["results"]))
+                    self.assertEqual(1, len(response["results"][2]["errors"]))
+                    client.close()
+            finally:
+                daemon.stop_background()
+            self.assertFalse(os.path.exists(path))
+        self.assertRaises(ValueError, ParseDaemon, "127.0.0.1", 0, None, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
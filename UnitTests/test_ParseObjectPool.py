@@ -0,0 +1,84 @@
+import gc
+import unittest
+
+from Benchmarks.ParseDaemonLoadGenerator import ParseDaemonLoadGenerator
+from F15_Parser.ExtractedRouteRecord import ExtractedRouteRecord
+from F15_Parser.F15TokenSyntaxDescriptions import TokenBaseType, TokenSubType
+from F15_Parser.ParseObjectPool import ParseObjectPool
+from Service.AsyncParseF15 import AsyncParseF15
+from Service.BulkParse import BulkParse
+from Utilities.GcControl import GcControl
+
+
+class ParseObjectPoolTest(unittest.TestCase):
+
+    def test_parse_01(self):
+        field_15s = ParseDaemonLoadGenerator.build_routes(300) + ["N0450F350 LNZ OAT ABC GAT DEF", ""]
+        expected = [AsyncParseF15.parse_text(field_15).as_xml() for field_15 in field_15s]
+        for recycle_records in [False, True]:
+            pool = ParseObjectPool(recycle_records=recycle_records)
+            # Later rounds parse with objects recycled from earlier messages
+            for _ in range(3):
+                for field_15, xml in zip(field_15s, expected):
+                    ers = AsyncParseF15.parse_text(field_15, object_pool=pool)
+                    self.assertEqual(xml, ers.as_xml())
+                    pool.release_sequence(ers)
+                results = AsyncParseF15.parse_texts(field_15s, object_pool=pool)
+                self.assertEqual(expected, [ers.as_xml() for ers in results])
+                for ers in results:
+                    pool.release_sequence(ers)
+            statistics = pool.get_statistics()
+            self.assertGreater(statistics["reuse_rate"], 0.5)
+            self.assertEqual(recycle_records, statistics["free_records"] > 0)
+            self.assertEqual(recycle_records, statistics["free_sequences"] > 0)
+
+    def test_release_01(self):
+        pool = ParseObjectPool(max_size=3, recycle_records=True)
+        ers = AsyncParseF15.parse_text("N0450F350 LNZ UL610 ABC DCT DEF", object_pool=pool)
+        pool.release_sequence(ers)
+        # Releasing twice does not pool the objects again, free lists are bounded
+        pool.release_sequence(ers)
+        self.assertEqual(3, pool.get_statistics()["free_records"])
+        self.assertEqual(1, pool.get_statistics()["free_sequences"])
+        self.assertEqual(3, pool.get_statistics()["free_tokens"])
+        self.assertEqual(1, pool.get_statistics()["free_token_lists"])
+        pool.clear()
+        self.assertEqual(0, pool.get_statistics()["requests"])
+        with self.assertRaises(ValueError):
+            ParseObjectPool(-1)
+
+    def test_record_reset_01(self):
+        record = ExtractedRouteRecord("50N010E", 3, 10, TokenBaseType.F15_POINT, TokenSubType.F15_SB_LL_DEG)
+        record.set_latitude(50.0)
+        record.set_lat_long_valid(True)
+        record.append_break_text("TEXT")
+        record.reset("ABC", 1, 4, TokenBaseType.F15_POINT, TokenSubType.F15_SB_PRP)
+        new_record = ExtractedRouteRecord("ABC", 1, 4, TokenBaseType.F15_POINT, TokenSubType.F15_SB_PRP)
+        for name in ExtractedRouteRecord.__annotations__:
+            self.assertEqual(getattr(new_record, name), getattr(record, name), name)
+
+    def test_gc_control_01(self):
+        enabled = gc.isenabled()
+        with GcControl(GcControl.DISABLE):
+            self.assertFalse(gc.isenabled())
+            with GcControl(GcControl.DISABLE):
+                self.assertFalse(gc.isenabled())
+            self.assertFalse(gc.isenabled())
+        self.assertEqual(enabled, gc.isenabled())
+        with GcControl(GcControl.FREEZE):
+            self.assertGreater(gc.get_freeze_count(), 0)
+        self.assertEqual(0, gc.get_freeze_count())
+        with self.assertRaises(ValueError):
+            GcControl("off")
+
+    def test_bulk_parse_01(self):
+        chunk = [("-", index, field_15) for index, field_15 in enumerate(ParseDaemonLoadGenerator.build_routes(50))]
+        expected = BulkParse.parse_chunk(chunk, "f15", "ndjson")
+        for gc_mode in GcControl.MODES:
+            self.assertEqual(expected, BulkParse.parse_chunk(chunk, "f15", "ndjson", pooling=True, gc_mode=gc_mode))
+        with self.assertRaises(ValueError):
+            BulkParse(gc_mode="off")
+
+
+if __name__ == '__main__':
+    unittest.main()
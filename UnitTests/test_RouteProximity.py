@@ -0,0 +1,92 @@
+import random
+import unittest
+
+from RouteAnalysis.RouteProximity import RouteProximity
+from UnitTests.F15ParseHelper import F15ParseHelper
+from Utilities.Constants import Constants
+
+
+class RouteProximityTest(unittest.TestCase):
+
+    def test_crossing_routes_01(self):
+        # Two routes crossing at 50N010E, at the same level and 2000ft apart
+        proximity = RouteProximity(5.0, 300.0)
+        proximity.add_route("A", F15ParseHelper.parse_field_15("N0450F350 50N009E 50N011E"))
+        proximity.add_route("B", F15ParseHelper.parse_field_15("N0450F350 49N010E 51N010E"))
+        proximity.add_route("C", F15ParseHelper.parse_field_15("N0450F370 49N010E 51N010E"))
+        conflicts = proximity.get_conflicts()
+        self.assertEqual(1, len(conflicts))
+        self.assertEqual(("A", "B"), conflicts[0].get_route_ids())
+        self.assertEqual((0, 0), conflicts[0].get_segment_indices())
+        self.assertAlmostEqual(0.0, conflicts[0].get_lateral_distance_si(), places=3)
+        self.assertEqual(0.0, conflicts[0].get_vertical_distance_si())
+        self.assertAlmostEqual(50.0, conflicts[0].get_latitude(), places=6)
+        self.assertAlmostEqual(10.0, conflicts[0].get_longitude(), places=6)
+        self.assertEqual(3, proximity.get_statistics()["segments"])
+
+    def test_parallel_routes_01(self):
+        # Parallel routes 3NM and 6NM apart (3 and 6 minutes of latitude), A continues well north of B
+        proximity = RouteProximity(5.0, 300.0)
+        proximity.add_route_segments("A", [[50.0, 5.0, 50.0, 15.0, 10000.0]])
+        proximity.add_route_segments("B", [[50.05, 5.0, 50.05, 15.0, 10100.0]])
+        proximity.add_route_segments("C", [[49.9, 5.0, 49.9, 15.0, 10000.0]])
+        proximity.add_route_segments("A", [[52.0, 15.0, 52.0, 16.0, 10000.0],
+                                           [52.0, 16.0, 50.0, 16.0, 10000.0]])
+        conflicts = proximity.get_conflicts()
+        self.assertEqual([("A", "B")], [conflict.get_route_ids() for conflict in conflicts])
+        self.assertEqual((0, 0), conflicts[0].get_segment_indices())
+        self.assertAlmostEqual(100.0, conflicts[0].get_vertical_distance_si())
+        self.assertLess(conflicts[0].get_lateral_distance_si(), 5.0 * Constants.NM_TO_METERS)
+        # Segment indices continue when segments are added to a route id again
+        self.assertEqual([["A", 0], ["B", 0], ["C", 0], ["A", 1], ["A", 2]],
+                         [segment[0:2] for segment in proximity.segments])
+
+    def test_limits_01(self):
+        # Both limits are exclusive
+        proximity = RouteProximity(5.0, 300.0)
+        proximity.add_route_segments("A", [[50.0, 5.0, 50.0, 6.0, 10000.0]])
+        proximity.add_route_segments("B", [[50.0, 5.0, 50.0, 6.0, 10300.0]])
+        self.assertEqual([], proximity.get_conflicts())
+        self.assertRaises(ValueError, RouteProximity, 0.0, 300.0)
+        self.assertRaises(ValueError, RouteProximity, 5.0, 0.0)
+        self.assertRaises(ValueError, RouteProximity, 5.0, 300.0, -1.0)
+
+    def test_long_segments_01(self):
+        # Oceanic segments where the planar estimate of the closest points is 35.9NM apart, the refined
+        # geodesic distance is 34.7NM
+        proximity = RouteProximity(35.0, 300.0)
+        proximity.add_route_segments("A", [[38.7, -56.5, 66.2, -28.0, 11000.0]])
+        proximity.add_route_segments("B", [[61.8, -31.2, 35.9, -31.7, 11000.0]])
+        conflicts = proximity.get_conflicts()
+        self.assertEqual(1, proximity.get_statistics()["refinements"])
+        self.assertEqual(1, len(conflicts))
+        self.assertAlmostEqual(34.66, conflicts[0].get_lateral_distance_si() / Constants.NM_TO_METERS, places=2)
+
+    def test_matches_brute_force_01(self):
+        # The pre-screen must not lose any pair found when every segment pair is checked; a grid with a
+        # single cell makes every pair in the same or an adjacent altitude band a candidate
+        generator = random.Random(15)
+        proximity = RouteProximity(20.0, 300.0)
+        brute_force = RouteProximity(20.0, 300.0, 360.0)
+        for route in range(20):
+            latitude = generator.uniform(60.0, 62.0)
+            longitude = generator.uniform(-3.0, 3.0)
+            altitude = generator.choice([9000.0, 9150.0, 9450.0])
+            route_segments = []
+            for _ in range(2):
+                next_latitude = latitude + generator.uniform(-0.5, 0.5)
+                next_longitude = longitude + generator.uniform(-1.0, 1.0)
+                route_segments.append([latitude, longitude, next_latitude, next_longitude, altitude])
+                latitude, longitude = next_latitude, next_longitude
+            proximity.add_route_segments(route, route_segments)
+            brute_force.add_route_segments(route, route_segments)
+        found = [(c.get_route_ids(), c.get_segment_indices()) for c in proximity.get_conflicts()]
+        expected = [(c.get_route_ids(), c.get_segment_indices()) for c in brute_force.get_conflicts()]
+        self.assertGreater(len(expected), 0)
+        self.assertEqual(expected, found)
+        self.assertLess(proximity.get_statistics()["candidate_pairs"],
+                        brute_force.get_statistics()["candidate_pairs"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+
+from Benchmarks.ParseDaemonLoadGenerator import ParseDaemonLoadGenerator
+from F15_Parser.ExtractedRouteRecord import ExtractedRouteRecord
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from F15_Parser.F15TokenSyntaxDescriptions import TokenBaseType, TokenSubType
+from F15_Parser.RouteSummary import RouteSummary
+from UnitTests.F15ParseHelper import F15ParseHelper
+
+
+class RouteSummaryTest(unittest.TestCase):
+    ROUTES = ["N0450M0825 00N000E B9 00N001E VFR IFR 00N001W/N0350F100 01N001W 01S001W 02S001W180060",
+              "N0450F350 ABC UL9 DEF DCT 50N010W DCT GHI/N0460F370 JKL OAT GHI GAT",
+              "N0100VFR PQR DCT IFR STU/N0250F150 VWX2A",
+              "N0450F350 ABC B9 NOLAN1D",
+              "N0450F350 LFPG1A ABC IFPSTOP DEF IFPSTART GHI",
+              "F350 ABC DEF"]
+
+    @staticmethod
+    def scan(ers):
+        # The aggregates computed separately from the records of a parsed ERS
+        records = ers.get_all_elements()
+        rules = [record.get_flight_rules() for record in records if record.get_flight_rules() != ""]
+        altitudes = [record.get_altitude_si() for record in records if record.get_altitude() != ""]
+        speeds = [record.get_speed_si() for record in records if record.get_speed() != ""]
+        positions = [record for record in records if record.is_lat_long_valid()]
+        return {
+            "derived_flight_rules": ers.get_derived_flight_rules(),
+            "points": len([record for record in records if record.get_base_type() == TokenBaseType.F15_POINT]),
+            "connectors": len([record for record in records if record.get_base_type() in
+                               RouteSummary.CONNECTOR_TYPES]),
+            "rule_changes": len([index for index in range(1, len(rules)) if rules[index] != rules[index - 1]]),
+            "break_sections": len([record for record in records if
+                                   record.get_base_type() == TokenBaseType.F15_BREAK_START]),
+            "total_distance": sum(record.get_distance() for record in positions),
+            "min_altitude_si": min(altitudes) if altitudes else None,
+            "max_altitude_si": max(altitudes) if altitudes else None,
+            "max_speed_si": max(speeds) if speeds else None,
+            "bounding_box": (min(record.get_latitude() for record in positions),
+                             min(record.get_longitude() for record in positions),
+                             max(record.get_latitude() for record in positions),
+                             max(record.get_longitude() for record in positions)) if positions else None
+        }
+
+    def test_route_summary_01(self):
+        # The summary filled in by the parser matches a scan of the records
+        for route in ParseDaemonLoadGenerator.build_routes(200, seed=50) + self.ROUTES:
+            ers = F15ParseHelper.parse_field_15(route)
+            summary = ers.route_summary
+            self.assertIsNotNone(summary, route)
+            self.assertIs(summary, ers.get_route_summary())
+            self.assertEqual(ers.get_derived_flight_rules(), summary.get_derived_flight_rules())
+            self.assertEqual(ers.get_number_of_elements(), summary.records)
+            statistics = summary.get_statistics()
+            expected = self.scan(ers)
+            self.assertAlmostEqual(expected.pop("total_distance"), statistics.pop("total_distance"), places=6)
+            self.assertEqual(expected, statistics, route)
+
+    def test_route_summary_02(self):
+        # The counts of a route with rule changes and break sections
+        ers = F15ParseHelper.parse_field_15(self.ROUTES[0])
+        summary = ers.get_route_summary()
+        self.assertEqual("Y", summary.get_derived_flight_rules())
+        self.assertEqual(8, summary.get_number_of_points())
+        self.assertEqual(1, summary.get_number_of_connectors())
+        self.assertEqual(2, summary.get_number_of_rule_changes())
+        self.assertEqual(1, summary.get_number_of_break_sections())
+        self.assertEqual(ers.get_first_element().get_speed_si(), summary.get_max_speed_si())
+        # The southernmost point lies 60 NM south of 02S001W
+        self.assertEqual((-1.0, 1.0, 1.0), summary.get_bounding_box()[1:])
+        self.assertAlmostEqual(-3.0, summary.get_bounding_box()[0], places=2)
+        self.assertGreater(summary.get_total_distance(), 0.0)
+        self.assertLess(summary.get_min_altitude_si(), summary.get_max_altitude_si())
+        # Field 15 without tokens is not summarised by the parser, the summary is accumulated when read
+        ers = F15ParseHelper.parse_field_15("")
+        self.assertIsNone(ers.route_summary)
+        summary = ers.get_route_summary()
+        self.assertEqual(2, summary.get_number_of_points())
+        self.assertIsNone(summary.get_bounding_box())
+        self.assertIsNone(summary.get_max_speed_si())
+
+    def test_route_summary_03(self):
+        # A summary is accumulated on first use for an ERS built by hand and discarded by appending
+        ers = ExtractedRouteSequence()
+        for latitude, longitude in [(10.0, 170.0), (12.0, -175.0), (11.0, 179.0)]:
+            record = ExtractedRouteRecord("", 0, 0, TokenBaseType.F15_POINT, TokenSubType.F15_SB_LL_DEG)
+            record.set_latitude(latitude)
+            record.set_longitude(longitude)
+            record.set_lat_long_valid(True)
+            ers.append_element(record)
+        summary = ers.get_route_summary()
+        self.assertIs(summary, ers.get_route_summary())
+        self.assertEqual(4, summary.get_number_of_points())
+        self.assertEqual((10.0, 170.0, 12.0, -175.0), summary.get_bounding_box())
+        ers.add_dummy_ades()
+        self.assertIsNone(ers.route_summary)
+        self.assertEqual(5, ers.get_route_summary().get_number_of_points())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import io
+import unittest
+
+from Tokenizer.StreamTokenize import StreamTokenize
+from Tokenizer.Tokenize import Tokenize
+
+
+class StreamTokenizeTest(unittest.TestCase):
+    TEXT = "N0450M0825 00N000E B9 00N001E VFR IFR 00N001W/N0350F100 01N001W\n" \
+           "N0450F350 LONGPOINTNAME/N0400F300  DCT\r\n  ABC/"
+
+    def test_stream_tokenize_01(self):
+        # Every chunk size gives the tokens and indexes of the string tokenizer
+        tokenizer = Tokenize()
+        tokenizer.set_whitespace(" \n\t\r/")
+        tokenizer.set_string_to_tokenize(self.TEXT)
+        tokenizer.tokenize()
+        expected = self.__summary(tokenizer.get_tokens().get_tokens())
+        for chunk_size in [1, 2, 3, 7, 64, 1000]:
+            stream_tokenizer = StreamTokenize(chunk_size)
+            self.assertEqual(expected, self.__summary(stream_tokenizer.tokenize_stream(io.StringIO(self.TEXT))))
+            self.assertEqual(expected, self.__summary(
+                stream_tokenizer.tokenize_stream(io.BytesIO(self.TEXT.encode("ascii")))))
+
+    def test_stream_tokenize_02(self):
+        tokenizer = StreamTokenize()
+        tokenizer.set_whitespace(" ")
+        self.assertEqual([("AB", 0, 2), ("CD", 3, 5), ("EFG", 6, 9)],
+                         self.__summary(tokenizer.tokenize_chunks(["A", "B C", "D", " ", "EF", "", "G"])))
+        self.assertEqual([], list(tokenizer.tokenize_chunks([])))
+
+    @staticmethod
+    def __summary(tokens):
+        return [(token.get_token_string(), token.get_token_start_index(), token.get_token_end_index())
+                for token in tokens]
+
+
+if __name__ == '__main__':
+    unittest.main()
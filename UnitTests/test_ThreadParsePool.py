@@ -0,0 +1,77 @@
+import sys
+import threading
+import unittest
+
+from Benchmarks.ParseDaemonLoadGenerator import ParseDaemonLoadGenerator
+from Service.ThreadParsePool import ThreadParsePool
+from UnitTests.F15ParseHelper import F15ParseHelper
+
+
+class ThreadParsePoolTest(unittest.TestCase):
+    ROUTES = ["N0450M0825 00N000E B9 00N001E VFR IFR 00N001W/N0350F100 01N001W 01S001W 02S001W180060",
+              "N0450F350 ABC UL9 DEF DCT 50N010W DCT GHI/N0460F370 JKL",
+              "N0100VFR PQR DCT IFR STU/N0250F150 VWX2A",
+              "N0450F350 ABC B9 NOLAN1D",
+              "F350 ABC DEF"]
+
+    def test_thread_parse_pool_01(self):
+        # Stress test: routes parsed by many threads switching as often as possible, and by several callers
+        # sharing the pool at once, give exactly the results of parsing them one by one
+        routes = ParseDaemonLoadGenerator.build_routes(300, seed=49) + self.ROUTES * 20
+        expected = [F15ParseHelper.parse_field_15(route).as_xml() for route in routes]
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadParsePool(8, 3) as pool:
+                for _ in range(3):
+                    self.assertEqual(expected, [ers.as_xml() for ers in pool.parse_texts(routes)])
+                caller_results = {}
+
+                def parse(caller):
+                    caller_results[caller] = [ers.as_xml() for ers in pool.parse_texts(routes[caller::4])]
+
+                callers = [threading.Thread(target=parse, args=(caller,)) for caller in range(4)]
+                for caller in callers:
+                    caller.start()
+                for caller in callers:
+                    caller.join()
+                for caller in range(4):
+                    self.assertEqual(expected[caller::4], caller_results[caller])
+                statistics = pool.get_statistics()
+        finally:
+            sys.setswitchinterval(switch_interval)
+        self.assertEqual(8, statistics["workers"])
+        self.assertEqual(len(routes) * 4, statistics["messages"])
+        self.assertLessEqual(statistics["threads_used"], 8)
+
+    def test_thread_parse_pool_02(self):
+        # Each thread has its own tokenizer, a single worker parses in the calling thread
+        pool = ThreadParsePool(1)
+        self.assertIsNone(pool.executor)
+        tokenizers = []
+        thread = threading.Thread(target=lambda: tokenizers.append(pool._ThreadParsePool__get_tokenizer()))
+        thread.start()
+        thread.join()
+        self.assertIs(pool._ThreadParsePool__get_tokenizer(), pool._ThreadParsePool__get_tokenizer())
+        self.assertIsNot(tokenizers[0], pool._ThreadParsePool__get_tokenizer())
+        self.assertEqual([F15ParseHelper.parse_field_15(route).as_xml() for route in self.ROUTES],
+                         [ers.as_xml() for ers in pool.parse_texts(self.ROUTES)])
+        self.assertEqual([], pool.parse_texts([]))
+        self.assertEqual(1, pool.get_statistics()["threads_used"])
+        self.assertRaises(ValueError, ThreadParsePool, 0)
+        self.assertRaises(ValueError, ThreadParsePool, 2, 0)
+
+    def test_thread_parse_pool_03(self):
+        # The default number of threads follows the GIL state
+        self.assertEqual(ThreadParsePool.is_gil_enabled(), ThreadParsePool(1).get_statistics()["gil_enabled"])
+        if ThreadParsePool.is_gil_enabled():
+            self.assertEqual(1, ThreadParsePool.get_default_workers())
+        else:
+            self.assertTrue(ThreadParsePool.is_free_threaded_build())
+            self.assertGreaterEqual(ThreadParsePool.get_default_workers(), 1)
+        if not ThreadParsePool.is_free_threaded_build():
+            self.assertTrue(ThreadParsePool.is_gil_enabled())
+
+
+if __name__ == '__main__':
+    unittest.main()
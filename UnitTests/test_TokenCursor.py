@@ -0,0 +1,68 @@
+import threading
+import unittest
+
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from F15_Parser.F15Parse import ParseF15
+from Tokenizer.TokenCursor import TokenCursor
+from Tokenizer.Tokenize import Tokenize
+
+
+class TokenCursorTest(unittest.TestCase):
+    ROUTES = ["N0450M0825 00N000E B9 00N001E VFR IFR 00N001W/N0350F100 01N001W 01S001W 02S001W180060",
+              "N0450F350 ABC UL9 DEF DCT 50N010W DCT GHI/N0460F370 JKL",
+              "N0100VFR PQR DCT IFR STU/N0250F150 VWX2A",
+              "N0450F350 ABC B9 NOLAN1D"]
+
+    def test_cursor_01(self):
+        tokens = self.__tokenize("A B C")
+        first = TokenCursor(tokens)
+        second = TokenCursor(first)
+        self.assertEqual("A", first.get_first_token().get_token_string())
+        self.assertEqual("B", first.get_next_token().get_token_string())
+        self.assertEqual("C", first.peek_next_token().get_token_string())
+        self.assertEqual("A", first.peek_previous_token().get_token_string())
+        self.assertEqual("A", second.get_current_token().get_token_string())
+        self.assertIsNone(second.get_previous_token())
+        self.assertIsNone(first.peek_next_token(2))
+        self.assertEqual(3, second.get_number_of_tokens())
+        self.assertEqual(0, tokens.current_token)
+
+    def test_parse_shared_tokens_01(self):
+        # Many threads parse the same token lists concurrently and always produce the sequential result
+        shared_tokens = [self.__tokenize(route) for route in self.ROUTES]
+        expected = [self.__parse(tokens) for tokens in shared_tokens]
+        failures = []
+
+        def worker(offset):
+            parser = ParseF15()
+            for iteration in range(40):
+                idx = (offset + iteration) % len(shared_tokens)
+                if self.__parse(shared_tokens[idx], parser) != expected[idx]:
+                    failures.append((offset, iteration))
+
+        threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([], failures)
+        self.assertEqual(0, shared_tokens[0].current_token)
+        self.assertEqual(expected[0], self.__parse(shared_tokens[0]))
+
+    @staticmethod
+    def __tokenize(field_15):
+        tokenizer = Tokenize()
+        tokenizer.set_whitespace(" \n\t\r/")
+        tokenizer.set_string_to_tokenize(field_15)
+        tokenizer.tokenize()
+        return tokenizer.get_tokens()
+
+    @staticmethod
+    def __parse(tokens, parser=None):
+        ers = ExtractedRouteSequence()
+        (parser or ParseF15()).parse_f15(ers, tokens)
+        return ers.as_xml()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from F15_Parser.F15Parse import ParseF15
+from F15_Parser.F15TokenSyntaxDescriptions import F15TokenSyntaxDefinition, TokenBaseType
+from Tokenizer.TokenInternPool import TokenInternPool
+from Tokenizer.Tokenize import Tokenize
+
+
+class TokenInternPoolTest(unittest.TestCase):
+
+    def test_intern_01(self):
+        pool = TokenInternPool(3)
+        first = pool.intern("".join(["D", "C", "T"]))
+        self.assertIs(first, pool.intern("".join(["D", "C", "T"])))
+        token_type = pool.get_token_type("DCT")
+        self.assertEqual(TokenBaseType.F15_DCT, token_type[F15TokenSyntaxDefinition.TOKEN_BASE_IDENTIFIER_IDX])
+        self.assertIs(pool.get_token_type("DCT"), F15TokenSyntaxDefinition().get_token_type("DCT"))
+        statistics = pool.get_statistics()
+        self.assertEqual(1, statistics["size"])
+        self.assertEqual(0.5, statistics["intern_hit_rate"])
+        self.assertEqual(0.5, statistics["type_hit_rate"])
+        # Long strings are never pooled, a full pool is cleared
+        long_string = "".join(["A"] * 30)
+        self.assertIs(long_string, pool.intern(long_string))
+        self.assertIsNot(long_string, pool.intern("".join(["A"] * 30)))
+        self.assertEqual(1, pool.get_size())
+        for token_string in ["ABC", "DEF", "GHI"]:
+            pool.intern(token_string)
+        self.assertEqual(1, pool.get_size())
+        self.assertEqual(1, pool.get_statistics()["clears"])
+        self.assertRaises(ValueError, TokenInternPool, 0)
+
+    def test_parse_interned_01(self):
+        # Tokens and records of separate messages share strings and classifications
+        pool = TokenInternPool()
+        tokenizer = Tokenize()
+        tokenizer.set_whitespace(" \n\t\r/")
+        tokenizer.set_intern_pool(pool)
+        records = []
+        for field_15 in ["N0450F350 ABC DCT DEF", "N0450F350 ABC DCT GHI"]:
+            tokenizer.set_string_to_tokenize(field_15)
+            tokenizer.tokenize()
+            ers = ExtractedRouteSequence()
+            ParseF15(pool).parse_f15(ers, tokenizer.get_tokens())
+            records.append(ers.get_all_elements())
+        self.assertIs(records[0][1].get_name(), records[1][1].get_name())
+        self.assertIs(records[0][2].get_name(), records[1][2].get_name())
+        statistics = pool.get_statistics()
+        self.assertEqual(5, statistics["size"])
+        self.assertEqual(8, statistics["type_lookups"])
+        self.assertEqual(3, statistics["type_hits"])
+
+
+if __name__ == '__main__':
+    unittest.main()
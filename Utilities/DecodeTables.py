@@ -0,0 +1,103 @@
+from Utilities.Constants import Constants
+from Utilities.Utils import Utils
+
+
+class DecodeTables:
+    """This class decodes field 15 speed and level strings to SI units with table lookups. The domain of
+    these strings is small and fixed (N/K speeds 0000-9999, M speeds 000-999, F/A levels 000-999 and S/M
+    levels 0000-9999) so each string is converted once, the first time it is seen, and looked up from then
+    on. Mach speeds depend on the altitude as well and are stored per (speed, altitude) pair.
+
+    Every table entry is computed by exactly the same arithmetic and rounding as the parser used before
+    the tables were introduced, so decoded values are identical."""
+
+    MAX_ENTRIES: int = 65536
+    """The maximum number of entries in each table, the fixed domain of level and knots/km/h speed strings
+    is smaller than this; once a table is full further values are converted without being stored"""
+
+    level_table: {} = {}
+    """A level string, e.g. 'F350', mapped to its altitude in meters"""
+
+    speed_table: {} = {}
+    """A knots or km/h speed string, e.g. 'N0450', mapped to its speed in meters / second"""
+
+    mach_table: {} = {}
+    """A (Mach speed string, altitude in meters) pair mapped to its speed in meters / second"""
+
+    @staticmethod
+    def get_level_si(level_string):
+        # type: (str) -> int
+        """Gets the altitude in meters for a level string, rounded to the nearest meter.
+
+            :param level_string: A level as given in field 15, e.g. F350, A045, S1130 or M0840;
+            :return: The altitude in meters;"""
+        level_si = DecodeTables.level_table.get(level_string)
+        if level_si is None:
+            level_si = DecodeTables.__compute_level_si(level_string)
+            if len(DecodeTables.level_table) < DecodeTables.MAX_ENTRIES:
+                DecodeTables.level_table[level_string] = level_si
+        return level_si
+
+    @staticmethod
+    def get_speed_si(speed_string, altitude_si):
+        # type: (str, float) -> int
+        """Gets the speed in meters / second for a speed string, rounded to the nearest meter / second.
+
+            :param speed_string: A speed as given in field 15, e.g. N0450, K0830 or M082;
+            :param altitude_si: The altitude in meters, only used for Mach speeds;
+            :return: The speed in meters / second;"""
+        speed_si = DecodeTables.speed_table.get(speed_string)
+        if speed_si is not None:
+            return speed_si
+        if speed_string[0:1] != "M":
+            speed_si = DecodeTables.__compute_speed_si(speed_string, altitude_si)
+            if len(DecodeTables.speed_table) < DecodeTables.MAX_ENTRIES:
+                DecodeTables.speed_table[speed_string] = speed_si
+            return speed_si
+        key = (speed_string, altitude_si)
+        speed_si = DecodeTables.mach_table.get(key)
+        if speed_si is None:
+            speed_si = DecodeTables.__compute_speed_si(speed_string, altitude_si)
+            if len(DecodeTables.mach_table) < DecodeTables.MAX_ENTRIES:
+                DecodeTables.mach_table[key] = speed_si
+        return speed_si
+
+    @staticmethod
+    def __compute_level_si(level_string):
+        # type: (str) -> int
+        """Converts a level string to meters; types other than 'A', 'F', 'S' and 'M' convert to their numeric
+        value unchanged.
+
+            :param level_string: A level as given in field 15, e.g. F350;
+            :return: The altitude in meters rounded to the nearest meter;"""
+        altitude = int(level_string[1:])
+        match level_string[0:1]:
+            # Types 'F' and 'S' are pressure flight levels in imperial ('F') or SI ('S') units
+            # Types 'A' and 'M' are altitudes in imperial ('A') or SI ('M') units
+            case "A" | "F":
+                # Hundreds of feet, e.g. F350 = 35,000 feet (10,668 Meters)
+                altitude = (altitude * 100) * Constants.FEET_TO_METERS
+            case "S" | "M":
+                # Tens of meters, e.g. S1130 = 11,300 meters
+                altitude = altitude * 10
+        return int(altitude + 0.5)
+
+    @staticmethod
+    def __compute_speed_si(speed_string, altitude_si):
+        # type: (str, float) -> int
+        """Converts a speed string to meters / second.
+
+            :param speed_string: A speed as given in field 15, e.g. N0450;
+            :param altitude_si: The altitude in meters used for Mach speeds;
+            :return: The speed in meters / second rounded to the nearest meter / second;"""
+        speed = int(speed_string[1:])
+        match speed_string[0:1]:
+            case "K":
+                # Kilometers / hour
+                speed = speed * Constants.KMH_TO_METERS_SECOND
+            case "N":
+                # Knots
+                speed = speed * Constants.KNOTS_TO_METERS_SECOND
+            case "M":
+                speed = Utils.mach_to_ms_speed(speed, altitude_si)
+        return int(speed + 0.5)
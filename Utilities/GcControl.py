@@ -0,0 +1,83 @@
+import gc
+
+
+class GcControl:
+    """This class suspends the cyclic garbage collector around a batch run, used as a context manager:
+
+        with GcControl(GcControl.FREEZE):
+            ...
+
+    Parsing creates no reference cycles, messages are freed by reference counting as soon as they are
+    released, but while the number of live objects grows, e.g. while the results of a chunk are held until
+    they are encoded, collections are triggered that traverse the young objects and, every so often, every
+    object of the process including long lived tables, caches and pools. The modes are:
+        - NONE: The collector runs as usual;
+        - DISABLE: The collector is disabled for the run and enabled again afterwards if it was enabled
+          before; cyclic garbage created meanwhile is collected by the next collection;
+        - FREEZE: All objects existing at the start of the run are moved to the permanent generation so that
+          collections during the run only traverse objects created by the run. They are unfrozen afterwards
+          unless objects were already frozen when the run started, e.g. by an application freezing its
+          state after start up, gc.unfreeze() would unfreeze those as well.
+
+    Runs may be nested."""
+
+    NONE: str = "none"
+    """The collector runs as usual"""
+
+    DISABLE: str = "disable"
+    """The collector is disabled during the run"""
+
+    FREEZE: str = "freeze"
+    """The objects existing at the start of the run are not collected during the run"""
+
+    MODES = [NONE, DISABLE, FREEZE]
+    """The supported modes"""
+
+    mode: str = NONE
+    """One of MODES"""
+
+    was_enabled: bool = True
+    """True if the collector was enabled when the run started"""
+
+    was_frozen: bool = False
+    """True if objects were frozen when the run started"""
+
+    def __init__(self, mode=NONE):
+        # type: (str) -> None
+        """Constructor.
+
+            :param mode: One of MODES;
+            :return: None"""
+        if mode not in GcControl.MODES:
+            raise ValueError("Unsupported garbage collection mode: " + str(mode))
+        self.mode = mode
+        self.was_enabled = True
+        self.was_frozen = False
+
+    def __enter__(self):
+        # type: () -> GcControl
+        """Starts the run.
+
+            :return: This instance;"""
+        self.was_enabled = gc.isenabled()
+        self.was_frozen = gc.get_freeze_count() > 0
+        if self.mode == GcControl.DISABLE:
+            gc.disable()
+        elif self.mode == GcControl.FREEZE:
+            gc.freeze()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # type: (type, BaseException, object) -> bool
+        """Ends the run, restoring the collector.
+
+            :param exc_type: The type of the exception raised by the run, None if there was none;
+            :param exc_value: The exception raised by the run, None if there was none;
+            :param traceback: The traceback of the exception, None if there was none;
+            :return: False, exceptions are not suppressed;"""
+        if self.mode == GcControl.DISABLE:
+            if self.was_enabled:
+                gc.enable()
+        elif self.mode == GcControl.FREEZE and not self.was_frozen:
+            gc.unfreeze()
+        return False
@@ -0,0 +1,155 @@
+import collections
+import marshal
+import os
+import threading
+
+
+class GeodesicCache:
+    """This class is a bounded cache of geodesic results keyed on the exact arguments of the calculation, e.g.
+    the coordinates of a point pair for an inverse calculation or a point, bearing and distance for a direct
+    projection. The same lat/long points, such as oceanic entry and exit points and the points of standard
+    tracks, appear in many flight plans and each repeated calculation is replaced by a dictionary lookup.
+
+    When the cache is full the least recently used result is evicted. The cache may be saved to a file and
+    loaded by a later run, the file is a marshal dump of the cached results, most recently used last, and a
+    file that cannot be read is ignored. The cache is safe to share between threads, lookups and updates are
+    made under a lock."""
+
+    MAX_SIZE: int = 65536
+    """The default maximum number of results held in the cache"""
+
+    FILE_VERSION: int = 1
+    """The version of the file format written by save()"""
+
+    max_size: int = MAX_SIZE
+    """The maximum number of results held in the cache, 0 to cache nothing"""
+
+    results: collections.OrderedDict = None
+    """The arguments of a calculation mapped to its result, least recently used first"""
+
+    lock: threading.Lock = None
+    """The lock protecting the results and the statistics"""
+
+    lookups: int = 0
+    """The number of results requested"""
+
+    hits: int = 0
+    """The number of results found in the cache"""
+
+    evictions: int = 0
+    """The number of results evicted because the cache was full"""
+
+    def __init__(self, max_size=MAX_SIZE):
+        # type: (int) -> None
+        """Constructor creating an empty cache.
+
+            :param max_size: The maximum number of results held in the cache, 0 to cache nothing;
+            :return: None"""
+        if max_size < 0:
+            raise ValueError("The cache size cannot be negative")
+        self.max_size = max_size
+        self.results = collections.OrderedDict()
+        self.lock = threading.Lock()
+        self.lookups = 0
+        self.hits = 0
+        self.evictions = 0
+
+    def get(self, key):
+        # type: (()) -> () | None
+        """Gets a cached result, making it the most recently used.
+
+            :param key: The arguments of the calculation;
+            :return: The cached result or None if the result is not cached;"""
+        with self.lock:
+            self.lookups = self.lookups + 1
+            result = self.results.get(key)
+            if result is not None:
+                self.hits = self.hits + 1
+                self.results.move_to_end(key)
+            return result
+
+    def put(self, key, result):
+        # type: ((), ()) -> None
+        """Adds a result to the cache as the most recently used, evicting the least recently used result if
+        the cache is full.
+
+            :param key: The arguments of the calculation;
+            :param result: The result of the calculation, not None;
+            :return: None"""
+        with self.lock:
+            if self.max_size == 0:
+                return
+            self.results[key] = result
+            self.results.move_to_end(key)
+            while len(self.results) > self.max_size:
+                self.results.popitem(last=False)
+                self.evictions = self.evictions + 1
+
+    def get_size(self):
+        # type: () -> int
+        """Gets the number of results held in the cache.
+
+            :return: The cache size;"""
+        return len(self.results)
+
+    def get_statistics(self):
+        # type: () -> {}
+        """Gets the cache statistics.
+
+            :return: A dictionary with the cache size and maximum size, the number of lookups, hits, the hit
+                     rate (0.0 to 1.0) and the number of evictions;"""
+        with self.lock:
+            return {
+                "size": len(self.results),
+                "max_size": self.max_size,
+                "lookups": self.lookups,
+                "hits": self.hits,
+                "hit_rate": self.hits / self.lookups if self.lookups > 0 else 0.0,
+                "evictions": self.evictions
+            }
+
+    def clear(self):
+        # type: () -> None
+        """Removes all results from the cache and resets the statistics.
+
+            :return: None"""
+        with self.lock:
+            self.results = collections.OrderedDict()
+            self.lookups = 0
+            self.hits = 0
+            self.evictions = 0
+
+    def save(self, file_name):
+        # type: (str) -> None
+        """Writes the cached results to a file, the file is replaced in a single step.
+
+            :param file_name: The name of the file to write;
+            :return: None"""
+        with self.lock:
+            data = marshal.dumps((GeodesicCache.FILE_VERSION, list(self.results.items())))
+        temporary_file = "{0}.{1}.tmp".format(file_name, os.getpid())
+        try:
+            with open(temporary_file, "wb") as file:
+                file.write(data)
+            os.replace(temporary_file, file_name)
+        finally:
+            if os.path.exists(temporary_file):
+                os.remove(temporary_file)
+
+    def load(self, file_name):
+        # type: (str) -> int
+        """Adds the results saved in a file to the cache as the most recently used results. A missing file
+        or a file that cannot be read is ignored.
+
+            :param file_name: The name of the file to read;
+            :return: The number of results read from the file;"""
+        try:
+            with open(file_name, "rb") as file:
+                version, items = marshal.loads(file.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return 0
+        if version != GeodesicCache.FILE_VERSION:
+            return 0
+        for key, result in items:
+            self.put(key, result)
+        return len(items)
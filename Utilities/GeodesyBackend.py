@@ -0,0 +1,362 @@
+import math
+
+
+class GeodesyBackend:
+    """This class is the interface of the geodesic calculations used by Utils, the inverse calculation of the
+    azimuth and distance between two points and the direct calculation of the point at a bearing and distance
+    from a point. Coordinates and azimuths are in degrees, distances in metres on the WGS84 ellipsoid.
+    Azimuths are returned in the range -180 to 180 and longitudes in the range -180 to 180.
+
+    Each backend documents the largest errors of its results compared to the Karney solution, measured by
+    Benchmarks/GeodesyBackendBenchmark.py over random points covering the globe; an approximate backend suits
+    pre-screening and display but not the final figures of a route."""
+
+    NAME: str = None
+    """The name of the backend"""
+
+    DISTANCE_ERROR: float = 0.0
+    """The largest error of an inverse distance relative to the distance, e.g. 0.001 is 0.1%"""
+
+    AZIMUTH_ERROR: float = 0.0
+    """The largest error of an inverse azimuth in degrees, for points less than AZIMUTH_ERROR_RANGE apart"""
+
+    AZIMUTH_ERROR_RANGE: float = 20000000.0
+    """The distance in metres up to which AZIMUTH_ERROR holds, the azimuth between nearly antipodal points is
+    not well defined for the approximations"""
+
+    POSITION_ERROR: float = 0.0
+    """The largest distance between a direct point and the Karney direct point relative to the projected
+    distance"""
+
+    def inverse(self, latitude_1, longitude_1, latitude_2, longitude_2):
+        # type: (float, float, float, float) -> (float, float)
+        """Calculates the azimuth and distance between two points.
+
+            :param latitude_1: The latitude of the first point;
+            :param longitude_1: The longitude of the first point;
+            :param latitude_2: The latitude of the second point;
+            :param longitude_2: The longitude of the second point;
+            :return: The azimuth at the first point and the distance;"""
+        raise NotImplementedError
+
+    def direct(self, latitude, longitude, bearing, distance):
+        # type: (float, float, float, float) -> (float, float)
+        """Calculates the point at a bearing and distance from a point.
+
+            :param latitude: The latitude of the point;
+            :param longitude: The longitude of the point;
+            :param bearing: The azimuth at the point;
+            :param distance: The distance to the projected point;
+            :return: The latitude and longitude of the projected point;"""
+        raise NotImplementedError
+
+    def get_name(self):
+        # type: () -> str
+        """Gets the name of the backend.
+
+            :return: The backend name;"""
+        return self.NAME
+
+    @staticmethod
+    def get_backends():
+        # type: () -> [GeodesyBackend]
+        """Gets an instance of each backend, the most accurate first.
+
+            :return: The list of backends;"""
+        return [KarneyBackend(), VincentyBackend(), SphericalBackend()]
+
+    @staticmethod
+    def get_backend(name):
+        # type: (str) -> GeodesyBackend
+        """Gets a backend by name.
+
+            :param name: The backend name, one of 'karney', 'vincenty' or 'spherical';
+            :return: A new instance of the backend;"""
+        for backend in GeodesyBackend.get_backends():
+            if backend.get_name() == name:
+                return backend
+        raise ValueError("Unknown geodesy backend: " + name)
+
+    @staticmethod
+    def normalise_degrees(degrees):
+        # type: (float) -> float
+        """Reduces an angle to the range -180 to 180.
+
+            :param degrees: The angle in degrees;
+            :return: The reduced angle;"""
+        degrees = math.remainder(degrees, 360.0)
+        return 180.0 if degrees == -180.0 else degrees
+
+
+class KarneyBackend(GeodesyBackend):
+    """This class calculates with the geographiclib implementation of the Karney algorithms, accurate to about
+    15 nanometres for any pair of points. This is the default backend, it is the slowest in pure Python."""
+
+    NAME: str = "karney"
+    """The name of the backend"""
+
+    geode = None
+    """The WGS84 Geodesic instance, geographiclib is imported on first use"""
+
+    def inverse(self, latitude_1, longitude_1, latitude_2, longitude_2):
+        # type: (float, float, float, float) -> (float, float)
+        """Calculates the azimuth and distance between two points, see GeodesyBackend.inverse().
+
+            :param latitude_1: The latitude of the first point;
+            :param longitude_1: The longitude of the first point;
+            :param latitude_2: The latitude of the second point;
+            :param longitude_2: The longitude of the second point;
+            :return: The azimuth at the first point and the distance;"""
+        result = KarneyBackend.get_geode().Inverse(latitude_1, longitude_1, latitude_2, longitude_2)
+        return result['azi1'], result['s12']
+
+    def direct(self, latitude, longitude, bearing, distance):
+        # type: (float, float, float, float) -> (float, float)
+        """Calculates the point at a bearing and distance from a point, see GeodesyBackend.direct().
+
+            :param latitude: The latitude of the point;
+            :param longitude: The longitude of the point;
+            :param bearing: The azimuth at the point;
+            :param distance: The distance to the projected point;
+            :return: The latitude and longitude of the projected point;"""
+        result = KarneyBackend.get_geode().Direct(latitude, longitude, bearing, distance)
+        return result['lat2'], result['lon2']
+
+    @staticmethod
+    def get_geode():
+        # type: () -> Geodesic
+        """Gets the geographiclib WGS84 Geodesic instance, importing geographiclib the first time.
+
+            :return: The Geodesic instance;"""
+        if KarneyBackend.geode is None:
+            from geographiclib.geodesic import Geodesic
+            KarneyBackend.geode = Geodesic.WGS84
+        return KarneyBackend.geode
+
+
+class VincentyBackend(GeodesyBackend):
+    """This class calculates with the Vincenty iterative formulae on the WGS84 ellipsoid, accurate to well
+    under a millimetre. The inverse iteration does not converge for nearly antipodal points, these fall back
+    to the Karney backend."""
+
+    NAME: str = "vincenty"
+    """The name of the backend"""
+
+    DISTANCE_ERROR: float = 1e-9
+    """The largest error of an inverse distance relative to the distance"""
+
+    AZIMUTH_ERROR: float = 1e-6
+    """The largest error of an inverse azimuth in degrees"""
+
+    POSITION_ERROR: float = 1e-9
+    """The largest distance between a direct point and the Karney direct point relative to the projected
+    distance"""
+
+    A: float = 6378137.0
+    """The WGS84 semi-major axis in metres"""
+
+    F: float = 1.0 / 298.257223563
+    """The WGS84 flattening"""
+
+    B: float = A * (1.0 - F)
+    """The WGS84 semi-minor axis in metres"""
+
+    TOLERANCE: float = 1e-12
+    """The change in radians at which an iteration has converged"""
+
+    MAX_ITERATIONS: int = 200
+    """The number of iterations after which the inverse calculation falls back to the Karney backend"""
+
+    fallback: KarneyBackend = None
+    """The backend of nearly antipodal points"""
+
+    def __init__(self):
+        # type: () -> None
+        """Constructor.
+
+            :return: None"""
+        self.fallback = KarneyBackend()
+
+    def inverse(self, latitude_1, longitude_1, latitude_2, longitude_2):
+        # type: (float, float, float, float) -> (float, float)
+        """Calculates the azimuth and distance between two points, see GeodesyBackend.inverse().
+
+            :param latitude_1: The latitude of the first point;
+            :param longitude_1: The longitude of the first point;
+            :param latitude_2: The latitude of the second point;
+            :param longitude_2: The longitude of the second point;
+            :return: The azimuth at the first point and the distance;"""
+        f = VincentyBackend.F
+        difference = math.radians(GeodesyBackend.normalise_degrees(longitude_2 - longitude_1))
+        reduced_1 = math.atan((1.0 - f) * math.tan(math.radians(latitude_1)))
+        reduced_2 = math.atan((1.0 - f) * math.tan(math.radians(latitude_2)))
+        sin_u1 = math.sin(reduced_1)
+        cos_u1 = math.cos(reduced_1)
+        sin_u2 = math.sin(reduced_2)
+        cos_u2 = math.cos(reduced_2)
+        lambda_ = difference
+        for _ in range(VincentyBackend.MAX_ITERATIONS):
+            sin_lambda = math.sin(lambda_)
+            cos_lambda = math.cos(lambda_)
+            sin_sigma = math.hypot(cos_u2 * sin_lambda, cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lambda)
+            if sin_sigma == 0.0:
+                # Coincident points
+                return 0.0, 0.0
+            cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lambda
+            sigma = math.atan2(sin_sigma, cos_sigma)
+            sin_alpha = cos_u1 * cos_u2 * sin_lambda / sin_sigma
+            cos_sq_alpha = 1.0 - sin_alpha * sin_alpha
+            # Zero on the equator
+            cos_2_sigma_m = cos_sigma - 2.0 * sin_u1 * sin_u2 / cos_sq_alpha if cos_sq_alpha != 0.0 else 0.0
+            c = f / 16.0 * cos_sq_alpha * (4.0 + f * (4.0 - 3.0 * cos_sq_alpha))
+            previous = lambda_
+            lambda_ = difference + (1.0 - c) * f * sin_alpha * (
+                sigma + c * sin_sigma * (cos_2_sigma_m + c * cos_sigma * (-1.0 + 2.0 * cos_2_sigma_m * cos_2_sigma_m)))
+            if abs(lambda_ - previous) <= VincentyBackend.TOLERANCE:
+                break
+        else:
+            return self.fallback.inverse(latitude_1, longitude_1, latitude_2, longitude_2)
+        if abs(lambda_) > math.pi:
+            return self.fallback.inverse(latitude_1, longitude_1, latitude_2, longitude_2)
+        a, b = VincentyBackend.__get_series(cos_sq_alpha)
+        delta_sigma = VincentyBackend.__get_delta_sigma(b, sin_sigma, cos_sigma, cos_2_sigma_m)
+        azimuth = math.degrees(math.atan2(cos_u2 * sin_lambda, cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lambda))
+        return azimuth, VincentyBackend.B * a * (sigma - delta_sigma)
+
+    def direct(self, latitude, longitude, bearing, distance):
+        # type: (float, float, float, float) -> (float, float)
+        """Calculates the point at a bearing and distance from a point, see GeodesyBackend.direct().
+
+            :param latitude: The latitude of the point;
+            :param longitude: The longitude of the point;
+            :param bearing: The azimuth at the point;
+            :param distance: The distance to the projected point;
+            :return: The latitude and longitude of the projected point;"""
+        f = VincentyBackend.F
+        alpha_1 = math.radians(bearing)
+        sin_alpha_1 = math.sin(alpha_1)
+        cos_alpha_1 = math.cos(alpha_1)
+        reduced_1 = math.atan((1.0 - f) * math.tan(math.radians(latitude)))
+        sin_u1 = math.sin(reduced_1)
+        cos_u1 = math.cos(reduced_1)
+        sigma_1 = math.atan2(math.tan(reduced_1), cos_alpha_1)
+        sin_alpha = cos_u1 * sin_alpha_1
+        cos_sq_alpha = 1.0 - sin_alpha * sin_alpha
+        a, b = VincentyBackend.__get_series(cos_sq_alpha)
+        sigma_0 = distance / (VincentyBackend.B * a)
+        sigma = sigma_0
+        for _ in range(VincentyBackend.MAX_ITERATIONS):
+            cos_2_sigma_m = math.cos(2.0 * sigma_1 + sigma)
+            sin_sigma = math.sin(sigma)
+            cos_sigma = math.cos(sigma)
+            previous = sigma
+            sigma = sigma_0 + VincentyBackend.__get_delta_sigma(b, sin_sigma, cos_sigma, cos_2_sigma_m)
+            if abs(sigma - previous) <= VincentyBackend.TOLERANCE:
+                break
+        cos_2_sigma_m = math.cos(2.0 * sigma_1 + sigma)
+        sin_sigma = math.sin(sigma)
+        cos_sigma = math.cos(sigma)
+        x = sin_u1 * sin_sigma - cos_u1 * cos_sigma * cos_alpha_1
+        latitude_2 = math.atan2(sin_u1 * cos_sigma + cos_u1 * sin_sigma * cos_alpha_1,
+                                (1.0 - f) * math.hypot(sin_alpha, x))
+        lambda_ = math.atan2(sin_sigma * sin_alpha_1, cos_u1 * cos_sigma - sin_u1 * sin_sigma * cos_alpha_1)
+        c = f / 16.0 * cos_sq_alpha * (4.0 + f * (4.0 - 3.0 * cos_sq_alpha))
+        difference = lambda_ - (1.0 - c) * f * sin_alpha * (
+            sigma + c * sin_sigma * (cos_2_sigma_m + c * cos_sigma * (-1.0 + 2.0 * cos_2_sigma_m * cos_2_sigma_m)))
+        return math.degrees(latitude_2), GeodesyBackend.normalise_degrees(longitude + math.degrees(difference))
+
+    @staticmethod
+    def __get_series(cos_sq_alpha):
+        # type: (float) -> (float, float)
+        """Gets the series coefficients A and B of the Vincenty formulae.
+
+            :param cos_sq_alpha: The square of the cosine of the azimuth at the equator;
+            :return: A and B;"""
+        u_sq = cos_sq_alpha * (VincentyBackend.A * VincentyBackend.A - VincentyBackend.B * VincentyBackend.B) / \
+            (VincentyBackend.B * VincentyBackend.B)
+        a = 1.0 + u_sq / 16384.0 * (4096.0 + u_sq * (-768.0 + u_sq * (320.0 - 175.0 * u_sq)))
+        b = u_sq / 1024.0 * (256.0 + u_sq * (-128.0 + u_sq * (74.0 - 47.0 * u_sq)))
+        return a, b
+
+    @staticmethod
+    def __get_delta_sigma(b, sin_sigma, cos_sigma, cos_2_sigma_m):
+        # type: (float, float, float, float) -> float
+        """Gets the correction of the angular distance of the Vincenty formulae.
+
+            :param b: The series coefficient B;
+            :param sin_sigma: The sine of the angular distance;
+            :param cos_sigma: The cosine of the angular distance;
+            :param cos_2_sigma_m: The cosine of twice the angular distance of the midpoint from the equator;
+            :return: The correction in radians;"""
+        cos_sq_2_sigma_m = cos_2_sigma_m * cos_2_sigma_m
+        return b * sin_sigma * (cos_2_sigma_m + b / 4.0 * (
+            cos_sigma * (-1.0 + 2.0 * cos_sq_2_sigma_m) -
+            b / 6.0 * cos_2_sigma_m * (-3.0 + 4.0 * sin_sigma * sin_sigma) * (-3.0 + 4.0 * cos_sq_2_sigma_m)))
+
+
+class SphericalBackend(GeodesyBackend):
+    """This class calculates great circles on a sphere of the WGS84 mean radius, the haversine distance, the
+    initial bearing and the destination point formulae. Distances are within about 0.6% of the ellipsoidal
+    distance, the error comes from the flattening of the earth and is largest along meridians."""
+
+    NAME: str = "spherical"
+    """The name of the backend"""
+
+    DISTANCE_ERROR: float = 0.006
+    """The largest error of an inverse distance relative to the distance"""
+
+    AZIMUTH_ERROR: float = 0.5
+    """The largest error of an inverse azimuth in degrees, for points less than AZIMUTH_ERROR_RANGE apart"""
+
+    AZIMUTH_ERROR_RANGE: float = 15000000.0
+    """The distance in metres up to which AZIMUTH_ERROR holds"""
+
+    POSITION_ERROR: float = 0.006
+    """The largest distance between a direct point and the Karney direct point relative to the projected
+    distance"""
+
+    RADIUS: float = 6371008.8
+    """The mean radius of the WGS84 ellipsoid in metres"""
+
+    def inverse(self, latitude_1, longitude_1, latitude_2, longitude_2):
+        # type: (float, float, float, float) -> (float, float)
+        """Calculates the azimuth and distance between two points, see GeodesyBackend.inverse().
+
+            :param latitude_1: The latitude of the first point;
+            :param longitude_1: The longitude of the first point;
+            :param latitude_2: The latitude of the second point;
+            :param longitude_2: The longitude of the second point;
+            :return: The azimuth at the first point and the distance;"""
+        phi_1 = math.radians(latitude_1)
+        phi_2 = math.radians(latitude_2)
+        difference = math.radians(longitude_2 - longitude_1)
+        cos_phi_1 = math.cos(phi_1)
+        cos_phi_2 = math.cos(phi_2)
+        sin_half_phi = math.sin((phi_2 - phi_1) / 2.0)
+        sin_half_lambda = math.sin(difference / 2.0)
+        h = sin_half_phi * sin_half_phi + cos_phi_1 * cos_phi_2 * sin_half_lambda * sin_half_lambda
+        distance = 2.0 * SphericalBackend.RADIUS * math.asin(math.sqrt(min(h, 1.0)))
+        azimuth = math.degrees(math.atan2(math.sin(difference) * cos_phi_2, cos_phi_1 * math.sin(phi_2) -
+                                          math.sin(phi_1) * cos_phi_2 * math.cos(difference)))
+        return azimuth, distance
+
+    def direct(self, latitude, longitude, bearing, distance):
+        # type: (float, float, float, float) -> (float, float)
+        """Calculates the point at a bearing and distance from a point, see GeodesyBackend.direct().
+
+            :param latitude: The latitude of the point;
+            :param longitude: The longitude of the point;
+            :param bearing: The azimuth at the point;
+            :param distance: The distance to the projected point;
+            :return: The latitude and longitude of the projected point;"""
+        phi_1 = math.radians(latitude)
+        theta = math.radians(bearing)
+        delta = distance / SphericalBackend.RADIUS
+        sin_phi_1 = math.sin(phi_1)
+        cos_phi_1 = math.cos(phi_1)
+        sin_delta = math.sin(delta)
+        cos_delta = math.cos(delta)
+        sin_phi_2 = max(-1.0, min(1.0, sin_phi_1 * cos_delta + cos_phi_1 * sin_delta * math.cos(theta)))
+        difference = math.atan2(math.sin(theta) * sin_delta * cos_phi_1, cos_delta - sin_phi_1 * sin_phi_2)
+        return math.degrees(math.asin(sin_phi_2)), \
+            GeodesyBackend.normalise_degrees(longitude + math.degrees(difference))
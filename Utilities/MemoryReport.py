@@ -0,0 +1,155 @@
+import enum
+import sys
+import types
+
+from F15_Parser.FlightState import FlightState
+from F15_Parser.ParseObjectPool import ParseObjectPool
+from Tokenizer.ColumnarTokens import ColumnarTokens
+from Tokenizer.TokenInternPool import TokenInternPool
+
+
+class MemoryReport:
+    """This class reports the deep size in bytes of Tokens and ExtractedRouteSequence instances, i.e. the size
+    of the object and of everything it references, each object counted once. The size of an object is taken
+    from sys.getsizeof(), instance dictionaries and slots are followed, classes, modules, functions and
+    enumeration members are static and not counted.
+
+    Objects shared between messages are counted separately as shared bytes, they do not grow with the number
+    of messages held: interned flight states, strings held by the shared TokenInternPool, strings of at most
+    one character, None, booleans and the small integers cached by Python. The remaining bytes are owned by
+    the message and are the figure to size caches with. Sizes are approximate, e.g. on recent Python
+    versions reading an instance dictionary may create it."""
+
+    STATIC_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType,
+                    enum.Enum, ParseObjectPool)
+    """Types of objects that are not counted at all; the object pool a pooled ERS refers to holds the objects
+    released by other messages"""
+
+    LEAF_TYPES = (str, bytes, int, float, bool, complex, memoryview, type(None))
+    """Types of objects that are counted without following their references; a memoryview is counted
+    without the buffer it refers to"""
+
+    @staticmethod
+    def get_deep_size(obj):
+        # type: (object) -> int
+        """Gets the number of bytes owned by an object and everything it references, excluding shared objects.
+
+            :param obj: The object to measure;
+            :return: The owned size in bytes;"""
+        sizes = [0, 0]
+        MemoryReport.__add_sizes(obj, set(), sizes)
+        return sizes[0]
+
+    @staticmethod
+    def get_tokens_report(tokens):
+        # type: (Tokens) -> {}
+        """Gets the memory used by a token list.
+
+            :param tokens: The token list, a Tokens, ColumnarTokens or TokenCursor instance;
+            :return: A dictionary with the number of tokens, the owned bytes of the tokens and of the whole
+                     token list, the shared bytes and the owned bytes per token;"""
+        seen = set()
+        token_sizes = [0, 0]
+        number_of_tokens = tokens.get_number_of_tokens()
+        if isinstance(tokens, ColumnarTokens):
+            # The tokens are the columns and the source string, requesting them would create proxies
+            MemoryReport.__add_sizes(tokens, seen, token_sizes)
+        else:
+            for idx in range(number_of_tokens):
+                MemoryReport.__add_sizes(tokens.get_token_at(idx), seen, token_sizes)
+        sizes = list(token_sizes)
+        MemoryReport.__add_sizes(tokens, seen, sizes)
+        return {
+            "tokens": number_of_tokens,
+            "token_bytes": token_sizes[0],
+            "bytes": sizes[0],
+            "shared_bytes": sizes[1],
+            "bytes_per_token": token_sizes[0] / number_of_tokens if number_of_tokens > 0 else 0.0
+        }
+
+    @staticmethod
+    def get_ers_report(ers):
+        # type: (ExtractedRouteSequence) -> {}
+        """Gets the memory used by an extracted route sequence.
+
+            :param ers: The extracted route sequence;
+            :return: A dictionary with the number of records and errors, the owned bytes of the records, of the
+                     errors as stored and of the whole ERS, the shared bytes and the owned bytes per record;"""
+        seen = set()
+        record_sizes = [0, 0]
+        for record in ers.get_all_elements():
+            MemoryReport.__add_sizes(record, seen, record_sizes)
+        error_sizes = [0, 0]
+        for error in ers.get_error_entries():
+            MemoryReport.__add_sizes(error, seen, error_sizes)
+        sizes = [record_sizes[0] + error_sizes[0], record_sizes[1] + error_sizes[1]]
+        MemoryReport.__add_sizes(ers, seen, sizes)
+        number_of_records = ers.get_number_of_elements()
+        return {
+            "records": number_of_records,
+            "errors": ers.get_number_of_errors(),
+            "record_bytes": record_sizes[0],
+            "error_bytes": error_sizes[0],
+            "bytes": sizes[0],
+            "shared_bytes": sizes[1],
+            "bytes_per_record": record_sizes[0] / number_of_records if number_of_records > 0 else 0.0
+        }
+
+    @staticmethod
+    def format_report(report):
+        # type: ({}) -> str
+        """Formats a report as a single line.
+
+            :param report: A report returned by get_tokens_report() or get_ers_report();
+            :return: The report as 'name=value' pairs;"""
+        return ", ".join("{0}={1:.1f}".format(name, value) if isinstance(value, float) else
+                         "{0}={1}".format(name, value) for name, value in report.items())
+
+    @staticmethod
+    def __add_sizes(obj, seen, sizes):
+        # type: (object, set, [int, int]) -> None
+        """Adds the sizes of an object and everything it references that has not been seen yet.
+
+            :param obj: The object to measure;
+            :param seen: The ids of all objects counted so far, updated;
+            :param sizes: A two element list, index 0 the owned and index 1 the shared bytes, updated;
+            :return: None"""
+        pending = [(obj, False)]
+        while len(pending) > 0:
+            item, shared = pending.pop()
+            if id(item) in seen or isinstance(item, MemoryReport.STATIC_TYPES):
+                continue
+            seen.add(id(item))
+            shared = shared or MemoryReport.__is_shared(item)
+            sizes[1 if shared else 0] = sizes[1 if shared else 0] + sys.getsizeof(item)
+            if isinstance(item, MemoryReport.LEAF_TYPES):
+                continue
+            if isinstance(item, dict):
+                pending.extend((value, shared) for value in item.keys())
+                pending.extend((value, shared) for value in item.values())
+            elif isinstance(item, (list, tuple, set, frozenset)):
+                pending.extend((value, shared) for value in item)
+            if hasattr(item, "__dict__"):
+                pending.append((item.__dict__, shared))
+            for cls in type(item).__mro__:
+                for name in getattr(cls, "__slots__", ()):
+                    if hasattr(item, name):
+                        pending.append((getattr(item, name), shared))
+
+    @staticmethod
+    def __is_shared(obj):
+        # type: (object) -> bool
+        """Checks if an object is shared between messages.
+
+            :param obj: The object to check;
+            :return: True if the object is shared, False if it is owned by the message;"""
+        if obj is None or isinstance(obj, (bool, FlightState)):
+            return True
+        if isinstance(obj, int):
+            return -5 <= obj <= 256
+        if isinstance(obj, str):
+            if len(obj) <= 1:
+                return True
+            entry = TokenInternPool.get_shared_pool().pool.get(obj)
+            return entry is not None and entry[0] is obj
+        return False
@@ -1,14 +1,116 @@
 import math
+import os
 
 from Utilities.Constants import Constants
-from geographiclib.geodesic import Geodesic
+from Utilities.GeodesicCache import GeodesicCache
+from Utilities.GeodesyBackend import GeodesyBackend, KarneyBackend
 
 
 class Utils:
     """This class contains utility methods used by the ICAO Field 15 Parser."""
 
-    geode = Geodesic.WGS84
-    """Define the WGS84 ellipsoid from the geographiclib library"""
+    geode = None
+    """The WGS84 ellipsoid from the geographiclib library, loaded on first use by get_geode() so that importing
+    the parser does not import geographiclib"""
+
+    geodesy_backend: GeodesyBackend = None
+    """The backend of the geodesic calculations, created on first use by get_geodesy_backend()"""
+
+    INVERSE_CACHE_FILE: str = "geodesic-inverse.marshal"
+    """The name of the file the inverse cache is saved to by save_geodesic_caches()"""
+
+    DIRECT_CACHE_FILE: str = "geodesic-direct.marshal"
+    """The name of the file the direct cache is saved to by save_geodesic_caches()"""
+
+    inverse_cache: GeodesicCache = None
+    """The cache of inverse results, a (latitude 1, longitude 1, latitude 2, longitude 2) tuple mapped to the
+    (azimuth, distance) tuple, created on first use by get_inverse_cache()"""
+
+    direct_cache: GeodesicCache = None
+    """The cache of direct results, a (latitude, longitude, bearing, distance) tuple mapped to the (latitude,
+    longitude) tuple of the projected point, created on first use by get_direct_cache()"""
+
+    @staticmethod
+    def get_geode():
+        # type: () -> Geodesic
+        """Gets the WGS84 ellipsoid used for geodesic calculations, importing geographiclib the first time.
+
+        :return: The geographiclib WGS84 Geodesic instance;
+        """
+        if Utils.geode is None:
+            Utils.geode = KarneyBackend.get_geode()
+        return Utils.geode
+
+    @staticmethod
+    def get_geodesy_backend():
+        # type: () -> GeodesyBackend
+        """Gets the backend of get_bearing_distance_between_points() and get_bearing_distance_projected_point().
+
+        :return: The geodesy backend, the Karney backend unless another has been set;
+        """
+        if Utils.geodesy_backend is None:
+            Utils.geodesy_backend = KarneyBackend()
+        return Utils.geodesy_backend
+
+    @staticmethod
+    def set_geodesy_backend(backend):
+        # type: (GeodesyBackend | str) -> None
+        """Sets the backend of get_bearing_distance_between_points() and get_bearing_distance_projected_point().
+        The geodesic caches hold results of the previous backend and are cleared.
+
+        :param backend: The geodesy backend or its name, e.g. 'spherical', see GeodesyBackend.get_backend();
+        :return: None
+        """
+        if isinstance(backend, str):
+            backend = GeodesyBackend.get_backend(backend)
+        Utils.geodesy_backend = backend
+        Utils.get_inverse_cache().clear()
+        Utils.get_direct_cache().clear()
+
+    @staticmethod
+    def get_inverse_cache():
+        # type: () -> GeodesicCache
+        """Gets the cache of the results of get_bearing_distance_between_points().
+
+        :return: The shared inverse cache;
+        """
+        if Utils.inverse_cache is None:
+            Utils.inverse_cache = GeodesicCache()
+        return Utils.inverse_cache
+
+    @staticmethod
+    def get_direct_cache():
+        # type: () -> GeodesicCache
+        """Gets the cache of the results of get_bearing_distance_projected_point().
+
+        :return: The shared direct cache;
+        """
+        if Utils.direct_cache is None:
+            Utils.direct_cache = GeodesicCache()
+        return Utils.direct_cache
+
+    @staticmethod
+    def save_geodesic_caches(directory):
+        # type: (str) -> None
+        """Saves the inverse and direct caches so that a later run can load them.
+
+        :param directory: The directory the cache files are written to, it is created if necessary;
+        :return: None
+        """
+        os.makedirs(directory, exist_ok=True)
+        Utils.get_inverse_cache().save(os.path.join(directory, Utils.INVERSE_CACHE_FILE))
+        Utils.get_direct_cache().save(os.path.join(directory, Utils.DIRECT_CACHE_FILE))
+
+    @staticmethod
+    def load_geodesic_caches(directory):
+        # type: (str) -> int
+        """Loads the inverse and direct caches saved by save_geodesic_caches(), missing files are ignored.
+
+        :param directory: The directory holding the cache files;
+        :return: The number of results loaded;
+        """
+        return Utils.get_inverse_cache().load(os.path.join(directory, Utils.INVERSE_CACHE_FILE)) + \
+            Utils.get_direct_cache().load(os.path.join(directory, Utils.DIRECT_CACHE_FILE))
 
     @staticmethod
     def is_degree_semantics(degrees, max_degrees):
@@ -103,8 +205,14 @@ class Utils:
         :return: A list containing two items, index 0 the latitude, index 1 the longitude of the projected
                  point calculated by this method.
         """
-        result = self.geode.Direct(latitude, longitude, bearing, distance)
-        return [result['lat2'], result['lon2']]
+        # Results are cached on the exact arguments, see get_direct_cache()
+        key = Utils.__get_cache_key((latitude, longitude, bearing, distance))
+        cache = Utils.get_direct_cache()
+        cached = cache.get(key)
+        if cached is None:
+            cached = Utils.get_geodesy_backend().direct(latitude, longitude, bearing, distance)
+            cache.put(key, cached)
+        return [cached[0], cached[1]]
 
     def get_bearing_distance_between_points(self, latitude_1, longitude_1, latitude_2, longitude_2):
         # type: (float, float, float, float) -> []
@@ -119,5 +227,25 @@ class Utils:
             - Index 1 the azimuth from point 1 to point 2;
             - Index 2 the distance between point 1 and point 2;
         """
-        result = self.geode.Inverse(latitude_1, longitude_1, latitude_2, longitude_2)
-        return [result['azi1'], result['s12']]
+        # Results are cached on the exact coordinates, see get_inverse_cache()
+        key = Utils.__get_cache_key((latitude_1, longitude_1, latitude_2, longitude_2))
+        cache = Utils.get_inverse_cache()
+        cached = cache.get(key)
+        if cached is None:
+            cached = Utils.get_geodesy_backend().inverse(latitude_1, longitude_1, latitude_2, longitude_2)
+            cache.put(key, cached)
+        return [cached[0], cached[1]]
+
+    @staticmethod
+    def __get_cache_key(values):
+        # type: ((float,)) -> ()
+        """Gets the geodesic cache key of the arguments of a calculation. Equal floats are equal keys except for
+        zero, 0.0 and -0.0 are equal but geographiclib may give different azimuths for them, so the signs of
+        the arguments are added to a key holding a zero.
+
+        :param values: The arguments of the calculation;
+        :return: The cache key;
+        """
+        if 0.0 in values:
+            return values + tuple(math.copysign(1.0, value) for value in values)
+        return values